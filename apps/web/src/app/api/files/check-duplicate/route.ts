@@ -27,7 +27,7 @@ export async function POST(request: Request) {
   try {
     const body = await request.json()
 
-    const { source_id, file_hash } = body
+    const { source_id, file_hash, file_size } = body
 
     if (!source_id || !file_hash) {
       return NextResponse.json(
@@ -38,16 +38,19 @@ export async function POST(request: Request) {
 
     const db = getDb()
 
-    // Check if a file with this hash has been successfully processed
+    // Check if a file with this hash (and size, when given) has been successfully processed
+    const sizeFilter = file_size != null ? 'AND file_size = ?' : ''
+    const args = file_size != null ? [source_id, file_hash, file_size] : [source_id, file_hash]
     const existing = db.prepare(`
       SELECT id, file_name, landing_key, status, processing_completed_at
       FROM file_processing_log
       WHERE source_id = ?
         AND file_hash = ?
+        ${sizeFilter}
         AND status IN ('completed', 'archived')
       ORDER BY processing_completed_at DESC
       LIMIT 1
-    `).get(source_id, file_hash) as FileProcessingLog | undefined
+    `).get(...args) as FileProcessingLog | undefined
 
     if (existing) {
       return NextResponse.json({
@@ -284,27 +284,25 @@ export async function POST(
           filesToProcess = [landingKey]
         }
 
-        // Process each file
-        const flowRuns: string[] = []
-        for (const landingKey of filesToProcess) {
-          const prefectRun = await triggerPrefectRun(deploymentId, {
-            workflow_id: workflowId,
-            job_id: job.id,
-            workflow_name: workflow.name,
-            job_name: job.name,
-            landing_key: landingKey,
-            primary_keys: primaryKeys,
-            column_mappings: columnMappings,
-            has_header: hasHeader,
-            flow_run_id: null,  // Will be set by Prefect
-            environment: workflowEnvironment,
-            destination_config: destinationConfig,  // Pass layer configurations
-            execution_id: sourceExecutionId,  // Pass execution ID for completion callback
-          })
-
-          flowRuns.push(prefectRun.id)
-          console.log(`✅ Prefect flow run created for ${landingKey}: ${prefectRun.id}`)
-        }
+        // A multi-file pattern match is ingested by one batch run that parses the
+        // files in parallel into a single Bronze dataset
+        const prefectRun = await triggerPrefectRun(deploymentId, {
+          workflow_id: workflowId,
+          job_id: job.id,
+          workflow_name: workflow.name,
+          job_name: job.name,
+          landing_key: filesToProcess[0],
+          landing_keys: filesToProcess.length > 1 ? filesToProcess : null,
+          primary_keys: primaryKeys,
+          column_mappings: columnMappings,
+          has_header: hasHeader,
+          flow_run_id: null,  // Will be set by Prefect
+          environment: workflowEnvironment,
+          destination_config: destinationConfig,  // Pass layer configurations
+          execution_id: sourceExecutionId,  // Pass execution ID for completion callback
+        })
+        const flowRuns: string[] = [prefectRun.id]
+        console.log(`✅ Prefect flow run created for ${filesToProcess.join(', ')}: ${prefectRun.id}`)
 
         const logEntry = [
           `Pattern matching mode: ${uploadMode}`,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 from pathlib import Path
 from typing import List, Optional
 
@@ -11,10 +12,14 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from tasks.bronze import bronze_ingest  # noqa: E402
-from tasks.database_bronze import ingest_from_database  # noqa: E402
+from tasks.bronze import bronze_batch_ingest, bronze_ingest  # noqa: E402
+from tasks.database_bronze import MAX_AUTO_PARTITIONS, get_connector, ingest_from_database  # noqa: E402
+from tasks.database_cdc import ingest_from_database_cdc  # noqa: E402
 from tasks.gold import gold_publish  # noqa: E402
 from tasks.silver import silver_transform  # noqa: E402
+from utils.file_tracking import log_file_processing  # noqa: E402
+from utils.metadata_catalog import update_job_execution_metrics  # noqa: E402
+from utils.config import settings  # noqa: E402
 from utils.slugify import slugify, generate_run_id  # noqa: E402
 from services.trigger_handler import notify_completion  # noqa: E402
 
@@ -42,6 +47,7 @@ def medallion_pipeline(
     workflow_name: str,
     job_name: str,
     landing_key: str = None,
+    landing_keys: Optional[List[str]] = None,
     primary_keys: Optional[List[str]] = None,
     column_mappings: Optional[List[dict]] = None,
     has_header: bool = True,
@@ -66,6 +72,8 @@ def medallion_pipeline(
         workflow_name: Workflow name
         job_name: Job name
         landing_key: S3 key for source data (file-based jobs only)
+        landing_keys: S3 keys of a multi-file batch (e.g. a file pattern match),
+            ingested in parallel into one Bronze dataset (file-based jobs only)
         primary_keys: Primary keys for deduplication
         column_mappings: Column mappings
         has_header: Whether file has headers
@@ -74,7 +82,9 @@ def medallion_pipeline(
         file_options: File-specific options
         execution_id: FlowForge execution ID (for dependency triggers)
         source_type: Source type ("file" or "database")
-        source_config: Database connection config (database jobs only)
+        source_config: Database connection config (database jobs only; PostgreSQL
+            tables with databaseConfig.syncMode "cdc" are read from a logical
+            replication slot)
         destination_config: Bronze layer config (database jobs only)
         batch_id: Batch identifier (database jobs only)
     """
@@ -103,7 +113,27 @@ def medallion_pipeline(
 
     try:
         # Route to appropriate bronze ingestion task based on source type
-        if source_type == "database":
+        database_config = (source_config or {}).get("databaseConfig") or {}
+        if source_type == "database" and database_config.get("syncMode") == "cdc":
+            logger.info("Database CDC job detected - using database_cdc task")
+            bronze_result = ingest_from_database_cdc(
+                workflow_id=workflow_id,
+                job_id=job_id,
+                workflow_slug=workflow_slug,
+                job_slug=job_slug,
+                run_id=run_id,
+                source_config=source_config,
+                destination_config=destination_config,
+                batch_id=batch_id or run_id,
+                execution_id=execution_id,
+                environment=environment,
+            )
+            if not bronze_result.get("bronze_parts"):
+                # No changes since Silver last merged: nothing for Silver/Gold to do
+                logger.info("No CDC changes pending - skipping Silver and Gold")
+                execution_status = "completed"
+                return {"bronze": bronze_result, "silver": None, "gold": None, "skipped": True}
+        elif source_type == "database":
             logger.info("Database job detected - using database_bronze task")
             bronze_result = ingest_from_database(
                 workflow_id=workflow_id,
@@ -117,6 +147,22 @@ def medallion_pipeline(
                 execution_id=execution_id,
                 environment=environment,
             )
+        elif landing_keys:
+            logger.info(f"File batch detected ({len(landing_keys)} files) - using bronze_batch_ingest task")
+            bronze_result = bronze_batch_ingest(
+                workflow_id=workflow_id,
+                job_id=job_id,
+                workflow_slug=workflow_slug,
+                job_slug=job_slug,
+                run_id=run_id,
+                landing_keys=landing_keys,
+                file_format=file_format,
+                file_options=file_options,
+                column_mappings=column_mappings,
+                has_header=has_header,
+                environment=environment,
+                destination_config=destination_config,
+            )
         else:
             logger.info("File job detected - using bronze_ingest task")
             bronze_result = bronze_ingest(
@@ -134,6 +180,23 @@ def medallion_pipeline(
                 destination_config=destination_config,
             )
 
+        # Duplicate landing file(s): nothing was parsed or written, so there is
+        # nothing for Silver/Gold to do
+        if bronze_result.get("skipped"):
+            if "duplicate_keys" in bronze_result:
+                logger.info(
+                    "All %d landing files were already processed - skipping Silver and Gold",
+                    len(bronze_result["duplicate_keys"]),
+                )
+            else:
+                logger.info(
+                    "Landing file %s was already processed (hash %s) - skipping Silver and Gold",
+                    bronze_result["landing_key"],
+                    bronze_result["file_hash"],
+                )
+            execution_status = "completed"
+            return {"bronze": bronze_result, "silver": None, "gold": None, "skipped": True}
+
         # Extract layer-specific configs
         bronze_config = destination_config.get("bronzeConfig", {}) if destination_config else {}
         silver_config = destination_config.get("silverConfig", {}) if destination_config else {}
@@ -162,6 +225,35 @@ def medallion_pipeline(
             "gold": gold_result,
         }
 
+        # Record the processed file(s) so their hashes can be matched by later runs
+        if "file_hashes" in bronze_result:
+            processed = [
+                (key, file["file_hash"], file["file_size"], bronze_result["file_records"][key])
+                for key, file in bronze_result["file_hashes"].items()
+            ]
+        else:
+            processed = [(
+                bronze_result["landing_key"],
+                bronze_result.get("file_hash"),
+                bronze_result.get("file_size"),
+                bronze_result.get("part_records", bronze_result["records"]),
+            )]
+        for landing, file_hash, file_size, records in processed:
+            if file_hash:
+                log_file_processing(
+                    source_id=job_id,
+                    execution_id=execution_id,
+                    landing_key=landing,
+                    file_hash=file_hash,
+                    file_size=file_size,
+                    status="completed",
+                    records_processed=records,
+                    bronze_key=bronze_result["bronze_key"],
+                    archive_key=None,
+                    error_message=None,
+                    logger=logger,
+                )
+
         # Mark as completed
         execution_status = "completed"
         logger.info("Medallion pipeline completed successfully")
@@ -195,6 +287,328 @@ def medallion_pipeline(
                 )
 
 
+def _table_slug(table: str) -> str:
+    """Slug of a source table name (schema-qualified names keep the schema, e.g. dbo-customers)."""
+    return slugify(table.replace(".", " "))
+
+
+def _table_connections(db_type: str, database_config: dict, max_connections: int) -> int:
+    """Connections one table's extraction opens, capping its partitions to the source limit.
+
+    `database_config` is updated in place so a partitioned extraction never asks
+    for more partitions than the limit allows. A PostgreSQL partitioned load also
+    holds one connection for the exported snapshot.
+    """
+    if not database_config.get("partitionColumn"):
+        return 1
+
+    snapshot_connections = 1 if db_type == "postgresql" else 0
+    budget = max(1, max_connections - snapshot_connections)
+    partitions = database_config.get("partitions") or 1
+    if partitions == "auto":
+        partitions = min(int(database_config.get("maxPartitions") or MAX_AUTO_PARTITIONS), budget)
+        database_config["maxPartitions"] = partitions
+    else:
+        partitions = min(int(partitions), budget)
+        database_config["partitions"] = partitions
+    if partitions <= 1:
+        return 1
+    return partitions + snapshot_connections
+
+
+def _table_configs(
+    table: str,
+    source_config: dict,
+    destination_config: dict,
+    overrides: dict,
+) -> tuple[dict, dict]:
+    """Build one table's source and destination configs from the shared ones.
+
+    The shared databaseConfig/bronzeConfig/silverConfig/goldConfig act as
+    defaults for every table; settings naming a single table or file
+    (tableName, query, fileName, s3Key, ...) are dropped, and `overrides`
+    (a table's entry in `table_configs`) is merged over each section.
+    """
+    per_table_only = ("tableName", "query", "storedProcedure", "lastWatermark", "fileName", "s3Key")
+
+    def section(config: dict, name: str) -> dict:
+        shared = {key: value for key, value in (config.get(name) or {}).items() if key not in per_table_only}
+        return {**shared, **(overrides.get(name) or {})}
+
+    table_source = {
+        **source_config,
+        "databaseConfig": {**section(source_config, "databaseConfig"), "tableName": table},
+    }
+    table_destination = {
+        **destination_config,
+        "bronzeConfig": section(destination_config, "bronzeConfig"),
+        "silverConfig": section(destination_config, "silverConfig"),
+        "goldConfig": section(destination_config, "goldConfig"),
+    }
+    return table_source, table_destination
+
+
+@flow(name="flowforge-database-medallion")
+def database_medallion_pipeline(
+    workflow_id: str,
+    job_id: str,
+    workflow_name: str,
+    job_name: str,
+    source_config: dict,
+    destination_config: Optional[dict] = None,
+    tables: Optional[List[str]] = None,
+    exclude_tables: Optional[List[str]] = None,
+    table_configs: Optional[dict] = None,
+    max_connections: Optional[int] = None,
+    flow_run_id: Optional[str] = None,
+    execution_id: Optional[str] = None,
+    batch_id: Optional[str] = None,
+    environment: str = "prod",
+) -> dict:
+    """Ingest many tables of one source database through Bronze → Silver → Gold.
+
+    Tables are extracted concurrently, with at most `max_connections` source
+    connections open at a time (a partitioned table counts one per partition).
+    As each table's Bronze load finishes, its Silver and Gold tasks are
+    submitted, so transforms overlap with the remaining extractions. Each table
+    runs as its own job (job id `{job_id}_{table}` and job slug
+    `{job}_{table}`), so catalog entries, checkpoints and quality rules are
+    per table; its Bronze table defaults to the source table name. Record
+    counts are summed into the metrics of `job_id` once all tables finish.
+
+    Args:
+        workflow_id: Workflow identifier
+        job_id: Job identifier
+        workflow_name: Workflow name
+        job_name: Job name
+        source_config: Database connection config, as for `medallion_pipeline`;
+            its databaseConfig holds defaults for every table
+        destination_config: Layer configs, used as defaults for every table
+        tables: Tables to ingest (default: every table from `list_tables()`)
+        exclude_tables: Tables to leave out
+        table_configs: Per-table overrides, e.g.
+            {"orders": {"databaseConfig": {"isIncremental": True, "deltaColumn": "updated_at",
+                                           "lastWatermark": "..."},
+                        "silverConfig": {"primaryKey": "order_id"}}}
+        max_connections: Source connection limit (default: source_config.maxConnections,
+            then DB_SOURCE_MAX_CONNECTIONS)
+        flow_run_id: Prefect flow run ID
+        execution_id: FlowForge execution ID (for dependency triggers)
+        batch_id: Batch identifier
+        environment: Environment name
+
+    Returns:
+        Aggregate throughput (records, bytes, records/s, MB/s over the run) and
+        per-table results
+    """
+    logger = get_run_logger()
+
+    workflow_slug = slugify(workflow_name)
+    job_slug = slugify(job_name)
+    run_id = generate_run_id(flow_run_id)
+    destination_config = destination_config or {}
+    table_configs = table_configs or {}
+    db_type = source_config.get("type")
+    max_connections = max(1, int(max_connections or source_config.get("maxConnections") or settings.db_source_max_connections))
+
+    execution_status = "failed"
+    started = time.monotonic()
+
+    try:
+        if tables is None:
+            connector = get_connector(db_type, source_config.get("connection", {}))
+            try:
+                tables = connector.list_tables()
+            finally:
+                connector.close()
+        excluded = set(exclude_tables or [])
+        tables = [table for table in tables if table not in excluded]
+
+        logger.info(
+            "Starting database medallion pipeline for workflow=%s job=%s: %d %s tables, %d connections (run: %s, execution: %s)",
+            workflow_id,
+            job_id,
+            len(tables),
+            db_type,
+            max_connections,
+            run_id,
+            execution_id or "N/A",
+        )
+
+        results = {table: {"table": table, "status": "pending"} for table in tables}
+        in_flight = []  # (table, bronze future, connections, submitted at)
+        transforms = []  # (table, silver future, gold future)
+        connections_in_use = 0
+
+        def finish_bronze(entry) -> None:
+            table, future, _, submitted = entry
+            bronze_result = future.result(raise_on_failure=False)
+            table_result = results[table]
+            table_result["bronze_seconds"] = round(time.monotonic() - submitted, 2)
+
+            if isinstance(bronze_result, BaseException) or bronze_result.get("status") != "success":
+                error = bronze_result if isinstance(bronze_result, BaseException) else bronze_result.get("error")
+                table_result.update(status="failed", error=str(error))
+                logger.error("Bronze ingestion of %s failed: %s", table, error)
+                return
+
+            table_result.update(
+                records=bronze_result.get("records_processed", 0),
+                bytes=bronze_result.get("file_size_bytes", 0),
+                bronze_key=bronze_result.get("bronze_key"),
+                watermark_value=bronze_result.get("watermark_value"),
+            )
+            if not bronze_result.get("bronze_key"):
+                table_result["status"] = "no_data"
+                return
+
+            _, table_destination = _table_configs(table, source_config, destination_config, table_configs.get(table) or {})
+            silver_config = table_destination["silverConfig"]
+            primary_key = silver_config.get("primaryKey")
+            silver_future = silver_transform.submit(
+                bronze_result,
+                primary_keys=([primary_key] if isinstance(primary_key, str) else primary_key) or None,
+                silver_config=silver_config,
+                destination_config=table_destination,
+            )
+            gold_future = gold_publish.submit(
+                silver_future,
+                gold_config=table_destination["goldConfig"],
+                destination_config=table_destination,
+            )
+            transforms.append((table, silver_future, gold_future))
+
+        for table in tables:
+            table_source, table_destination = _table_configs(table, source_config, destination_config, table_configs.get(table) or {})
+            connections = min(
+                _table_connections(db_type, table_source["databaseConfig"], max_connections),
+                max_connections,
+            )
+
+            # Wait for running extractions to free enough source connections
+            while in_flight and connections_in_use + connections > max_connections:
+                done = [entry for entry in in_flight if entry[1].get_state().is_final()]
+                if not done:
+                    time.sleep(1)
+                    continue
+                for entry in done:
+                    in_flight.remove(entry)
+                    connections_in_use -= entry[2]
+                    finish_bronze(entry)
+
+            logger.info("Extracting %s (%d connection(s), %d in use)", table, connections, connections_in_use)
+            if table_source["databaseConfig"].get("syncMode") == "cdc":
+                ingest = ingest_from_database_cdc
+            else:
+                ingest = ingest_from_database
+            results[table]["job_id"] = f"{job_id}_{_table_slug(table)}"
+            future = ingest.submit(
+                workflow_id=workflow_id,
+                job_id=results[table]["job_id"],
+                workflow_slug=workflow_slug,
+                job_slug=f"{job_slug}_{_table_slug(table)}",
+                run_id=run_id,
+                source_config=table_source,
+                destination_config=table_destination,
+                batch_id=batch_id or run_id,
+                execution_id=execution_id,
+                environment=environment,
+            )
+            in_flight.append((table, future, connections, time.monotonic()))
+            connections_in_use += connections
+
+        for entry in in_flight:
+            finish_bronze(entry)
+
+        for table, silver_future, gold_future in transforms:
+            table_result = results[table]
+            # Gold never runs (and has no result) when its Silver task failed
+            silver_result = silver_future.result(raise_on_failure=False)
+            gold_result = None if isinstance(silver_result, BaseException) else gold_future.result(raise_on_failure=False)
+            error = next((result for result in (silver_result, gold_result) if isinstance(result, BaseException)), None)
+            if error is not None:
+                table_result.update(status="failed", error=str(error))
+                logger.error("Silver/Gold processing of %s failed: %s", table, error)
+                continue
+            table_result.update(
+                status="completed",
+                silver_key=silver_result.get("silver_key"),
+                silver_records=silver_result.get("records", 0),
+                gold_key=gold_result.get("gold_key"),
+                gold_records=gold_result.get("rows", 0),
+            )
+
+        elapsed = time.monotonic() - started
+        records = sum(result.get("records", 0) for result in results.values())
+        try:
+            update_job_execution_metrics(
+                job_id=job_id,
+                bronze_records=records,
+                silver_records=sum(result.get("silver_records", 0) for result in results.values()),
+                gold_records=sum(result.get("gold_records", 0) for result in results.values()),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update job execution metrics: {e}")
+        total_bytes = sum(result.get("bytes", 0) for result in results.values())
+        failed = [table for table, result in results.items() if result["status"] == "failed"]
+        summary = {
+            "workflow_id": workflow_id,
+            "job_id": job_id,
+            "run_id": run_id,
+            "tables": len(tables),
+            "completed": sum(1 for result in results.values() if result["status"] == "completed"),
+            "no_data": sum(1 for result in results.values() if result["status"] == "no_data"),
+            "failed": failed,
+            "max_connections": max_connections,
+            "records": records,
+            "bytes": total_bytes,
+            "elapsed_seconds": round(elapsed, 2),
+            "records_per_second": round(records / elapsed, 1) if elapsed else None,
+            "mb_per_second": round(total_bytes / 1024 / 1024 / elapsed, 2) if elapsed else None,
+            "results": list(results.values()),
+        }
+
+        logger.info(
+            "Database medallion pipeline finished: %d/%d tables completed, %d failed, %d records in %.1fs (%s records/s, %s MB/s)",
+            summary["completed"] + summary["no_data"],
+            len(tables),
+            len(failed),
+            records,
+            elapsed,
+            summary["records_per_second"],
+            summary["mb_per_second"],
+        )
+
+        execution_status = "failed" if failed else "completed"
+        return summary
+
+    except Exception as e:
+        logger.error(f"Database medallion pipeline failed: {e}")
+        execution_status = "failed"
+        raise
+
+    finally:
+        # Notify completion to trigger dependent workflows
+        if execution_id:
+            try:
+                logger.info(
+                    f"Notifying execution completion: {execution_id}, status: {execution_status}"
+                )
+                trigger_result = notify_completion(
+                    execution_id=execution_id,
+                    workflow_id=workflow_id,
+                    status=execution_status
+                )
+                logger.info(
+                    f"Triggered {trigger_result.get('triggeredCount', 0)} dependent workflows"
+                )
+            except Exception as trigger_error:
+                # Don't fail the flow if trigger notification fails
+                logger.warning(
+                    f"Failed to notify execution completion: {trigger_error}"
+                )
+
+
 if __name__ == "__main__":
     args = _parse_args()
     medallion_pipeline(
@@ -7,18 +7,50 @@ import tempfile
 import polars as pl
 from prefect import task, get_run_logger
 
-from utils.parquet_utils import add_audit_columns, read_csv, read_parquet, write_parquet
+from utils.bronze_parts import (
+    build_part,
+    load_manifest,
+    manifest_key,
+    parts_manifest_key,
+    register_parts,
+    write_parts_manifest,
+)
+from utils.config import settings
+from utils.parquet_utils import (
+    add_audit_columns,
+    add_audit_columns_lazy,
+    read_csv,
+    read_parquet,
+    sink_parquet,
+    streaming_chunk_rows,
+    write_parquet,
+    write_parquet_batches,
+)
 from utils.s3 import S3Client
+from utils.schema_registry import (
+    header_drift,
+    load_schema,
+    save_schema,
+    schema_from_column_mappings,
+    to_polars_schema,
+)
 from utils.slugify import slugify, generate_run_id
 from utils.metadata_catalog import catalog_bronze_asset, update_job_execution_metrics
+from utils.compression import compression_of, decompress_to_file, strip_compression_extension
 from utils.file_handlers import get_file_handler, detect_file_format
+from utils.file_tracking import check_file_already_processed, etag_md5
 from utils.ai_quality_profiler import AIQualityProfiler
 
 
+import logging
 import os
 import requests
 
 
+# Rows loaded from a streamed Bronze file for catalog schema and AI profiling
+STREAMING_SAMPLE_ROWS = 10_000
+
+
 def _save_quality_rules_to_db(job_id: str, suggested_rules: list, logger):
     """
     Save AI-suggested quality rules to database via Quality API
@@ -84,6 +116,7 @@ def _build_bronze_key(
     Load strategies:
     - "versioned" (default) and "append": create a versioned file with run_id (consistent with database bronze)
       Pattern: bronze/{tableName}/{yyyymmdd}/{tableName}_{runId}_v{sequence}.parquet
+      In append mode each file is an immutable part listed in bronze/{tableName}/_manifest.json
     - "overwrite": use a fixed _current file
       Pattern: bronze/{tableName}/{yyyymmdd}/{tableName}_current.parquet
 
@@ -112,6 +145,243 @@ def _build_bronze_key(
     return filename, s3_key
 
 
+def _should_stream(bronze_config: dict, file_size: int) -> bool:
+    """
+    Decide whether a landing file is ingested in streaming (bounded-memory) mode.
+
+    bronzeConfig.ingestMode selects the mode explicitly ("streaming" or "memory");
+    the default "auto" streams files at or above the configured size threshold.
+    """
+    ingest_mode = bronze_config.get("ingestMode", "auto")
+    if ingest_mode == "streaming":
+        return True
+    if ingest_mode == "memory":
+        return False
+    threshold_bytes = settings.bronze_streaming_threshold_mb * 1024 * 1024
+    return file_size >= threshold_bytes
+
+
+def _bronze_table_prefix(
+    workflow_slug: str,
+    job_slug: str,
+    custom_table_name: str | None = None,
+) -> str:
+    """Return the S3 prefix holding every object (and the part manifest) of a Bronze table."""
+    base_name = custom_table_name if custom_table_name else f"{workflow_slug}_{job_slug}"
+    return f"bronze/{base_name}/"
+
+
+def _resolve_pinned_schema(
+    s3: S3Client,
+    handler,
+    schema_prefix: str,
+    landing_key: str,
+    local_file: Path | None,
+    file_options: dict,
+    column_mappings: list[dict] | None,
+    file_format: str,
+    bronze_config: dict,
+    run_id: str,
+    logger,
+) -> dict | None:
+    """
+    Return the pinned schema to read a landing file with, or None to infer types.
+
+    The schema comes from the registry, or is seeded from column mappings whose
+    every entry carries a dataType. Only the file's header line is read to check
+    for drift. On drift, bronzeConfig.schemaDrift "fail" raises; the default
+    "evolve" infers types for this run and re-pins the new schema afterwards.
+    """
+    entry = load_schema(s3, schema_prefix)
+    if entry is None:
+        mapped = schema_from_column_mappings(column_mappings)
+        if mapped is None:
+            return None
+        entry = save_schema(
+            s3, schema_prefix, mapped,
+            source="column_mappings", file_format=file_format, run_id=run_id,
+        )
+
+    if entry.get("file_format") != file_format:
+        logger.info(f"Pinned schema is for {entry.get('file_format')} files, inferring types for {file_format}")
+        return None
+
+    if local_file is not None:
+        header = handler.read_header(str(local_file), file_options)
+    else:
+        # One small ranged GET for the header line
+        with s3.open_object(landing_key, block_size=64 * 1024, read_ahead=0) as header_stream:
+            header = handler.read_header(header_stream, file_options)
+
+    drift = header_drift(entry, header)
+    if drift is None:
+        logger.info(f"Reading with pinned {entry['source']} schema v{entry['version']} ({len(header)} columns, no inference)")
+        return entry
+
+    message = f"Schema drift against pinned schema v{entry['version']}: added={drift['added']}, removed={drift['removed']}, reordered={drift['reordered']}"
+    if bronze_config.get("schemaDrift", "evolve") == "fail":
+        raise ValueError(message)
+    logger.warning(f"{message} - inferring types and re-pinning")
+    return None
+
+
+def _effective_load_strategy(bronze_config: dict, logger) -> str:
+    """Resolve the Bronze load strategy from bronzeConfig (loadMode wins over loadStrategy)."""
+    load_strategy = bronze_config.get("loadStrategy", "versioned")
+    load_mode = bronze_config.get("loadMode", "versioned")
+
+    # Normalize: if loadMode is set, use it; otherwise fall back to loadStrategy
+    # "overwrite" mode means replace file, "append" means add to existing
+    effective_strategy = load_mode if load_mode in ("append", "overwrite") else load_strategy
+
+    logger.info(f"Bronze config: loadStrategy={load_strategy}, loadMode={load_mode}, effective={effective_strategy}, tableName={bronze_config.get('tableName')}")
+    return effective_strategy
+
+
+def _register_append_part(
+    s3: S3Client,
+    table_prefix: str | None,
+    bronze_key: str,
+    local_parquet: Path,
+    part_records: int,
+    run_id: str,
+    source_file: str | None,
+    logger,
+    source_files: int | None = None,
+) -> tuple[int, int | None, list[str] | None]:
+    """
+    Register an uploaded Bronze file as a new part in the table manifest (append mode only).
+
+    A part coalesced from several landing files records how many there were in
+    `source_files` instead of a file name (each row keeps its own `_source_file`).
+
+    Returns:
+        (table_record_count, table_bytes, part_keys). Outside append mode
+        (table_prefix is None) returns (part_records, None, None).
+    """
+    if not table_prefix:
+        return part_records, None, None
+
+    manifest = register_parts(s3, table_prefix, [
+        build_part(
+            bronze_key,
+            rows=part_records,
+            num_bytes=local_parquet.stat().st_size,
+            run_id=run_id,
+            source_file=source_file,
+            **({"source_files": source_files} if source_files is not None else {}),
+        )
+    ])
+    bronze_parts = [part["key"] for part in manifest["parts"]]
+    logger.info(f"Append mode: wrote part {len(bronze_parts)} ({part_records} rows), table total {manifest['total_rows']} rows")
+    return manifest["total_rows"], manifest["total_bytes"], bronze_parts
+
+
+def _catalog_and_profile_bronze(
+    *,
+    job_id: str,
+    workflow_slug: str,
+    job_slug: str,
+    bronze_key: str,
+    record_count: int,
+    df: pl.DataFrame,
+    environment: str,
+    custom_table_name: str | None,
+    file_size: int | None,
+    logger,
+    table_prefix: str | None = None,
+) -> None:
+    """
+    Catalog a Bronze dataset, update job metrics and run the AI profiler (all non-blocking).
+
+    Append-mode tables (table_prefix set) are cataloged by their manifest, since
+    record_count and file_size are totals over all of their parts.
+    """
+    # Write metadata to catalog
+    try:
+        asset_id = catalog_bronze_asset(
+            source_id=job_id,  # job_id is actually the source ID
+            workflow_slug=workflow_slug,
+            source_slug=job_slug,
+            s3_key=manifest_key(table_prefix) if table_prefix else bronze_key,
+            row_count=record_count,
+            dataframe=df,
+            environment=environment,
+            custom_table_name=custom_table_name,
+            file_size=file_size,
+        )
+        logger.info(f"✅ Bronze metadata cataloged: {asset_id} (table: {custom_table_name or 'auto-generated'})")
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to catalog bronze metadata: {e}")
+
+    # Update job execution metrics
+    try:
+        update_job_execution_metrics(
+            job_id=job_id,
+            bronze_records=record_count,
+        )
+        logger.info(f"✅ Updated job execution metrics: bronze_records={record_count}")
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to update job execution metrics: {e}")
+
+    # Run AI Quality Profiler to generate quality rule suggestions
+    try:
+        logger.info("🤖 Running AI Quality Profiler...")
+        profiler = AIQualityProfiler()
+        table_name = custom_table_name or f"{workflow_slug}_{job_slug}"
+        profiling_result = profiler.profile_dataframe(df, table_name)
+
+        logger.info(f"✅ AI Profiling complete:")
+        logger.info(f"   - Column count: {profiling_result['column_count']}")
+        logger.info(f"   - Suggested rules: {len(profiling_result['ai_suggestions'].get('quality_rules', []))}")
+
+        # Save suggested rules to database via API
+        suggested_rules = profiling_result['ai_suggestions'].get('quality_rules', [])
+        if suggested_rules:
+            logger.info(f"💾 Saving {len(suggested_rules)} AI-suggested quality rules to database...")
+            _save_quality_rules_to_db(job_id, suggested_rules, logger)
+
+    except Exception as e:
+        logger.warning(f"⚠️ AI Quality Profiler failed (non-blocking): {e}")
+        import traceback
+        logger.warning(traceback.format_exc())
+
+
+def _skip_duplicates(bronze_config: dict) -> bool:
+    """Whether landing files already processed for the job are skipped (bronzeConfig.skipDuplicates)."""
+    return bool(bronze_config.get("skipDuplicates", settings.bronze_skip_duplicate_files))
+
+
+def _duplicate_result(
+    *,
+    workflow_id: str,
+    job_id: str,
+    workflow_slug: str,
+    job_slug: str,
+    run_id: str,
+    landing_key: str,
+    file_hash: str,
+    file_size: int,
+    environment: str,
+) -> dict:
+    """Result returned by `bronze_ingest` for a landing file that was already processed."""
+    return {
+        "workflow_id": workflow_id,
+        "job_id": job_id,
+        "workflow_slug": workflow_slug,
+        "job_slug": job_slug,
+        "run_id": run_id,
+        "bronze_key": None,
+        "records": 0,
+        "landing_key": landing_key,
+        "file_hash": file_hash,
+        "file_size": file_size,
+        "skipped": True,
+        "skip_reason": "duplicate",
+        "environment": environment,
+    }
+
+
 @task(name="bronze_ingest")
 def bronze_ingest(
     *,
@@ -141,34 +411,57 @@ def bronze_ingest(
         run_id: Short run identifier (e.g., "cfee487b" or "20251006-abc123").
         landing_key: S3 key under `landing/` that points to the file.
         file_format: File format ('csv', 'json', 'parquet', 'excel'). Auto-detected if not specified.
-        file_options: Format-specific options (e.g., delimiter, encoding for CSV)
+        file_options: Format-specific options (e.g., delimiter, encoding for CSV). For Excel,
+            "sheets" ("all" or a list of names) ingests each selected sheet as its own Bronze part
         column_mappings: Optional list of column mappings for headerless CSVs
             [{"sourceColumn": "Column_0", "targetColumn": "customer_id", "dataType": "integer"}, ...]
         has_header: Whether the CSV file has a header row (default: True) - CSV only
         infer_schema_length: Optional inference window for CSV schema - CSV only
-        destination_config: Layer configuration including bronzeConfig with loadStrategy
+        destination_config: Layer configuration including bronzeConfig with loadStrategy,
+            ingestMode ("auto", "streaming", "memory" or "split"), memoryBudgetMb for streaming,
+            splitWorkers and splitRangeGets for byte-range parallel CSV ingest,
+            skipDuplicates, pinSchema (default true: CSVs are read with the table's pinned
+            schema, without inference) and schemaDrift ("evolve" or "fail")
 
     Returns:
-        Dictionary describing the created Bronze artifact.
+        Dictionary describing the created Bronze artifact. When skipDuplicates is on and
+        the landing file was already processed for this job, nothing is parsed or written
+        and the result has `skipped=True` and `bronze_key=None`.
     """
     logger = get_run_logger()
     s3 = S3Client()
 
     # Extract bronze config
     bronze_config = destination_config.get("bronzeConfig", {}) if destination_config else {}
-    load_strategy = bronze_config.get("loadStrategy", "versioned")
-    load_mode = bronze_config.get("loadMode", "versioned")
     custom_table_name = bronze_config.get("tableName")
+    skip_duplicates = _skip_duplicates(bronze_config)
 
-    # Normalize: if loadMode is set, use it; otherwise fall back to loadStrategy
-    # "overwrite" mode means replace file, "append" means add to existing
-    effective_strategy = load_mode if load_mode in ("append", "overwrite") else load_strategy
+    # Single-PUT uploads carry their MD5 in the ETag, so duplicates of those are
+    # detected from one HEAD request, before anything is downloaded
+    landing_meta = s3.get_object_metadata(landing_key)
+    file_size = landing_meta["size"]
+    file_hash = etag_md5(landing_meta["etag"])
+    if skip_duplicates and file_hash and check_file_already_processed(job_id, file_hash, logger, file_size=file_size):
+        logger.info(f"Skipping already processed landing file {landing_key} (ETag match)")
+        return _duplicate_result(
+            workflow_id=workflow_id, job_id=job_id, workflow_slug=workflow_slug, job_slug=job_slug,
+            run_id=run_id, landing_key=landing_key, file_hash=file_hash, file_size=file_size,
+            environment=environment,
+        )
 
-    logger.info(f"Bronze config: loadStrategy={load_strategy}, loadMode={load_mode}, effective={effective_strategy}, tableName={custom_table_name}")
+    effective_strategy = _effective_load_strategy(bronze_config, logger)
+
+    # Append mode writes a new part file per run, numbered after the parts
+    # already listed in the table manifest
+    table_prefix = None
+    sequence = 1
+    if effective_strategy == "append":
+        table_prefix = _bronze_table_prefix(workflow_slug, job_slug, custom_table_name)
+        sequence = len(load_manifest(s3, table_prefix)["parts"]) + 1
 
     source_filename = Path(landing_key).name
     bronze_filename, bronze_key = _build_bronze_key(
-        workflow_slug, job_slug, run_id, source_filename, sequence=1,
+        workflow_slug, job_slug, run_id, source_filename, sequence=sequence,
         load_strategy=effective_strategy,
         custom_table_name=custom_table_name,
     )
@@ -176,22 +469,20 @@ def bronze_ingest(
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_dir_path = Path(tmp_dir)
-        local_file = tmp_dir_path / Path(landing_key).name
-        s3.download_file(landing_key, local_file)
 
         # Auto-detect file format if not specified
         if not file_format or file_format == "csv":
-            detected_format = detect_file_format(str(local_file))
+            detected_format = detect_file_format(landing_key)
             if file_format != detected_format:
                 logger.info(f"Auto-detected file format: {detected_format} (specified: {file_format})")
                 file_format = detected_format
 
         # Get appropriate file handler
         try:
-            handler = get_file_handler(str(local_file))
+            handler = get_file_handler(landing_key)
             logger.info(f"Using {handler.__class__.__name__} for file format: {file_format}")
         except ValueError as e:
-            logger.error(f"No handler found for file: {local_file}")
+            logger.error(f"No handler found for file: {landing_key}")
             raise
 
         # Prepare file options based on format
@@ -203,90 +494,690 @@ def bronze_ingest(
             file_options.setdefault("has_header", has_header)
             file_options.setdefault("infer_schema_length", infer_schema_length)
 
-        # Read file using appropriate handler
-        logger.info(f"Reading {file_format.upper()} file with options: {file_options}")
-        df = handler.read(str(local_file), file_options)
-        logger.info(f"Successfully read file: {df.height} rows, {df.width} columns")
-
-        # Apply column mappings if provided (for headerless CSVs with AI-generated names)
+        rename_map = {}
         if column_mappings and len(column_mappings) > 0:
-            logger.info(f"Applying {len(column_mappings)} column mappings from AI suggestions")
+            # Column mappings for headerless CSVs with AI-generated names
             rename_map = {mapping["sourceColumn"]: mapping["targetColumn"] for mapping in column_mappings}
-            logger.info(f"Column rename map: {rename_map}")
-            df = df.rename(rename_map)
-            logger.info(f"Renamed columns: {df.columns}")
+            logger.info(f"Column rename map from {len(column_mappings)} mappings: {rename_map}")
+
+        local_file = None
+        if skip_duplicates and file_hash is None:
+            # Multipart upload: hash the file while downloading it, then parse the local copy
+            local_file = tmp_dir_path / source_filename
+            file_hash = s3.download_file_hashed(landing_key, local_file)["md5"]
+            if check_file_already_processed(job_id, file_hash, logger, file_size=file_size):
+                logger.info(f"Skipping already processed landing file {landing_key} (content hash match)")
+                return _duplicate_result(
+                    workflow_id=workflow_id, job_id=job_id, workflow_slug=workflow_slug, job_slug=job_slug,
+                    run_id=run_id, landing_key=landing_key, file_hash=file_hash, file_size=file_size,
+                    environment=environment,
+                )
 
-        df = add_audit_columns(df, source_file=Path(landing_key).name)
+        # Large plain CSVs: parse record-aligned byte ranges in parallel, one Bronze part each
+        split_workers = _split_workers(bronze_config, file_format, source_filename, file_size, file_options)
+        if split_workers:
+            split_result = _split_csv_ingest(
+                s3=s3, handler=handler,
+                workflow_id=workflow_id, job_id=job_id, workflow_slug=workflow_slug, job_slug=job_slug,
+                run_id=run_id, landing_key=landing_key, local_file=local_file,
+                file_size=file_size, file_hash=file_hash, file_format=file_format,
+                file_options=file_options, column_mappings=column_mappings, rename_map=rename_map,
+                bronze_config=bronze_config, bronze_key=bronze_key, table_prefix=table_prefix,
+                workers=split_workers, environment=environment, tmp_dir_path=tmp_dir_path, logger=logger,
+            )
+            if split_result is not None:
+                return split_result
+            if local_file is None and (tmp_dir_path / source_filename).exists():
+                local_file = tmp_dir_path / source_filename
 
-        # Handle append strategy: load existing data and concatenate
-        if effective_strategy == "append" and s3.object_exists(bronze_key):
-            logger.info(f"Append mode: Loading existing Bronze data from {bronze_key}")
-            existing_parquet = tmp_dir_path / "existing.parquet"
-            s3.download_file(bronze_key, existing_parquet)
-            existing_df = read_parquet(existing_parquet)
-            logger.info(f"Existing Bronze data: {existing_df.height} rows")
+        # Multi-sheet workbooks: each selected sheet becomes its own Bronze part
+        if file_options.get("sheets") and hasattr(handler, "read_sheets"):
+            if local_file is None:
+                local_file = tmp_dir_path / source_filename
+                s3.download_file(landing_key, local_file)
+            return _excel_sheets_ingest(
+                s3=s3, handler=handler,
+                workflow_id=workflow_id, job_id=job_id, workflow_slug=workflow_slug, job_slug=job_slug,
+                run_id=run_id, landing_key=landing_key, local_file=local_file,
+                file_size=file_size, file_hash=file_hash, file_options=file_options, rename_map=rename_map,
+                custom_table_name=custom_table_name, bronze_key=bronze_key, table_prefix=table_prefix,
+                environment=environment, tmp_dir_path=tmp_dir_path, logger=logger,
+            )
 
-            # Concatenate existing + new data
-            df = pl.concat([existing_df, df], how="diagonal")
-            logger.info(f"After append: {df.height} total rows")
+        stream_ingest = _should_stream(bronze_config, file_size)
+        if stream_ingest:
+            # Lazy scans need a local, memory-mappable copy of the landing file
+            if local_file is None:
+                compression = compression_of(source_filename)
+                if compression in ("gzip", "bz2", "zstd"):
+                    # Decompress while downloading, straight to the plain local file
+                    local_file = tmp_dir_path / strip_compression_extension(source_filename)
+                    with s3.open_object(landing_key) as landing_stream:
+                        decompress_to_file(landing_stream, compression, local_file)
+                    handler = get_file_handler(local_file.name)
+                    logger.info(f"Decompressed {compression} landing file while downloading: {local_file.name}")
+                else:
+                    local_file = tmp_dir_path / source_filename
+                    s3.download_file(landing_key, local_file)
+
+        # Read with the job's pinned schema (no type inference) when the header still matches
+        schema_prefix = _bronze_table_prefix(workflow_slug, job_slug, custom_table_name)
+        pinned_schema = None
+        if hasattr(handler, "read_header") and bronze_config.get("pinSchema", True):
+            pinned_schema = _resolve_pinned_schema(
+                s3, handler, schema_prefix, landing_key, local_file, file_options,
+                column_mappings, file_format, bronze_config, run_id, logger,
+            )
+            if pinned_schema:
+                file_options["schema"] = to_polars_schema(pinned_schema)
+        raw_schema = None
+
+        lf = None
+        batches = None
+        if stream_ingest:
+            try:
+                lf = handler.scan(str(local_file), file_options)
+            except NotImplementedError:
+                # Formats without a lazy scan may still be readable batch by batch
+                try:
+                    batches = handler.iter_batches(str(local_file), file_options)
+                except NotImplementedError as e:
+                    logger.warning(f"Streaming ingest unavailable, falling back to in-memory read: {e}")
 
-        # Persist to Parquet locally and upload to MinIO
         local_parquet = tmp_dir_path / bronze_filename
-        write_parquet(df, local_parquet)
+
+        streamed = None
+        if not stream_ingest and local_file is None:
+            streamed = _stream_landing_file(
+                s3, handler, landing_key, file_options, local_parquet,
+                rename_map=rename_map, ingested_at=datetime.utcnow(), logger=logger,
+            )
+            if streamed is None:
+                # The eager readers need the whole file: parse a local copy rather
+                # than buffering the object in memory next to the DataFrame
+                local_file = tmp_dir_path / source_filename
+                s3.download_file(landing_key, local_file)
+
+        if lf is not None:
+            ingest_mode = "streaming"
+            memory_budget_mb = bronze_config.get("memoryBudgetMb") or settings.bronze_memory_budget_mb
+            logger.info(f"Streaming {file_format.upper()} file to Parquet (memory budget: {memory_budget_mb} MB)")
+
+            def sink_landing(lf: pl.LazyFrame) -> None:
+                if rename_map:
+                    lf = lf.rename(rename_map)
+                lf = add_audit_columns_lazy(lf, source_file=source_filename)
+
+                chunk_rows = streaming_chunk_rows(lf.head(1000).collect(), memory_budget_mb)
+                logger.info(f"Streaming chunk size: {chunk_rows} rows")
+                with pl.Config(streaming_chunk_size=chunk_rows):
+                    sink_parquet(lf, local_parquet, row_group_size=chunk_rows)
+
+            try:
+                raw_schema = dict(lf.collect_schema())
+                sink_landing(lf)
+            except Exception as e:
+                if "schema" not in file_options:
+                    raise
+                # A column no longer parses as its pinned type: infer again and re-pin
+                logger.warning(f"Pinned schema v{pinned_schema['version']} no longer fits the data, re-inferring: {str(e).splitlines()[0]}")
+                file_options.pop("schema")
+                pinned_schema = None
+                lf = handler.scan(str(local_file), file_options)
+                raw_schema = dict(lf.collect_schema())
+                sink_landing(lf)
+
+            # Row count comes from Parquet metadata; only a bounded sample is loaded
+            # for catalog schema extraction and AI profiling
+            record_count = pl.scan_parquet(local_parquet).select(pl.len()).collect().item()
+            df = read_parquet(local_parquet, n_rows=STREAMING_SAMPLE_ROWS)
+            logger.info(f"Streamed {record_count} rows, {df.width} columns")
+        elif batches is not None:
+            ingest_mode = "streaming"
+            logger.info(f"Streaming {file_format.upper()} file to Parquet in record batches")
+
+            record_count, _ = _write_landing_batches(
+                batches, local_parquet,
+                source_file=source_filename, rename_map=rename_map, ingested_at=datetime.utcnow(),
+            )
+            df = read_parquet(local_parquet, n_rows=STREAMING_SAMPLE_ROWS)
+            logger.info(f"Streamed {record_count} rows, {df.width} columns")
+        elif streamed is not None:
+            ingest_mode = "memory"
+            record_count, raw_schema = streamed
+            df = read_parquet(local_parquet, n_rows=STREAMING_SAMPLE_ROWS)
+            logger.info(f"Parsed {record_count} rows, {df.width} columns while reading from S3")
+        else:
+            ingest_mode = "memory"
+            # Read file using appropriate handler
+            logger.info(f"Reading {file_format.upper()} file with options: {file_options}")
+            def read_landing() -> pl.DataFrame:
+                return handler.read(str(local_file), file_options)
+
+            try:
+                df = read_landing()
+            except Exception as e:
+                if "schema" not in file_options:
+                    raise
+                # A column no longer parses as its pinned type: infer again and re-pin
+                logger.warning(f"Pinned schema v{pinned_schema['version']} no longer fits the data, re-inferring: {str(e).splitlines()[0]}")
+                file_options.pop("schema")
+                pinned_schema = None
+                df = read_landing()
+            raw_schema = dict(df.schema)
+            logger.info(f"Successfully read file: {df.height} rows, {df.width} columns")
+
+            if rename_map:
+                df = df.rename(rename_map)
+                logger.info(f"Renamed columns: {df.columns}")
+
+            df = add_audit_columns(df, source_file=source_filename)
+
+            # Persist to Parquet locally
+            write_parquet(df, local_parquet)
+            record_count = df.height
+
+        # Upload to MinIO
         s3.upload_file(local_parquet, bronze_key)
 
+        # First successful ingest (or a re-inferred schema) pins the schema for later runs
+        if hasattr(handler, "read_header") and bronze_config.get("pinSchema", True) and not pinned_schema and raw_schema:
+            try:
+                pinned_schema = save_schema(
+                    s3, schema_prefix, raw_schema,
+                    source="inferred", file_format=file_format, run_id=run_id,
+                    previous=load_schema(s3, schema_prefix),
+                )
+            except ValueError as e:
+                logger.warning(f"Schema not pinned: {e}")
+
+        part_records = record_count
+        record_count, table_bytes, bronze_parts = _register_append_part(
+            s3, table_prefix, bronze_key, local_parquet, part_records, run_id, source_filename, logger
+        )
+
     logger.info("Bronze dataset created: s3://%s/%s", s3.bucket, bronze_key)
 
-    # Write metadata to catalog
+    _catalog_and_profile_bronze(
+        job_id=job_id,
+        workflow_slug=workflow_slug,
+        job_slug=job_slug,
+        bronze_key=bronze_key,
+        record_count=record_count,
+        df=df,
+        environment=environment,
+        custom_table_name=custom_table_name,
+        file_size=table_bytes,
+        logger=logger,
+        table_prefix=table_prefix,
+    )
+
+    return {
+        "workflow_id": workflow_id,
+        "job_id": job_id,
+        "workflow_slug": workflow_slug,
+        "job_slug": job_slug,
+        "run_id": run_id,
+        "bronze_key": bronze_key,
+        "bronze_filename": bronze_filename,
+        "records": record_count,
+        "part_records": part_records,
+        "bronze_parts": bronze_parts,
+        "bronze_manifest_key": manifest_key(table_prefix) if table_prefix else None,
+        "columns": df.columns,
+        "landing_key": landing_key,
+        "file_hash": file_hash,
+        "file_size": file_size,
+        "ingest_mode": ingest_mode,
+        "schema_version": pinned_schema["version"] if pinned_schema else None,
+        "environment": environment,
+    }
+
+
+def _write_landing_batches(
+    batches,
+    local_parquet: Path,
+    *,
+    source_file: str,
+    rename_map: dict,
+    ingested_at: datetime,
+    strict_rename: bool = True,
+) -> tuple[int, dict | None]:
+    """
+    Write the record batches of one landing file to a local Parquet file with audit columns.
+
+    Returns:
+        (rows, raw_schema), where raw_schema is the schema of the first batch
+        before renames (None for an empty file)
+    """
+    raw_schema = None
+
+    def audited_batches():
+        nonlocal raw_schema
+        row_number_start = 1
+        for batch in batches:
+            batch_df = pl.from_arrow(batch)
+            if raw_schema is None:
+                raw_schema = dict(batch_df.schema)
+            if rename_map:
+                batch_df = batch_df.rename(rename_map, strict=strict_rename)
+            yield add_audit_columns(
+                batch_df,
+                source_file=source_file,
+                timestamp=ingested_at,
+                row_number_start=row_number_start,
+            )
+            row_number_start += batch_df.height
+
+    rows = write_parquet_batches(audited_batches(), local_parquet)
+    return rows, raw_schema
+
+
+def _stream_landing_file(
+    s3: S3Client,
+    handler,
+    landing_key: str,
+    file_options: dict,
+    local_parquet: Path,
+    *,
+    rename_map: dict,
+    ingested_at: datetime,
+    logger,
+    strict_rename: bool = True,
+) -> tuple[int, dict | None] | None:
+    """
+    Parse a landing file batch by batch straight from S3 into a local Parquet file.
+
+    Batches are parsed while the stream's read-ahead fetches the next blocks, so
+    the transfer overlaps parsing and neither the object nor a local copy of it is
+    held. Returns None when the format has no incremental reader (e.g. Excel, ZIP)
+    or the stream does not parse with its sampled or pinned types; the caller then
+    reads a downloaded copy.
+    """
     try:
-        # Use user-configured table name from destination_config if provided
-        custom_table_name = bronze_config.get("tableName") if bronze_config else None
-        asset_id = catalog_bronze_asset(
-            source_id=job_id,  # job_id is actually the source ID
-            workflow_slug=workflow_slug,
-            source_slug=job_slug,
-            s3_key=bronze_key,
-            row_count=df.height,
-            dataframe=df,
-            environment=environment,
-            custom_table_name=custom_table_name,
-        )
-        logger.info(f"✅ Bronze metadata cataloged: {asset_id} (table: {custom_table_name or 'auto-generated'})")
+        with s3.open_object(landing_key) as landing_stream:
+            batches = handler.iter_batches(landing_stream, file_options)
+            return _write_landing_batches(
+                batches, local_parquet,
+                source_file=Path(landing_key).name, rename_map=rename_map,
+                ingested_at=ingested_at, strict_rename=strict_rename,
+            )
+    except NotImplementedError:
+        return None
     except Exception as e:
-        logger.warning(f"⚠️ Failed to catalog bronze metadata: {e}")
+        logger.warning(f"Streaming read of {landing_key} failed, reading a local copy instead: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+        return None
 
-    # Update job execution metrics
-    try:
-        update_job_execution_metrics(
-            job_id=job_id,
-            bronze_records=df.height,
+
+# Per-process S3 client reused by batch ingest workers
+_worker_s3: S3Client | None = None
+
+
+def _pinned_file_options(
+    s3: S3Client,
+    handler,
+    landing_key: str,
+    local_file: str | None,
+    file_options: dict,
+    pinned_schema: dict | None,
+    schema_drift: str,
+    logger,
+) -> dict:
+    """
+    Return the read options of one batch file: with the pinned schema when its header matches it.
+
+    Files of a batch may differ, so each one's header line is checked on its own
+    (one small ranged GET unless a local copy exists). A drifted file is read with
+    inferred types, or fails the batch with bronzeConfig.schemaDrift "fail".
+    """
+    if not pinned_schema or not hasattr(handler, "read_header") or detect_file_format(landing_key) != pinned_schema.get("file_format"):
+        return file_options
+
+    if local_file is not None:
+        header = handler.read_header(local_file, file_options)
+    else:
+        with s3.open_object(landing_key, block_size=64 * 1024, read_ahead=0) as header_stream:
+            header = handler.read_header(header_stream, file_options)
+
+    drift = header_drift(pinned_schema, header)
+    if drift is None:
+        return {**file_options, "schema": to_polars_schema(pinned_schema)}
+
+    message = f"Schema drift against pinned schema v{pinned_schema['version']}: added={drift['added']}, removed={drift['removed']}, reordered={drift['reordered']}"
+    if schema_drift == "fail":
+        raise ValueError(message)
+    logger.warning(f"{landing_key}: {message} - inferring types for this file")
+    return file_options
+
+
+def _ingest_landing_file(
+    landing_key: str,
+    local_file: str | None,
+    file_options: dict,
+    rename_map: dict,
+    part_path: str,
+    ingested_at: datetime,
+    pinned_schema: dict | None = None,
+    schema_drift: str = "evolve",
+) -> tuple[int, dict | None]:
+    """
+    Parse one landing file into a local Parquet part (runs in a batch ingest worker process).
+
+    Each part carries its own `_source_file` and a `_row_number` local to that file,
+    matching what `bronze_ingest` would have written for the file on its own. A
+    `local_file` already downloaded by the parent (while hashing it) is parsed
+    instead of reading the object again. A file whose header matches
+    `pinned_schema` is read with it (no inference); if a column no longer parses
+    as its pinned type, the file is read again with inferred types.
+
+    Returns:
+        (rows written, raw schema of the file before renames)
+    """
+    global _worker_s3
+    if _worker_s3 is None:
+        _worker_s3 = S3Client()
+
+    logger = logging.getLogger(__name__)
+    handler = get_file_handler(landing_key)
+    file_options = _pinned_file_options(
+        _worker_s3, handler, landing_key, local_file, dict(file_options), pinned_schema, schema_drift, logger,
+    )
+
+    downloaded = None
+    if local_file is None:
+        streamed = _stream_landing_file(
+            _worker_s3, handler, landing_key, file_options, Path(part_path),
+            rename_map=rename_map, ingested_at=ingested_at, strict_rename=False, logger=logger,
         )
-        logger.info(f"✅ Updated job execution metrics: bronze_records={df.height}")
-    except Exception as e:
-        logger.warning(f"⚠️ Failed to update job execution metrics: {e}")
+        if streamed is not None:
+            return streamed
+
+        # Formats without an incremental reader are parsed from a local copy
+        downloaded = Path(part_path).with_name(f"{Path(part_path).stem}_{Path(landing_key).name}")
+        _worker_s3.download_file(landing_key, downloaded)
+        local_file = str(downloaded)
 
-    # Run AI Quality Profiler to generate quality rule suggestions
-    profiling_result = None
     try:
-        logger.info("🤖 Running AI Quality Profiler...")
-        profiler = AIQualityProfiler()
-        table_name = custom_table_name or f"{workflow_slug}_{job_slug}"
-        profiling_result = profiler.profile_dataframe(df, table_name)
+        try:
+            df = handler.read(local_file, file_options)
+        except Exception as e:
+            if "schema" not in file_options:
+                raise
+            # A column no longer parses as its pinned type: infer for this file
+            logger.warning(f"{landing_key}: pinned schema no longer fits the data, re-inferring: {str(e).splitlines()[0]}")
+            file_options = {key: value for key, value in file_options.items() if key != "schema"}
+            df = handler.read(local_file, file_options)
+    finally:
+        if downloaded is not None:
+            downloaded.unlink()
+    raw_schema = dict(df.schema)
 
-        logger.info(f"✅ AI Profiling complete:")
-        logger.info(f"   - Column count: {profiling_result['column_count']}")
-        logger.info(f"   - Suggested rules: {len(profiling_result['ai_suggestions'].get('quality_rules', []))}")
+    if rename_map:
+        df = df.rename({k: v for k, v in rename_map.items() if k in df.columns})
 
-        # Save suggested rules to database via API
-        suggested_rules = profiling_result['ai_suggestions'].get('quality_rules', [])
-        if suggested_rules:
-            logger.info(f"💾 Saving {len(suggested_rules)} AI-suggested quality rules to database...")
-            _save_quality_rules_to_db(job_id, suggested_rules, logger)
+    df = add_audit_columns(df, source_file=Path(landing_key).name, timestamp=ingested_at)
+    write_parquet(df, part_path)
+    return df.height, raw_schema
 
-    except Exception as e:
-        logger.warning(f"⚠️ AI Quality Profiler failed (non-blocking): {e}")
-        import traceback
-        logger.warning(traceback.format_exc())
+
+def _check_batch_duplicates(
+    s3: S3Client,
+    job_id: str,
+    landing_keys: list[str],
+    skip_duplicates: bool,
+    download_dir: Path,
+    logger,
+) -> tuple[dict[str, dict], list[str], dict[str, str]]:
+    """
+    Hash the landing files of a batch and find those already processed for the job.
+
+    Files are hashed as in `bronze_ingest`: single-PUT uploads from their ETag (one
+    HEAD request each); with skipDuplicates on, multipart uploads while downloading
+    them into `download_dir`, and that copy is parsed later instead of the object.
+    A file repeating the content of an earlier file of the batch is a duplicate too.
+
+    Returns:
+        (file_hashes, duplicates, local_files): {key: {"file_hash", "file_size"}} for
+        the files to ingest (file_hash None if unknown), the keys of duplicates, and
+        {key: local path} of the files downloaded while hashing
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def inspect(index: int, landing_key: str) -> tuple[str | None, int, str | None, bool]:
+        landing_meta = s3.get_object_metadata(landing_key)
+        file_size = landing_meta["size"]
+        file_hash = etag_md5(landing_meta["etag"])
+        local_file = None
+        if skip_duplicates and file_hash is None:
+            local_file = str(download_dir / f"landing_{index:05d}_{Path(landing_key).name}")
+            file_hash = s3.download_file_hashed(landing_key, local_file)["md5"]
+        duplicate = skip_duplicates and check_file_already_processed(job_id, file_hash, logger, file_size=file_size)
+        return file_hash, file_size, local_file, duplicate
+
+    with ThreadPoolExecutor(max_workers=min(settings.s3_bulk_max_workers, len(landing_keys))) as executor:
+        inspected = list(executor.map(inspect, range(len(landing_keys)), landing_keys))
+
+    file_hashes: dict[str, dict] = {}
+    duplicates: list[str] = []
+    local_files: dict[str, str] = {}
+    seen: set[tuple[str, int]] = set()
+    for landing_key, (file_hash, file_size, local_file, duplicate) in zip(landing_keys, inspected):
+        if skip_duplicates and (duplicate or (file_hash, file_size) in seen):
+            duplicates.append(landing_key)
+            if local_file:
+                Path(local_file).unlink()
+            continue
+        seen.add((file_hash, file_size))
+        file_hashes[landing_key] = {"file_hash": file_hash, "file_size": file_size}
+        if local_file:
+            local_files[landing_key] = local_file
+    return file_hashes, duplicates, local_files
+
+
+@task(name="bronze_batch_ingest")
+def bronze_batch_ingest(
+    *,
+    workflow_id: str,
+    job_id: str,
+    workflow_slug: str,
+    job_slug: str,
+    run_id: str,
+    landing_keys: list[str],
+    file_format: str = "csv",
+    file_options: dict | None = None,
+    column_mappings: list[dict] | None = None,
+    has_header: bool = True,
+    infer_schema_length: int | None = None,
+    environment: str = "prod",
+    destination_config: dict | None = None,
+    max_workers: int | None = None,
+) -> dict:
+    """Ingest a batch of landing files (e.g. a glob pattern match) into one Bronze dataset.
+
+    Files are parsed concurrently in a process pool, one local part per file, then
+    coalesced into a single Bronze Parquet file. Columns missing from some files are
+    null-filled and differing dtypes are widened. Every row keeps the name of the
+    file it came from in `_source_file`.
+
+    With skipDuplicates on, files already processed for the job (or repeating an
+    earlier file of the batch) are dropped before anything is parsed, as in
+    `bronze_ingest`. The job's pinned schema is resolved once and every file whose
+    header matches it is read with it, without type inference.
+
+    Args:
+        landing_keys: S3 keys under `landing/` to ingest together.
+        max_workers: Worker processes (default: BRONZE_BATCH_MAX_WORKERS or CPU count).
+        Other arguments are as for `bronze_ingest`.
+
+    Returns:
+        Dictionary describing the created Bronze artifact, as returned by
+        `bronze_ingest`, plus the ingested `landing_keys`, the skipped
+        `duplicate_keys`, and per-file row counts and hashes (`file_records`,
+        `file_hashes`). When every file is a duplicate, nothing is written and
+        the result has `skipped=True` and `bronze_key=None`.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    logger = get_run_logger()
+    s3 = S3Client()
+
+    if not landing_keys:
+        raise ValueError("bronze_batch_ingest requires at least one landing key")
+
+    bronze_config = destination_config.get("bronzeConfig", {}) if destination_config else {}
+    custom_table_name = bronze_config.get("tableName")
+    effective_strategy = _effective_load_strategy(bronze_config, logger)
+
+    table_prefix = None
+    sequence = 1
+    if effective_strategy == "append":
+        table_prefix = _bronze_table_prefix(workflow_slug, job_slug, custom_table_name)
+        sequence = len(load_manifest(s3, table_prefix)["parts"]) + 1
+
+    bronze_filename, bronze_key = _build_bronze_key(
+        workflow_slug, job_slug, run_id, Path(landing_keys[0]).name, sequence=sequence,
+        load_strategy=effective_strategy,
+        custom_table_name=custom_table_name,
+    )
+
+    if not file_format or file_format == "csv":
+        file_format = detect_file_format(landing_keys[0])
+
+    file_options = dict(file_options or {})
+    if file_format == "csv":
+        file_options.setdefault("has_header", has_header)
+        file_options.setdefault("infer_schema_length", infer_schema_length)
+
+    rename_map = {}
+    if column_mappings:
+        rename_map = {mapping["sourceColumn"]: mapping["targetColumn"] for mapping in column_mappings}
+
+    ingested_at = datetime.utcnow()
+    file_records: dict[str, int] = {}
+    raw_schemas: dict[str, dict | None] = {}
+    failures: dict[str, str] = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+
+        skip_duplicates = _skip_duplicates(bronze_config)
+        file_hashes, duplicates, local_files = _check_batch_duplicates(
+            s3, job_id, landing_keys, skip_duplicates, tmp_dir_path, logger
+        )
+        if duplicates:
+            logger.info(f"Skipping {len(duplicates)} already processed landing files: {duplicates[:10]}{' ...' if len(duplicates) > 10 else ''}")
+        ingest_keys = [key for key in landing_keys if key in file_hashes]
+        if not ingest_keys:
+            return {
+                "workflow_id": workflow_id,
+                "job_id": job_id,
+                "workflow_slug": workflow_slug,
+                "job_slug": job_slug,
+                "run_id": run_id,
+                "bronze_key": None,
+                "records": 0,
+                "landing_key": landing_keys[0],
+                "landing_keys": [],
+                "duplicate_keys": duplicates,
+                "file_hash": None,
+                "file_hashes": {},
+                "skipped": True,
+                "skip_reason": "duplicate",
+                "environment": environment,
+            }
+
+        workers = min(max_workers or settings.bronze_batch_max_workers or os.cpu_count() or 1, len(ingest_keys))
+        logger.info(f"Starting Bronze batch ingest of {len(ingest_keys)} files with {workers} workers (strategy: {effective_strategy}, table: {custom_table_name or 'auto'})")
+
+        part_paths = {
+            key: str(tmp_dir_path / f"part_{index:05d}.parquet")
+            for index, key in enumerate(ingest_keys)
+        }
+
+        # Resolve the pinned schema once, against the first file's header; each
+        # worker checks its own file's header against it before reading with it
+        handler = get_file_handler(ingest_keys[0])
+        schema_prefix = _bronze_table_prefix(workflow_slug, job_slug, custom_table_name)
+        pin_schema = hasattr(handler, "read_header") and bronze_config.get("pinSchema", True)
+        pinned_schema = None
+        if pin_schema:
+            first_local = local_files.get(ingest_keys[0])
+            pinned_schema = _resolve_pinned_schema(
+                s3, handler, schema_prefix, ingest_keys[0], Path(first_local) if first_local else None,
+                file_options, column_mappings, file_format, bronze_config, run_id, logger,
+            )
+        schema_drift = bronze_config.get("schemaDrift", "evolve")
+
+        # Spawned workers avoid inheriting the flow's threads and open sockets
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {
+                pool.submit(
+                    _ingest_landing_file, key, local_files.get(key), file_options, rename_map, part_paths[key], ingested_at,
+                    pinned_schema, schema_drift,
+                ): key
+                for key in ingest_keys
+            }
+            for future, key in futures.items():
+                try:
+                    file_records[key], raw_schemas[key] = future.result()
+                    logger.info(f"   ✓ {key}: {file_records[key]} rows")
+                except Exception as e:
+                    failures[key] = str(e)
+                    logger.error(f"   ✗ {key}: {e}")
+
+        if failures:
+            raise RuntimeError(f"Bronze batch ingest failed for {len(failures)}/{len(ingest_keys)} files: {failures}")
+
+        # Coalesce the per-file parts without materializing the batch
+        local_parquet = tmp_dir_path / bronze_filename
+        lf = pl.concat(
+            [pl.scan_parquet(part_paths[key]) for key in ingest_keys],
+            how="diagonal_relaxed",
+        )
+        memory_budget_mb = bronze_config.get("memoryBudgetMb") or settings.bronze_memory_budget_mb
+        chunk_rows = streaming_chunk_rows(lf.head(1000).collect(), memory_budget_mb)
+        with pl.Config(streaming_chunk_size=chunk_rows):
+            sink_parquet(lf, local_parquet, row_group_size=chunk_rows)
+
+        record_count = sum(file_records.values())
+        df = read_parquet(local_parquet, n_rows=STREAMING_SAMPLE_ROWS)
+        logger.info(f"Coalesced {len(ingest_keys)} files into {record_count} rows, {df.width} columns")
+
+        s3.upload_file(local_parquet, bronze_key)
+
+        # As in bronze_ingest, the first file's schema is pinned when none applied
+        if pin_schema and not pinned_schema and raw_schemas[ingest_keys[0]]:
+            try:
+                pinned_schema = save_schema(
+                    s3, schema_prefix, raw_schemas[ingest_keys[0]],
+                    source="inferred", file_format=file_format, run_id=run_id,
+                    previous=load_schema(s3, schema_prefix),
+                )
+            except ValueError as e:
+                logger.warning(f"Schema not pinned: {e}")
+
+        part_records = record_count
+        record_count, table_bytes, bronze_parts = _register_append_part(
+            s3, table_prefix, bronze_key, local_parquet, part_records, run_id,
+            None, logger, source_files=len(ingest_keys),
+        )
+
+    logger.info("Bronze dataset created: s3://%s/%s", s3.bucket, bronze_key)
+
+    _catalog_and_profile_bronze(
+        job_id=job_id,
+        workflow_slug=workflow_slug,
+        job_slug=job_slug,
+        bronze_key=bronze_key,
+        record_count=record_count,
+        df=df,
+        environment=environment,
+        custom_table_name=custom_table_name,
+        file_size=table_bytes,
+        logger=logger,
+        table_prefix=table_prefix,
+    )
 
     return {
         "workflow_id": workflow_id,
@@ -296,8 +1187,485 @@ def bronze_ingest(
         "run_id": run_id,
         "bronze_key": bronze_key,
         "bronze_filename": bronze_filename,
-        "records": df.height,
+        "records": record_count,
+        "part_records": part_records,
+        "bronze_parts": bronze_parts,
+        "bronze_manifest_key": manifest_key(table_prefix) if table_prefix else None,
+        "columns": df.columns,
+        "landing_key": ingest_keys[0],
+        "landing_keys": ingest_keys,
+        "duplicate_keys": duplicates,
+        "file_records": file_records,
+        "file_hashes": file_hashes,
+        "ingest_mode": "batch",
+        "schema_version": pinned_schema["version"] if pinned_schema else None,
+        "environment": environment,
+    }
+
+
+def _sheet_part_key(bronze_key: str, index: int, sheet_name: str) -> str:
+    """S3 key of the Bronze part written for workbook sheet `index` (e.g. ..._v001_s02-orders.parquet)."""
+    suffix = f"s{index + 1:02d}"
+    if slugify(sheet_name):
+        suffix = f"{suffix}-{slugify(sheet_name)}"
+    return f"{bronze_key[:-len('.parquet')]}_{suffix}.parquet"
+
+
+def _excel_sheets_ingest(
+    *,
+    s3: S3Client,
+    handler,
+    workflow_id: str,
+    job_id: str,
+    workflow_slug: str,
+    job_slug: str,
+    run_id: str,
+    landing_key: str,
+    local_file: Path,
+    file_size: int,
+    file_hash: str | None,
+    file_options: dict,
+    rename_map: dict,
+    custom_table_name: str | None,
+    bronze_key: str,
+    table_prefix: str | None,
+    environment: str,
+    tmp_dir_path: Path,
+    logger,
+) -> dict:
+    """
+    Ingest the workbook sheets selected by file_options["sheets"] as one Bronze part per sheet.
+
+    Sheets are parsed concurrently (`ExcelHandler.read_sheets`) and each keeps its
+    own columns and types. The parts are listed, with their sheet name, in a
+    manifest that is the Bronze key of the file, as for a split CSV.
+    """
+    source_filename = Path(landing_key).name
+    ingested_at = datetime.utcnow()
+
+    sheets = handler.read_sheets(str(local_file), file_options)
+    if not sheets:
+        raise ValueError(f"No sheets selected in {landing_key}")
+
+    parts = []
+    samples = {}
+    for index, (sheet_name, df) in enumerate(sheets.items()):
+        if rename_map:
+            df = df.rename(rename_map, strict=False)
+        df = add_audit_columns(df, source_file=source_filename, timestamp=ingested_at)
+        df = df.with_columns(pl.lit(sheet_name).alias("_sheet_name"))
+
+        part_key = _sheet_part_key(bronze_key, index, sheet_name)
+        local_parquet = write_parquet(df, tmp_dir_path / Path(part_key).name)
+        s3.upload_file(local_parquet, part_key)
+        parts.append(build_part(
+            part_key, rows=df.height, num_bytes=local_parquet.stat().st_size, run_id=run_id,
+            source_file=source_filename, sheet=sheet_name,
+        ))
+        samples[sheet_name] = df.head(STREAMING_SAMPLE_ROWS)
+        logger.info(f"   ✓ sheet {index + 1}/{len(sheets)} '{sheet_name}': {df.height} rows, {df.width} columns")
+    del sheets
+
+    part_records = sum(part["rows"] for part in parts)
+    dataset_key = parts_manifest_key(bronze_key)
+    write_parts_manifest(s3, dataset_key, parts)
+
+    if table_prefix:
+        manifest = register_parts(s3, table_prefix, parts)
+        record_count = manifest["total_rows"]
+        table_bytes = manifest["total_bytes"]
+        bronze_parts = [part["key"] for part in manifest["parts"]]
+    else:
+        record_count = part_records
+        table_bytes = sum(part["bytes"] for part in parts)
+        bronze_parts = [part["key"] for part in parts]
+
+    df = pl.concat(list(samples.values()), how="diagonal_relaxed")
+    logger.info("Bronze dataset created: %d sheet parts listed in s3://%s/%s", len(parts), s3.bucket, dataset_key)
+
+    _catalog_and_profile_bronze(
+        job_id=job_id,
+        workflow_slug=workflow_slug,
+        job_slug=job_slug,
+        bronze_key=dataset_key,
+        record_count=record_count,
+        df=df,
+        environment=environment,
+        custom_table_name=custom_table_name,
+        file_size=table_bytes,
+        logger=logger,
+        table_prefix=table_prefix,
+    )
+
+    return {
+        "workflow_id": workflow_id,
+        "job_id": job_id,
+        "workflow_slug": workflow_slug,
+        "job_slug": job_slug,
+        "run_id": run_id,
+        "bronze_key": dataset_key,
+        "bronze_filename": Path(dataset_key).name,
+        "records": record_count,
+        "part_records": part_records,
+        "bronze_parts": bronze_parts,
+        "bronze_manifest_key": manifest_key(table_prefix) if table_prefix else None,
+        "sheet_parts": {part["sheet"]: part["key"] for part in parts},
+        "columns": df.columns,
+        "landing_key": landing_key,
+        "file_hash": file_hash,
+        "file_size": file_size,
+        "ingest_mode": "sheets",
+        "schema_version": None,
+        "environment": environment,
+    }
+
+
+def _split_workers(bronze_config: dict, file_format: str, source_filename: str, file_size: int, file_options: dict) -> int:
+    """
+    Return the worker count for a byte-range split ingest, or 0 to ingest the file as a whole.
+
+    Only plain (uncompressed) UTF-8 CSVs can be split. bronzeConfig.ingestMode "split"
+    forces splitting; "auto" splits files at or above the split threshold when more
+    than one worker is available.
+    """
+    if file_format != "csv" or compression_of(source_filename):
+        return 0
+    if file_options.get("encoding", "utf-8").lower().replace("-", "") not in ("utf8", "utf8lossy"):
+        return 0
+
+    workers = bronze_config.get("splitWorkers") or settings.bronze_split_max_workers or os.cpu_count() or 1
+    ingest_mode = bronze_config.get("ingestMode", "auto")
+    if ingest_mode == "split":
+        return workers
+    threshold_mb = settings.bronze_split_threshold_mb
+    if ingest_mode == "auto" and threshold_mb and file_size >= threshold_mb * 1024 * 1024 and workers > 1:
+        return workers
+    return 0
+
+
+def _range_part_key(bronze_key: str, index: int) -> str:
+    """S3 key of the Bronze part written for byte range `index` (e.g. ..._v001_r0003.parquet)."""
+    return f"{bronze_key[:-len('.parquet')]}_r{index + 1:04d}.parquet"
+
+
+def _ingest_csv_range(
+    landing_key: str,
+    local_file: str | None,
+    start: int,
+    end: int,
+    csv_options: dict,
+    schema: dict,
+    rename_map: dict,
+    part_path: str,
+    ingested_at: datetime,
+) -> int:
+    """
+    Parse one byte range of a CSV into a local Parquet part (runs in a split ingest worker process).
+
+    The range is read from the local copy or with a single S3 range GET. Its
+    `_row_number` starts at 1: the global offset is only known once every range
+    is counted, and is added by `_upload_csv_range`.
+
+    Returns:
+        Rows written.
+    """
+    import io
+
+    global _worker_s3
+    if _worker_s3 is None:
+        _worker_s3 = S3Client()
+
+    if local_file:
+        with open(local_file, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+    else:
+        data = _worker_s3.read_range(landing_key, start, end)
+
+    df = pl.read_csv(
+        io.BytesIO(data),
+        has_header=False,
+        schema=schema,
+        separator=csv_options["delimiter"],
+        quote_char=csv_options["quote_char"],
+        encoding=csv_options["encoding"],
+        try_parse_dates=False,
+        ignore_errors=False,
+    )
+    del data
+
+    if rename_map:
+        df = df.rename({k: v for k, v in rename_map.items() if k in df.columns})
+
+    df = add_audit_columns(df, source_file=Path(landing_key).name, timestamp=ingested_at)
+    write_parquet(df, part_path)
+    return df.height
+
+
+def _upload_csv_range(part_path: str, part_key: str, row_offset: int) -> int:
+    """
+    Shift a range part's `_row_number` by the rows of the earlier ranges and upload it.
+
+    The part is rewritten with a streaming scan, so it is never loaded whole.
+
+    Returns:
+        Size of the uploaded part in bytes.
+    """
+    global _worker_s3
+    if _worker_s3 is None:
+        _worker_s3 = S3Client()
+
+    if row_offset:
+        shifted_path = Path(part_path).with_name(f"{Path(part_path).stem}_offset.parquet")
+        sink_parquet(
+            pl.scan_parquet(part_path).with_columns(pl.col("_row_number") + row_offset),
+            shifted_path,
+        )
+        Path(part_path).unlink()
+        part_path = str(shifted_path)
+    _worker_s3.upload_file(part_path, part_key)
+    return Path(part_path).stat().st_size
+
+
+# Bytes of the file head used to infer column types for a split ingest
+SPLIT_SAMPLE_BYTES = 16 * 1024 * 1024
+
+
+def _split_csv_ingest(
+    *,
+    s3: S3Client,
+    handler,
+    workflow_id: str,
+    job_id: str,
+    workflow_slug: str,
+    job_slug: str,
+    run_id: str,
+    landing_key: str,
+    local_file: Path | None,
+    file_size: int,
+    file_hash: str | None,
+    file_format: str,
+    file_options: dict,
+    column_mappings: list[dict] | None,
+    rename_map: dict,
+    bronze_config: dict,
+    bronze_key: str,
+    table_prefix: str | None,
+    workers: int,
+    environment: str,
+    tmp_dir_path: Path,
+    logger,
+) -> dict | None:
+    """
+    Ingest one large CSV as record-aligned byte ranges parsed in parallel processes.
+
+    Every range is written as its own Bronze part with a global `_row_number`.
+    Ranges are read from a local copy of the file, or with S3 range GETs when
+    bronzeConfig.splitRangeGets is set. All ranges share one schema: the table's
+    pinned schema, or types inferred from the head of the file.
+
+    Returns:
+        The `bronze_ingest` result, or None if a range does not parse with the
+        sampled types (its parts are removed and the caller ingests the file as a whole).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import io
+    import multiprocessing
+
+    from utils.csv_split import find_data_start, local_reader, record_start_after, split_csv_ranges
+
+    source_filename = Path(landing_key).name
+    custom_table_name = bronze_config.get("tableName")
+
+    if local_file is None and not bronze_config.get("splitRangeGets", False):
+        local_file = tmp_dir_path / source_filename
+        s3.download_file(landing_key, local_file)
+    if local_file is not None:
+        read_at = local_reader(str(local_file))
+    else:
+        def read_at(offset: int, length: int) -> bytes:
+            return s3.read_range(landing_key, offset, offset + length)
+
+    csv_options = {
+        "delimiter": file_options.get("delimiter", ","),
+        "quote_char": file_options.get("quote_char", '"'),
+        "encoding": "utf8-lossy" if "lossy" in file_options.get("encoding", "utf-8").lower() else "utf8",
+    }
+    data_start, num_columns = find_data_start(
+        read_at,
+        has_header=file_options.get("has_header", True),
+        skip_rows=file_options.get("skip_rows", 0),
+        delimiter=csv_options["delimiter"],
+        quote_char=csv_options["quote_char"],
+    )
+    # Ranges are at least bronze_split_range_mb, and never more than 10,000 parts
+    range_bytes = max(settings.bronze_split_range_mb * 1024 * 1024, (file_size - data_start) // 10_000 + 1)
+    ranges = split_csv_ranges(
+        read_at, file_size,
+        data_start=data_start, num_columns=num_columns, range_bytes=range_bytes,
+        delimiter=csv_options["delimiter"], quote_char=csv_options["quote_char"],
+    )
+    logger.info(f"Split {source_filename} ({file_size} bytes) into {len(ranges)} byte ranges for {min(workers, len(ranges))} workers")
+
+    # One schema for every range: the pinned one, or inferred from the file head
+    schema_prefix = _bronze_table_prefix(workflow_slug, job_slug, custom_table_name)
+    pinned_schema = None
+    if bronze_config.get("pinSchema", True):
+        pinned_schema = _resolve_pinned_schema(
+            s3, handler, schema_prefix, landing_key, local_file, file_options,
+            column_mappings, file_format, bronze_config, run_id, logger,
+        )
+    if pinned_schema:
+        schema = to_polars_schema(pinned_schema)
+    else:
+        sample_end = min(
+            ranges[0][1] if ranges else file_size,
+            record_start_after(read_at, data_start, data_start + SPLIT_SAMPLE_BYTES, file_size, quote_char=csv_options["quote_char"]),
+        )
+        schema = dict(pl.read_csv(
+            io.BytesIO(read_at(0, sample_end)),
+            has_header=file_options.get("has_header", True),
+            separator=csv_options["delimiter"],
+            quote_char=csv_options["quote_char"],
+            encoding=csv_options["encoding"],
+            skip_rows=file_options.get("skip_rows", 0),
+            try_parse_dates=True,
+            infer_schema_length=None,
+        ).schema)
+        logger.info(f"Inferred {len(schema)} column types from the first {sample_end} bytes")
+
+    ingested_at = datetime.utcnow()
+    part_keys = [_range_part_key(bronze_key, index) for index in range(len(ranges))]
+    part_paths = [str(tmp_dir_path / f"range_{index:05d}.parquet") for index in range(len(ranges))]
+    part_rows: dict[int, int] = {}
+    part_bytes: dict[int, int] = {}
+    failures: dict[int, Exception] = {}
+
+    def range_error(error: Exception) -> str:
+        return str(error).splitlines()[0] if str(error) else type(error).__name__
+
+    # Spawned workers avoid inheriting the flow's threads and open sockets
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges)), mp_context=context) as pool:
+        # Parse every range independently; each part is numbered from 1
+        futures = [
+            pool.submit(
+                _ingest_csv_range, landing_key, str(local_file) if local_file else None, start, end,
+                csv_options, schema, rename_map, part_paths[index], ingested_at,
+            )
+            for index, (start, end) in enumerate(ranges)
+        ]
+        for index, future in enumerate(futures):
+            try:
+                part_rows[index] = future.result()
+                logger.info(f"   ✓ range {index + 1}/{len(ranges)} [{ranges[index][0]}, {ranges[index][1]}): {part_rows[index]} rows")
+            except Exception as e:
+                failures[index] = e
+                logger.error(f"   ✗ range {index + 1}/{len(ranges)}: {range_error(e)}")
+
+        if failures:
+            # Nothing was uploaded yet
+            first_failure = failures[min(failures)]
+            if isinstance(first_failure, pl.exceptions.PolarsError):
+                logger.warning(f"Byte range {min(failures) + 1} does not parse with the sampled column types - ingesting the file as a whole")
+                return None
+            raise RuntimeError(f"Split CSV ingest failed for {len(failures)}/{len(ranges)} byte ranges: {first_failure}")
+
+        # All counts are known: shift each part to its global row numbers and upload it
+        row_offsets = []
+        row_offset = 0
+        for index in range(len(ranges)):
+            row_offsets.append(row_offset)
+            row_offset += part_rows[index]
+        futures = [
+            pool.submit(_upload_csv_range, part_paths[index], part_keys[index], row_offsets[index])
+            for index in range(len(ranges))
+        ]
+        for index, future in enumerate(futures):
+            try:
+                part_bytes[index] = future.result()
+            except Exception as e:
+                failures[index] = e
+                logger.error(f"   ✗ upload of range {index + 1}/{len(ranges)}: {range_error(e)}")
+
+    if failures:
+        for index in part_bytes:
+            try:
+                s3.delete_file(part_keys[index])
+            except Exception as e:
+                logger.warning(f"Failed to remove part {part_keys[index]}: {e}")
+        raise RuntimeError(f"Split CSV ingest failed to upload {len(failures)}/{len(ranges)} parts: {failures[min(failures)]}")
+
+    part_records = sum(part_rows.values())
+    logger.info(f"Wrote {len(ranges)} Bronze parts, {part_records} rows")
+
+    if not pinned_schema:
+        try:
+            pinned_schema = save_schema(
+                s3, schema_prefix, schema,
+                source="inferred", file_format=file_format, run_id=run_id,
+                previous=load_schema(s3, schema_prefix),
+            )
+        except ValueError as e:
+            logger.warning(f"Schema not pinned: {e}")
+
+    parts = [
+        build_part(
+            part_keys[index], rows=part_rows[index], num_bytes=part_bytes[index], run_id=run_id,
+            source_file=source_filename, byte_range=[start, end], row_offset=row_offsets[index],
+        )
+        for index, (start, end) in enumerate(ranges)
+    ]
+    # The parts of this file are one dataset: its manifest is the Bronze key, so
+    # the key and the record count describe the same rows
+    dataset_key = parts_manifest_key(bronze_key)
+    write_parts_manifest(s3, dataset_key, parts)
+
+    if table_prefix:
+        manifest = register_parts(s3, table_prefix, parts)
+        record_count = manifest["total_rows"]
+        table_bytes = manifest["total_bytes"]
+        bronze_parts = [part["key"] for part in manifest["parts"]]
+    else:
+        record_count = part_records
+        table_bytes = sum(part_bytes.values())
+        bronze_parts = part_keys
+
+    df = read_parquet(part_paths[0], n_rows=STREAMING_SAMPLE_ROWS)
+    logger.info("Bronze dataset created: %d parts listed in s3://%s/%s", len(part_keys), s3.bucket, dataset_key)
+
+    _catalog_and_profile_bronze(
+        job_id=job_id,
+        workflow_slug=workflow_slug,
+        job_slug=job_slug,
+        bronze_key=dataset_key,
+        record_count=record_count,
+        df=df,
+        environment=environment,
+        custom_table_name=custom_table_name,
+        file_size=table_bytes,
+        logger=logger,
+        table_prefix=table_prefix,
+    )
+
+    return {
+        "workflow_id": workflow_id,
+        "job_id": job_id,
+        "workflow_slug": workflow_slug,
+        "job_slug": job_slug,
+        "run_id": run_id,
+        "bronze_key": dataset_key,
+        "bronze_filename": Path(dataset_key).name,
+        "records": record_count,
+        "part_records": part_records,
+        "bronze_parts": bronze_parts,
+        "bronze_manifest_key": manifest_key(table_prefix) if table_prefix else None,
         "columns": df.columns,
         "landing_key": landing_key,
+        "file_hash": file_hash,
+        "file_size": file_size,
+        "ingest_mode": "split",
+        "byte_ranges": len(ranges),
+        "schema_version": pinned_schema["version"] if pinned_schema else None,
         "environment": environment,
     }
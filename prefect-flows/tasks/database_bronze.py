@@ -5,21 +5,53 @@ Reads data from databases (SQL Server, PostgreSQL, etc.) and writes to Bronze la
 
 from prefect import task
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import os
 import tempfile
 
 from utils.database_connectors import SQLServerConnector, PostgreSQLConnector, MySQLConnector
 from utils.s3 import S3Client
+from utils.bronze_parts import build_part, parts_manifest_key, write_parts_manifest
+from utils.schema_cache import load_database_metadata
+from utils.table_sampler import sample_table
+from utils.extract_checkpoint import can_resume, key_value, load_checkpoint, new_checkpoint, save_checkpoint
+from utils.range_sync import (
+    DEFAULT_FANOUT,
+    DEFAULT_LEAF_ROWS,
+    apply_leaves,
+    bucket_range,
+    find_changed_leaves,
+    leaf_width_for,
+    load_sync_state,
+    merge_ranges,
+    new_sync_state,
+    save_pending_state,
+    top_level,
+)
 from utils.ai_quality_profiler import AIQualityProfiler
 from utils.metadata_catalog import catalog_bronze_asset, update_job_execution_metrics
 import polars as pl
 import requests
 
 
+# Rows fetched from the source per batch (overridable with databaseConfig.batchSize)
+DEFAULT_BATCH_SIZE = 10000
+# Rows kept from the head of an extraction for cataloging and AI profiling
+SAMPLE_ROWS = 10000
+# Rows per checkpointed page of a keyset-paged incremental load
+DEFAULT_PAGE_ROWS = 1_000_000
+# Estimated rows per partition when databaseConfig.partitions is "auto"
+TARGET_PARTITION_ROWS = 5_000_000
+MAX_AUTO_PARTITIONS = 8
+# Key ranges combined into one query of a checksum range sync
+SYNC_RANGES_PER_QUERY = 200
+
 @task(name="ingest-from-database", retries=2, retry_delay_seconds=30)
 def ingest_from_database(
     workflow_id: str,
@@ -53,7 +85,22 @@ def ingest_from_database(
                 "storedProcedure": str (optional),
                 "isIncremental": bool,
                 "deltaColumn": str (optional),
-                "lastWatermark": str (optional)
+                "lastWatermark": str (optional),
+                "primaryKey": str | list (optional, defaults to silverConfig.primaryKey;
+                    pages incremental loads by (deltaColumn, primaryKey) with checkpoints),
+                "pageSize": int (optional, rows per checkpointed page),
+                "batchSize": int (optional, rows per fetch),
+                "extractMode": "cursor" | "copy" (optional, "copy" is PostgreSQL only),
+                "partitionColumn": str (optional, split a table load on this column),
+                "partitions": int | "auto" (optional, concurrent partition extracts;
+                    "auto" sizes them from table statistics),
+                "maxPartitions": int (optional, cap for "auto", default 8),
+                "partitionStrategy": "auto" | "range" | "hash" (optional),
+                "syncMode": "checksum" (optional, pull only primary key ranges whose
+                    checksums changed, including deletes; needs a single integer
+                    primaryKey and silverConfig.mergeStrategy "merge"),
+                "syncLeafRows": int (optional, rows per checksummed key range),
+                "syncFanout": int (optional, sub-ranges per mismatching range)
             }
         }
         destination_config: {
@@ -75,9 +122,15 @@ def ingest_from_database(
             "bronze_file_path": str,
             "file_size_bytes": int,
             "schema": list,
-            "watermark_value": str (if incremental)
+            "watermark_value": str (if incremental),
+            "bronze_parts": list (if a partitioned or paged load wrote several parts),
+            "pages": int (if the load was keyset-paged),
+            "sync": dict (if the load was a checksum range sync: key_column,
+                ranges replaced in Silver (None: the whole table), state_key,
+                changed_leaves)
         }
     """
+    resumable = False
     try:
         print(f"\n{'='*60}")
         print(f"Database Bronze Ingestion - Job: {job_id}")
@@ -92,7 +145,7 @@ def ingest_from_database(
 
         # Initialize database connector
         print(f"1. Initializing {db_type} connector...")
-        connector = _get_connector(db_type, connection_config)
+        connector = get_connector(db_type, connection_config)
         print(f"   Connected to: {connection_config.get('database')}")
 
         # Determine what to read
@@ -102,99 +155,277 @@ def ingest_from_database(
         delta_column = database_config.get('deltaColumn')
         last_watermark = database_config.get('lastWatermark')
 
-        # Read data from database
+        # Incremental table loads with a primary key are paged by (delta_column, pk)
+        # and checkpointed, so a failed load resumes after the last committed page
+        primary_key = database_config.get('primaryKey') or (destination_config.get('silverConfig') or {}).get('primaryKey')
+        key_columns = None
+        if is_incremental and delta_column and primary_key and table_name and not custom_query:
+            primary_keys = [primary_key] if isinstance(primary_key, str) else list(primary_key)
+            key_columns = [delta_column] + [column for column in primary_keys if column != delta_column]
+            resumable = True
+
+        # Checksum range sync: pull only the primary key ranges whose checksums
+        # changed since the last sync (tables without a reliable delta column)
+        sync_key_column = None
+        if database_config.get('syncMode') == 'checksum':
+            sync_keys = [primary_key] if isinstance(primary_key, str) else list(primary_key or [])
+            merge_strategy = (destination_config.get('silverConfig') or {}).get('mergeStrategy')
+            if custom_query or not table_name or len(sync_keys) != 1:
+                print(f"   WARNING: checksum sync needs a table with a single-column primary key, running a full load")
+            elif merge_strategy != 'merge':
+                print(f"   WARNING: checksum sync needs silverConfig.mergeStrategy 'merge', running a full load")
+            else:
+                sync_key_column = sync_keys[0]
+                key_columns = None
+                resumable = False
+
+        # Build the extraction query
         print(f"\n2. Reading data from database...")
         if custom_query:
             print(f"   Executing custom query: {custom_query[:100]}...")
-            arrow_table = connector.read_query(custom_query)
+            query = custom_query
+        elif sync_key_column:
+            print(f"   Checksum range sync of: {table_name} (key: {sync_key_column})")
+            query = None
+        elif key_columns:
+            print(f"   Keyset-paged incremental load from: {table_name}")
+            print(f"   Key: ({', '.join(key_columns)}), Last watermark: {last_watermark}")
+            query = None
         elif is_incremental and delta_column and last_watermark:
             print(f"   Incremental load from: {table_name}")
             print(f"   Delta column: {delta_column}, Last watermark: {last_watermark}")
-            arrow_table = connector.get_incremental_data(
-                table_name=table_name,
-                delta_column=delta_column,
-                last_value=last_watermark
+            query = connector.build_select(
+                table_name,
+                where_clause=connector.incremental_where(delta_column, last_watermark),
+                order_by=delta_column
             )
         else:
             print(f"   Full load from table: {table_name}")
-            arrow_table = connector.read_table(table_name)
-
-        # Close connector
-        connector.close()
-
-        # Check if data is empty
-        if arrow_table.num_rows == 0:
-            print(f"   WARNING: No data returned from source")
-            return {
-                "status": "success",
-                "records_processed": 0,
-                "bronze_file_path": None,
-                "file_size_bytes": 0,
-                "message": "No new data to process"
-            }
-
-        print(f"   Records read: {arrow_table.num_rows}")
-        print(f"   Columns: {arrow_table.num_columns}")
-        print(f"   Memory size: {arrow_table.nbytes / 1024:.2f} KB")
-
-        # Add audit columns
-        if bronze_config.get('auditColumns', True):
-            print(f"\n3. Adding audit columns...")
-            arrow_table = _add_audit_columns(
-                arrow_table,
-                batch_id=batch_id,
-                source_system=db_type,
-                source_file=table_name or 'custom_query'
-            )
-            print(f"   Added 5 audit columns")
+            query = connector.build_select(table_name)
 
         # Prepare output path
         bronze_table_name = bronze_config.get('tableName') or table_name or f"{workflow_slug}_{job_slug}_bronze"
         date_folder = datetime.utcnow().strftime("%Y%m%d")
         output_filename = bronze_config.get('fileName') or f"{bronze_table_name}_{run_id}_v001.parquet"
         s3_key = bronze_config.get('s3Key') or f"bronze/{bronze_table_name}/{date_folder}/{output_filename}"
-
-        # Write to Parquet locally first
-        print(f"\n4. Writing to Parquet...")
-        temp_dir = tempfile.gettempdir()
-        local_temp_path = os.path.join(temp_dir, output_filename)
         compression = bronze_config.get('compression', 'snappy')
-
-        pq.write_table(
-            arrow_table,
-            local_temp_path,
-            compression=compression,
-            use_dictionary=True,
-            write_statistics=True
-        )
-
-        file_size = os.path.getsize(local_temp_path)
-        print(f"   File size: {file_size / 1024:.2f} KB")
-        print(f"   Compression: {compression}")
-
-        # Upload to S3/MinIO
-        print(f"\n5. Uploading to MinIO...")
-        print(f"   S3 Key: {s3_key}")
-
+        batch_size = database_config.get('batchSize') or DEFAULT_BATCH_SIZE
+        audit = None
+        if bronze_config.get('auditColumns', True):
+            audit = {
+                "batch_id": batch_id,
+                "source_system": db_type,
+                "source_file": table_name or 'custom_query',
+                "ingestion_time": datetime.now(),
+            }
+        watermark_column = delta_column if is_incremental and not sync_key_column else None
+
+        # Large tables: extract disjoint partitions concurrently, one Parquet part each
+        partition_column = database_config.get('partitionColumn')
+        partitions = database_config.get('partitions') or 1
+        if partition_column and (key_columns or sync_key_column):
+            print(f"   WARNING: keyset-paged and checksum sync loads are not partitioned, ignoring partitionColumn")
+            partition_column = None
+        if partition_column and partitions == 'auto' and table_name and not custom_query:
+            partitions = _auto_partitions(connector, table_name, database_config)
+        partitions = int(partitions) if partitions != 'auto' else 1
+        partition_queries = None
+        if partition_column and partitions > 1:
+            if custom_query:
+                print(f"   WARNING: partitioned extraction needs a table, reading the custom query serially")
+            else:
+                base_where = None
+                if is_incremental and delta_column and last_watermark:
+                    base_where = connector.incremental_where(delta_column, last_watermark)
+                predicates = connector.partition_predicates(
+                    table_name,
+                    partition_column,
+                    partitions,
+                    strategy=database_config.get('partitionStrategy', 'auto'),
+                    where_clause=base_where
+                )
+                partition_queries = [connector.build_select(table_name, where_clause=predicate) for predicate in predicates]
+                print(f"   Partitioned on {partition_column} into {len(partition_queries)} ranges")
+
+        # Stream batches from the source straight into Parquet files, so memory
+        # stays flat regardless of table size. The temp directory is private to
+        # this run, so concurrent runs never share a file name.
         s3_client = S3Client()
-        s3_url = s3_client.upload_file(
-            local_path=local_temp_path,
-            s3_key=s3_key
-        )
-        print(f"   Upload complete: {s3_url}")
+        sync = None
+        with tempfile.TemporaryDirectory(prefix="flowforge_db_") as temp_dir:
+            if sync_key_column:
+                print(f"\n3. Comparing range checksums and streaming changed ranges to Parquet...")
+                local_temp_path = os.path.join(temp_dir, output_filename)
+                try:
+                    sync = _extract_checksum_sync(
+                        connector,
+                        s3_client,
+                        table_name,
+                        sync_key_column,
+                        table_prefix=f"bronze/{bronze_table_name}/",
+                        job_id=job_id,
+                        run_id=run_id,
+                        local_path=local_temp_path,
+                        database_config=database_config,
+                        batch_size=batch_size,
+                        audit=audit,
+                        compression=compression
+                    )
+                finally:
+                    connector.close()
+                if sync is None:
+                    print(f"   No range checksums changed since the last sync")
+                    return {
+                        "status": "success",
+                        "records_processed": 0,
+                        "bronze_file_path": None,
+                        "file_size_bytes": 0,
+                        "message": "No changes since the last checksum sync"
+                    }
+                extracts = [sync.pop("extract")]
+                part_keys = [s3_key]
+                local_paths = [local_temp_path]
+            elif key_columns:
+                page_rows = int(database_config.get('pageSize') or DEFAULT_PAGE_ROWS)
+                print(f"\n3. Streaming pages of {page_rows} rows to Parquet...")
+                try:
+                    extracts, part_keys = _extract_keyset_pages(
+                        connector,
+                        s3_client,
+                        table_name,
+                        key_columns,
+                        last_watermark,
+                        table_prefix=f"bronze/{bronze_table_name}/",
+                        job_id=job_id,
+                        run_id=run_id,
+                        s3_key=s3_key,
+                        temp_dir=temp_dir,
+                        database_config=database_config,
+                        batch_size=batch_size,
+                        page_rows=page_rows,
+                        audit=audit,
+                        compression=compression
+                    )
+                finally:
+                    connector.close()
+                local_paths = None
+            elif partition_queries is None:
+                print(f"\n3. Streaming to Parquet in batches of {batch_size} rows...")
+                local_temp_path = os.path.join(temp_dir, output_filename)
+                try:
+                    extracts = [_extract_to_parquet(
+                        _iter_source_batches(connector, query, database_config, batch_size),
+                        local_temp_path,
+                        audit=audit,
+                        compression=compression,
+                        watermark_column=watermark_column
+                    )]
+                finally:
+                    connector.close()
+                part_keys = [s3_key]
+                local_paths = [local_temp_path]
+            else:
+                print(f"\n3. Streaming {len(partition_queries)} partitions to Parquet in parallel...")
+                local_paths = [os.path.join(temp_dir, f"part_{index:05d}.parquet") for index in range(len(partition_queries))]
+                part_keys = [_partition_part_key(s3_key, index) for index in range(len(partition_queries))]
+                extracts = _extract_partitions(
+                    db_type,
+                    connection_config,
+                    partition_queries,
+                    local_paths,
+                    database_config=database_config,
+                    batch_size=batch_size,
+                    audit=audit,
+                    compression=compression,
+                    watermark_column=watermark_column
+                )
+                connector.close()
+
+            row_count = sum(extract["rows"] for extract in extracts)
+
+            # Check if data is empty (a checksum sync of emptied ranges still
+            # writes an empty part, so Silver applies the deletes)
+            if row_count == 0 and not (sync and sync["ranges"] and extracts[0]["schema"] is not None):
+                print(f"   WARNING: No data returned from source")
+                return {
+                    "status": "success",
+                    "records_processed": 0,
+                    "bronze_file_path": None,
+                    "file_size_bytes": 0,
+                    "message": "No new data to process"
+                }
 
-        # Clean up local file
-        os.remove(local_temp_path)
+            # Empty partitions are not written to Bronze
+            written = [index for index, extract in enumerate(extracts) if extract["rows"] or sync]
+            part_keys = [part_keys[index] for index in written]
+            output_schema = next((extracts[index]["schema"] for index in written if extracts[index]["schema"]), None)
+            if output_schema is None:
+                # Every page was committed by an earlier attempt
+                head = _read_part_head(s3_client, part_keys[0])
+                output_schema = head.schema
+                extracts[written[0]]["sample"] = [head]
+            sample_batches = []
+            sample_rows = 0
+            for index in written:
+                for sample in extracts[index]["sample"]:
+                    if sample_rows < SAMPLE_ROWS and sample.schema == output_schema:
+                        sample_batches.append(sample.slice(0, SAMPLE_ROWS - sample_rows))
+                        sample_rows += sample_batches[-1].num_rows
+            print(f"   Records read: {row_count}")
+            print(f"   Columns: {len(output_schema)}")
+            if audit:
+                print(f"   Added 5 audit columns")
+
+            file_size = sum(extracts[index]["file_size"] for index in written)
+            print(f"   File size: {file_size / 1024:.2f} KB")
+            print(f"   Compression: {compression}")
+
+            # Upload to S3/MinIO
+            print(f"\n4. Uploading to MinIO...")
+            print(f"   S3 Key: {part_keys[0]}" + (f" (+{len(part_keys) - 1} parts)" if len(part_keys) > 1 else ""))
+
+            if local_paths is None:
+                # Keyset pages were uploaded and checkpointed as they were extracted
+                s3_url = f"s3://{s3_client.bucket}/{part_keys[0]}"
+            elif len(part_keys) == 1:
+                s3_url = s3_client.upload_file(
+                    local_path=local_paths[written[0]],
+                    s3_key=part_keys[0]
+                )
+            else:
+                s3_client.upload_many([(local_paths[index], key) for index, key in zip(written, part_keys)])
+                s3_url = f"s3://{s3_client.bucket}/{part_keys[0]}"
+            if len(part_keys) == 1:
+                s3_key = part_keys[0]
+            else:
+                # The parts are one dataset: its manifest is the Bronze key, so
+                # the key and the record count describe the same rows
+                s3_key = parts_manifest_key(s3_key)
+                write_parts_manifest(s3_client, s3_key, [
+                    build_part(
+                        key, rows=extracts[index]["rows"], num_bytes=extracts[index]["file_size"],
+                        run_id=run_id, source_file=table_name,
+                    )
+                    for index, key in zip(written, part_keys)
+                ])
+                s3_url = f"s3://{s3_client.bucket}/{s3_key}"
+            print(f"   Upload complete: {s3_url}")
+
+            if sync:
+                # Silver commits the state once it has merged these ranges
+                sync["state_key"] = save_pending_state(s3_client, f"bronze/{bronze_table_name}/", sync.pop("state"))
 
         # Calculate new watermark if incremental
         watermark_value = None
-        if is_incremental and delta_column:
-            # Get max value of delta column
-            watermark_value = _get_max_watermark(arrow_table, delta_column)
-            print(f"\n6. New watermark: {delta_column} = {watermark_value}")
+        if watermark_column:
+            watermark_max = None
+            for extract in extracts:
+                if extract["watermark"] is not None and (watermark_max is None or extract["watermark"] > watermark_max):
+                    watermark_max = extract["watermark"]
+            watermark_value = _format_watermark(watermark_max)
+            print(f"\n5. New watermark: {delta_column} = {watermark_value}")
 
-        row_count = arrow_table.num_rows
-        column_names = [field.name for field in arrow_table.schema]
+        column_names = [field.name for field in output_schema]
 
         # Prepare result payload required by downstream Silver/Gold tasks
         result = {
@@ -216,7 +447,7 @@ def ingest_from_database(
                     "name": field.name,
                     "type": str(field.type)
                 }
-                for field in arrow_table.schema
+                for field in output_schema
             ],
             "compression": compression,
             "table_name": bronze_table_name,
@@ -226,8 +457,17 @@ def ingest_from_database(
         if watermark_value:
             result["watermark_value"] = watermark_value
 
-        # Convert to Polars for downstream processing (metadata + AI)
-        df_polars = pl.from_arrow(arrow_table)
+        if partition_queries is not None:
+            result["partitions"] = len(partition_queries)
+        if len(part_keys) > 1:
+            result["bronze_parts"] = part_keys
+        if key_columns:
+            result["pages"] = len(part_keys)
+        if sync:
+            result["sync"] = sync
+
+        # Convert the sampled head to Polars for downstream processing (metadata + AI)
+        df_polars = pl.from_arrow(pa.concat_tables(sample_batches) if sample_batches else output_schema.empty_table())
 
         # Catalog dataset in FlowForge metadata store
         try:
@@ -240,6 +480,7 @@ def ingest_from_database(
                 dataframe=df_polars,
                 environment=environment,
                 custom_table_name=bronze_table_name,
+                file_size=file_size,
             )
             print(f"   Cataloged bronze asset: {asset_id}")
         except Exception as e:
@@ -257,7 +498,7 @@ def ingest_from_database(
 
         # Run AI Quality Profiler to generate quality rule suggestions
         try:
-            print(f"\n7. Running AI Quality Profiler...")
+            print(f"\n6. Running AI Quality Profiler...")
             profiler = AIQualityProfiler()
 
             # Use bronze table name for profiling
@@ -281,7 +522,7 @@ def ingest_from_database(
         print(f"\n{'='*60}")
         print(f"Database Bronze Ingestion Complete")
         print(f"Status: SUCCESS")
-        print(f"Records: {arrow_table.num_rows}")
+        print(f"Records: {row_count}")
         print(f"File: {s3_url}")
         print(f"{'='*60}\n")
 
@@ -293,6 +534,10 @@ def ingest_from_database(
         import traceback
         traceback.print_exc()
 
+        if resumable:
+            # Let the task retries resume from the last checkpointed page
+            raise
+
         return {
             "status": "failed",
             "error": error_msg,
@@ -300,7 +545,7 @@ def ingest_from_database(
         }
 
 
-def _get_connector(db_type: str, connection_config: Dict[str, Any]):
+def get_connector(db_type: str, connection_config: Dict[str, Any]):
     """
     Get appropriate database connector based on type
 
@@ -330,17 +575,469 @@ def _get_connector(db_type: str, connection_config: Dict[str, Any]):
             timeout=connection_config.get('timeout', 30)
         )
     elif db_type == 'mysql':
-        # Placeholder for future implementation
-        raise NotImplementedError("MySQL connector not yet implemented")
+        return MySQLConnector(
+            host=connection_config.get('host', 'localhost'),
+            port=connection_config.get('port', 3306),
+            database=connection_config.get('database'),
+            username=connection_config.get('username'),
+            password=connection_config.get('password'),
+            timeout=connection_config.get('timeout', 30)
+        )
     else:
         raise ValueError(f"Unsupported database type: {db_type}")
 
 
+def _iter_source_batches(
+    connector,
+    query: str,
+    database_config: Dict[str, Any],
+    batch_size: int,
+    snapshot: Optional[str] = None
+):
+    """
+    Stream the rows of an extraction query as Arrow RecordBatches
+
+    databaseConfig.extractMode selects the extraction engine:
+    - "cursor" (default): DB-API fetchmany() batches
+    - "copy": COPY (query) TO STDOUT parsed by Arrow's CSV reader (PostgreSQL only)
+
+    Args:
+        connector: DatabaseConnector instance
+        query: SQL query to extract
+        database_config: Source databaseConfig
+        batch_size: Rows per batch for cursor extraction
+        snapshot: Exported snapshot to read from (PostgreSQL partitioned loads)
+
+    Returns:
+        Iterator of PyArrow RecordBatches
+    """
+    snapshot_args = {"snapshot": snapshot} if snapshot else {}
+    extract_mode = database_config.get('extractMode', 'cursor')
+    if extract_mode == 'copy':
+        if hasattr(connector, 'iter_copy_batches'):
+            print(f"   Extraction engine: COPY TO STDOUT")
+            return connector.iter_copy_batches(query, **snapshot_args)
+        print(f"   WARNING: COPY extraction is not supported for {connector.__class__.__name__}, using cursor")
+
+    return connector.iter_query_batches(query, batch_size=batch_size, **snapshot_args)
+
+
+def _extract_to_parquet(
+    batches,
+    local_path: str,
+    *,
+    audit: Optional[Dict[str, Any]],
+    compression: str,
+    watermark_column: Optional[str],
+    key_columns: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Write a stream of RecordBatches to one local Parquet file
+
+    Args:
+        batches: Iterator of PyArrow RecordBatches
+        local_path: Parquet file to write
+        audit: Keyword arguments for _add_audit_columns (None to skip audit columns)
+        compression: Parquet compression codec
+        watermark_column: Column whose running maximum is tracked (None to skip)
+        key_columns: Columns whose values in the last row are returned as "last_key"
+
+    Returns:
+        {"rows", "watermark", "schema", "sample", "file_size", "last_key"};
+        nothing is written (and schema is None) when the source returned no batches
+    """
+    writer = None
+    row_count = 0
+    watermark_max = None
+    last_key = None
+    sample_batches = []
+    sample_rows = 0
+    try:
+        for batch in batches:
+            if batch.num_rows == 0 and writer is not None:
+                continue
+            table = pa.Table.from_batches([batch])
+
+            if watermark_column and table.num_rows:
+                watermark_max = _max_value(watermark_max, table, watermark_column)
+            if key_columns and table.num_rows:
+                last_key = [table.column(column)[-1].as_py() for column in key_columns]
+
+            if audit:
+                table = _add_audit_columns(table, **audit)
+
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    local_path,
+                    table.schema,
+                    compression=compression,
+                    use_dictionary=True,
+                    write_statistics=True
+                )
+            writer.write_table(table)
+            row_count += table.num_rows
+
+            # Keep the head of the data for cataloging and AI profiling
+            if sample_rows < SAMPLE_ROWS and table.num_rows:
+                sample_batches.append(table.slice(0, SAMPLE_ROWS - sample_rows))
+                sample_rows += sample_batches[-1].num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return {
+        "rows": row_count,
+        "watermark": watermark_max,
+        "schema": writer.schema if writer is not None else None,
+        "sample": sample_batches,
+        "file_size": os.path.getsize(local_path) if writer is not None else 0,
+        "last_key": last_key,
+    }
+
+
+def _extract_partitions(
+    db_type: str,
+    connection_config: Dict[str, Any],
+    queries: List[str],
+    local_paths: List[str],
+    *,
+    database_config: Dict[str, Any],
+    batch_size: int,
+    audit: Optional[Dict[str, Any]],
+    compression: str,
+    watermark_column: Optional[str]
+) -> List[Dict[str, Any]]:
+    """
+    Extract disjoint partitions of a table concurrently, one connection and one Parquet file each
+
+    On PostgreSQL every partition reads the same exported snapshot, so the parts
+    add up to one consistent image of the table. Other databases read each
+    partition in its own transaction.
+
+    Args:
+        db_type: Database type (sql-server, postgresql, mysql)
+        connection_config: Connection parameters
+        queries: One SELECT per partition
+        local_paths: Parquet file per partition
+        database_config: Source databaseConfig
+        batch_size: Rows per fetch
+        audit: Keyword arguments for _add_audit_columns (None to skip audit columns)
+        compression: Parquet compression codec
+        watermark_column: Column whose running maximum is tracked (None to skip)
+
+    Returns:
+        Per-partition results of _extract_to_parquet, in partition order
+    """
+    def extract(index: int, snapshot: Optional[str]) -> Dict[str, Any]:
+        connector = get_connector(db_type, connection_config)
+        try:
+            result = _extract_to_parquet(
+                _iter_source_batches(connector, queries[index], database_config, batch_size, snapshot=snapshot),
+                local_paths[index],
+                audit=audit,
+                compression=compression,
+                watermark_column=watermark_column
+            )
+        finally:
+            connector.close()
+        print(f"   Partition {index + 1}/{len(queries)}: {result['rows']} rows")
+        return result
+
+    def run(snapshot: Optional[str] = None) -> List[Dict[str, Any]]:
+        with ThreadPoolExecutor(max_workers=len(queries), thread_name_prefix="db-partition") as pool:
+            futures = [pool.submit(extract, index, snapshot) for index in range(len(queries))]
+            return [future.result() for future in futures]
+
+    if db_type == 'postgresql':
+        # The exporting transaction must stay open until every partition has started reading
+        snapshot_connector = get_connector(db_type, connection_config)
+        try:
+            with snapshot_connector.exported_snapshot() as snapshot:
+                print(f"   Shared snapshot: {snapshot}")
+                return run(snapshot)
+        finally:
+            snapshot_connector.close()
+
+    return run()
+
+
+def _extract_keyset_pages(
+    connector,
+    s3_client: S3Client,
+    table_name: str,
+    key_columns: List[str],
+    last_watermark: Optional[str],
+    *,
+    table_prefix: str,
+    job_id: str,
+    run_id: str,
+    s3_key: str,
+    temp_dir: str,
+    database_config: Dict[str, Any],
+    batch_size: int,
+    page_rows: int,
+    audit: Optional[Dict[str, Any]],
+    compression: str
+) -> tuple:
+    """
+    Extract an incremental load in keyset pages, committing each page before the next
+
+    Each page selects up to page_rows rows after the last (delta_column, pk)
+    key in key order. It is uploaded as its own Bronze part, then the job's
+    checkpoint advances to the page's last key. A retry (or the next run from
+    the same watermark) skips the committed pages and continues after them.
+
+    Args:
+        connector: DatabaseConnector instance
+        s3_client: S3Client instance
+        table_name: Source table
+        key_columns: [delta_column, primary key column(s)]
+        last_watermark: Watermark the load starts after (None for the first load)
+        table_prefix: Bronze table prefix holding the checkpoint
+        job_id: FlowForge job ID (one checkpoint per job)
+        run_id: Current run ID
+        s3_key: Bronze key the page part keys are derived from
+        temp_dir: Directory for the local page files
+        database_config: Source databaseConfig
+        batch_size: Rows per fetch
+        page_rows: Rows per page
+        audit: Keyword arguments for _add_audit_columns (None to skip audit columns)
+        compression: Parquet compression codec
+
+    Returns:
+        (extracts, part_keys): one extract dict per committed page (as from
+        _extract_to_parquet, with "watermark" set to the page's last delta value)
+        and the S3 keys of the pages, in key order
+    """
+    checkpoint = load_checkpoint(s3_client, table_prefix, job_id)
+    if can_resume(checkpoint, table_name, key_columns, last_watermark):
+        print(f"   Resuming after {len(checkpoint['parts'])} committed page(s), last key {checkpoint['last_key']}")
+    else:
+        previous_key = checkpoint.get("last_key") if checkpoint and checkpoint.get("key_columns") == key_columns else None
+        checkpoint = new_checkpoint(job_id, run_id, table_name, key_columns, last_watermark)
+        if previous_key and last_watermark is not None and str(previous_key[0]) == str(last_watermark):
+            # Continue after the previous load's last row, so rows that share
+            # the watermark value but were committed later are not skipped
+            checkpoint["last_key"] = previous_key
+    checkpoint["run_id"] = run_id
+
+    # Pages committed by an earlier attempt are only listed; their rows are already in Bronze
+    extracts = [
+        {"rows": part["rows"], "file_size": part["bytes"], "schema": None, "sample": [], "watermark": part["last_key"][0]}
+        for part in checkpoint["parts"]
+    ]
+    last_key = checkpoint["last_key"]
+
+    while True:
+        if last_key is not None:
+            where_clause = connector.keyset_where(key_columns, last_key)
+        elif last_watermark:
+            where_clause = connector.incremental_where(key_columns[0], last_watermark)
+        else:
+            where_clause = None
+        query = connector.build_select(table_name, where_clause=where_clause, order_by=", ".join(key_columns), limit=page_rows)
+
+        index = len(checkpoint["parts"])
+        local_path = os.path.join(temp_dir, f"page_{index:05d}.parquet")
+        extract = _extract_to_parquet(
+            _iter_source_batches(connector, query, database_config, batch_size),
+            local_path,
+            audit=audit,
+            compression=compression,
+            watermark_column=None,
+            key_columns=key_columns
+        )
+        if extract["rows"]:
+            part_key = _page_part_key(s3_key, index)
+            s3_client.upload_file(local_path=local_path, s3_key=part_key)
+            os.remove(local_path)
+
+            last_key = [key_value(value) for value in extract["last_key"]]
+            extract["watermark"] = last_key[0]
+            extracts.append(extract)
+            checkpoint["parts"].append({"key": part_key, "rows": extract["rows"], "bytes": extract["file_size"], "last_key": last_key})
+            checkpoint["last_key"] = last_key
+            save_checkpoint(s3_client, table_prefix, checkpoint)
+            print(f"   Page {index + 1}: {extract['rows']} rows, last key {last_key}")
+
+        if extract["rows"] < page_rows:
+            break
+
+    checkpoint["status"] = "complete"
+    save_checkpoint(s3_client, table_prefix, checkpoint)
+    return extracts, [part["key"] for part in checkpoint["parts"]]
+
+
+def _read_part_head(s3_client: S3Client, s3_key: str) -> pa.Table:
+    """Read the first SAMPLE_ROWS rows of a Bronze part straight from S3"""
+    with s3_client.open_object(s3_key) as stream:
+        parquet_file = pq.ParquetFile(stream)
+        batch = next(parquet_file.iter_batches(batch_size=SAMPLE_ROWS), None)
+        if batch is None:
+            return parquet_file.schema_arrow.empty_table()
+        return pa.Table.from_batches([batch])
+
+
+def _page_part_key(s3_key: str, index: int) -> str:
+    """S3 key of the Bronze part written for keyset page `index` (e.g. ..._v001_k0003.parquet)."""
+    return f"{s3_key[:-len('.parquet')]}_k{index + 1:04d}.parquet"
+
+
+def _extract_checksum_sync(
+    connector,
+    s3_client: S3Client,
+    table_name: str,
+    key_column: str,
+    *,
+    table_prefix: str,
+    job_id: str,
+    run_id: str,
+    local_path: str,
+    database_config: Dict[str, Any],
+    batch_size: int,
+    audit: Optional[Dict[str, Any]],
+    compression: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract the primary key ranges of a table whose checksums changed since the last sync
+
+    Range checksums are computed in the source database and compared with the
+    committed sync state (see utils.range_sync), descending only into
+    mismatching ranges. The first sync checksums every leaf range and reads the
+    whole table. Checksums are always read before the rows, so a row changing
+    during the extract is pulled again by the next sync.
+
+    Args:
+        connector: DatabaseConnector instance
+        s3_client: S3Client instance
+        table_name: Table to sync
+        key_column: Integer primary key column
+        table_prefix: Bronze table prefix (holds the sync state)
+        job_id: FlowForge job ID
+        run_id: Current run ID
+        local_path: Parquet file to write
+        database_config: Source databaseConfig
+        batch_size: Rows per fetch
+        audit: Keyword arguments for _add_audit_columns (None to skip audit columns)
+        compression: Parquet compression codec
+
+    Returns:
+        None if no range changed, else {"extract": result of _extract_to_parquet,
+        "state": sync state to save as pending, "key_column", "ranges" (key ranges
+        replaced in Silver, None for the whole table), "changed_leaves"}
+    """
+    state = load_sync_state(s3_client, table_prefix, job_id)
+    if state and (state["source_table"] != table_name or state["key_column"] != key_column):
+        print(f"   WARNING: Sync state is for {state['source_table']}.{state['key_column']}, starting over")
+        state = None
+
+    bounds = connector.read_query(f"SELECT MIN({key_column}) AS lo, MAX({key_column}) AS hi FROM {table_name}")
+    lo, hi = bounds.to_pylist()[0].values()
+    if lo is not None and (not isinstance(lo, int) or isinstance(lo, bool)):
+        raise ValueError(f"Checksum sync needs an integer primary key, {key_column} is {type(lo).__name__}")
+
+    def fetch(level: int, ranges: Optional[List[tuple]]) -> Dict[int, tuple]:
+        width = state["leaf_width"] * state["fanout"] ** level
+        if ranges is None:
+            return connector.range_checksums(table_name, key_column, state["base"], width)
+        checksums = {}
+        for start in range(0, len(ranges), SYNC_RANGES_PER_QUERY):
+            checksums.update(connector.range_checksums(
+                table_name, key_column, state["base"], width, _key_ranges_where(key_column, ranges[start:start + SYNC_RANGES_PER_QUERY])
+            ))
+        return checksums
+
+    if state is None:
+        try:
+            estimated_rows = connector.get_row_count(table_name)
+        except Exception:
+            estimated_rows = None
+        leaf_width = 1
+        if lo is not None:
+            leaf_width = leaf_width_for(lo, hi, estimated_rows, int(database_config.get('syncLeafRows') or DEFAULT_LEAF_ROWS))
+        state = new_sync_state(
+            job_id, table_name, key_column, lo if lo is not None else 0, leaf_width,
+            fanout=int(database_config.get('syncFanout') or DEFAULT_FANOUT)
+        )
+        changed = fetch(0, None)
+        print(f"   First sync: {len(changed)} key ranges of {leaf_width} keys checksummed, reading the whole table")
+        ranges = None
+        queries = [connector.build_select(table_name)]
+    else:
+        if lo is None:
+            lo = hi = state["base"]
+        changed = find_changed_leaves(fetch, state, top_level(state, lo, hi))
+        if not changed:
+            return None
+        ranges = merge_ranges([bucket_range(state, 0, leaf) for leaf in changed])
+        print(f"   {len(changed)} key ranges changed ({len(ranges)} contiguous), reading them")
+        queries = [
+            connector.build_select(table_name, where_clause=_key_ranges_where(key_column, ranges[start:start + SYNC_RANGES_PER_QUERY]))
+            for start in range(0, len(ranges), SYNC_RANGES_PER_QUERY)
+        ]
+
+    state["run_id"] = run_id
+    apply_leaves(state, changed)
+
+    extract = _extract_to_parquet(
+        chain.from_iterable(_iter_source_batches(connector, query, database_config, batch_size) for query in queries),
+        local_path,
+        audit=audit,
+        compression=compression,
+        watermark_column=None
+    )
+    return {
+        "extract": extract,
+        "state": state,
+        "key_column": key_column,
+        "ranges": [list(key_range) for key_range in ranges] if ranges is not None else None,
+        "changed_leaves": len(changed),
+    }
+
+
+def _key_ranges_where(key_column: str, ranges: List[tuple]) -> str:
+    """WHERE clause selecting half-open key ranges [lo, hi)"""
+    return " OR ".join(f"({key_column} >= {lo} AND {key_column} < {hi})" for lo, hi in ranges)
+
+
+def _auto_partitions(connector, table_name: str, database_config: Dict[str, Any]) -> int:
+    """
+    Size partitioned extraction from table statistics: one partition per
+    TARGET_PARTITION_ROWS rows, capped at databaseConfig.maxPartitions
+
+    Args:
+        connector: DatabaseConnector instance
+        table_name: Table to extract
+        database_config: Source databaseConfig
+
+    Returns:
+        Number of partitions (1 when statistics are unavailable)
+    """
+    max_partitions = int(database_config.get('maxPartitions') or MAX_AUTO_PARTITIONS)
+    try:
+        estimated_rows = connector.get_table_stats(table_name).get('row_count')
+    except Exception as e:
+        print(f"   WARNING: Could not size partitions from table statistics: {e}")
+        return 1
+    if not estimated_rows:
+        return 1
+
+    partitions = max(1, min(max_partitions, -(-estimated_rows // TARGET_PARTITION_ROWS)))
+    print(f"   Estimated {estimated_rows} rows, using {partitions} partitions")
+    return partitions
+
+
+def _partition_part_key(s3_key: str, index: int) -> str:
+    """S3 key of the Bronze part written for partition `index` (e.g. ..._v001_p0003.parquet)."""
+    return f"{s3_key[:-len('.parquet')]}_p{index + 1:04d}.parquet"
+
+
 def _add_audit_columns(
     arrow_table: pa.Table,
     batch_id: str,
     source_system: str,
-    source_file: str
+    source_file: str,
+    ingestion_time: Optional[datetime] = None
 ) -> pa.Table:
     """
     Add audit columns to Arrow table
@@ -350,20 +1047,23 @@ def _add_audit_columns(
         batch_id: Unique batch identifier
         source_system: Source system name (e.g., 'sql-server')
         source_file: Source table/file name
+        ingestion_time: Timestamp stamped on every row (defaults to now); pass the
+            same value for every batch of one extraction
 
     Returns:
         Arrow table with audit columns added
     """
     num_rows = arrow_table.num_rows
-    current_time = datetime.now()
+    current_time = ingestion_time or datetime.now()
 
-    # Create audit columns
+    # Create audit columns (constant per batch, so repeat one scalar instead of building lists)
+    ingestion_scalar = pa.scalar(current_time, type=pa.timestamp('ms'))
     audit_columns = {
-        '_batch_id': pa.array([batch_id] * num_rows, type=pa.string()),
-        '_ingestion_time': pa.array([current_time] * num_rows, type=pa.timestamp('ms')),
-        '_source_system': pa.array([source_system] * num_rows, type=pa.string()),
-        '_source_file': pa.array([source_file] * num_rows, type=pa.string()),
-        '_file_modified_time': pa.array([current_time] * num_rows, type=pa.timestamp('ms'))
+        '_batch_id': pa.repeat(pa.scalar(batch_id, type=pa.string()), num_rows),
+        '_ingestion_time': pa.repeat(ingestion_scalar, num_rows),
+        '_source_system': pa.repeat(pa.scalar(source_system, type=pa.string()), num_rows),
+        '_source_file': pa.repeat(pa.scalar(source_file, type=pa.string()), num_rows),
+        '_file_modified_time': pa.repeat(ingestion_scalar, num_rows)
     }
 
     # Append audit columns to table
@@ -373,31 +1073,50 @@ def _add_audit_columns(
     return arrow_table
 
 
-def _get_max_watermark(arrow_table: pa.Table, column_name: str) -> Any:
+def _max_value(current: Any, arrow_table: pa.Table, column_name: str) -> Any:
     """
-    Get maximum value from a column (for watermarking)
+    Fold the maximum of a column in one batch into a running maximum (for watermarking)
 
     Args:
-        arrow_table: Arrow table
+        current: Running maximum so far (None before the first batch)
+        arrow_table: Batch of rows
         column_name: Column to get max value from
 
     Returns:
-        Maximum value from column
+        New running maximum
     """
     try:
-        column = arrow_table.column(column_name)
-        max_value = pa.compute.max(column).as_py()
+        batch_max = pc.max(arrow_table.column(column_name)).as_py()
+    except Exception as e:
+        print(f"Warning: Could not compute watermark: {e}")
+        return current
 
-        # Convert to string if datetime
-        if isinstance(max_value, datetime):
-            return max_value.isoformat()
+    if batch_max is None:
+        return current
+    if current is None or batch_max > current:
+        return batch_max
+    return current
 
-        return str(max_value)
 
-    except Exception as e:
-        print(f"Warning: Could not compute watermark: {e}")
+def _format_watermark(max_value: Any) -> Any:
+    """
+    Format a maximum delta column value as a watermark
+
+    Args:
+        max_value: Maximum value of the delta column
+
+    Returns:
+        ISO string for datetimes, str() otherwise (None if there was no value)
+    """
+    if max_value is None:
         return None
 
+    # Convert to string if datetime
+    if isinstance(max_value, datetime):
+        return max_value.isoformat()
+
+    return str(max_value)
+
 
 def _save_quality_rules_to_db(job_id: str, suggested_rules: list):
     """
@@ -470,7 +1189,7 @@ def test_database_connection(
         }
     """
     try:
-        connector = _get_connector(db_type, connection_config)
+        connector = get_connector(db_type, connection_config)
         result = connector.test_connection()
         connector.close()
         return result
@@ -502,7 +1221,7 @@ def list_database_tables(
         }
     """
     try:
-        connector = _get_connector(db_type, connection_config)
+        connector = get_connector(db_type, connection_config)
         tables = connector.list_tables()
         connector.close()
 
@@ -521,11 +1240,60 @@ def list_database_tables(
         }
 
 
+@task(name="introspect-database")
+def introspect_database(
+    db_type: str,
+    connection_config: Dict[str, Any],
+    refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Get columns, primary keys, indexes and statistics of every table (for UI schema browser)
+
+    Metadata is read in bulk and cached locally until a DDL change is detected
+    (see utils.schema_cache).
+
+    Args:
+        db_type: Database type
+        connection_config: Connection parameters
+        refresh: Re-read the catalog even if no DDL change was detected
+
+    Returns:
+        {
+            "success": bool,
+            "tables": {table_name: {"columns", "primary_key", "indexes", "stats"}},
+            "count": int,
+            "cached": bool,
+            "introspected_at": str
+        }
+    """
+    try:
+        connector = get_connector(db_type, connection_config)
+        metadata = load_database_metadata(connector, refresh=refresh)
+        connector.close()
+
+        return {
+            "success": True,
+            "tables": metadata["tables"],
+            "count": len(metadata["tables"]),
+            "cached": metadata["cached"],
+            "introspected_at": metadata["introspected_at"]
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "tables": {},
+            "count": 0
+        }
+
+
 @task(name="get-database-schema")
 def get_database_schema(
     db_type: str,
     connection_config: Dict[str, Any],
-    table_name: str
+    table_name: str,
+    exact_count: bool = False
 ) -> Dict[str, Any]:
     """
     Get schema for a specific table (for UI schema preview)
@@ -534,20 +1302,31 @@ def get_database_schema(
         db_type: Database type
         connection_config: Connection parameters
         table_name: Table name
+        exact_count: Count rows with COUNT(*) instead of reading table statistics
 
     Returns:
         {
             "success": bool,
             "schema": list of column info,
             "row_count": int,
-            "preview": list of sample rows
+            "row_count_exact": bool,
+            "table_stats": dict (approximate counts, sizes, modification info),
+            "preview": list of sample rows,
+            "metadata": {"temporal_columns", "pk_candidates", "primary_key", "indexes"}
         }
     """
     try:
-        connector = _get_connector(db_type, connection_config)
+        connector = get_connector(db_type, connection_config)
 
-        schema = connector.get_schema(table_name)
-        row_count = connector.get_row_count(table_name)
+        # Columns and keys from the bulk metadata cache (one DDL version query
+        # when it is current); tables it does not cover are read directly
+        table_metadata = None
+        try:
+            table_metadata = load_database_metadata(connector)["tables"].get(table_name)
+        except Exception as e:
+            print(f"   WARNING: Schema metadata cache unavailable: {e}")
+        schema = table_metadata["columns"] if table_metadata else connector.get_schema(table_name)
+        row_count, table_stats = _table_row_count(connector, table_name, exact_count)
 
         # Fetch preview data (first 20 rows)
         preview_data = connector.preview_data(table_name, limit=20)
@@ -564,11 +1343,15 @@ def get_database_schema(
             "success": True,
             "schema": schema,
             "row_count": row_count,
+            "row_count_exact": table_stats.get("row_count_exact", True),
+            "table_stats": table_stats,
             "preview": preview_data,
             "table_name": table_name,
             "metadata": {
                 "temporal_columns": temporal_columns,
-                "pk_candidates": pk_candidates
+                "pk_candidates": pk_candidates,
+                "primary_key": table_metadata["primary_key"] if table_metadata else [],
+                "indexes": table_metadata["indexes"] if table_metadata else []
             }
         }
 
@@ -591,16 +1374,23 @@ def preview_database_table(
     db_type: str,
     connection_config: Dict[str, Any],
     table_name: str,
-    limit: int = 100
+    limit: int = 100,
+    exact_count: bool = False,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Preview sample rows from a database table (for UI data preview)
 
+    Rows are sampled across the table with the dialect's sampling clause and
+    served from the local sample cache on repeat previews (see utils.table_sampler).
+
     Args:
         db_type: Database type
         connection_config: Connection parameters
         table_name: Table name
         limit: Maximum number of rows to return (default 100)
+        exact_count: Count rows with COUNT(*) instead of reading table statistics
+        use_cache: Serve and store the sample in the sample cache
 
     Returns:
         {
@@ -608,24 +1398,33 @@ def preview_database_table(
             "schema": list of column info,
             "rows": list of dicts (row data),
             "total_rows": int (in sample),
-            "row_count": int (total in table)
+            "row_count": int (total in table),
+            "row_count_exact": bool,
+            "sample_strategy": "sample" | "head",
+            "cached": bool
         }
     """
     try:
-        connector = _get_connector(db_type, connection_config)
+        connector = get_connector(db_type, connection_config)
 
         # Get schema
         schema = connector.get_schema(table_name)
 
-        # Get row count
-        row_count = connector.get_row_count(table_name)
-
-        # Read sample data
-        query = f"SELECT * FROM {table_name} LIMIT {limit}"
-        arrow_table = connector.read_query(query)
+        # Read sample data (row count is read on a cache miss to size the sample)
+        sample = sample_table(
+            connector,
+            table_name,
+            limit,
+            schema,
+            count_rows=lambda: _sample_row_count(connector, table_name, exact_count),
+            use_cache=use_cache
+        )
+        row_count, row_count_exact = sample["row_count"], sample["row_count_exact"]
+        if exact_count and not row_count_exact:
+            row_count, row_count_exact = connector.get_row_count(table_name, exact=True), True
 
         # Convert to list of dicts
-        df = pl.from_arrow(arrow_table)
+        df = pl.from_arrow(sample["table"])
         rows = df.to_dicts()
 
         connector.close()
@@ -636,6 +1435,9 @@ def preview_database_table(
             "rows": rows,
             "total_rows": len(rows),
             "row_count": row_count,
+            "row_count_exact": row_count_exact,
+            "sample_strategy": sample["strategy"],
+            "cached": sample["cached"],
             "table_name": table_name
         }
 
@@ -656,29 +1458,40 @@ def get_sample_data(
     db_type: str,
     connection_config: Dict[str, Any],
     table_name: str,
-    sample_size: int = 1000
+    sample_size: int = 1000,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Get sample data from database table for AI analysis
 
+    Rows are sampled across the table (not just its first rows) and shared
+    with UI previews through the sample cache (see utils.table_sampler).
+
     Args:
         db_type: Database type (sql-server, postgresql, mysql)
         connection_config: Connection configuration dictionary
         table_name: Name of the table to sample
         sample_size: Number of rows to sample (default 1000)
+        use_cache: Serve and store the sample in the sample cache
 
     Returns:
         Dictionary with success status and Polars DataFrame
     """
     try:
-        connector = _get_connector(db_type, connection_config)
+        connector = get_connector(db_type, connection_config)
 
         # Read sample data
-        query = f"SELECT * FROM {table_name} LIMIT {sample_size}"
-        arrow_table = connector.read_query(query)
+        sample = sample_table(
+            connector,
+            table_name,
+            sample_size,
+            connector.get_schema(table_name),
+            count_rows=lambda: _sample_row_count(connector, table_name),
+            use_cache=use_cache
+        )
 
         # Convert to Polars DataFrame
-        df = pl.from_arrow(arrow_table)
+        df = pl.from_arrow(sample["table"])
 
         connector.close()
 
@@ -687,6 +1500,8 @@ def get_sample_data(
             "dataframe": df,
             "row_count": len(df),
             "column_count": len(df.columns),
+            "sample_strategy": sample["strategy"],
+            "cached": sample["cached"],
             "message": f"Sampled {len(df)} rows from {table_name}"
         }
 
@@ -704,6 +1519,36 @@ def get_sample_data(
 
 # ========== Helper Functions for Schema Intelligence ==========
 
+def _table_row_count(connector, table_name: str, exact_count: bool = False) -> tuple:
+    """
+    Row count for UI previews, from table statistics unless an exact count is requested
+
+    Args:
+        connector: DatabaseConnector instance
+        table_name: Table name
+        exact_count: Run COUNT(*) instead of reading statistics
+
+    Returns:
+        (row_count, table_stats); table_stats is {"row_count_exact": True} for
+        exact counts and when statistics are unavailable
+    """
+    if not exact_count:
+        try:
+            table_stats = connector.get_table_stats(table_name)
+            if table_stats.get('row_count') is not None:
+                return table_stats['row_count'], table_stats
+        except Exception as e:
+            print(f"   WARNING: Table statistics unavailable for {table_name}: {e}")
+
+    return connector.get_row_count(table_name, exact=True), {"row_count_exact": True}
+
+
+def _sample_row_count(connector, table_name: str, exact_count: bool = False) -> tuple:
+    """(row_count, row_count_exact) of a table, for sizing a table sample"""
+    row_count, table_stats = _table_row_count(connector, table_name, exact_count)
+    return row_count, table_stats.get("row_count_exact", True)
+
+
 def _detect_temporal_columns(schema: list) -> list:
     """
     Detect columns that are suitable for incremental loading (timestamps, dates)
@@ -0,0 +1,462 @@
+"""
+Database CDC Bronze Ingestion Task
+Streams PostgreSQL logical replication changes into Bronze Parquet part files.
+"""
+
+from prefect import task
+from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+import os
+import re
+import select
+import tempfile
+import time
+from typing import Dict, Any, List, Optional
+
+from utils.bronze_parts import build_part, load_manifest, manifest_key, register_parts
+from utils.pg_cdc import (
+    CDC_PLUGINS,
+    ChangeBuffer,
+    PgOutputDecoder,
+    Wal2JsonDecoder,
+    arrow_type_for,
+    cdc_checkpoint_key,
+    load_cdc_checkpoint,
+    lsn_to_int,
+    lsn_to_str,
+    new_cdc_checkpoint,
+    pending_parts,
+    save_cdc_checkpoint,
+    snapshot_columns,
+    split_type_name,
+)
+from utils.s3 import S3Client
+from utils.metadata_catalog import catalog_bronze_asset, update_job_execution_metrics
+from tasks.database_bronze import (
+    DEFAULT_BATCH_SIZE,
+    SAMPLE_ROWS,
+    _add_audit_columns,
+    _extract_to_parquet,
+    _read_part_head,
+    get_connector,
+)
+import polars as pl
+
+
+# Buffered changes are flushed to a Bronze part when any threshold is reached
+# (overridable with databaseConfig.cdcFlushRows / cdcFlushBytes / cdcFlushSeconds)
+DEFAULT_FLUSH_ROWS = 100_000
+DEFAULT_FLUSH_BYTES = 64 * 1024 * 1024
+DEFAULT_FLUSH_SECONDS = 60
+# A run stops after this long, or once the slot has been idle this long
+DEFAULT_MAX_RUN_SECONDS = 300
+DEFAULT_IDLE_SECONDS = 30
+# Longest wait for a replication message between flush and stop checks
+POLL_SECONDS = 1.0
+
+@task(name="ingest-from-database-cdc", retries=2, retry_delay_seconds=30)
+def ingest_from_database_cdc(
+    workflow_id: str,
+    job_id: str,
+    workflow_slug: str,
+    job_slug: str,
+    run_id: str,
+    source_config: Dict[str, Any],
+    destination_config: Optional[Dict[str, Any]],
+    batch_id: str,
+    execution_id: Optional[str] = None,
+    environment: str = "prod"
+) -> Dict[str, Any]:
+    """
+    Ingest changes of a PostgreSQL table from a logical replication slot into Bronze
+
+    The first run creates the slot, exporting its snapshot, and loads the table
+    as of that snapshot (op "R"). Every run then consumes committed changes from
+    the slot's checkpointed LSN and writes them as Bronze parts, flushing on
+    row, size or time thresholds. Each flush registers the part in the table
+    manifest, advances the checkpoint and confirms the LSN to the server.
+    Silver applies the parts in LSN order (see tasks.silver).
+
+    The table needs a primary key (the default REPLICA IDENTITY sends only key
+    values for deletes) and the server wal_level = logical. wal2json must be
+    installed on the server to use it; pgoutput is built in.
+
+    Args:
+        job_id: FlowForge job ID
+        source_config: {
+            "type": "postgresql",
+            "connection": {"host", "port", "database", "username", "password"},
+            "databaseConfig": {
+                "tableName": str,
+                "primaryKey": str | list (optional, else silverConfig.primaryKey),
+                "syncMode": "cdc",
+                "cdcPlugin": "pgoutput" | "wal2json" (optional, default pgoutput),
+                "slotName": str (optional, default flowforge_{job slug}),
+                "publicationName": str (optional, pgoutput only, default the slot
+                    name; created for the table if missing),
+                "cdcInitialLoad": bool (optional, default True),
+                "cdcFlushRows": int, "cdcFlushBytes": int, "cdcFlushSeconds": int (optional),
+                "cdcMaxRunSeconds": int, "cdcIdleSeconds": int (optional),
+                "batchSize": int (optional, initial load fetch size)
+            }
+        }
+        destination_config: {
+            "bronzeConfig": {...},
+            "silverConfig": {"mergeStrategy": "merge", ...}
+        }
+
+    Returns:
+        {
+            "status": "success",
+            "records": int (changes written by this run),
+            "bronze_parts": list (every part Silver has not merged yet, if any),
+            "cdc": {"checkpoint_key", "end_lsn", "key_columns", "slot_name", "plugin"},
+            ... (as ingest_from_database)
+        }
+    """
+    try:
+        print(f"\n{'='*60}")
+        print(f"Database CDC Ingestion - Job: {job_id}")
+        print(f"{'='*60}\n")
+
+        # Extract configuration
+        db_type = source_config.get('type')
+        connection_config = source_config.get('connection', {})
+        database_config = source_config.get('databaseConfig', {})
+        destination_config = destination_config or {}
+        bronze_config = destination_config.get('bronzeConfig', {}) or {}
+        silver_config = destination_config.get('silverConfig') or {}
+
+        table_name = database_config.get('tableName')
+        primary_key = database_config.get('primaryKey') or silver_config.get('primaryKey')
+        plugin = database_config.get('cdcPlugin', 'pgoutput')
+        if db_type != 'postgresql':
+            raise ValueError(f"CDC ingestion supports PostgreSQL sources only, not {db_type}")
+        if not table_name or database_config.get('query'):
+            raise ValueError("CDC ingestion needs databaseConfig.tableName (custom queries cannot be replicated)")
+        if not primary_key:
+            raise ValueError("CDC ingestion needs a primary key, so Silver can apply updates and deletes")
+        if silver_config.get('mergeStrategy') != 'merge':
+            raise ValueError("CDC ingestion needs silverConfig.mergeStrategy 'merge'")
+        if plugin not in CDC_PLUGINS:
+            raise ValueError(f"Unsupported CDC plugin: {plugin} (expected one of {', '.join(CDC_PLUGINS)})")
+        key_columns = [primary_key] if isinstance(primary_key, str) else list(primary_key)
+
+        slot_name = database_config.get('slotName') or _slot_name(job_slug)
+        publication = database_config.get('publicationName') or slot_name
+        flush_rows = int(database_config.get('cdcFlushRows') or DEFAULT_FLUSH_ROWS)
+        flush_bytes = int(database_config.get('cdcFlushBytes') or DEFAULT_FLUSH_BYTES)
+        flush_seconds = float(database_config.get('cdcFlushSeconds') or DEFAULT_FLUSH_SECONDS)
+        max_run_seconds = float(database_config.get('cdcMaxRunSeconds') or DEFAULT_MAX_RUN_SECONDS)
+        idle_seconds = float(database_config.get('cdcIdleSeconds') or DEFAULT_IDLE_SECONDS)
+
+        bronze_table_name = bronze_config.get('tableName') or table_name
+        table_prefix = f"bronze/{bronze_table_name}/"
+        date_folder = datetime.utcnow().strftime("%Y%m%d")
+        compression = bronze_config.get('compression', 'snappy')
+        audit = None
+        if bronze_config.get('auditColumns', True):
+            audit = {
+                "batch_id": batch_id,
+                "source_system": db_type,
+                "source_file": table_name,
+                "ingestion_time": datetime.now(),
+            }
+
+        print(f"1. Initializing {db_type} connector...")
+        connector = get_connector(db_type, connection_config)
+        print(f"   Connected to: {connection_config.get('database')}")
+        print(f"   Slot: {slot_name} ({plugin})")
+
+        s3_client = S3Client()
+        checkpoint = load_cdc_checkpoint(s3_client, table_prefix, job_id)
+        if checkpoint and (checkpoint["slot_name"] != slot_name or checkpoint["source_table"] != table_name):
+            print(f"   WARNING: CDC checkpoint is for {checkpoint['source_table']} on slot {checkpoint['slot_name']}, starting over")
+            checkpoint = None
+
+        slot = connector.replication_slot(slot_name)
+        if checkpoint and slot is None:
+            raise Exception(
+                f"Replication slot {slot_name} no longer exists, so changes after {checkpoint['lsn']} are lost; "
+                f"delete {cdc_checkpoint_key(table_prefix, job_id)} to reload the table"
+            )
+        if slot and checkpoint is None:
+            # Left by a run that failed before its initial load was checkpointed
+            print(f"   WARNING: Dropping replication slot {slot_name}, which has no checkpoint")
+            connector.drop_replication_slot(slot_name)
+        if plugin == 'pgoutput' and connector.ensure_publication(publication, table_name):
+            print(f"   Created publication {publication} for {table_name}")
+
+        written: List[Dict[str, Any]] = []
+        samples: List[pa.Table] = []
+
+        with tempfile.TemporaryDirectory(prefix="flowforge_cdc_") as temp_dir:
+
+            def publish(local_path: str, rows: int, end_lsn: int) -> None:
+                """Upload a part, register it and advance the checkpoint past it"""
+                s3_key = f"{table_prefix}{date_folder}/{bronze_table_name}_{run_id}_c{len(written) + 1:04d}.parquet"
+                s3_client.upload_file(local_path=local_path, s3_key=s3_key)
+                part = build_part(
+                    s3_key,
+                    rows=rows,
+                    num_bytes=os.path.getsize(local_path),
+                    run_id=run_id,
+                    source_file=table_name,
+                    cdc_job_id=job_id,
+                    cdc_end_lsn=lsn_to_str(end_lsn),
+                )
+                register_parts(s3_client, table_prefix, [part])
+                checkpoint["lsn"] = lsn_to_str(end_lsn)
+                save_cdc_checkpoint(s3_client, table_prefix, checkpoint)
+                os.remove(local_path)
+                written.append(part)
+                print(f"   Flushed {rows} changes up to {lsn_to_str(end_lsn)}: {s3_key}")
+
+            repl_conn = connector.replication_connection()
+            try:
+                cursor = repl_conn.cursor()
+
+                if checkpoint is None:
+                    print(f"\n2. Creating replication slot and loading the table from its snapshot...")
+                    cursor.execute(f"CREATE_REPLICATION_SLOT {slot_name} LOGICAL {plugin} EXPORT_SNAPSHOT")
+                    _, consistent_point, snapshot, _ = cursor.fetchone()
+                    consistent_lsn = lsn_to_int(consistent_point)
+                    checkpoint = new_cdc_checkpoint(job_id, table_name, slot_name, plugin, consistent_lsn)
+                    if database_config.get('cdcInitialLoad', True):
+                        # The snapshot stays valid until the next command on the replication connection
+                        local_path = os.path.join(temp_dir, "snapshot.parquet")
+                        batches = connector.iter_query_batches(
+                            connector.build_select(table_name),
+                            batch_size=database_config.get('batchSize') or DEFAULT_BATCH_SIZE,
+                            snapshot=snapshot
+                        )
+                        extract = _extract_to_parquet(
+                            _snapshot_batches(batches, consistent_lsn),
+                            local_path,
+                            audit=audit,
+                            compression=compression,
+                            watermark_column=None
+                        )
+                        connector.close()
+                        print(f"   Initial load: {extract['rows']} rows as of {consistent_point}")
+                        if extract["rows"]:
+                            publish(local_path, extract["rows"], consistent_lsn)
+                            samples.extend(extract["sample"])
+                    save_cdc_checkpoint(s3_client, table_prefix, checkpoint)
+
+                start_lsn = lsn_to_int(checkpoint["lsn"])
+                print(f"\n3. Streaming changes from {checkpoint['lsn']}...")
+                if plugin == 'pgoutput':
+                    decoder = PgOutputDecoder(_pgoutput_type_resolver(connector))
+                    options = {"proto_version": "1", "publication_names": publication}
+                else:
+                    decoder = Wal2JsonDecoder(lambda type_name: arrow_type_for(connector, *split_type_name(type_name)))
+                    options = {
+                        "format-version": "2",
+                        "include-transaction": "1",
+                        "include-types": "1",
+                        "include-typmod": "1",
+                        "add-tables": table_name if "." in table_name else f"*.{table_name}",
+                    }
+                cursor.start_replication(slot_name=slot_name, decode=False, start_lsn=start_lsn, options=options)
+
+                buffer = ChangeBuffer()
+                transaction: List[Dict[str, Any]] = []
+
+                def flush() -> None:
+                    table = buffer.to_arrow()
+                    if audit:
+                        table = _add_audit_columns(table, **audit)
+                    local_path = os.path.join(temp_dir, "changes.parquet")
+                    pq.write_table(table, local_path, compression=compression)
+                    if sum(sample.num_rows for sample in samples) < SAMPLE_ROWS:
+                        samples.append(table.slice(0, SAMPLE_ROWS))
+                    publish(local_path, table.num_rows, buffer.end_lsn)
+                    # Only now may the server discard the WAL of these changes
+                    cursor.send_feedback(flush_lsn=buffer.end_lsn)
+                    buffer.clear()
+
+                started = last_message = time.monotonic()
+                while True:
+                    message = cursor.read_message()
+                    now = time.monotonic()
+                    if message is None:
+                        if buffer.rows and now - buffer.started_at >= flush_seconds:
+                            flush()
+                        if now - started >= max_run_seconds or now - last_message >= idle_seconds:
+                            break
+                        select.select([cursor], [], [], POLL_SECONDS)
+                        continue
+                    last_message = now
+
+                    for event in decoder.decode(message.payload, message.data_start):
+                        if event["kind"] == "begin":
+                            transaction = []
+                        elif event["kind"] == "change" and _is_table(event["table"], table_name):
+                            transaction.append(event)
+                        elif event["kind"] == "relation" and _is_table(event["table"], table_name):
+                            if buffer.rows and buffer.conflicts([event]):
+                                # Column types changed: each part keeps one schema
+                                flush()
+                        elif event["kind"] == "commit":
+                            end_lsn = event["end_lsn"]
+                            if end_lsn <= start_lsn:
+                                # Already in a Bronze part (resent after an unconfirmed flush)
+                                pass
+                            elif transaction:
+                                if buffer.rows and buffer.conflicts(transaction):
+                                    flush()
+                                buffer.add(transaction, end_lsn, now)
+                            elif not buffer.rows:
+                                # Nothing of this table is pending: let the server free the WAL
+                                cursor.send_feedback(flush_lsn=end_lsn)
+                            transaction = []
+
+                    if buffer.rows and (
+                        len(buffer.rows) >= flush_rows
+                        or buffer.num_bytes >= flush_bytes
+                        or now - buffer.started_at >= flush_seconds
+                    ):
+                        flush()
+
+                if buffer.rows:
+                    flush()
+            finally:
+                repl_conn.close()
+                connector.close()
+
+        records = sum(part["rows"] for part in written)
+        print(f"   Changes written: {records} in {len(written)} part(s)")
+
+        manifest = load_manifest(s3_client, table_prefix)
+        pending = pending_parts(manifest, checkpoint)
+        if not pending:
+            print(f"   No changes for Silver")
+            return {
+                "status": "success",
+                "records_processed": 0,
+                "bronze_file_path": None,
+                "file_size_bytes": 0,
+                "message": "No new changes"
+            }
+
+        # The Bronze table is the change log in the manifest; Silver reads the pending parts
+        bronze_key = manifest_key(table_prefix)
+        sample = samples[0] if samples else _read_part_head(s3_client, pending[-1]["key"])
+        file_size = sum(part["bytes"] for part in written)
+        end_lsn = pending[-1]["cdc_end_lsn"]
+        print(f"\n4. {len(pending)} part(s) up to {end_lsn} pending for Silver")
+
+        result = {
+            "status": "success",
+            "workflow_id": workflow_id,
+            "job_id": job_id,
+            "workflow_slug": workflow_slug,
+            "job_slug": job_slug,
+            "run_id": run_id,
+            "records": records,
+            "columns": sample.column_names,
+            "records_processed": records,
+            "bronze_file_path": f"s3://{s3_client.bucket}/{bronze_key}",
+            "bronze_key": bronze_key,
+            "bronze_filename": os.path.basename(bronze_key),
+            "file_size_bytes": file_size,
+            "schema": [
+                {
+                    "name": field.name,
+                    "type": str(field.type)
+                }
+                for field in sample.schema
+            ],
+            "compression": compression,
+            "table_name": bronze_table_name,
+            "environment": environment,
+            "bronze_parts": [part["key"] for part in pending],
+            "cdc": {
+                "checkpoint_key": cdc_checkpoint_key(table_prefix, job_id),
+                "end_lsn": end_lsn,
+                "key_columns": key_columns,
+                "slot_name": slot_name,
+                "plugin": plugin,
+            },
+        }
+
+        # Catalog dataset in FlowForge metadata store
+        try:
+            asset_id = catalog_bronze_asset(
+                source_id=job_id,  # job_id is actually the source ID
+                workflow_slug=workflow_slug,
+                source_slug=job_slug,
+                s3_key=bronze_key,
+                row_count=manifest["total_rows"],
+                dataframe=pl.from_arrow(sample),
+                environment=environment,
+                custom_table_name=bronze_table_name,
+                file_size=manifest["total_bytes"],
+            )
+            print(f"   Cataloged bronze asset: {asset_id}")
+        except Exception as e:
+            print(f"   WARNING: Failed to catalog bronze metadata: {e}")
+
+        # Update job execution metrics for UI dashboards
+        try:
+            update_job_execution_metrics(
+                job_id=job_id,
+                bronze_records=records,
+            )
+            print(f"   Updated job execution metrics (bronze_records={records})")
+        except Exception as e:
+            print(f"   WARNING: Failed to update job execution metrics: {e}")
+
+        print(f"\n{'='*60}")
+        print(f"Database CDC Ingestion Complete")
+        print(f"Status: SUCCESS")
+        print(f"Changes: {records}")
+        print(f"LSN: {checkpoint['lsn']}")
+        print(f"{'='*60}\n")
+
+        return result
+
+    except Exception as e:
+        print(f"\nERROR: Database CDC ingestion failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        # The checkpoint and slot keep every unflushed change, so retries resume
+        raise
+
+
+def _slot_name(job_slug: str) -> str:
+    """Default replication slot name of a job (lowercase letters, digits and underscores, at most 63)"""
+    return f"flowforge_{re.sub(r'[^a-z0-9_]', '_', job_slug.lower())}"[:63]
+
+
+def _is_table(event_table: str, table_name: str) -> bool:
+    """Whether a decoded change's "schema.table" is the configured (optionally schema-qualified) table"""
+    if "." in table_name:
+        return event_table == table_name
+    return event_table.split(".", 1)[1] == table_name
+
+
+def _snapshot_batches(batches, lsn: int):
+    """Add CDC audit columns to the RecordBatches of the initial load"""
+    for batch in batches:
+        table = snapshot_columns(pa.Table.from_batches([batch]), lsn)
+        yield from table.to_batches() or [pa.RecordBatch.from_pylist([], schema=table.schema)]
+
+
+def _pgoutput_type_resolver(connector):
+    """Map pgoutput column (type OID, typmod) pairs to Arrow types, resolving OIDs once each"""
+    type_names: Dict[int, str] = {}
+
+    def arrow_type(type_oid: int, typmod: int) -> pa.DataType:
+        if type_oid not in type_names:
+            type_names.update(connector.type_names([type_oid]))
+        type_name = type_names.get(type_oid, 'text')
+        precision = scale = None
+        if type_name in ('numeric', 'decimal') and typmod >= 4:
+            precision = ((typmod - 4) >> 16) & 0xFFFF
+            scale = (typmod - 4) & 0xFFFF
+        return arrow_type_for(connector, type_name, precision, scale)
+
+    return arrow_type
@@ -119,15 +119,12 @@ def gold_publish(
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
-        silver_file = tmp_path / "silver.parquet"
         gold_file = tmp_path / gold_filename
 
-        # Download Silver file
-        logger.info(f"📥 Downloading Silver data: {silver_key}")
-        s3.download_file(silver_key, str(silver_file))
-
-        # Read Silver data
-        df = read_parquet(str(silver_file))
+        # Read Silver data straight from S3
+        logger.info(f"📥 Reading Silver data: {silver_key}")
+        with s3.open_object(silver_key) as silver_stream:
+            df = read_parquet(silver_stream)
         logger.info(f"📊 Silver data loaded: {len(df)} rows, {len(df.columns)} columns")
 
         # Connect to DuckDB and load data
@@ -8,12 +8,16 @@ import polars as pl
 from prefect import task, get_run_logger
 
 from utils.parquet_utils import (
-    add_surrogate_key,
-    deduplicate,
+    add_surrogate_key_lazy,
+    deduplicate_lazy,
     read_parquet,
-    write_parquet,
+    scan_parquet,
+    sink_parquet,
 )
+from utils.bronze_parts import dataset_part_keys, scan_parts
 from utils.s3 import S3Client
+from utils.range_sync import commit_sync_state
+from utils.pg_cdc import COMMIT_LSN_COLUMN, LSN_COLUMN, OP_COLUMN, commit_silver_lsn
 from utils.metadata_catalog import catalog_silver_asset, update_job_execution_metrics
 from utils.quality_executor import QualityRuleExecutor
 import os
@@ -21,6 +25,10 @@ import requests
 import json
 
 
+# Rows loaded from the Silver file for catalog schema extraction
+CATALOG_SAMPLE_ROWS = 10_000
+
+
 def _load_quality_rules(job_id: str, logger) -> list:
     """
     Load active quality rules for a job from the database via API
@@ -122,7 +130,7 @@ def _save_quarantined_records(job_id: str, rule_execution_id: str, quarantined_r
         logger.info(f"   Saved {saved_count} quarantined records")
 
 
-def _execute_quality_rules(job_id: str, df: pl.DataFrame, logger) -> dict:
+def _execute_quality_rules(job_id: str, df: pl.DataFrame, logger, rules: list | None = None) -> dict:
     """
     Execute quality rules on a DataFrame and quarantine failed records
 
@@ -130,12 +138,14 @@ def _execute_quality_rules(job_id: str, df: pl.DataFrame, logger) -> dict:
         job_id: FlowForge job ID
         df: Polars DataFrame to validate
         logger: Prefect logger
+        rules: Quality rules already loaded with `_load_quality_rules` (loaded here if None)
 
     Returns:
         Dictionary with execution summary
     """
     # Load quality rules for this job
-    rules = _load_quality_rules(job_id, logger)
+    if rules is None:
+        rules = _load_quality_rules(job_id, logger)
 
     if not rules:
         logger.info("No quality rules found for this job")
@@ -229,6 +239,33 @@ def _build_silver_keys(
     return current_filename, current_key, archive_key
 
 
+def _latest_current_key(s3: S3Client, current_key: str, current_filename: str) -> str | None:
+    """
+    Return the Silver file a checksum-sync or CDC merge should start from.
+
+    Merge/replace keys live in a date folder, so the first merge of a day finds
+    no file under today's key; it continues from the latest earlier date folder.
+    """
+    if s3.object_exists(current_key):
+        return current_key
+    table_prefix = current_key.rsplit("/", 2)[0] + "/"
+    candidates = sorted(
+        obj["key"] for obj in s3.list_objects(prefix=table_prefix)
+        if obj["key"].endswith(f"/{current_filename}") and "/archive/" not in obj["key"]
+    )
+    return candidates[-1] if candidates else None
+
+
+def _sync_range_filter(key_column: str, ranges: list | None) -> pl.Expr:
+    """Rows of the key ranges replaced by a checksum sync (None: every row)."""
+    if ranges is None:
+        return pl.lit(True)
+    expr = pl.lit(False)
+    for lo, hi in ranges:
+        expr = expr | ((pl.col(key_column) >= lo) & (pl.col(key_column) < hi))
+    return expr
+
+
 @task(name="silver_transform")
 def silver_transform(
     bronze_result: dict,
@@ -266,25 +303,54 @@ def silver_transform(
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
-        local_bronze = tmp_path / Path(bronze_key).name
-        s3.download_file(bronze_key, local_bronze)
-
-        df = read_parquet(local_bronze)
-
-        if primary_keys:
-            df = deduplicate(df, subset=primary_keys, keep="last")
-        else:
-            df = deduplicate(df, subset=None, keep="last")
 
-        # Execute quality rules before adding surrogate key
+        # Build the Bronze → Silver transform as one lazy query; data is only
+        # materialized when it is sunk to the Silver Parquet file below
+        bronze_parts = bronze_result.get("bronze_parts")
+        if bronze_parts:
+            # Append-mode Bronze: the table is the set of parts in its manifest
+            logger.info(f"Scanning {len(bronze_parts)} Bronze part file(s)")
+        lf = scan_parts(s3, bronze_parts or dataset_part_keys(s3, bronze_key), tmp_path / "bronze")
+
+        cdc = bronze_result.get("cdc")
+        cdc_deleted = None
+        cdc_truncated = False
+        if cdc:
+            # CDC parts: apply changes in commit order; the last change of each key wins
+            primary_keys = primary_keys or cdc["key_columns"]
+            lf = lf.sort([COMMIT_LSN_COLUMN, LSN_COLUMN], maintain_order=True)
+            truncate_lsn = lf.filter(pl.col(OP_COLUMN) == "T").select(pl.col(LSN_COLUMN).max()).collect().item()
+            if truncate_lsn is not None:
+                # Rows from before the last TRUNCATE are gone, Silver's included
+                logger.info("CDC: table truncated at LSN %s, dropping earlier rows", truncate_lsn)
+                lf = lf.filter(pl.col(LSN_COLUMN) > truncate_lsn)
+                cdc_truncated = True
+
+        lf = deduplicate_lazy(lf, subset=primary_keys or None, keep="last")
+
+        if cdc:
+            # Deleted keys are removed from existing Silver data below
+            cdc_deleted = lf.filter(pl.col(OP_COLUMN) == "D").select(primary_keys)
+            lf = lf.filter(pl.col(OP_COLUMN) != "D")
+
+        # Execute quality rules before adding surrogate key. Rules report failures
+        # by row position, so the deduplicated data is collected only when a job
+        # actually has rules.
         quality_execution_summary = None
         try:
             logger.info("🔍 Executing quality rules...")
-            quality_execution_summary = _execute_quality_rules(
-                job_id=job_id,
-                df=df,
-                logger=logger
-            )
+            rules = _load_quality_rules(job_id, logger)
+            if rules:
+                df = lf.collect()
+                lf = df.lazy()
+                quality_execution_summary = _execute_quality_rules(
+                    job_id=job_id,
+                    df=df,
+                    logger=logger,
+                    rules=rules,
+                )
+            else:
+                logger.info("No quality rules found for this job")
 
             if quality_execution_summary:
                 logger.info(f"✅ Quality execution complete:")
@@ -298,8 +364,10 @@ def silver_transform(
                     if failed_indices:
                         logger.info(f"   Removing {len(failed_indices)} quarantined records from Silver layer")
                         # Keep only records that passed quality checks
-                        mask = [i not in failed_indices for i in range(len(df))]
-                        df = df.filter(pl.Series(mask))
+                        df = df.with_row_index("_quality_row").filter(
+                            ~pl.col("_quality_row").is_in(list(failed_indices))
+                        ).drop("_quality_row")
+                        lf = df.lazy()
                         logger.info(f"   Clean records count: {len(df)}")
 
         except Exception as e:
@@ -308,51 +376,85 @@ def silver_transform(
             logger.warning(traceback.format_exc())
 
         # Handle merge strategy: load existing Silver data and merge on primary key
-        if merge_strategy == "merge" and s3.object_exists(current_key):
-            logger.info(f"Merge mode: Loading existing Silver data from {current_key}")
-            existing_silver = tmp_path / "existing_silver.parquet"
-            s3.download_file(current_key, existing_silver)
-            existing_df = read_parquet(existing_silver)
-            logger.info(f"Existing Silver data: {existing_df.height} rows")
-
-            if primary_keys:
+        sync = bronze_result.get("sync")
+        existing_key = None
+        if merge_strategy == "merge" and not cdc_truncated:
+            if sync or cdc:
+                # Only changed rows arrive, so the merge must start from the last
+                # Silver state even when it is in an earlier date folder
+                existing_key = _latest_current_key(s3, current_key, current_filename)
+            elif s3.object_exists(current_key):
+                existing_key = current_key
+        if existing_key:
+            logger.info(f"Merge mode: Scanning existing Silver data from {existing_key}")
+            local_existing = tmp_path / "existing.parquet"
+            s3.download_file(existing_key, local_existing)
+            # Remove _sk_id from existing data before merge (will be regenerated)
+            existing_lf = scan_parquet(local_existing).select(pl.exclude("_sk_id"))
+
+            if sync:
+                # Checksum sync: Bronze holds every source row of the changed key
+                # ranges, so existing rows in those ranges are replaced (rows
+                # missing from Bronze were deleted at the source)
+                existing_lf = existing_lf.filter(~_sync_range_filter(sync["key_column"], sync["ranges"]))
+                lf = pl.concat([existing_lf, lf], how="diagonal")
+                logger.info(
+                    "Replacing %s key range(s) of %s in existing Silver data",
+                    "all" if sync["ranges"] is None else len(sync["ranges"]), sync["key_column"],
+                )
+            elif cdc_deleted is not None:
+                # CDC: drop existing rows whose key was changed or deleted, then add
+                # the latest version of every changed key
+                existing_only = existing_lf.join(
+                    pl.concat([lf.select(primary_keys), cdc_deleted]),
+                    on=primary_keys,
+                    how="anti"
+                )
+                lf = pl.concat([existing_only, lf], how="diagonal")
+                logger.info("Applying CDC changes to existing Silver data on %s", primary_keys)
+            elif primary_keys:
                 # Merge: Update existing records by primary key, add new records
-                # Remove _sk_id from existing data before merge (will be regenerated)
-                if "_sk_id" in existing_df.columns:
-                    existing_df = existing_df.drop("_sk_id")
-
                 # Use anti-join to find records in existing that are NOT in new data
                 # Then concatenate with new data (new data takes precedence)
-                existing_only = existing_df.join(
-                    df.select(primary_keys),
+                existing_only = existing_lf.join(
+                    lf.select(primary_keys),
                     on=primary_keys,
                     how="anti"
                 )
-                df = pl.concat([existing_only, df], how="diagonal")
-                logger.info(f"After merge: {df.height} total rows (existing not in new: {existing_only.height}, new: {df.height - existing_only.height})")
+                lf = pl.concat([existing_only, lf], how="diagonal")
+                logger.info("Merging new records into existing Silver data on %s", primary_keys)
             else:
                 # No primary key - just append (same as append mode)
-                if "_sk_id" in existing_df.columns:
-                    existing_df = existing_df.drop("_sk_id")
-                df = pl.concat([existing_df, df], how="diagonal")
-                logger.info(f"After merge (no PK, appending): {df.height} total rows")
+                lf = pl.concat([existing_lf, lf], how="diagonal")
+                logger.info("Merging (no PK, appending) into existing Silver data")
 
-        df = add_surrogate_key(df, key_column="_sk_id", start=1)
+        lf = add_surrogate_key_lazy(lf, key_column="_sk_id", start=1)
 
         local_silver = tmp_path / "current.parquet"
-        write_parquet(df, local_silver)
+        sink_parquet(lf, local_silver)
+
+        # Row count comes from Parquet metadata; only a bounded sample is loaded
+        # for catalog schema extraction
+        silver_records = pl.scan_parquet(local_silver).select(pl.len()).collect().item()
+        df = read_parquet(local_silver, n_rows=CATALOG_SAMPLE_ROWS)
+        logger.info(f"Silver dataset: {silver_records} rows, {df.width} columns")
 
-        # Archive previous Silver, if it exists
+        # Archive previous Silver, if it exists (server-side copy, no local round-trip)
         if s3.object_exists(current_key):
-            previous_path = tmp_path / "previous_current.parquet"
-            s3.download_file(current_key, previous_path)
-            s3.upload_file(previous_path, archive_key)
+            s3.copy_file(current_key, archive_key)
             logger.info("Archived previous Silver dataset to %s", archive_key)
 
         s3.upload_file(local_silver, current_key)
 
     logger.info("Silver dataset ready at %s", current_key)
 
+    if sync and sync.get("state_key"):
+        # Silver now holds the synced ranges; the next sync compares against them
+        commit_sync_state(s3, sync["state_key"])
+    if cdc:
+        # Later runs only hand Silver the parts after this LSN
+        commit_silver_lsn(s3, cdc["checkpoint_key"], cdc["end_lsn"])
+
     # Write metadata to catalog
     try:
         # Get user-configured table names from silver_config
@@ -366,7 +468,7 @@ def silver_transform(
             workflow_slug=workflow_slug,
             source_slug=job_slug,
             s3_key=current_key,
-            row_count=df.height,
+            row_count=silver_records,
             dataframe=df,
             parent_bronze_table=parent_bronze_table,
             environment=environment,
@@ -384,10 +486,10 @@ def silver_transform(
 
         update_job_execution_metrics(
             job_id=job_id,
-            silver_records=df.height,
+            silver_records=silver_records,
             quarantined_records=quarantined_count,
         )
-        logger.info(f"✅ Updated job execution metrics: silver_records={df.height}, quarantined={quarantined_count}")
+        logger.info(f"✅ Updated job execution metrics: silver_records={silver_records}, quarantined={quarantined_count}")
     except Exception as e:
         logger.warning(f"⚠️ Failed to update job execution metrics: {e}")
 
@@ -399,7 +501,7 @@ def silver_transform(
         "run_id": run_id,
         "silver_key": current_key,
         "silver_filename": current_filename,
-        "records": df.height,
+        "records": silver_records,
         "columns": df.columns,
         "bronze_key": bronze_key,
         "environment": environment,
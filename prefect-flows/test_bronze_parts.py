@@ -0,0 +1,78 @@
+"""
+Regression tests for the Bronze part manifest
+
+Run with pytest, or directly:
+    python test_bronze_parts.py
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+from botocore.exceptions import ClientError
+
+from utils.bronze_parts import build_part, load_manifest, register_parts
+
+
+class _ConditionalStore:
+    """In-memory stand-in for the S3Client JSON calls, with S3's conditional-write semantics."""
+
+    def __init__(self):
+        self.objects = {}
+        self.lock = threading.Lock()
+
+    def read_json_with_etag(self, key):
+        body = self.objects.get(key)
+        time.sleep(0.001)  # let other writers interleave between read and write
+        if body is None:
+            return None, None
+        return json.loads(body), hashlib.md5(body).hexdigest()
+
+    def write_json(self, key, data, if_match=None, if_none_match=False):
+        body = json.dumps(data).encode()
+        with self.lock:
+            current = self.objects.get(key)
+            if (if_none_match and current is not None) or (
+                if_match and (current is None or hashlib.md5(current).hexdigest() != if_match)
+            ):
+                raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+            self.objects[key] = body
+
+    def object_exists(self, key):
+        return key in self.objects
+
+    def read_json(self, key):
+        body = self.objects[key]
+        time.sleep(0.001)
+        return json.loads(body)
+
+
+def test_concurrent_registrations_keep_every_part():
+    store = _ConditionalStore()
+    writers = 4
+    parts_per_writer = 25
+    barrier = threading.Barrier(writers)
+
+    def register(writer):
+        barrier.wait()
+        for index in range(parts_per_writer):
+            part = build_part(f"bronze/t/w{writer}_{index}.parquet", rows=1, num_bytes=10, run_id=f"r{writer}")
+            register_parts(store, "bronze/t/", [part])
+
+    threads = [threading.Thread(target=register, args=(writer,)) for writer in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    manifest = load_manifest(store, "bronze/t/")
+    assert len(manifest["parts"]) == writers * parts_per_writer
+    assert manifest["total_rows"] == writers * parts_per_writer
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"  {name}: ok")
@@ -0,0 +1,57 @@
+"""
+Regression tests for CSV byte-range splitting
+
+Run with pytest, or directly:
+    python test_csv_split.py
+"""
+
+from utils.csv_split import find_data_start, split_csv_ranges
+
+MB = 1024 * 1024
+
+
+def _counting_reader(data: bytes):
+    calls = []
+
+    def read_at(offset: int, length: int) -> bytes:
+        chunk = data[offset:offset + length]
+        calls.append(len(chunk))
+        return chunk
+
+    return read_at, calls
+
+
+def test_split_quote_free_csv_reads_each_byte_about_once():
+    line = b"12345,some text value,67.89,2024-01-01\n"
+    data = b"id,name,amount,day\n" + line * (11 * MB // len(line))
+    read_at, calls = _counting_reader(data)
+    data_start, num_columns = find_data_start(read_at)
+    calls.clear()
+
+    ranges = split_csv_ranges(read_at, len(data), data_start=data_start, num_columns=num_columns, range_bytes=MB)
+
+    assert len(ranges) == 11
+    assert ranges[0][0] == data_start and ranges[-1][1] == len(data)
+    assert all(data[start - 1:start] == b"\n" for start, _ in ranges[1:])
+    # Probing a quote-free file cannot decide the in-quotes state, so every cut
+    # probes as far as it is allowed to; that must stay within the file size
+    assert sum(calls) <= 1.25 * len(data)
+
+
+def test_split_keeps_quoted_newlines_in_one_range():
+    record = b'1,"line one\nline two\nline three",3\n'
+    data = b"a,b,c\n" + record * (3 * MB // len(record))
+    read_at, _ = _counting_reader(data)
+    data_start, num_columns = find_data_start(read_at)
+
+    ranges = split_csv_ranges(read_at, len(data), data_start=data_start, num_columns=num_columns, range_bytes=MB)
+
+    assert len(ranges) == 3
+    assert all(data[start:start + 2] == b"1," for start, _ in ranges)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"  {name}: ok")
@@ -0,0 +1,57 @@
+"""
+Regression tests for the database connector helpers that need no server
+
+Run with pytest, or directly:
+    python test_database_connectors.py
+"""
+
+import io
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from utils.database_connectors import PostgreSQLConnector, _to_arrow_array
+
+
+def test_copy_csv_keeps_null_like_literals():
+    schema = pa.schema([("id", pa.int64()), ("label", pa.string()), ("score", pa.float64())])
+    # COPY ... (FORMAT csv): NULL is an empty unquoted field, '' is quoted
+    lines = [
+        "1,NA,1.5",
+        "2,NULL,2.5",
+        "3,null,NaN",
+        "4,N/A,nan",
+        "5,nan,",
+        "6,NaN,0",
+        '7,"",0',
+        "8,,0",
+    ]
+    table = pa_csv.read_csv(
+        io.BytesIO("\n".join(lines).encode()),
+        read_options=pa_csv.ReadOptions(column_names=schema.names),
+        convert_options=PostgreSQLConnector.copy_convert_options(schema),
+    )
+    labels = table.column("label").to_pylist()
+    assert labels == ["NA", "NULL", "null", "N/A", "nan", "NaN", "", None]
+    scores = table.column("score").to_pylist()
+    assert scores[4] is None
+    assert scores[2] != scores[2] and scores[3] != scores[3]
+
+
+def test_decimal_conversion_never_loses_digits():
+    decimal_type = pa.decimal128(10, 2)
+    assert _to_arrow_array((1.1, 2.25, None), decimal_type).to_pylist() == [Decimal("1.10"), Decimal("2.25"), None]
+    for values in ((Decimal("1.239"),), (Decimal("123456789012.5"),), (1.239,)):
+        try:
+            _to_arrow_array(values, decimal_type)
+        except ValueError:
+            continue
+        raise AssertionError(f"{values} converted to {decimal_type} without an error")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"  {name}: ok")
@@ -0,0 +1,98 @@
+"""
+Regression tests for the file format handlers
+
+Run with pytest, or directly:
+    python test_file_handlers.py
+"""
+
+import io
+
+import polars as pl
+
+from utils.file_handlers import get_file_handler
+from utils.parquet_utils import read_parquet
+
+
+def test_csv_stream_batches_match_eager_read():
+    rows = "".join(f'{i},"name {i}\nline two",{i * 1.5},2024-01-0{i % 9 + 1},2024-01-01 10:00:0{i % 10},\n' for i in range(30_000))
+    data = ("id,name,amount,day,ts,empty\n" + rows).encode()
+
+    batches = list(get_file_handler("x.csv").iter_batches(io.BytesIO(data), {"has_header": True}))
+
+    streamed = pl.concat([pl.from_arrow(batch) for batch in batches])
+    assert streamed.equals(pl.read_csv(io.BytesIO(data), try_parse_dates=True))
+
+
+def test_csv_stream_batches_raise_on_values_outside_the_sampled_types():
+    data = b"a\n" + b"1\n" * 20_000 + b"x\n"
+    try:
+        list(get_file_handler("x.csv").iter_batches(io.BytesIO(data), {"infer_schema_length": 100}))
+    except Exception:
+        return
+    raise AssertionError("a value outside the sampled types was read")
+
+
+def test_read_parquet_stream_by_row_group():
+    buffer = io.BytesIO()
+    pl.DataFrame({"a": range(100_000)}).write_parquet(buffer, row_group_size=10_000)
+
+    assert read_parquet(io.BytesIO(buffer.getvalue())).height == 100_000
+    assert read_parquet(io.BytesIO(buffer.getvalue()), n_rows=15_000)["a"].to_list() == list(range(15_000))
+
+
+def _workbook(path):
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(str(path))
+    for name, rows in (("first", [["a"], [1], [2]]), ("second", [["b", "c"], ["x", 1.5]]), ("third", [["d"], [True]])):
+        sheet = workbook.add_worksheet(name)
+        for row_index, row in enumerate(rows):
+            sheet.write_row(row_index, 0, row)
+    workbook.close()
+    return str(path)
+
+
+def test_excel_sheet_index_is_one_based(tmp_path):
+    path = _workbook(tmp_path / "book.xlsx")
+    handler = get_file_handler(path)
+
+    assert handler.read(path, {}).columns == ["a"]
+    assert handler.read(path, {"sheet_index": 1}).columns == ["a"]
+    assert handler.read(path, {"sheet_index": 2}).columns == ["b", "c"]
+
+
+def test_excel_schemas_are_inferred_per_sheet(tmp_path):
+    path = _workbook(tmp_path / "book.xlsx")
+
+    schemas = get_file_handler(path).infer_sheet_schemas(path, sample_rows=10)
+
+    assert list(schemas) == ["first", "second", "third"]
+    assert [(column["name"], column["type"]) for column in schemas["second"]] == [("b", "string"), ("c", "float")]
+    assert [(column["name"], column["type"]) for column in schemas["third"]] == [("d", "boolean")]
+
+
+
+def test_excel_sheets_are_read_one_frame_per_sheet(tmp_path):
+    path = _workbook(tmp_path / "book.xlsx")
+    handler = get_file_handler(path)
+
+    frames = handler.read_sheets(path, {"sheets": ["third", "second"]})
+
+    assert {name: frame.columns for name, frame in frames.items()} == {"second": ["b", "c"], "third": ["d"]}
+    try:
+        handler.read(path, {"sheets": "all"})
+    except ValueError:
+        return
+    raise AssertionError("read() merged several sheets into one frame")
+
+
+if __name__ == "__main__":
+    import inspect
+    import pathlib
+    import tempfile
+
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                test(*([pathlib.Path(tmp_dir)] if inspect.signature(test).parameters else []))
+            print(f"  {name}: ok")
@@ -0,0 +1,62 @@
+"""
+Regression tests for the streaming JSON readers
+
+Run with pytest, or directly:
+    python test_json_stream.py
+"""
+
+import io
+import json
+
+import pyarrow as pa
+
+from utils.json_stream import iter_json_array_batches, iter_ndjson_batches
+
+
+def _array_stream(records):
+    return io.BytesIO(json.dumps(records).encode())
+
+
+def _ndjson_stream(records):
+    return io.BytesIO("\n".join(json.dumps(record) for record in records).encode())
+
+
+def _raises(batches):
+    try:
+        list(batches)
+    except (ValueError, pa.ArrowInvalid):
+        return True
+    return False
+
+
+def test_array_type_change_after_first_block_raises():
+    records = [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}, {"a": 2.5, "b": "w"}]
+    assert _raises(iter_json_array_batches(_array_stream(records), batch_rows=3))
+    assert _raises(iter_ndjson_batches(_ndjson_stream(records), batch_rows=3))
+
+
+def test_array_new_field_after_first_block_raises():
+    records = [{"a": 1}, {"a": 2}, {"a": 3}, {"a": 4, "d": "new"}]
+    assert _raises(iter_json_array_batches(_array_stream(records), batch_rows=3))
+    assert _raises(iter_ndjson_batches(_ndjson_stream(records), batch_rows=3))
+
+
+def test_array_fields_missing_or_widened_losslessly():
+    records = [
+        {"a": 1, "n": {"x": 1, "y": "s"}},
+        {"a": 2, "c": None},
+        {"a": 3, "c": "late in block"},
+        {"a": 4.0, "n": {"x": 2}},
+    ]
+    batches = list(iter_json_array_batches(_array_stream(records), batch_rows=3))
+    rows = [row for batch in batches for row in batch.to_pylist()]
+    assert batches[0].schema.names == ["a", "n", "c"]
+    assert rows[2]["c"] == "late in block"
+    assert rows[3] == {"a": 4, "n": {"x": 2, "y": None}, "c": None}
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"  {name}: ok")
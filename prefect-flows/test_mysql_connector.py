@@ -0,0 +1,142 @@
+"""
+Test script for MySQL connector
+
+Run against the local MySQL container:
+    docker compose --profile mysql up -d mysql
+"""
+
+from utils.database_connectors import MySQLConnector
+
+def main():
+    print("\n" + "=" * 60)
+    print("Testing MySQL Connector")
+    print("=" * 60 + "\n")
+
+    # Initialize connector
+    connector = MySQLConnector(
+        host='localhost',
+        port=3306,
+        database='flowforge_test',
+        username='flowforge',
+        password='flowforge123'
+    )
+
+    # Test 1: Connection
+    print("Test 1: Testing connection...")
+    result = connector.test_connection()
+    print(f"  Success: {result['success']}")
+    print(f"  Message: {result['message']}")
+    if result['success']:
+        print(f"  Version: {result['server_version']}")
+    print()
+
+    if not result['success']:
+        print("Connection failed. Exiting.")
+        return
+
+    # Test 2: Create sample table
+    print("Test 2: Creating sample 'customers' table...")
+    conn = connector.connect()
+    cursor = conn.cursor()
+    cursor.execute("DROP TABLE IF EXISTS customers")
+    cursor.execute("""
+        CREATE TABLE customers (
+            customer_id INT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+            first_name VARCHAR(50),
+            last_name VARCHAR(50),
+            email VARCHAR(100),
+            balance DECIMAL(12, 2),
+            profile JSON,
+            avatar BLOB,
+            signup_date DATE,
+            modified_date DATETIME(3)
+        )
+    """)
+    cursor.executemany(
+        """
+        INSERT INTO customers
+            (first_name, last_name, email, balance, profile, avatar, signup_date, modified_date)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(3) - INTERVAL %s MINUTE)
+        """,
+        [
+            (f"First{i}", f"Last{i}", f"customer{i}@example.com", i * 10.25,
+             '{"tier": "gold"}', bytes([i % 256]), '2024-01-01', i)
+            for i in range(1, 1001)
+        ]
+    )
+    conn.commit()
+    cursor.close()
+    connector.close()
+    print("  Inserted 1000 rows")
+    print()
+
+    # Test 3: List tables
+    print("Test 3: Listing tables...")
+    tables = connector.list_tables()
+    print(f"  Found {len(tables)} tables:")
+    for table in tables:
+        print(f"    - {table}")
+    print()
+
+    # Test 4: Get schema
+    print("Test 4: Getting schema for 'customers' table...")
+    schema = connector.get_schema('customers')
+    print(f"  Found {len(schema)} columns:")
+    for col in schema[:5]:  # Show first 5
+        print(f"    - {col['column_name']}: {col['data_type']}")
+    print(f"    ... ({len(schema) - 5} more columns)")
+    print()
+
+    # Test 5: Get row count
+    print("Test 5: Getting row count...")
+    count = connector.get_row_count('customers')
+    exact_count = connector.get_row_count('customers', exact=True)
+    print(f"  Estimated customers: {count}")
+    print(f"  Exact customers: {exact_count}")
+    print()
+
+    # Test 6: Preview data
+    print("Test 6: Previewing first 5 rows...")
+    rows = connector.preview_data('customers', limit=5)
+    for i, row in enumerate(rows, 1):
+        print(f"  Row {i}: {row['first_name']} {row['last_name']} - {row['email']}")
+    print()
+
+    # Test 7: Stream table as Arrow batches
+    print("Test 7: Streaming table as Arrow RecordBatches...")
+    batches = list(connector.iter_query_batches("SELECT * FROM customers", batch_size=250))
+    print(f"  Batches: {len(batches)} ({sum(b.num_rows for b in batches)} rows)")
+    print(f"  Arrow Schema:")
+    for field in batches[0].schema:
+        print(f"    - {field.name}: {field.type}")
+    print()
+
+    # Test 8: Read full table as Arrow
+    print("Test 8: Reading full table as Arrow Table...")
+    arrow_table = connector.read_table('customers')
+    print(f"  Arrow Table Shape: {arrow_table.num_rows} rows x {arrow_table.num_columns} columns")
+    print(f"  Column Names: {arrow_table.column_names[:5]}...")
+    print(f"  Memory Size: {arrow_table.nbytes / 1024:.2f} KB")
+    print()
+
+    # Test 9: Incremental load simulation
+    print("Test 9: Testing incremental load...")
+    latest = connector.read_query(
+        "SELECT * FROM customers ORDER BY modified_date DESC LIMIT 10"
+    )
+    last_value = latest.column('modified_date')[-1].as_py()
+    arrow_table_incremental = connector.get_incremental_data('customers', 'modified_date', last_value)
+    print(f"  Retrieved {arrow_table_incremental.num_rows} records modified after {last_value}")
+    print()
+
+    print("=" * 60)
+    print("All tests completed successfully!")
+    print("=" * 60 + "\n")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"\nError: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,96 @@
+"""
+Regression tests for cached table samples
+
+Run with pytest, or directly:
+    python test_table_sampler.py
+"""
+
+import tempfile
+
+import pyarrow as pa
+
+from utils.database_connectors import (
+    MySQLConnector,
+    PostgreSQLConnector,
+    SAMPLE_ROW_CAP,
+    SAMPLE_SCAN_MAX_ROWS,
+    SAMPLE_SEEKS,
+)
+from utils.table_sampler import SampleCache, sample_table
+
+SCHEMA = [{"column_name": "id", "data_type": "integer"}]
+
+
+class PhysicalOrderConnector(PostgreSQLConnector):
+    """Returns what a sampling clause would: rows spread over the table, in physical order"""
+
+    def __init__(self):
+        super().__init__("localhost", 5432, "db", "user", "password")
+        self.queries = []
+
+    def read_query(self, query):
+        self.queries.append(query)
+        return pa.table({"id": list(range(0, 1_000_000, 500))})
+
+
+class KeyedMySQLConnector(MySQLConnector):
+    """MySQL connector with a fixed primary key and key range, recording its queries"""
+
+    def __init__(self, key_column):
+        super().__init__("localhost", 3306, "db", "user", "password")
+        self.key_column = key_column
+        self.queries = []
+
+    def _integer_primary_key(self, table_name):
+        return self.key_column
+
+    def read_query(self, query):
+        self.queries.append(query)
+        return pa.table({"lo": [1], "hi": [10_000_000]})
+
+
+def test_sampling_queries_limit_only_as_a_cap():
+    query = PhysicalOrderConnector().build_sample("orders", 1000, 1_000_000)
+    assert str(1000 * SAMPLE_ROW_CAP) in query
+
+
+def test_mysql_samples_by_seeking_random_primary_keys():
+    connector = KeyedMySQLConnector("id")
+
+    query = connector.build_sample("orders", 1000, 10_000_000)
+
+    assert "RAND()" not in query
+    assert query.count("WHERE `id` >= ") == SAMPLE_SEEKS
+    assert query.count(f"ORDER BY `id` LIMIT {-(-2000 // SAMPLE_SEEKS)}") == SAMPLE_SEEKS
+    assert connector.queries == ["SELECT MIN(`id`) AS lo, MAX(`id`) AS hi FROM orders"]
+
+
+def test_mysql_without_integer_key_scans_only_small_tables():
+    connector = KeyedMySQLConnector(None)
+    head_query = connector.build_select("orders", limit=1000)
+
+    assert "RAND()" in connector.build_sample("orders", 1000, SAMPLE_SCAN_MAX_ROWS)
+    assert connector.build_sample("orders", 1000, SAMPLE_SCAN_MAX_ROWS + 1) == head_query
+
+
+def test_preview_rows_are_drawn_from_the_whole_sample():
+    connector = PhysicalOrderConnector()
+    cache = SampleCache(cache_dir=tempfile.mkdtemp(), ttl_seconds=60)
+    count_rows = lambda: (1_000_000, False)
+
+    fresh = sample_table(connector, "orders", 100, SCHEMA, count_rows=count_rows, cache=cache)
+    cached = sample_table(connector, "orders", 100, SCHEMA, count_rows=count_rows, cache=cache)
+
+    assert len(connector.queries) == 1 and cached["cached"]
+    for result in (fresh, cached):
+        ids = result["table"].column("id").to_pylist()
+        assert result["strategy"] == "sample" and len(ids) == 100
+        # The first 5% of the sampled rows have ids below 50,000
+        assert max(ids) > 500_000
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"  {name}: ok")
@@ -0,0 +1,219 @@
+"""
+Bronze part-file manifest utilities for FlowForge.
+
+Append-style Bronze tables are stored as immutable Parquet part files under the
+table prefix, plus a small JSON manifest that lists them:
+
+    bronze/{tableName}/_manifest.json
+    bronze/{tableName}/{yyyymmdd}/{tableName}_{runId}_v{sequence}.parquet
+
+Writers upload a new part and then register it in the manifest, so an append
+costs O(new batch) instead of O(table history). Readers use the manifest to find
+every part that makes up the table, and the metadata catalog points at the
+manifest (see `dataset_part_keys`), so its path and row count describe the same
+data.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+import random
+import time
+
+import polars as pl
+from botocore.exceptions import ClientError
+
+from utils.parquet_utils import scan_parquet
+from utils.s3 import S3Client, is_precondition_failure
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "_manifest.json"
+
+# Conditional manifest rewrites tried before giving up on a contended table
+MANIFEST_WRITE_ATTEMPTS = 10
+
+
+def manifest_key(table_prefix: str) -> str:
+    """Return the manifest key for a Bronze table prefix (e.g. "bronze/customers/")."""
+    return f"{table_prefix.rstrip('/')}/{MANIFEST_FILENAME}"
+
+
+def load_manifest(s3: S3Client, table_prefix: str) -> Dict[str, Any]:
+    """
+    Load the manifest for a Bronze table, or an empty one if none exists yet.
+
+    Args:
+        s3: S3Client instance
+        table_prefix: Bronze table prefix (e.g. "bronze/customers/")
+
+    Returns:
+        Manifest dict with 'table_prefix', 'parts', 'total_rows' and 'total_bytes'
+    """
+    key = manifest_key(table_prefix)
+    if s3.object_exists(key):
+        return s3.read_json(key)
+
+    return _empty_manifest(table_prefix)
+
+
+def _empty_manifest(table_prefix: str) -> Dict[str, Any]:
+    """Return the manifest of a Bronze table that has no parts yet."""
+    return {
+        "table_prefix": table_prefix,
+        "parts": [],
+        "total_rows": 0,
+        "total_bytes": 0,
+        "updated_at": None,
+    }
+
+
+def build_part(
+    s3_key: str,
+    rows: int,
+    num_bytes: int,
+    run_id: str,
+    source_file: Optional[str] = None,
+    **extra: Any,
+) -> Dict[str, Any]:
+    """
+    Build a manifest entry for a newly written part file.
+
+    Args:
+        s3_key: S3 key of the part
+        rows: Row count of the part
+        num_bytes: Size of the part in bytes
+        run_id: Run that produced the part
+        source_file: Landing file or source table the part came from
+        **extra: Additional writer-specific attributes (e.g. watermark)
+
+    Returns:
+        Manifest part entry
+    """
+    return {
+        "key": s3_key,
+        "rows": rows,
+        "bytes": num_bytes,
+        "run_id": run_id,
+        "source_file": source_file,
+        "created_at": datetime.utcnow().isoformat(),
+        **extra,
+    }
+
+
+def register_parts(s3: S3Client, table_prefix: str, parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Append part entries to a Bronze table manifest and persist it.
+
+    Parts are registered only after they have been uploaded, so a reader never
+    sees a manifest entry for a missing object. The manifest is rewritten with a
+    conditional PUT on the ETag it was read with (or only if it does not exist
+    yet); when another run registered parts in between, the manifest is re-read
+    and the entries are merged again, so concurrent writers never lose a part.
+
+    Args:
+        s3: S3Client instance
+        table_prefix: Bronze table prefix
+        parts: Entries built with `build_part`
+
+    Returns:
+        Updated manifest
+
+    Raises:
+        RuntimeError: If the manifest kept changing for MANIFEST_WRITE_ATTEMPTS attempts
+    """
+    key = manifest_key(table_prefix)
+    for attempt in range(1, MANIFEST_WRITE_ATTEMPTS + 1):
+        manifest, etag = s3.read_json_with_etag(key)
+        if manifest is None:
+            manifest = _empty_manifest(table_prefix)
+
+        known_keys = {part["key"] for part in manifest["parts"]}
+        new_parts = [part for part in parts if part["key"] not in known_keys]
+
+        manifest["parts"].extend(new_parts)
+        manifest["total_rows"] = sum(part["rows"] for part in manifest["parts"])
+        manifest["total_bytes"] = sum(part["bytes"] for part in manifest["parts"])
+        manifest["updated_at"] = datetime.utcnow().isoformat()
+
+        try:
+            s3.write_json(key, manifest, if_match=etag, if_none_match=etag is None)
+        except ClientError as e:
+            if not is_precondition_failure(e):
+                raise
+            logger.info(f"{key} changed while registering parts (attempt {attempt}), retrying")
+            time.sleep(random.uniform(0, 0.2 * attempt))
+            continue
+
+        logger.info(
+            f"Registered {len(new_parts)} part(s) in {key} "
+            f"({len(manifest['parts'])} parts, {manifest['total_rows']} rows total)"
+        )
+        return manifest
+
+    raise RuntimeError(f"Could not register parts in {key}: it changed on each of {MANIFEST_WRITE_ATTEMPTS} attempts")
+
+
+def parts_manifest_key(bronze_key: str) -> str:
+    """Manifest key of a dataset written as several parts of one Bronze key (e.g. ..._v001_manifest.json)."""
+    return f"{bronze_key[:-len('.parquet')]}{MANIFEST_FILENAME}"
+
+
+def write_parts_manifest(s3: S3Client, key: str, parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Write a manifest listing the parts of one multi-part Bronze write.
+
+    Unlike a table manifest, it is written once and describes only these
+    parts, e.g. the byte ranges of one split CSV or the partitions of one
+    database extract.
+
+    Args:
+        s3: S3Client instance
+        key: Manifest key (see `parts_manifest_key`)
+        parts: Entries built with `build_part`, all uploaded already
+
+    Returns:
+        The manifest
+    """
+    manifest = {
+        "parts": parts,
+        "total_rows": sum(part["rows"] for part in parts),
+        "total_bytes": sum(part["bytes"] for part in parts),
+        "updated_at": datetime.utcnow().isoformat(),
+    }
+    s3.write_json(key, manifest)
+    return manifest
+
+
+def dataset_part_keys(s3: S3Client, key: str) -> List[str]:
+    """
+    Resolve a cataloged Bronze key to the Parquet files it stands for.
+
+    Multi-part datasets are cataloged by their manifest; any other key is a
+    single Parquet file.
+    """
+    if key.endswith(MANIFEST_FILENAME):
+        return [part["key"] for part in s3.read_json(key)["parts"]]
+    return [key]
+
+
+def scan_parts(s3: S3Client, part_keys: List[str], local_dir: str | Path) -> pl.LazyFrame:
+    """
+    Download Bronze part files into `local_dir` and scan them lazily as one table.
+
+    Nothing is loaded into memory until the returned LazyFrame is collected or
+    sunk.
+
+    Args:
+        s3: S3Client instance
+        part_keys: S3 keys of the parts, in manifest order
+        local_dir: Directory that must outlive the LazyFrame
+
+    Returns:
+        LazyFrame over all parts (diagonal concat, so schema additions across parts are kept)
+    """
+    local_dir = Path(local_dir)
+    local_paths = [local_dir / f"part_{index:05d}.parquet" for index in range(len(part_keys))]
+    s3.download_many(list(zip(part_keys, local_paths)))
+    return scan_parquet(local_paths)
@@ -0,0 +1,155 @@
+"""
+Compressed landing file support for FlowForge.
+
+Landing files may be uploaded compressed (gzip, bzip2, Zstandard) or as ZIP
+archives. The helpers here decompress them as streams, so a file is never held
+in memory or written to disk in compressed and decompressed form at once:
+
+    orders.csv.gz   -> gzip stream over orders.csv
+    events.json.zst -> Zstandard stream over events.json
+    export.zip      -> one stream per archive member
+
+The inner format is taken from the file name without the compression
+extension (ZIP members use their own names).
+"""
+
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Union
+import bz2
+import gzip
+import io
+import shutil
+import zipfile
+
+# Compression extension -> codec
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.zst': 'zstd',
+    '.zstd': 'zstd',
+    '.zip': 'zip',
+}
+
+# Bytes copied per read when decompressing to a file
+_COPY_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def compression_of(file_name: str) -> Optional[str]:
+    """Return the codec implied by the file extension ('gzip', 'bz2', 'zstd', 'zip') or None."""
+    return COMPRESSION_EXTENSIONS.get(Path(file_name).suffix.lower())
+
+
+def strip_compression_extension(file_name: str) -> str:
+    """Return the file name without its compression extension (orders.csv.gz -> orders.csv)."""
+    if compression_of(file_name):
+        return file_name[: -len(Path(file_name).suffix)]
+    return file_name
+
+
+class _DecompressedStream(io.RawIOBase):
+    """Read-only view of a decompressing stream, named after the decompressed file."""
+
+    def __init__(self, stream: BinaryIO, name: str, owned: List[BinaryIO]):
+        self._stream = stream
+        self._owned = owned
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            for stream in reversed(self._owned):
+                stream.close()
+        super().close()
+
+
+def open_decompressed(source: Union[str, BinaryIO], compression: str, name: Optional[str] = None) -> io.BufferedReader:
+    """
+    Open a gzip, bzip2 or Zstandard source as a decompressed binary stream.
+
+    Args:
+        source: Local path or binary stream (e.g. S3Client.open_object); when a
+            stream is passed, decompression runs while the stream is being read
+        compression: 'gzip', 'bz2' or 'zstd'
+        name: Name reported by the returned stream (defaults to the source name
+            without its compression extension)
+
+    Returns:
+        Buffered binary stream of the decompressed bytes
+    """
+    owned: List[BinaryIO] = []
+    if isinstance(source, str):
+        source_name = source
+        source = open(source, 'rb')
+        owned.append(source)
+    else:
+        source_name = getattr(source, 'name', '') or ''
+
+    if compression == 'gzip':
+        stream = gzip.GzipFile(fileobj=source, mode='rb')
+    elif compression == 'bz2':
+        stream = bz2.BZ2File(source, mode='rb')
+    elif compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("Reading .zst files requires the 'zstandard' package") from e
+        stream = zstandard.ZstdDecompressor().stream_reader(source, read_across_frames=True)
+    else:
+        raise ValueError(f"Unsupported stream compression: {compression}")
+    owned.append(stream)
+
+    raw = _DecompressedStream(stream, name or strip_compression_extension(source_name), owned)
+    return io.BufferedReader(raw, buffer_size=_COPY_CHUNK_BYTES)
+
+
+def decompress_to_file(source: Union[str, BinaryIO], compression: str, dest_path: Union[str, Path]) -> Path:
+    """
+    Stream-decompress a gzip, bzip2 or Zstandard source into a local file.
+
+    Passing an S3 stream decompresses while downloading, in a single pass.
+
+    Returns:
+        Path of the decompressed file
+    """
+    dest_path = Path(dest_path)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open_decompressed(source, compression) as stream, open(dest_path, 'wb') as target:
+        shutil.copyfileobj(stream, target, _COPY_CHUNK_BYTES)
+    return dest_path
+
+
+def archive_members(source: Union[str, bytes, BinaryIO]) -> List[str]:
+    """List the data files in a ZIP archive (directories and macOS metadata are skipped)."""
+    with zipfile.ZipFile(_zip_source(source)) as archive:
+        return [
+            info.filename for info in archive.infolist()
+            if not info.is_dir() and not info.filename.startswith('__MACOSX/')
+            and not Path(info.filename).name.startswith('.')
+        ]
+
+
+def open_archive_member(source: Union[str, bytes], member: str) -> BinaryIO:
+    """
+    Open one ZIP member as a decompressing stream.
+
+    Each call opens its own archive handle, so members can be read from
+    several threads at once. The returned stream's `name` is the member name.
+    """
+    archive = zipfile.ZipFile(_zip_source(source))
+    stream = archive.open(member)
+    raw = _DecompressedStream(stream, member, [archive, stream])
+    return io.BufferedReader(raw, buffer_size=_COPY_CHUNK_BYTES)
+
+
+def _zip_source(source: Union[str, bytes, BinaryIO]) -> Union[str, BinaryIO]:
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    return source
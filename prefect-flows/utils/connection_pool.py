@@ -0,0 +1,147 @@
+"""
+Pooled database connections for FlowForge connectors.
+
+Opening a connection to a remote SQL Server or PostgreSQL instance costs a TCP,
+TLS and authentication handshake, which dominates short metadata calls (test
+connection, list tables, schema preview). Connectors return their connection to
+a process-wide pool instead of closing it, and the next connector with the same
+connection config picks it up again:
+
+    connector.connect()  ->  pool.acquire(key)   (idle connection or a new one)
+    connector.close()    ->  pool.release(key)   (reset, then kept idle)
+
+Idle connections are health-checked before reuse when they have been idle for a
+while, and closed once they have been idle longer than the idle timeout.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Tuple
+import atexit
+import threading
+import time
+
+from utils.config import settings
+
+
+class ConnectionPool:
+    """Thread-safe pool of idle DB-API connections keyed by connection config"""
+
+    def __init__(
+        self,
+        max_idle_per_key: int = 4,
+        idle_timeout_seconds: float = 300,
+        health_check_seconds: float = 30
+    ):
+        """
+        Args:
+            max_idle_per_key: Idle connections kept per connection config (0 disables pooling)
+            idle_timeout_seconds: Idle connections older than this are closed
+            health_check_seconds: Idle connections older than this are pinged before reuse
+        """
+        self.max_idle_per_key = max_idle_per_key
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.health_check_seconds = health_check_seconds
+        self._idle: Dict[Hashable, Deque[Tuple[Any, float]]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, connect: Callable[[], Any], ping: Callable[[Any], None]) -> Any:
+        """
+        Get a connection for `key`: the most recently released idle one, or a new one
+
+        Args:
+            key: Connection config key (see DatabaseConnector._pool_key)
+            connect: Opens a new connection
+            ping: Raises if a connection is no longer usable
+
+        Returns:
+            DB-API connection
+        """
+        self.evict_idle()
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    break
+                conn, released_at = idle.pop()
+
+            if time.monotonic() - released_at < self.health_check_seconds:
+                return conn
+            try:
+                ping(conn)
+                return conn
+            except Exception:
+                _close_quietly(conn)
+
+        return connect()
+
+    def release(self, key: Hashable, conn: Any, reset: Callable[[Any], None]) -> None:
+        """
+        Return a connection to the pool, closing it if it cannot be reset or the pool is full
+
+        Args:
+            key: Connection config key the connection was acquired with
+            conn: DB-API connection
+            reset: Ends any open transaction and restores session defaults
+        """
+        try:
+            reset(conn)
+        except Exception:
+            _close_quietly(conn)
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_idle_per_key:
+                idle.append((conn, time.monotonic()))
+                return
+        _close_quietly(conn)
+
+    def evict_idle(self) -> int:
+        """Close connections idle longer than the idle timeout; returns how many were closed"""
+        deadline = time.monotonic() - self.idle_timeout_seconds
+        expired = []
+        with self._lock:
+            for key, idle in list(self._idle.items()):
+                # Oldest connections are at the left end
+                while idle and idle[0][1] < deadline:
+                    expired.append(idle.popleft()[0])
+                if not idle:
+                    del self._idle[key]
+
+        for conn in expired:
+            _close_quietly(conn)
+        return len(expired)
+
+    def close_all(self) -> None:
+        """Close every idle connection"""
+        with self._lock:
+            idle_connections = [conn for idle in self._idle.values() for conn, _ in idle]
+            self._idle.clear()
+
+        for conn in idle_connections:
+            _close_quietly(conn)
+
+    def stats(self) -> Dict[str, int]:
+        """Number of connection configs and idle connections currently pooled"""
+        with self._lock:
+            return {
+                "keys": len(self._idle),
+                "idle_connections": sum(len(idle) for idle in self._idle.values()),
+            }
+
+
+def _close_quietly(conn: Any) -> None:
+    """Close a connection, ignoring errors from connections that are already broken"""
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+# Process-wide pool shared by all connectors
+connection_pool = ConnectionPool(
+    max_idle_per_key=settings.db_pool_max_idle_per_key,
+    idle_timeout_seconds=settings.db_pool_idle_timeout_seconds,
+    health_check_seconds=settings.db_pool_health_check_seconds,
+)
+atexit.register(connection_pool.close_all)
@@ -0,0 +1,243 @@
+"""
+Byte-range splitting of large CSV files for FlowForge.
+
+A large CSV is cut into contiguous byte ranges that each start at the beginning
+of a record, so every range can be parsed independently (in its own process,
+from a local file or with S3 range GETs):
+
+    [header][range 0      ][range 1      ][range 2   ]
+            ^data_start    ^record start  ^record start
+
+A newline only ends a record outside quotes. Whether a nominal cut point lies
+inside a quoted field is first decided from a small window after it: both quote
+states are tried and the one whose following records have the header's column
+count wins. When that is ambiguous (e.g. single-column files), the quote parity
+is counted exactly from the previous boundary. Quotes are escaped by doubling
+(RFC 4180), so the parity of the quote count always gives the state.
+"""
+
+from typing import Callable, List, Optional, Tuple
+import csv
+import io
+
+# read_at(offset, length) -> bytes
+ReadAt = Callable[[int, int], bytes]
+
+# Bytes inspected after a nominal cut point to find the next record start
+_PROBE_WINDOW_BYTES = 1024 * 1024
+_MAX_PROBE_WINDOW_BYTES = 16 * 1024 * 1024
+# Records that must match the column count to accept a quote state
+_PROBE_RECORDS = 16
+# Bytes read per step when counting quotes exactly
+_PARITY_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def local_reader(path: str) -> ReadAt:
+    """Return a `read_at` function over a local file."""
+    def read_at(offset: int, length: int) -> bytes:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return f.read(length)
+    return read_at
+
+
+def find_data_start(
+    read_at: ReadAt,
+    *,
+    has_header: bool = True,
+    skip_rows: int = 0,
+    delimiter: str = ',',
+    quote_char: str = '"',
+    encoding: str = 'utf-8',
+) -> Tuple[int, int]:
+    """
+    Locate the first data record of a CSV file.
+
+    Returns:
+        (data_start, num_columns): byte offset of the first data record and the
+        number of fields in the header (or first) record
+    """
+    length = _PROBE_WINDOW_BYTES
+    while True:
+        window = read_at(0, length)
+        position = 0
+        for _ in range(skip_rows):
+            newline = window.find(b'\n', position)
+            position = len(window) if newline < 0 else newline + 1
+        header_end = _next_record_start(window, position, quote_char.encode(), in_quotes=False)
+        if header_end is not None or len(window) < length or length >= _MAX_PROBE_WINDOW_BYTES:
+            break
+        length *= 4
+
+    if header_end is None:
+        header_end = len(window)
+    header = window[position:header_end].decode(encoding, errors='replace').lstrip('\ufeff')
+    num_columns = len(next(csv.reader(io.StringIO(header, newline=''), delimiter=delimiter, quotechar=quote_char), []))
+    return (header_end if has_header else position), num_columns
+
+
+def split_csv_ranges(
+    read_at: ReadAt,
+    size: int,
+    *,
+    data_start: int,
+    num_columns: int,
+    range_bytes: int,
+    delimiter: str = ',',
+    quote_char: str = '"',
+    encoding: str = 'utf-8',
+) -> List[Tuple[int, int]]:
+    """
+    Cut the data records of a CSV file into record-aligned byte ranges.
+
+    Args:
+        read_at: Reads `length` bytes at `offset` of the file
+        size: File size in bytes
+        data_start: Offset of the first data record (see `find_data_start`)
+        num_columns: Fields per record, used to validate cut points
+        range_bytes: Target size of each range
+        delimiter, quote_char, encoding: CSV dialect
+
+    Returns:
+        [(start, end), ...] covering [data_start, size) without gaps or overlaps
+    """
+    boundaries = [data_start]
+    nominal = data_start + range_bytes
+    while nominal < size:
+        # Probing further than the exact parity scan would read is never worth it
+        probe_limit = max(_PROBE_WINDOW_BYTES, min(_MAX_PROBE_WINDOW_BYTES, nominal - boundaries[-1]))
+        start = _probe_record_start(read_at, nominal, size, num_columns, delimiter, quote_char, encoding, probe_limit)
+        if start is None:
+            start = record_start_after(read_at, boundaries[-1], nominal, size, quote_char=quote_char)
+        if start >= size:
+            break
+        if start > boundaries[-1]:
+            boundaries.append(start)
+        nominal = max(start, nominal) + range_bytes
+
+    boundaries.append(size)
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1) if boundaries[i + 1] > boundaries[i]]
+
+
+def _next_record_start(data: bytes, position: int, quote: bytes, in_quotes: bool) -> Optional[int]:
+    """Offset just past the first newline outside quotes at or after `position`, or None."""
+    while True:
+        newline = data.find(b'\n', position)
+        if newline < 0:
+            return None
+        in_quotes ^= data.count(quote, position, newline) % 2 == 1
+        if not in_quotes:
+            return newline + 1
+        position = newline + 1
+
+
+def _probe_record_start(
+    read_at: ReadAt,
+    nominal: int,
+    size: int,
+    num_columns: int,
+    delimiter: str,
+    quote_char: str,
+    encoding: str,
+    limit: int,
+) -> Optional[int]:
+    """
+    Find the record start after `nominal` from a small window, or None if ambiguous.
+
+    The window grows 4x while undecided, up to `limit` bytes; each step reads
+    only the bytes past the previous window.
+    """
+    quote = quote_char.encode()
+    window = b''
+    window_bytes = _PROBE_WINDOW_BYTES
+    while True:
+        if len(window) < window_bytes:
+            window += read_at(nominal + len(window), window_bytes - len(window))
+        at_eof = nominal + len(window) >= size
+        candidates = set()
+        undecided = False
+        for in_quotes in (False, True):
+            start = _next_record_start(window, 0, quote, in_quotes)
+            if start is None:
+                if at_eof:
+                    candidates.add(size)
+                else:
+                    undecided = True
+                continue
+            verdict = _records_fit(window[start:], num_columns, delimiter, quote_char, encoding, at_eof)
+            if verdict is None:
+                undecided = True
+            elif verdict:
+                candidates.add(nominal + start)
+
+        if not undecided or window_bytes >= limit:
+            return candidates.pop() if len(candidates) == 1 else None
+        window_bytes = min(window_bytes * 4, limit)
+
+
+def _records_fit(
+    data: bytes,
+    num_columns: int,
+    delimiter: str,
+    quote_char: str,
+    encoding: str,
+    at_eof: bool,
+) -> Optional[bool]:
+    """
+    Check that the records at the start of `data` all have `num_columns` fields.
+
+    Returns None when `data` holds too few complete records to decide.
+    """
+    text = data.decode(encoding, errors='replace')
+    reader = csv.reader(io.StringIO(text, newline=''), delimiter=delimiter, quotechar=quote_char)
+    rows = []
+    try:
+        for row in reader:
+            if row:
+                rows.append(row)
+            if len(rows) > _PROBE_RECORDS:
+                break
+    except csv.Error:
+        return False
+
+    if not at_eof and len(rows) <= _PROBE_RECORDS:
+        # The last record may be cut off by the window edge
+        rows = rows[:-1]
+        if len(rows) < 2:
+            return None
+    return all(len(row) == num_columns for row in rows[:_PROBE_RECORDS])
+
+
+def record_start_after(read_at: ReadAt, record_start: int, offset: int, size: int, *, quote_char: str = '"') -> int:
+    """
+    Return the start of the first record beginning after `offset`, counting quotes exactly.
+
+    Reads [record_start, offset) sequentially, so prefer `split_csv_ranges` for
+    cut points far from a known record start.
+
+    Args:
+        read_at: Reads `length` bytes at `offset` of the file
+        record_start: A known record start before `offset` (e.g. the data start)
+        offset: Byte offset to search from
+        size: File size in bytes
+    """
+    quote = quote_char.encode()
+    in_quotes = False
+    position = record_start
+    while position < offset:
+        chunk = read_at(position, min(_PARITY_CHUNK_BYTES, offset - position))
+        if not chunk:
+            break
+        in_quotes ^= chunk.count(quote) % 2 == 1
+        position += len(chunk)
+
+    while position < size:
+        chunk = read_at(position, _PARITY_CHUNK_BYTES)
+        if not chunk:
+            break
+        start = _next_record_start(chunk, 0, quote, in_quotes)
+        if start is not None:
+            return position + start
+        in_quotes ^= chunk.count(quote) % 2 == 1
+        position += len(chunk)
+    return size
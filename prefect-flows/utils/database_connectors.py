@@ -7,10 +7,230 @@ import pymssql
 import psycopg2
 import psycopg2.extras
 import pyarrow as pa
+import json
+import random
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from abc import ABC, abstractmethod
 
+from utils.connection_pool import connection_pool
+
+# Table samples read this many times the requested rows' worth of the table
+# (sampling clauses return a varying number of rows); the caller picks `rows`
+# of them at random
+SAMPLE_OVERSAMPLING = 2
+# LIMIT of a sampling query, in requested rows: only a guard against stale row
+# estimates, so it must rarely cut the sample (rows past it are never read and
+# the rows before it are in physical order)
+SAMPLE_ROW_CAP = 4
+# Random primary key positions a MySQL sample is read from (one index seek each)
+SAMPLE_SEEKS = 32
+# Largest table (estimated rows) MySQL samples with a full RAND() scan when it
+# has no integer primary key to seek on; larger tables are read from the head
+SAMPLE_SCAN_MAX_ROWS = 1_000_000
+
+
+def _rows_to_record_batch(
+    rows: List[tuple],
+    columns: List[str],
+    schema: Optional[pa.Schema] = None
+) -> pa.RecordBatch:
+    """
+    Convert a batch of DB-API rows into an Arrow RecordBatch, column by column
+
+    Args:
+        rows: Rows returned by fetchmany()
+        columns: Column names from cursor.description
+        schema: Target schema (from describe_query or the first batch of the
+            result set); values are converted straight to its types so every
+            batch of a result set has the same schema
+
+    Returns:
+        PyArrow RecordBatch
+    """
+    values_by_column = list(zip(*rows)) if rows else [()] * len(columns)
+    if schema is None:
+        arrays = [pa.array(values) for values in values_by_column]
+        # Columns that are all NULL in the first batch are typed as strings
+        arrays = [array.cast(pa.string()) if pa.types.is_null(array.type) else array for array in arrays]
+        return pa.RecordBatch.from_arrays(arrays, names=columns)
+
+    arrays = [_to_arrow_array(values, field.type) for field, values in zip(schema, values_by_column)]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _to_arrow_array(values: tuple, arrow_type: pa.DataType) -> pa.Array:
+    """
+    Convert one column of Python values to an Arrow array of a known type
+
+    Typed conversion runs in Arrow's C++ converter (Decimal and datetime values
+    included), so the fast path is a single pa.array() call. Values it cannot
+    take directly fall back to a slower conversion:
+    - strings: json.dumps() for JSON documents and arrays, str() for anything else
+    - decimals: floats are converted through their shortest decimal repr; a value
+      that does not fit the column precision and scale raises ValueError rather
+      than being rounded or truncated
+    - dates and times: values the driver returns as text (e.g. MySQL zero dates
+      such as '0000-00-00') become NULL
+    """
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        if pa.types.is_string(arrow_type):
+            return pa.array([_to_text(v) for v in values], type=arrow_type)
+        if pa.types.is_decimal(arrow_type):
+            exact = [Decimal(repr(v)) if isinstance(v, float) else v for v in values]
+            try:
+                return pa.array(exact, type=arrow_type)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                raise ValueError(f"Decimal values do not fit {arrow_type} without loss: {str(e)}") from e
+        if pa.types.is_temporal(arrow_type):
+            return pa.array([None if isinstance(v, str) else v for v in values], type=arrow_type)
+        raise
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """Render a non-string value stored in a string column"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (bytes, memoryview)):
+        return bytes(value).hex()
+    return str(value)
+
+
+def _column_info(
+    column_name: str,
+    data_type: str,
+    is_nullable: str,
+    max_length: Optional[int],
+    precision: Optional[int],
+    scale: Optional[int]
+) -> Dict[str, Any]:
+    """Column dict in the get_schema() format, from an INFORMATION_SCHEMA.COLUMNS row"""
+    col_info = {
+        'column_name': column_name,
+        'data_type': data_type,
+        'is_nullable': is_nullable == 'YES'
+    }
+    if max_length:
+        col_info['max_length'] = max_length
+    if precision:
+        col_info['numeric_precision'] = precision
+    if scale:
+        col_info['numeric_scale'] = scale
+    return col_info
+
+
+def _introspected_tables(column_rows: List[tuple], index_rows: List[tuple]) -> Dict[str, Dict[str, Any]]:
+    """
+    Assemble per-table metadata from the two bulk introspection queries
+
+    Args:
+        column_rows: (table, column, data_type, is_nullable, max_length, precision, scale),
+            ordered by table and column position
+        index_rows: (table, index, is_primary, is_unique, column, row_count, total_bytes,
+            schema_modified), one row per index key column ordered by table, index and
+            key position; a table without indexes has one row with a NULL index
+
+    Returns:
+        {table: {"columns": [...], "primary_key": [...], "indexes": [...], "stats": {...}}}
+    """
+    tables: Dict[str, Dict[str, Any]] = {}
+    for table, *column in column_rows:
+        entry = tables.setdefault(table, {"columns": [], "primary_key": [], "indexes": [], "stats": None})
+        entry["columns"].append(_column_info(*column))
+
+    for table, index_name, is_primary, is_unique, column_name, row_count, total_bytes, schema_modified in index_rows:
+        entry = tables.get(table)
+        if entry is None:
+            # Created between the two queries
+            continue
+        if entry["stats"] is None:
+            entry["stats"] = {
+                "row_count": int(row_count) if row_count is not None else None,
+                "row_count_exact": False,
+                "total_bytes": int(total_bytes) if total_bytes is not None else None,
+                "schema_modified": schema_modified.isoformat() if schema_modified else None,
+            }
+        if index_name is None:
+            continue
+        indexes = entry["indexes"]
+        if not indexes or indexes[-1]["name"] != index_name:
+            indexes.append({"name": index_name, "columns": [], "unique": bool(is_unique), "primary": bool(is_primary)})
+        # Expression index keys have no column name
+        if column_name is not None:
+            indexes[-1]["columns"].append(column_name)
+            if is_primary:
+                entry["primary_key"].append(column_name)
+
+    return tables
+
+
+def _decimal_type(precision: int, scale: int) -> pa.DataType:
+    """Arrow decimal type for a NUMERIC(precision, scale) column"""
+    if precision > 38:
+        return pa.decimal256(min(precision, 76), scale)
+    return pa.decimal128(precision, scale)
+
+
+def _sample_percent(rows: int, row_count: Optional[int]) -> Optional[float]:
+    """
+    Sampling rate (percent of the table) expected to return SAMPLE_OVERSAMPLING
+    times `rows` rows, or None when the table should simply be read up to `rows`
+    (no row estimate, or the table is not much larger than the sample)
+
+    Sampling queries return more than `rows` rows, capped at SAMPLE_ROW_CAP
+    times `rows`; the caller shuffles them and keeps `rows`.
+    """
+    if not row_count or row_count <= rows * SAMPLE_OVERSAMPLING:
+        return None
+    return 100.0 * SAMPLE_OVERSAMPLING * rows / row_count
+
+
+def _range_predicates(column: str, lo: Any, hi: Any, partitions: int) -> Optional[List[str]]:
+    """
+    Build equal-width range predicates between lo and hi
+
+    Returns None when the column type cannot be range-partitioned (or has no values).
+    """
+    from datetime import date
+    from decimal import Decimal
+
+    if lo is None or hi is None or isinstance(lo, bool):
+        return None
+
+    if isinstance(lo, int):
+        span = hi - lo + 1
+        bounds = [lo + span * index // partitions for index in range(1, partitions)]
+    elif isinstance(lo, (float, Decimal)):
+        bounds = [lo + (hi - lo) * index / partitions for index in range(1, partitions)]
+    elif isinstance(lo, datetime):
+        bounds = [lo + (hi - lo) * index / partitions for index in range(1, partitions)]
+    elif isinstance(lo, date):
+        bounds = [lo + (hi - lo) * index // partitions for index in range(1, partitions)]
+    else:
+        return None
+
+    # Narrow ranges can produce repeated bounds
+    bounds = sorted(set(bounds))
+
+    def literal(value: Any) -> str:
+        if isinstance(value, (datetime, date)):
+            return f"'{value.isoformat(sep=' ') if isinstance(value, datetime) else value.isoformat()}'"
+        return str(value)
+
+    predicates = [f"{column} < {literal(bounds[0])} OR {column} IS NULL"] if bounds else [f"{column} >= {literal(lo)} OR {column} IS NULL"]
+    for lower, upper in zip(bounds, bounds[1:]):
+        predicates.append(f"{column} >= {literal(lower)} AND {column} < {literal(upper)}")
+    if bounds:
+        predicates.append(f"{column} >= {literal(bounds[-1])}")
+    return predicates
+
 
 class DatabaseConnector(ABC):
     """Base class for all database connectors"""
@@ -40,6 +260,339 @@ class DatabaseConnector(ABC):
         """Execute custom query and return Arrow Table"""
         pass
 
+    def iter_query_batches(self, query: str, batch_size: int = 10000) -> Iterator[pa.RecordBatch]:
+        """Execute query and stream results as Arrow RecordBatches of up to batch_size rows"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support streaming reads")
+
+    def _pool_key(self) -> tuple:
+        """Connection pool key: connectors with the same config share pooled connections"""
+        return (self.__class__.__name__, self.host, self.port, self.database, self.username, self.password, self.timeout)
+
+    @staticmethod
+    def _ping(conn) -> None:
+        """Health check for a pooled connection (raises if it is no longer usable)"""
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        cursor.close()
+        conn.rollback()
+
+    def describe_query(self, query: str) -> pa.Schema:
+        """Get the Arrow schema of a query's result from catalog metadata, without reading rows"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support describing queries")
+
+    def _result_schema(self, query: str) -> Optional[pa.Schema]:
+        """
+        Typed schema for streaming a query, or None to infer types from the first batch
+
+        Describing can fail for statements the server cannot analyse up front
+        (temp tables, dynamic SQL, stored procedures), so that is not an error.
+        """
+        try:
+            return self.describe_query(query)
+        except Exception as e:
+            print(f"   WARNING: Could not describe query result, inferring column types: {e}")
+            return None
+
+    @staticmethod
+    def _named_schema(described: Optional[pa.Schema], columns: List[str]) -> Optional[pa.Schema]:
+        """Give a described schema the cursor's column names (None if the columns do not line up)"""
+        if described is None or len(described) != len(columns):
+            return None
+        return pa.schema([field.with_name(name) for field, name in zip(described, columns)])
+
+    def get_table_stats(self, table_name: str) -> Dict[str, Any]:
+        """Get approximate row count, size and modification info from catalog metadata"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support table statistics")
+
+    def ddl_version(self) -> str:
+        """Cheap catalog fingerprint that changes when tables, columns or indexes change"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support DDL change detection")
+
+    def introspect_database(self) -> Dict[str, Dict[str, Any]]:
+        """Columns, primary key, indexes and statistics of every table, in two catalog queries"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support bulk introspection")
+
+    def _run_introspection(self, column_query: str, index_query: str) -> Dict[str, Dict[str, Any]]:
+        """Run the two bulk introspection queries on one connection (see _introspected_tables)"""
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute(column_query)
+            column_rows = cursor.fetchall()
+            cursor.execute(index_query)
+            index_rows = cursor.fetchall()
+
+            cursor.close()
+            self.close()
+
+            return _introspected_tables(column_rows, index_rows)
+
+        except Exception as e:
+            raise Exception(f"Failed to introspect database: {str(e)}")
+
+    def _fetch_ddl_version(self, query: str) -> str:
+        """Run a DDL version query and join its single row into a string"""
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute(query)
+            row = cursor.fetchone()
+
+            cursor.close()
+            self.close()
+
+            return ":".join("" if value is None else str(value) for value in row)
+
+        except Exception as e:
+            raise Exception(f"Failed to read DDL version: {str(e)}")
+
+    def get_row_count(self, table_name: str, exact: bool = False) -> int:
+        """
+        Get total row count for a table
+
+        Returns the approximate count from get_table_stats unless exact is set
+        or the table has no statistics, in which case SELECT COUNT(*) is run
+        (a full scan on large tables).
+
+        Args:
+            table_name: Name of the table
+            exact: Count the rows instead of reading statistics
+
+        Returns:
+            Number of rows
+        """
+        if not exact:
+            try:
+                row_count = self.get_table_stats(table_name).get('row_count')
+                if row_count is not None:
+                    return row_count
+            except Exception as e:
+                print(f"   WARNING: Falling back to an exact row count for {table_name}: {e}")
+
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            count = cursor.fetchone()[0]
+
+            cursor.close()
+            self.close()
+
+            return count
+
+        except Exception as e:
+            raise Exception(f"Failed to get row count: {str(e)}")
+
+    def build_select(
+        self,
+        table_name: str,
+        where_clause: Optional[str] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> str:
+        """
+        Build the SELECT statement used to read a table
+
+        Args:
+            table_name: Name of the table to read
+            where_clause: Optional WHERE clause (without 'WHERE' keyword)
+            order_by: Optional ORDER BY clause (without 'ORDER BY' keyword)
+            limit: Optional maximum number of rows
+
+        Returns:
+            SQL query
+        """
+        query = f"SELECT * FROM {table_name}"
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        if order_by:
+            query += f" ORDER BY {order_by}"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return query
+
+    def build_sample(self, table_name: str, rows: int, row_count: Optional[int] = None) -> str:
+        """
+        Build a query reading up to `rows` rows spread across a table
+
+        The base implementation reads the first rows; connectors override it
+        with their dialect's sampling clause, used when row_count (an estimate
+        from get_table_stats) shows the table is much larger than the sample.
+        Sampling queries return about SAMPLE_OVERSAMPLING times `rows` rows
+        (see _sample_percent), to be shuffled and trimmed by the caller.
+
+        Args:
+            table_name: Name of the table to sample
+            rows: Maximum number of rows
+            row_count: Estimated rows in the table (None if unknown)
+
+        Returns:
+            SQL query
+        """
+        return self.build_select(table_name, limit=rows)
+
+    def hash_partition_predicate(self, column: str, partitions: int, index: int) -> str:
+        """Predicate selecting hash bucket `index` of `partitions` for a column"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support hash partitioning")
+
+    def partition_predicates(
+        self,
+        table_name: str,
+        column: str,
+        partitions: int,
+        strategy: str = 'auto',
+        where_clause: Optional[str] = None
+    ) -> List[str]:
+        """
+        Split a table into disjoint row sets for parallel extraction
+
+        Strategies:
+        - "range": equal-width ranges between MIN and MAX of a numeric or
+          date/time column (NULLs go to the first range)
+        - "hash": hash of the column modulo `partitions` (any column type)
+        - "auto": "range" for numeric and date/time columns, otherwise "hash"
+
+        Args:
+            table_name: Name of the table
+            column: Partitioning column (e.g. the primary key)
+            partitions: Number of partitions
+            strategy: "auto", "range" or "hash"
+            where_clause: Optional filter applied before partitioning
+
+        Returns:
+            WHERE clauses (without 'WHERE' keyword), one per partition, that
+            together select every row matching where_clause exactly once
+        """
+        if partitions <= 1:
+            return [where_clause] if where_clause else ['1 = 1']
+
+        predicates = None
+        if strategy in ('auto', 'range'):
+            bounds_query = f"SELECT MIN({column}) AS lo, MAX({column}) AS hi FROM {table_name}"
+            if where_clause:
+                bounds_query += f" WHERE {where_clause}"
+            lo, hi = self.read_query(bounds_query).to_pylist()[0].values()
+            predicates = _range_predicates(column, lo, hi, partitions)
+            if predicates is None and strategy == 'range':
+                raise ValueError(f"Cannot range-partition on {column}: needs a numeric or date/time column with values")
+
+        if predicates is None:
+            predicates = [self.hash_partition_predicate(column, partitions, index) for index in range(partitions)]
+
+        if where_clause:
+            predicates = [f"({where_clause}) AND ({predicate})" for predicate in predicates]
+        return predicates
+
+    def row_hash_expression(self, table_name: str) -> str:
+        """SQL expression hashing a whole row of `table_name` (aliased t) to an integer"""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support row checksums")
+
+    def range_checksums(
+        self,
+        table_name: str,
+        key_column: str,
+        base: int,
+        width: int,
+        where_clause: Optional[str] = None
+    ) -> Dict[int, Tuple[int, int]]:
+        """
+        Count and checksum the rows of fixed-width key ranges, inside the database
+
+        Rows are grouped into buckets FLOOR((key - base) / width) of an integer
+        key column; each bucket's checksum is the sum of its row hashes
+        (row_hash_expression), so checksums of adjacent buckets add up to the
+        checksum of the bucket that covers them.
+
+        Args:
+            table_name: Name of the table
+            key_column: Integer key column (e.g. the primary key)
+            base: Key value where bucket 0 starts
+            width: Bucket width in key values
+            where_clause: Optional filter (without 'WHERE' keyword), e.g. key ranges
+
+        Returns:
+            {bucket: (row_count, checksum)} for every non-empty bucket
+        """
+        bucket = f"FLOOR(({key_column} - {int(base)}) / CAST({int(width)} AS DECIMAL(38, 0)))"
+        query = (
+            f"SELECT {bucket}, COUNT(*), SUM({self.row_hash_expression(table_name)}) "
+            f"FROM {table_name} AS t"
+        )
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        query += f" GROUP BY {bucket}"
+
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute(query)
+            rows = cursor.fetchall()
+
+            cursor.close()
+            self.close()
+
+            return {int(row[0]): (int(row[1]), int(row[2] or 0)) for row in rows}
+
+        except Exception as e:
+            raise Exception(f"Failed to compute range checksums: {str(e)}")
+
+    def incremental_where(self, delta_column: str, last_value: Any) -> str:
+        """
+        Build the WHERE clause selecting rows changed since the last watermark
+
+        Args:
+            delta_column: Column to use for incremental logic (e.g., 'modified_date')
+            last_value: Last watermark value from previous run
+
+        Returns:
+            WHERE clause (without 'WHERE' keyword)
+        """
+        return f"{delta_column} > {self._literal(last_value)}"
+
+    def keyset_where(self, key_columns: List[str], last_key: List[Any]) -> str:
+        """
+        Build the WHERE clause selecting rows after a composite key, in key order
+
+        (delta_column, pk) > (d, k) is spelled out as
+        delta_column > d OR (delta_column = d AND pk > k), so rows that share
+        the last delta value are not skipped and the predicate works on every
+        database (SQL Server has no row-value comparison).
+
+        Args:
+            key_columns: Keyset columns, most significant first (e.g. [delta_column, pk])
+            last_key: Values of key_columns in the last row already read
+
+        Returns:
+            WHERE clause (without 'WHERE' keyword)
+        """
+        clauses = []
+        for index, column in enumerate(key_columns):
+            terms = [f"{previous} = {self._literal(value)}" for previous, value in zip(key_columns[:index], last_key)]
+            terms.append(f"{column} > {self._literal(last_key[index])}")
+            clauses.append(" AND ".join(terms))
+        return " OR ".join(f"({clause})" for clause in clauses)
+
+    @staticmethod
+    def _literal(value: Any) -> str:
+        """Render a Python value as a SQL literal"""
+        from datetime import date
+        from decimal import Decimal
+
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            return str(int(value))
+        if isinstance(value, (int, float, Decimal)):
+            return str(value)
+        if isinstance(value, (datetime, date)):
+            return f"'{value.isoformat()}'"
+        return "'" + str(value).replace("'", "''") + "'"
+
 
 class SQLServerConnector(DatabaseConnector):
     """SQL Server database connector using pymssql"""
@@ -74,7 +627,7 @@ class SQLServerConnector(DatabaseConnector):
 
     def connect(self) -> pymssql.Connection:
         """
-        Create database connection
+        Get a database connection from the connection pool (opening one if none is idle)
 
         Returns:
             pymssql.Connection object
@@ -83,23 +636,32 @@ class SQLServerConnector(DatabaseConnector):
             Exception if connection fails
         """
         try:
-            self.connection = pymssql.connect(
-                server=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.username,
-                password=self.password,
-                timeout=self.timeout,
-                login_timeout=self.timeout
-            )
+            self.connection = connection_pool.acquire(self._pool_key(), self._open_connection, self._ping)
             return self.connection
         except Exception as e:
             raise Exception(f"Failed to connect to SQL Server: {str(e)}")
 
+    def _open_connection(self) -> pymssql.Connection:
+        """Open a new database connection"""
+        return pymssql.connect(
+            server=self.host,
+            port=self.port,
+            database=self.database,
+            user=self.username,
+            password=self.password,
+            timeout=self.timeout,
+            login_timeout=self.timeout
+        )
+
+    @staticmethod
+    def _reset_connection(conn: pymssql.Connection) -> None:
+        """End any open transaction (and pending results) before the connection is reused"""
+        conn.rollback()
+
     def close(self):
-        """Close database connection"""
+        """Return the database connection to the connection pool"""
         if self.connection:
-            self.connection.close()
+            connection_pool.release(self._pool_key(), self.connection, self._reset_connection)
             self.connection = None
 
     def test_connection(self) -> Dict[str, Any]:
@@ -244,7 +806,7 @@ class SQLServerConnector(DatabaseConnector):
         """
         type_mapping = {
             # Integer types
-            'tinyint': pa.int8(),
+            'tinyint': pa.uint8(),
             'smallint': pa.int16(),
             'int': pa.int32(),
             'bigint': pa.int64(),
@@ -260,6 +822,8 @@ class SQLServerConnector(DatabaseConnector):
             'nvarchar': pa.string(),
             'text': pa.string(),
             'ntext': pa.string(),
+            'xml': pa.string(),
+            'uniqueidentifier': pa.string(),
 
             # Date/time types
             'date': pa.date32(),
@@ -274,6 +838,7 @@ class SQLServerConnector(DatabaseConnector):
             # Binary
             'binary': pa.binary(),
             'varbinary': pa.binary(),
+            'image': pa.binary(),
 
             # Money
             'money': pa.decimal128(19, 4),
@@ -283,12 +848,52 @@ class SQLServerConnector(DatabaseConnector):
         # Handle DECIMAL/NUMERIC with precision and scale
         if sql_type in ['decimal', 'numeric']:
             if precision and scale is not None:
-                return pa.decimal128(precision, scale)
+                return _decimal_type(precision, scale)
             else:
                 return pa.decimal128(18, 0)  # Default
 
         return type_mapping.get(sql_type, pa.string())  # Default to string for unknown types
 
+    def describe_query(self, query: str) -> pa.Schema:
+        """
+        Get the Arrow schema of a query's result without reading any rows
+
+        Column types come from sys.dm_exec_describe_first_result_set, mapped
+        with _sql_type_to_arrow.
+
+        Args:
+            query: SQL query (a single SELECT)
+
+        Returns:
+            PyArrow Schema
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT name, system_type_name, precision, scale, error_message
+                FROM sys.dm_exec_describe_first_result_set(%s, NULL, 0)
+                ORDER BY column_ordinal
+            """, (query,))
+            rows = cursor.fetchall()
+
+            cursor.close()
+            self.close()
+
+            if not rows or rows[0][4]:
+                raise Exception(rows[0][4] if rows else "query returns no result set")
+
+            fields = []
+            for name, system_type_name, precision, scale, _ in rows:
+                # system_type_name carries the declared size, e.g. decimal(18,2)
+                sql_type = system_type_name.split('(')[0].strip().lower()
+                fields.append(pa.field(name or '', self._sql_type_to_arrow(sql_type, precision, scale)))
+            return pa.schema(fields)
+
+        except Exception as e:
+            raise Exception(f"Failed to describe query: {str(e)}")
+
     def read_table(
         self,
         table_name: str,
@@ -308,14 +913,7 @@ class SQLServerConnector(DatabaseConnector):
         Returns:
             PyArrow Table with all data
         """
-        # Build query
-        query = f"SELECT * FROM {table_name}"
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        if order_by:
-            query += f" ORDER BY {order_by}"
-
-        return self.read_query(query)
+        return self.read_query(self.build_select(table_name, where_clause, order_by))
 
     def read_query(self, query: str) -> pa.Table:
         """
@@ -327,45 +925,95 @@ class SQLServerConnector(DatabaseConnector):
         Returns:
             PyArrow Table with query results
         """
-        try:
-            conn = self.connect()
-            cursor = conn.cursor()
+        return pa.Table.from_batches(list(self.iter_query_batches(query)))
 
-            # Execute query
-            cursor.execute(query)
+    def iter_query_batches(self, query: str, batch_size: int = 10000) -> Iterator[pa.RecordBatch]:
+        """
+        Execute SQL query and stream results as Arrow RecordBatches
+
+        pymssql reads result rows off the connection as they are fetched, so
+        only batch_size rows are held client-side at a time. Column types come
+        from describe_query, so every batch is converted with explicit types.
+
+        Args:
+            query: SQL query to execute
+            batch_size: Rows per RecordBatch
 
-            # Get column names and types
+        Yields:
+            PyArrow RecordBatches sharing one schema (an empty result yields
+            one empty batch with the result columns)
+        """
+        described = self._result_schema(query)
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query)
             columns = [desc[0] for desc in cursor.description]
 
-            # Fetch all rows
-            rows = cursor.fetchall()
+            schema = self._named_schema(described, columns)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows and schema is not None:
+                    break
+                batch = _rows_to_record_batch(rows, columns, schema)
+                schema = batch.schema
+                yield batch
+                if not rows:
+                    break
 
+        except Exception as e:
+            raise Exception(f"Failed to execute query: {str(e)}")
+        finally:
             cursor.close()
             self.close()
 
-            if not rows:
-                # Return empty table with schema
-                return pa.table({col: [] for col in columns})
+    def build_select(
+        self,
+        table_name: str,
+        where_clause: Optional[str] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> str:
+        """Build the SELECT statement used to read a table (T-SQL limits rows with TOP)"""
+        query = super().build_select(table_name, where_clause, order_by)
+        if limit is not None:
+            query = f"SELECT TOP {int(limit)} " + query[len("SELECT "):]
+        return query
+
+    def build_sample(self, table_name: str, rows: int, row_count: Optional[int] = None) -> str:
+        """
+        Build a query reading up to `rows` rows spread across a table
 
-            # Convert to dict of lists (column-oriented)
-            data = {}
-            for i, col_name in enumerate(columns):
-                data[col_name] = [row[i] for row in rows]
+        TABLESAMPLE SYSTEM reads randomly chosen data pages, so the cost follows
+        the sample size rather than the table size (rows on one page are read
+        together). Tables not much larger than the sample are read with TOP.
+        """
+        percent = _sample_percent(rows, row_count)
+        if percent is None:
+            return super().build_sample(table_name, rows, row_count)
+        return self.build_select(f"{table_name} TABLESAMPLE SYSTEM ({percent:.6f} PERCENT)", limit=rows * SAMPLE_ROW_CAP)
 
-            # Create Arrow Table
-            arrow_table = pa.table(data)
+    def hash_partition_predicate(self, column: str, partitions: int, index: int) -> str:
+        """Predicate selecting hash bucket `index` of `partitions` (CHECKSUM based)"""
+        return f"(CAST(CHECKSUM({column}) AS BIGINT) + 2147483648) % {partitions} = {index}"
 
-            return arrow_table
+    def row_hash_expression(self, table_name: str) -> str:
+        """
+        SQL expression hashing a whole row to an integer (BINARY_CHECKSUM)
 
-        except Exception as e:
-            raise Exception(f"Failed to execute query: {str(e)}")
+        BINARY_CHECKSUM skips text, ntext, image and xml columns, so changes
+        confined to those columns are not detected.
+        """
+        return "CAST(BINARY_CHECKSUM(*) AS BIGINT)"
 
     def get_incremental_data(
         self,
         table_name: str,
         delta_column: str,
         last_value: Any,
-        batch_size: int = 10000
+        batch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        last_key: Optional[List[Any]] = None
     ) -> pa.Table:
         """
         Read incremental data based on watermark column
@@ -375,47 +1023,172 @@ class SQLServerConnector(DatabaseConnector):
             delta_column: Column to use for incremental logic (e.g., 'modified_date')
             last_value: Last watermark value from previous run
             batch_size: Number of rows per batch
+            key_columns: Primary key column(s) breaking ties on delta_column
+            last_key: Primary key value(s) of the last row read at last_value;
+                with key_columns, rows sharing last_value are not skipped
 
         Returns:
             PyArrow Table with new/updated records
         """
-        # Build WHERE clause for incremental load
-        if isinstance(last_value, (datetime, str)):
-            where_clause = f"{delta_column} > '{last_value}'"
-        else:
-            where_clause = f"{delta_column} > {last_value}"
-
+        if key_columns and last_key is not None:
+            return self.read_table(
+                table_name=table_name,
+                batch_size=batch_size,
+                where_clause=self.keyset_where([delta_column] + key_columns, [last_value] + list(last_key)),
+                order_by=", ".join([delta_column] + key_columns)
+            )
         return self.read_table(
             table_name=table_name,
             batch_size=batch_size,
-            where_clause=where_clause,
+            where_clause=self.incremental_where(delta_column, last_value),
             order_by=delta_column
         )
 
-    def get_row_count(self, table_name: str) -> int:
+    def get_table_stats(self, table_name: str) -> Dict[str, Any]:
         """
-        Get total row count for a table
+        Get approximate table statistics from catalog metadata, without scanning the table
+
+        Row counts and sizes come from sys.dm_db_partition_stats (heap or
+        clustered index rows, all partitions); last_modified is the latest user
+        update recorded in sys.dm_db_index_usage_stats since the last restart.
 
         Args:
-            table_name: Name of the table
+            table_name: Name of the table (optionally schema-qualified)
 
         Returns:
-            Number of rows
+            {
+                'row_count': int,
+                'row_count_exact': False,
+                'total_bytes': int,
+                'data_bytes': int,
+                'partitions': int,
+                'last_modified': datetime or None,
+                'schema_modified': datetime,
+                'source': 'sys.dm_db_partition_stats'
+            }
         """
         try:
             conn = self.connect()
             cursor = conn.cursor()
 
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
-
+            cursor.execute("""
+                SELECT
+                    SUM(CASE WHEN ps.index_id IN (0, 1) THEN ps.row_count ELSE 0 END),
+                    SUM(ps.reserved_page_count) * 8192,
+                    SUM(CASE WHEN ps.index_id IN (0, 1)
+                        THEN ps.in_row_data_page_count + ps.lob_used_page_count + ps.row_overflow_used_page_count
+                        ELSE 0 END) * 8192,
+                    SUM(CASE WHEN ps.index_id IN (0, 1) THEN 1 ELSE 0 END),
+                    MAX(o.modify_date),
+                    (
+                        SELECT MAX(us.last_user_update)
+                        FROM sys.dm_db_index_usage_stats us
+                        WHERE us.database_id = DB_ID() AND us.object_id = OBJECT_ID(%s)
+                    )
+                FROM sys.dm_db_partition_stats ps
+                JOIN sys.objects o ON o.object_id = ps.object_id
+                WHERE ps.object_id = OBJECT_ID(%s)
+            """, (table_name, table_name))
+            row = cursor.fetchone()
             cursor.close()
-            self.close()
 
-            return count
+            if row is None or row[0] is None:
+                raise Exception(f"no statistics for {table_name}")
+
+            return {
+                'row_count': int(row[0]),
+                'row_count_exact': False,
+                'total_bytes': int(row[1] or 0),
+                'data_bytes': int(row[2] or 0),
+                'partitions': int(row[3] or 0),
+                'last_modified': row[5],
+                'schema_modified': row[4],
+                'source': 'sys.dm_db_partition_stats'
+            }
 
         except Exception as e:
-            raise Exception(f"Failed to get row count: {str(e)}")
+            raise Exception(f"Failed to get table stats: {str(e)}")
+        finally:
+            self.close()
+
+    def ddl_version(self) -> str:
+        """
+        Cheap catalog fingerprint that changes when tables, columns or indexes change
+
+        sys.objects.modify_date changes on ALTER TABLE and when an index on the
+        table is created or altered; the object count catches drops.
+        """
+        return self._fetch_ddl_version("""
+            SELECT COUNT(*), CONVERT(varchar(33), MAX(modify_date), 126)
+            FROM sys.objects
+            WHERE is_ms_shipped = 0
+        """)
+
+    def introspect_database(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Columns, primary key, indexes and statistics of every table, in two catalog queries
+
+        Columns come from INFORMATION_SCHEMA.COLUMNS (as in get_schema), key
+        columns of every index from sys.indexes, row counts from sys.partitions
+        and sizes from sys.allocation_units.
+
+        Returns:
+            {
+                table_name: {
+                    'columns': list of column info (as get_schema),
+                    'primary_key': list of column names,
+                    'indexes': [{'name': str, 'columns': list, 'unique': bool, 'primary': bool}],
+                    'stats': {'row_count': int, 'row_count_exact': False, 'total_bytes': int,
+                              'schema_modified': ISO datetime of the last DDL change}
+                }
+            }
+        """
+        return self._run_introspection(
+            """
+                SELECT
+                    c.TABLE_NAME,
+                    c.COLUMN_NAME,
+                    c.DATA_TYPE,
+                    c.IS_NULLABLE,
+                    c.CHARACTER_MAXIMUM_LENGTH,
+                    c.NUMERIC_PRECISION,
+                    c.NUMERIC_SCALE
+                FROM INFORMATION_SCHEMA.COLUMNS c
+                JOIN INFORMATION_SCHEMA.TABLES t
+                    ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+                WHERE t.TABLE_TYPE = 'BASE TABLE'
+                ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+            """,
+            """
+                SELECT
+                    t.name,
+                    i.name,
+                    i.is_primary_key,
+                    i.is_unique,
+                    col.name,
+                    rc.row_count,
+                    sz.total_bytes,
+                    t.modify_date
+                FROM sys.tables t
+                JOIN sys.indexes i ON i.object_id = t.object_id
+                LEFT JOIN sys.index_columns ic
+                    ON ic.object_id = i.object_id AND ic.index_id = i.index_id AND ic.key_ordinal > 0
+                LEFT JOIN sys.columns col ON col.object_id = ic.object_id AND col.column_id = ic.column_id
+                CROSS APPLY (
+                    SELECT SUM(p.rows) AS row_count
+                    FROM sys.partitions p
+                    WHERE p.object_id = t.object_id AND p.index_id IN (0, 1)
+                ) rc
+                CROSS APPLY (
+                    SELECT SUM(a.total_pages) * 8192 AS total_bytes
+                    FROM sys.partitions p
+                    JOIN sys.allocation_units a ON a.container_id = p.partition_id
+                    WHERE p.object_id = t.object_id
+                ) sz
+                WHERE t.is_ms_shipped = 0
+                ORDER BY t.name, i.index_id, ic.key_ordinal
+            """
+        )
 
     def preview_data(self, table_name: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -478,7 +1251,7 @@ class PostgreSQLConnector(DatabaseConnector):
 
     def connect(self) -> psycopg2.extensions.connection:
         """
-        Create database connection
+        Get a database connection from the connection pool (opening one if none is idle)
 
         Returns:
             psycopg2.Connection object
@@ -487,22 +1260,39 @@ class PostgreSQLConnector(DatabaseConnector):
             Exception if connection fails
         """
         try:
-            self.connection = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.username,
-                password=self.password,
-                connect_timeout=self.timeout
-            )
+            self.connection = connection_pool.acquire(self._pool_key(), self._open_connection, self._ping)
             return self.connection
         except Exception as e:
             raise Exception(f"Failed to connect to PostgreSQL: {str(e)}")
 
+    def _open_connection(self) -> psycopg2.extensions.connection:
+        """Open a new database connection"""
+        return psycopg2.connect(
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            user=self.username,
+            password=self.password,
+            connect_timeout=self.timeout
+        )
+
+    @staticmethod
+    def _reset_connection(conn: psycopg2.extensions.connection) -> None:
+        """
+        Restore session defaults before the connection is reused
+
+        Rolls back (dropping server-side cursors), undoes SET commands such as
+        the COPY DateStyle/TimeZone, and clears snapshot isolation settings.
+        """
+        if conn.closed:
+            raise Exception("connection is closed")
+        conn.reset()
+        conn.set_session(isolation_level='DEFAULT', readonly='DEFAULT', deferrable='DEFAULT')
+
     def close(self):
-        """Close database connection"""
+        """Return the database connection to the connection pool"""
         if self.connection:
-            self.connection.close()
+            connection_pool.release(self._pool_key(), self.connection, self._reset_connection)
             self.connection = None
 
     def test_connection(self) -> Dict[str, Any]:
@@ -690,7 +1480,7 @@ class PostgreSQLConnector(DatabaseConnector):
         # Handle NUMERIC/DECIMAL with precision and scale
         if pg_type in ['numeric', 'decimal']:
             if precision and scale is not None:
-                return pa.decimal128(precision, scale)
+                return _decimal_type(precision, scale)
             else:
                 return pa.decimal128(18, 0)  # Default
 
@@ -715,14 +1505,7 @@ class PostgreSQLConnector(DatabaseConnector):
         Returns:
             PyArrow Table with all data
         """
-        # Build query
-        query = f"SELECT * FROM {table_name}"
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        if order_by:
-            query += f" ORDER BY {order_by}"
-
-        return self.read_query(query)
+        return self.read_query(self.build_select(table_name, where_clause, order_by))
 
     def read_query(self, query: str) -> pa.Table:
         """
@@ -734,45 +1517,402 @@ class PostgreSQLConnector(DatabaseConnector):
         Returns:
             PyArrow Table with query results
         """
+        return pa.Table.from_batches(list(self.iter_query_batches(query)))
+
+    def iter_query_batches(
+        self,
+        query: str,
+        batch_size: int = 10000,
+        snapshot: Optional[str] = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Execute SQL query and stream results as Arrow RecordBatches
+
+        Uses a named (server-side) cursor, so the server keeps the result set
+        and only batch_size rows are held client-side at a time. Column types
+        come from describe_query, so every batch is converted with explicit types.
+
+        Args:
+            query: SQL query to execute (a single SELECT)
+            batch_size: Rows per RecordBatch
+            snapshot: Snapshot id from exported_snapshot() to read as of
+
+        Yields:
+            PyArrow RecordBatches sharing one schema (an empty result yields
+            one empty batch with the result columns)
+        """
+        described = self._result_schema(query)
+        conn = self.connect()
+        try:
+            self._begin_snapshot(conn, snapshot)
+            cursor = conn.cursor(name=f"flowforge_{uuid.uuid4().hex[:16]}")
+            cursor.itersize = batch_size
+            cursor.execute(query)
+
+            schema = None
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows and schema is not None:
+                    break
+                # Named cursors only describe the result after the first fetch
+                columns = [desc[0] for desc in cursor.description or []]
+                if schema is None:
+                    schema = self._named_schema(described, columns)
+                batch = _rows_to_record_batch(rows, columns, schema)
+                schema = batch.schema
+                yield batch
+                if not rows:
+                    break
+
+        except Exception as e:
+            raise Exception(f"Failed to execute query: {str(e)}")
+        finally:
+            # Closing the connection also drops the server-side cursor
+            self.close()
+
+    def hash_partition_predicate(self, column: str, partitions: int, index: int) -> str:
+        """Predicate selecting hash bucket `index` of `partitions` (hashtext based)"""
+        return f"mod(hashtext({column}::text)::bigint + 2147483648, {partitions}) = {index}"
+
+    def row_hash_expression(self, table_name: str) -> str:
+        """SQL expression hashing a whole row to a 64-bit integer (hash of the row's text form)"""
+        return "hashtextextended(t::text, 0)"
+
+    def build_sample(self, table_name: str, rows: int, row_count: Optional[int] = None) -> str:
+        """
+        Build a query reading up to `rows` rows spread across a table
+
+        TABLESAMPLE SYSTEM reads randomly chosen heap blocks, so the cost follows
+        the sample size rather than the table size (rows in one block are read
+        together). Tables not much larger than the sample are read with LIMIT.
+        """
+        percent = _sample_percent(rows, row_count)
+        if percent is None:
+            return super().build_sample(table_name, rows, row_count)
+        return self.build_select(f"{table_name} TABLESAMPLE SYSTEM ({percent:.6f})", limit=rows * SAMPLE_ROW_CAP)
+
+    @contextmanager
+    def exported_snapshot(self) -> Iterator[str]:
+        """
+        Export a snapshot that other connections can read the database as of
+
+        Opens a dedicated REPEATABLE READ transaction and keeps it open while
+        the context is active. Pass the snapshot id to iter_query_batches or
+        iter_copy_batches on other connectors so parallel extractions all see
+        the same committed data.
+
+        Yields:
+            Snapshot id from pg_export_snapshot()
+        """
+        conn = psycopg2.connect(
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            user=self.username,
+            password=self.password,
+            connect_timeout=self.timeout
+        )
+        try:
+            conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+            cursor = conn.cursor()
+            cursor.execute("SELECT pg_export_snapshot()")
+            snapshot_id = cursor.fetchone()[0]
+            yield snapshot_id
+        finally:
+            conn.rollback()
+            conn.close()
+
+    def _begin_snapshot(self, conn, snapshot: Optional[str]) -> None:
+        """Start a REPEATABLE READ transaction on an exported snapshot (if given)"""
+        if not snapshot:
+            return
+        conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+        cursor = conn.cursor()
+        cursor.execute("SET TRANSACTION SNAPSHOT %s", (snapshot,))
+        cursor.close()
+
+    def replication_connection(self) -> psycopg2.extras.LogicalReplicationConnection:
+        """
+        Open a dedicated logical replication connection (not pooled)
+
+        The session uses ISO dates and UTC offsets, so output plugins write
+        temporal values in the text forms Arrow parses (as in iter_copy_batches).
+        The caller closes the connection.
+
+        Returns:
+            psycopg2 LogicalReplicationConnection
+        """
+        try:
+            return psycopg2.connect(
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.username,
+                password=self.password,
+                connect_timeout=self.timeout,
+                connection_factory=psycopg2.extras.LogicalReplicationConnection,
+                options="-c DateStyle=ISO,YMD -c TimeZone=UTC"
+            )
+        except Exception as e:
+            raise Exception(f"Failed to open replication connection: {str(e)}")
+
+    def replication_slot(self, slot_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a replication slot of this database
+
+        Args:
+            slot_name: Name of the slot
+
+        Returns:
+            {'plugin': str, 'confirmed_flush_lsn': str, 'active': bool} or None if the slot does not exist
+        """
         try:
             conn = self.connect()
             cursor = conn.cursor()
 
-            # Execute query
-            cursor.execute(query)
+            cursor.execute(
+                """
+                SELECT plugin, confirmed_flush_lsn::text, active
+                FROM pg_replication_slots
+                WHERE slot_name = %s AND database = current_database()
+                """,
+                (slot_name,)
+            )
+            row = cursor.fetchone()
 
-            # Get column names
-            columns = [desc[0] for desc in cursor.description]
+            cursor.close()
+            self.close()
 
-            # Fetch all rows
-            rows = cursor.fetchall()
+            if row is None:
+                return None
+            return {'plugin': row[0], 'confirmed_flush_lsn': row[1], 'active': row[2]}
+
+        except Exception as e:
+            raise Exception(f"Failed to get replication slot {slot_name}: {str(e)}")
+
+    def drop_replication_slot(self, slot_name: str) -> None:
+        """Drop a replication slot (the server frees the WAL it retained)"""
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT pg_drop_replication_slot(%s)", (slot_name,))
 
             cursor.close()
             self.close()
 
-            if not rows:
-                # Return empty table with schema
-                return pa.table({col: [] for col in columns})
+        except Exception as e:
+            raise Exception(f"Failed to drop replication slot {slot_name}: {str(e)}")
+
+    def ensure_publication(self, publication: str, table_name: str) -> bool:
+        """
+        Create a publication of a table for pgoutput, unless it exists
+
+        Args:
+            publication: Publication name
+            table_name: Table to publish (optionally schema-qualified)
+
+        Returns:
+            True if the publication was created
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
 
-            # Convert to dict of lists (column-oriented)
-            data = {}
-            for i, col_name in enumerate(columns):
-                data[col_name] = [row[i] for row in rows]
+            cursor.execute("SELECT 1 FROM pg_publication WHERE pubname = %s", (publication,))
+            created = cursor.fetchone() is None
+            if created:
+                cursor.execute(f"CREATE PUBLICATION {publication} FOR TABLE {table_name}")
+                conn.commit()
 
-            # Create Arrow Table
-            arrow_table = pa.table(data)
+            cursor.close()
+            self.close()
 
-            return arrow_table
+            return created
 
         except Exception as e:
-            raise Exception(f"Failed to execute query: {str(e)}")
+            raise Exception(f"Failed to create publication {publication}: {str(e)}")
+
+    def type_names(self, oids: List[int]) -> Dict[int, str]:
+        """
+        Resolve type OIDs (e.g. from pgoutput relation messages) to type names
+
+        Args:
+            oids: Type OIDs
+
+        Returns:
+            {oid: type name as in information_schema, e.g. 'timestamp without time zone'}
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT oid, format_type(oid, NULL) FROM pg_type WHERE oid = ANY(%s)", (list(oids),))
+            names = dict(cursor.fetchall())
+
+            cursor.close()
+            self.close()
+
+            return names
+
+        except Exception as e:
+            raise Exception(f"Failed to resolve type OIDs: {str(e)}")
+
+    def describe_query(self, query: str) -> pa.Schema:
+        """
+        Get the Arrow schema of a query's result without reading any rows
+
+        Column types come from the result's type OIDs, mapped with
+        _pg_type_to_arrow. Unconstrained NUMERIC is read as strings, since its
+        values can exceed any fixed decimal precision and scale.
+
+        Args:
+            query: SQL query (a single SELECT)
+
+        Returns:
+            PyArrow Schema
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute(f"SELECT * FROM ({query}) AS flowforge_q LIMIT 0")
+            description = cursor.description
+
+            cursor.execute(
+                "SELECT oid, format_type(oid, NULL) FROM pg_type WHERE oid = ANY(%s)",
+                (list({column.type_code for column in description}),)
+            )
+            type_names = dict(cursor.fetchall())
+
+            cursor.close()
+            self.close()
+
+            fields = []
+            for column in description:
+                pg_type = type_names.get(column.type_code, 'text')
+                if pg_type in ('numeric', 'decimal') and not column.precision:
+                    # Unconstrained NUMERIC can exceed any fixed decimal128 precision/scale
+                    arrow_type = pa.string()
+                else:
+                    arrow_type = self._pg_type_to_arrow(pg_type, column.precision, column.scale)
+                fields.append(pa.field(column.name, arrow_type))
+            return pa.schema(fields)
+
+        except Exception as e:
+            raise Exception(f"Failed to describe query: {str(e)}")
+
+    @staticmethod
+    def copy_convert_options(schema: pa.Schema) -> 'pa_csv.ConvertOptions':
+        """
+        Arrow CSV conversion options for COPY ... (FORMAT csv) output
+
+        COPY writes NULL as an empty unquoted field and an empty string as "",
+        so that is the only null marker; literals such as NA, NULL or NaN are
+        data.
+        """
+        import pyarrow.csv as pa_csv
+
+        return pa_csv.ConvertOptions(
+            column_types=schema,
+            null_values=[''],
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=False,
+            true_values=['t'],
+            false_values=['f'],
+        )
+
+    def iter_copy_batches(
+        self,
+        query: str,
+        block_size: int = 8 * 1024 * 1024,
+        snapshot: Optional[str] = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Extract a query with COPY (...) TO STDOUT and stream it as Arrow RecordBatches
+
+        The server streams the result as CSV text into a pipe that Arrow's
+        multithreaded CSV reader parses directly into typed columns (see
+        describe_query), so no Python object is created per row or value.
+        bytea columns are kept as their hex text form.
+
+        Args:
+            query: SQL query to execute (a single SELECT)
+            block_size: Bytes of CSV parsed per RecordBatch
+            snapshot: Snapshot id from exported_snapshot() to read as of
+
+        Yields:
+            PyArrow RecordBatches sharing one schema (an empty result yields
+            one empty batch with the result columns)
+        """
+        import io
+        import os
+        import threading
+        import pyarrow.csv as pa_csv
+
+        schema = self.describe_query(query)
+        schema = pa.schema([field.with_type(pa.string()) if pa.types.is_binary(field.type) else field for field in schema])
+        conn = self.connect()
+
+        read_fd, write_fd = os.pipe()
+        source = io.BufferedReader(io.FileIO(read_fd, 'rb'), buffer_size=block_size)
+        sink = io.FileIO(write_fd, 'wb')
+        copy_errors: List[Exception] = []
+
+        def run_copy():
+            try:
+                self._begin_snapshot(conn, snapshot)
+                cursor = conn.cursor()
+                # Text forms Arrow parses: ISO dates and UTC offsets
+                cursor.execute("SET DateStyle TO ISO, YMD; SET TIME ZONE 'UTC'")
+                cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv)", sink, size=block_size)
+                cursor.close()
+            except Exception as e:
+                copy_errors.append(e)
+            finally:
+                sink.close()
+
+        copy_thread = threading.Thread(target=run_copy, name="flowforge-pg-copy", daemon=True)
+        copy_thread.start()
+        try:
+            if not source.peek(1):
+                copy_thread.join()
+                if not copy_errors:
+                    yield pa.RecordBatch.from_pylist([], schema=schema)
+            else:
+                reader = pa_csv.open_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(column_names=schema.names, block_size=block_size),
+                    parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                    convert_options=self.copy_convert_options(schema),
+                )
+                for batch in reader:
+                    yield batch
+
+        except Exception as e:
+            copy_thread.join()
+            if copy_errors:
+                raise Exception(f"Failed to execute COPY: {str(copy_errors[0])}")
+            raise Exception(f"Failed to parse COPY output: {str(e)}")
+        finally:
+            # Closing the read end stops a COPY that is still writing
+            source.close()
+            if copy_thread.is_alive():
+                conn.cancel()
+            copy_thread.join()
+            self.close()
+
+        if copy_errors:
+            raise Exception(f"Failed to execute COPY: {str(copy_errors[0])}")
 
     def get_incremental_data(
         self,
         table_name: str,
         delta_column: str,
         last_value: Any,
-        batch_size: int = 10000
+        batch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        last_key: Optional[List[Any]] = None
     ) -> pa.Table:
         """
         Read incremental data based on watermark column
@@ -782,47 +1922,193 @@ class PostgreSQLConnector(DatabaseConnector):
             delta_column: Column to use for incremental logic
             last_value: Last watermark value from previous run
             batch_size: Number of rows per batch
+            key_columns: Primary key column(s) breaking ties on delta_column
+            last_key: Primary key value(s) of the last row read at last_value;
+                with key_columns, rows sharing last_value are not skipped
 
         Returns:
             PyArrow Table with new/updated records
         """
-        # Build WHERE clause for incremental load
-        if isinstance(last_value, (datetime, str)):
-            where_clause = f"{delta_column} > '{last_value}'"
-        else:
-            where_clause = f"{delta_column} > {last_value}"
-
+        if key_columns and last_key is not None:
+            return self.read_table(
+                table_name=table_name,
+                batch_size=batch_size,
+                where_clause=self.keyset_where([delta_column] + key_columns, [last_value] + list(last_key)),
+                order_by=", ".join([delta_column] + key_columns)
+            )
         return self.read_table(
             table_name=table_name,
             batch_size=batch_size,
-            where_clause=where_clause,
+            where_clause=self.incremental_where(delta_column, last_value),
             order_by=delta_column
         )
 
-    def get_row_count(self, table_name: str) -> int:
+    def get_table_stats(self, table_name: str) -> Dict[str, Any]:
         """
-        Get total row count for a table
+        Get approximate table statistics from planner metadata, without scanning the table
+
+        The row count is estimated the way the planner does it: pg_class.reltuples
+        scaled to the table's current page count, falling back to
+        pg_stat_user_tables.n_live_tup for tables never analyzed. Partitioned
+        tables are summed over their partitions. PostgreSQL does not record
+        modification times, so last_modified is None and last_analyzed and
+        modifications_since_analyze indicate how fresh the estimate is.
 
         Args:
-            table_name: Name of the table
+            table_name: Name of the table (optionally schema-qualified)
 
         Returns:
-            Number of rows
+            {
+                'row_count': int or None (no statistics yet),
+                'row_count_exact': False,
+                'total_bytes': int,
+                'data_bytes': int,
+                'partitions': int,
+                'last_modified': None,
+                'last_analyzed': datetime or None,
+                'modifications_since_analyze': int or None,
+                'source': 'pg_class'
+            }
         """
         try:
             conn = self.connect()
             cursor = conn.cursor()
 
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
-
+            cursor.execute("""
+                WITH rel AS (
+                    SELECT c.oid, c.relkind, c.reltuples, c.relpages
+                    FROM pg_class c
+                    WHERE c.oid = to_regclass(%s)
+                        OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(%s))
+                )
+                SELECT
+                    SUM(CASE
+                        WHEN r.reltuples >= 0 AND r.relpages > 0
+                            THEN r.reltuples / r.relpages
+                                * (pg_relation_size(r.oid) / current_setting('block_size')::int)
+                        WHEN r.reltuples >= 0 THEN r.reltuples
+                        ELSE s.n_live_tup
+                    END)::bigint,
+                    BOOL_OR(r.relkind <> 'p' AND r.reltuples < 0 AND s.n_live_tup IS NULL),
+                    SUM(pg_total_relation_size(r.oid)),
+                    SUM(pg_relation_size(r.oid)),
+                    COUNT(*) FILTER (WHERE r.relkind <> 'p'),
+                    MAX(GREATEST(s.last_analyze, s.last_autoanalyze)),
+                    SUM(s.n_mod_since_analyze)
+                FROM rel r
+                LEFT JOIN pg_stat_user_tables s ON s.relid = r.oid
+            """, (table_name, table_name))
+            row = cursor.fetchone()
             cursor.close()
-            self.close()
 
-            return count
+            if row is None or row[4] is None or (row[4] == 0 and row[0] is None):
+                raise Exception(f"no statistics for {table_name}")
+
+            return {
+                'row_count': None if row[1] else int(row[0] or 0),
+                'row_count_exact': False,
+                'total_bytes': int(row[2] or 0),
+                'data_bytes': int(row[3] or 0),
+                'partitions': int(row[4]),
+                'last_modified': None,
+                'last_analyzed': row[5],
+                'modifications_since_analyze': int(row[6]) if row[6] is not None else None,
+                'source': 'pg_class'
+            }
 
         except Exception as e:
-            raise Exception(f"Failed to get row count: {str(e)}")
+            raise Exception(f"Failed to get table stats: {str(e)}")
+        finally:
+            self.close()
+
+    def ddl_version(self) -> str:
+        """
+        Cheap catalog fingerprint that changes when tables, columns or indexes change
+
+        PostgreSQL records no DDL times, so this hashes the row versions (xmin)
+        of the public schema's pg_class and pg_attribute rows. DDL rewrites
+        these rows, while VACUUM and ANALYZE update them in place (TRUNCATE
+        also changes it).
+        """
+        return self._fetch_ddl_version("""
+            SELECT COUNT(*), md5(string_agg(version, ',' ORDER BY version))
+            FROM (
+                SELECT 'c' || c.oid || ':' || c.xmin::text AS version
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = 'public'
+                UNION ALL
+                SELECT 'a' || a.attrelid || '.' || a.attnum || ':' || a.xmin::text
+                FROM pg_attribute a
+                JOIN pg_class c ON c.oid = a.attrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = 'public' AND a.attnum > 0
+            ) versions
+        """)
+
+    def introspect_database(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Columns, primary key, indexes and statistics of every public table, in two catalog queries
+
+        Columns come from information_schema.columns (as in get_schema), index
+        key columns from pg_index and row counts from the planner estimate
+        (pg_class.reltuples, or pg_stat_user_tables.n_live_tup for tables never
+        analyzed).
+
+        Returns:
+            {
+                table_name: {
+                    'columns': list of column info (as get_schema),
+                    'primary_key': list of column names,
+                    'indexes': [{'name': str, 'columns': list, 'unique': bool, 'primary': bool}],
+                    'stats': {'row_count': int, 'row_count_exact': False, 'total_bytes': int,
+                              'schema_modified': None}
+                }
+            }
+        """
+        return self._run_introspection(
+            """
+                SELECT
+                    c.table_name,
+                    c.column_name,
+                    c.data_type,
+                    c.is_nullable,
+                    c.character_maximum_length,
+                    c.numeric_precision,
+                    c.numeric_scale
+                FROM information_schema.columns c
+                JOIN information_schema.tables t
+                    ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+                WHERE c.table_schema = 'public'
+                    AND t.table_type = 'BASE TABLE'
+                ORDER BY c.table_name, c.ordinal_position
+            """,
+            """
+                SELECT
+                    t.relname,
+                    ic.relname,
+                    ix.indisprimary,
+                    ix.indisunique,
+                    a.attname,
+                    (CASE WHEN t.reltuples >= 0 THEN t.reltuples ELSE s.n_live_tup END)::bigint,
+                    pg_total_relation_size(t.oid),
+                    NULL::timestamp
+                FROM pg_class t
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                LEFT JOIN pg_index ix ON ix.indrelid = t.oid
+                LEFT JOIN pg_class ic ON ic.oid = ix.indexrelid
+                LEFT JOIN LATERAL (
+                    SELECT u.attnum, u.ord
+                    FROM unnest(ix.indkey) WITH ORDINALITY AS u(attnum, ord)
+                    WHERE u.ord <= ix.indnkeyatts
+                ) k ON true
+                LEFT JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+                LEFT JOIN pg_stat_user_tables s ON s.relid = t.oid
+                WHERE n.nspname = 'public'
+                    AND t.relkind IN ('r', 'p')
+                ORDER BY t.relname, ic.relname, k.ord
+            """
+        )
 
     def preview_data(self, table_name: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -852,8 +2138,696 @@ class PostgreSQLConnector(DatabaseConnector):
 
 
 class MySQLConnector(DatabaseConnector):
-    """MySQL connector (placeholder for future implementation)"""
-    pass
+    """MySQL / MariaDB database connector using PyMySQL"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        database: str,
+        username: str,
+        password: str,
+        timeout: int = 30
+    ):
+        """
+        Initialize MySQL connector
+
+        Args:
+            host: Database host (e.g., 'localhost')
+            port: Database port (default: 3306)
+            database: Database name
+            username: Database username
+            password: Database password
+            timeout: Connection timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.database = database
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.connection = None
+
+    def connect(self):
+        """
+        Get a database connection from the connection pool (opening one if none is idle)
+
+        Returns:
+            pymysql.connections.Connection object
+
+        Raises:
+            Exception if connection fails
+        """
+        try:
+            self.connection = connection_pool.acquire(self._pool_key(), self._open_connection, self._ping)
+            return self.connection
+        except Exception as e:
+            raise Exception(f"Failed to connect to MySQL: {str(e)}")
+
+    def _open_connection(self):
+        """Open a new database connection (TIMESTAMP values are read in UTC)"""
+        import pymysql
+
+        return pymysql.connect(
+            host=self.host,
+            port=int(self.port),
+            database=self.database,
+            user=self.username,
+            password=self.password,
+            connect_timeout=self.timeout,
+            charset='utf8mb4',
+            init_command="SET time_zone = '+00:00'"
+        )
+
+    @staticmethod
+    def _reset_connection(conn) -> None:
+        """End any open transaction before the connection is reused"""
+        if not conn.open:
+            raise Exception("connection is closed")
+        conn.rollback()
+
+    def close(self):
+        """Return the database connection to the connection pool"""
+        if self.connection:
+            connection_pool.release(self._pool_key(), self.connection, self._reset_connection)
+            self.connection = None
+
+    def test_connection(self) -> Dict[str, Any]:
+        """
+        Test database connection
+
+        Returns:
+            {
+                'success': bool,
+                'message': str,
+                'server_version': str (if success)
+            }
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            # Get MySQL / MariaDB version
+            cursor.execute("SELECT VERSION()")
+            version = cursor.fetchone()[0]
+
+            # Get database name
+            cursor.execute("SELECT DATABASE()")
+            db_name = cursor.fetchone()[0]
+
+            cursor.close()
+            self.close()
+
+            return {
+                'success': True,
+                'message': f'Successfully connected to {db_name}',
+                'server_version': version,
+                'database': db_name
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Connection failed: {str(e)}'
+            }
+
+    def list_tables(self) -> List[str]:
+        """
+        List all tables in the connected database
+
+        Returns:
+            List of table names
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT TABLE_NAME
+                FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_TYPE = 'BASE TABLE'
+                ORDER BY TABLE_NAME
+            """)
+
+            tables = [row[0] for row in cursor.fetchall()]
+
+            cursor.close()
+            self.close()
+
+            return tables
+
+        except Exception as e:
+            raise Exception(f"Failed to list tables: {str(e)}")
+
+    def get_schema(self, table_name: str) -> List[Dict[str, str]]:
+        """
+        Get schema for a specific table
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            List of dicts with column info
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT
+                    COLUMN_NAME,
+                    DATA_TYPE,
+                    IS_NULLABLE,
+                    CHARACTER_MAXIMUM_LENGTH,
+                    NUMERIC_PRECISION,
+                    NUMERIC_SCALE
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_NAME = %s
+                ORDER BY ORDINAL_POSITION
+            """, (table_name,))
+
+            schema = []
+            for row in cursor.fetchall():
+                col_info = {
+                    'column_name': row[0],
+                    'data_type': row[1],
+                    'is_nullable': row[2] == 'YES'
+                }
+                if row[3]:  # max_length
+                    col_info['max_length'] = row[3]
+                if row[4]:  # numeric_precision
+                    col_info['numeric_precision'] = row[4]
+                if row[5]:  # numeric_scale
+                    col_info['numeric_scale'] = row[5]
+
+                schema.append(col_info)
+
+            cursor.close()
+            self.close()
+
+            return schema
+
+        except Exception as e:
+            raise Exception(f"Failed to get schema for {table_name}: {str(e)}")
+
+    def _mysql_type_to_arrow(self, mysql_type: str, precision: Optional[int] = None, scale: Optional[int] = None) -> pa.DataType:
+        """
+        Map MySQL data types to Arrow data types
+
+        Integer types map to the next wider signed type, so UNSIGNED values fit
+        (BIGINT UNSIGNED above 2^63 does not).
+
+        Args:
+            mysql_type: MySQL data type
+            precision: Numeric precision (for DECIMAL/NUMERIC)
+            scale: Numeric scale (for DECIMAL/NUMERIC)
+
+        Returns:
+            PyArrow DataType
+        """
+        type_mapping = {
+            # Integer types
+            'tinyint': pa.int16(),
+            'smallint': pa.int32(),
+            'mediumint': pa.int32(),
+            'int': pa.int64(),
+            'integer': pa.int64(),
+            'bigint': pa.int64(),
+            'year': pa.int16(),
+
+            # Float types
+            'float': pa.float32(),
+            'double': pa.float64(),
+
+            # String types
+            'char': pa.string(),
+            'varchar': pa.string(),
+            'tinytext': pa.string(),
+            'text': pa.string(),
+            'mediumtext': pa.string(),
+            'longtext': pa.string(),
+            'enum': pa.string(),
+            'set': pa.string(),
+            'json': pa.string(),
+
+            # Date/time types
+            'date': pa.date32(),
+            'datetime': pa.timestamp('us'),
+            'timestamp': pa.timestamp('us', tz='UTC'),
+            'time': pa.duration('us'),  # TIME is an interval (may be negative or exceed 24h)
+
+            # Binary types
+            'binary': pa.binary(),
+            'varbinary': pa.binary(),
+            'tinyblob': pa.binary(),
+            'blob': pa.binary(),
+            'mediumblob': pa.binary(),
+            'longblob': pa.binary(),
+            'bit': pa.binary(),
+        }
+
+        # Handle DECIMAL/NUMERIC with precision and scale
+        if mysql_type in ['decimal', 'numeric']:
+            if precision and scale is not None:
+                return _decimal_type(precision, scale)
+            else:
+                return pa.decimal128(10, 0)  # Default
+
+        return type_mapping.get(mysql_type, pa.string())  # Default to string for unknown types
+
+    def describe_query(self, query: str) -> pa.Schema:
+        """
+        Get the Arrow schema of a query's result without reading any rows
+
+        Column types come from the result metadata of a LIMIT 0 probe, mapped
+        with _mysql_type_to_arrow. String and BLOB columns share their type
+        codes and are told apart by the binary character set (63).
+
+        Args:
+            query: SQL query (a single SELECT)
+
+        Returns:
+            PyArrow Schema
+        """
+        from pymysql.constants import FIELD_TYPE
+
+        BINARY_CHARSET = 63
+        type_names = {
+            FIELD_TYPE.TINY: 'tinyint',
+            FIELD_TYPE.SHORT: 'smallint',
+            FIELD_TYPE.INT24: 'mediumint',
+            FIELD_TYPE.LONG: 'int',
+            FIELD_TYPE.LONGLONG: 'bigint',
+            FIELD_TYPE.YEAR: 'year',
+            FIELD_TYPE.FLOAT: 'float',
+            FIELD_TYPE.DOUBLE: 'double',
+            FIELD_TYPE.DECIMAL: 'decimal',
+            FIELD_TYPE.NEWDECIMAL: 'decimal',
+            FIELD_TYPE.DATE: 'date',
+            FIELD_TYPE.NEWDATE: 'date',
+            FIELD_TYPE.DATETIME: 'datetime',
+            FIELD_TYPE.TIMESTAMP: 'timestamp',
+            FIELD_TYPE.TIME: 'time',
+            FIELD_TYPE.BIT: 'bit',
+            FIELD_TYPE.JSON: 'json',
+        }
+
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute(f"SELECT * FROM ({query}) AS flowforge_q LIMIT 0")
+            description = cursor.description
+            # PyMySQL only exposes column character sets on the result fields
+            binary = [field.charsetnr == BINARY_CHARSET for field in cursor._result.fields]
+
+            cursor.close()
+            self.close()
+
+            fields = []
+            for (name, type_code, _, length, _, scale, _), is_binary in zip(description, binary):
+                mysql_type = type_names.get(type_code, 'varbinary' if is_binary else 'varchar')
+                precision = None
+                if mysql_type == 'decimal' and length:
+                    # Display length counts the decimal point (and sign, so this may overshoot by one)
+                    precision = length - (1 if scale else 0)
+                fields.append(pa.field(name, self._mysql_type_to_arrow(mysql_type, precision, scale)))
+            return pa.schema(fields)
+
+        except Exception as e:
+            raise Exception(f"Failed to describe query: {str(e)}")
+
+    def read_table(
+        self,
+        table_name: str,
+        batch_size: int = 10000,
+        where_clause: Optional[str] = None,
+        order_by: Optional[str] = None
+    ) -> pa.Table:
+        """
+        Read entire table into Arrow Table
+
+        Args:
+            table_name: Name of the table to read
+            batch_size: Number of rows per batch (for memory efficiency)
+            where_clause: Optional WHERE clause (without 'WHERE' keyword)
+            order_by: Optional ORDER BY clause (without 'ORDER BY' keyword)
+
+        Returns:
+            PyArrow Table with all data
+        """
+        return self.read_query(self.build_select(table_name, where_clause, order_by))
+
+    def read_query(self, query: str) -> pa.Table:
+        """
+        Execute custom SQL query and return Arrow Table
+
+        Args:
+            query: SQL query to execute
+
+        Returns:
+            PyArrow Table with query results
+        """
+        return pa.Table.from_batches(list(self.iter_query_batches(query)))
+
+    def iter_query_batches(self, query: str, batch_size: int = 10000) -> Iterator[pa.RecordBatch]:
+        """
+        Execute SQL query and stream results as Arrow RecordBatches
+
+        Uses an unbuffered cursor (SSCursor), so rows are read off the socket
+        as they are fetched and only batch_size rows are held client-side at a
+        time. Column types come from describe_query, so every batch is
+        converted with explicit types.
+
+        Args:
+            query: SQL query to execute
+            batch_size: Rows per RecordBatch
+
+        Yields:
+            PyArrow RecordBatches sharing one schema (an empty result yields
+            one empty batch with the result columns)
+        """
+        import pymysql.cursors
+
+        described = self._result_schema(query)
+        conn = self.connect()
+        finished = False
+        try:
+            cursor = conn.cursor(pymysql.cursors.SSCursor)
+            cursor.execute(query)
+            columns = [desc[0] for desc in cursor.description]
+
+            schema = self._named_schema(described, columns)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows and schema is not None:
+                    break
+                batch = _rows_to_record_batch(rows, columns, schema)
+                schema = batch.schema
+                yield batch
+                if not rows:
+                    break
+
+            cursor.close()
+            finished = True
+
+        except Exception as e:
+            raise Exception(f"Failed to execute query: {str(e)}")
+        finally:
+            if not finished:
+                # Unread rows of an unbuffered result block the connection; drop it
+                # instead of draining the rest of the result
+                conn.close()
+            self.close()
+
+    def hash_partition_predicate(self, column: str, partitions: int, index: int) -> str:
+        """Predicate selecting hash bucket `index` of `partitions` (CRC32 based)"""
+        return f"MOD(CRC32({column}), {partitions}) = {index}"
+
+    def row_hash_expression(self, table_name: str) -> str:
+        """
+        SQL expression hashing a whole row to an integer (first 60 bits of an MD5)
+
+        MySQL has no whole-row reference, so the columns are read from get_schema
+        and concatenated (with a marker for NULL).
+        """
+        columns = ", ".join(f"IFNULL(t.`{column['column_name']}`, CHAR(0))" for column in self.get_schema(table_name))
+        return f"CAST(CONV(LEFT(MD5(CONCAT_WS(CHAR(31), {columns})), 15), 16, 10) AS UNSIGNED)"
+
+    def build_sample(self, table_name: str, rows: int, row_count: Optional[int] = None) -> str:
+        """
+        Build a query reading up to `rows` rows spread across a table
+
+        MySQL has no TABLESAMPLE. With an integer primary key, the sample is the
+        union of SAMPLE_SEEKS short index range reads starting at random key
+        values between MIN and MAX (both read from the index), so the cost
+        follows the sample size. Without one, rows are kept with probability
+        RAND() < rate, which scans the whole table: only done up to
+        SAMPLE_SCAN_MAX_ROWS rows, larger tables are read from the head. Tables
+        not much larger than the sample are read with LIMIT.
+        """
+        percent = _sample_percent(rows, row_count)
+        if percent is None:
+            return super().build_sample(table_name, rows, row_count)
+
+        key_column = self._integer_primary_key(table_name)
+        if key_column is not None:
+            lo, hi = self.read_query(
+                f"SELECT MIN(`{key_column}`) AS lo, MAX(`{key_column}`) AS hi FROM {table_name}"
+            ).to_pylist()[0].values()
+            if lo is not None:
+                seek_rows = -(-rows * SAMPLE_OVERSAMPLING // SAMPLE_SEEKS)
+                starts = sorted(random.randint(lo, hi) for _ in range(SAMPLE_SEEKS))
+                # UNION (not UNION ALL) drops rows read twice by overlapping seeks
+                return " UNION ".join(
+                    f"({self.build_select(table_name, where_clause=f'`{key_column}` >= {start}', order_by=f'`{key_column}`', limit=seek_rows)})"
+                    for start in starts
+                )
+
+        if row_count > SAMPLE_SCAN_MAX_ROWS:
+            return super().build_sample(table_name, rows, row_count)
+        return self.build_select(
+            table_name, where_clause=f"RAND() < {percent / 100:.8f}", limit=rows * SAMPLE_ROW_CAP
+        )
+
+    def _integer_primary_key(self, table_name: str) -> Optional[str]:
+        """Name of the table's primary key if it is a single integer column, else None"""
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT k.COLUMN_NAME, c.DATA_TYPE
+                FROM information_schema.KEY_COLUMN_USAGE k
+                JOIN information_schema.COLUMNS c
+                    ON c.TABLE_SCHEMA = k.TABLE_SCHEMA
+                    AND c.TABLE_NAME = k.TABLE_NAME
+                    AND c.COLUMN_NAME = k.COLUMN_NAME
+                WHERE k.TABLE_SCHEMA = DATABASE()
+                    AND k.TABLE_NAME = %s
+                    AND k.CONSTRAINT_NAME = 'PRIMARY'
+            """, (table_name,))
+            key_columns = cursor.fetchall()
+            cursor.close()
+        finally:
+            self.close()
+
+        if len(key_columns) == 1 and key_columns[0][1].lower() in ('tinyint', 'smallint', 'mediumint', 'int', 'bigint'):
+            return key_columns[0][0]
+        return None
+
+    def get_incremental_data(
+        self,
+        table_name: str,
+        delta_column: str,
+        last_value: Any,
+        batch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        last_key: Optional[List[Any]] = None
+    ) -> pa.Table:
+        """
+        Read incremental data based on watermark column
+
+        Args:
+            table_name: Name of the table
+            delta_column: Column to use for incremental logic
+            last_value: Last watermark value from previous run
+            batch_size: Number of rows per batch
+            key_columns: Primary key column(s) breaking ties on delta_column
+            last_key: Primary key value(s) of the last row read at last_value;
+                with key_columns, rows sharing last_value are not skipped
+
+        Returns:
+            PyArrow Table with new/updated records
+        """
+        if key_columns and last_key is not None:
+            return self.read_table(
+                table_name=table_name,
+                batch_size=batch_size,
+                where_clause=self.keyset_where([delta_column] + key_columns, [last_value] + list(last_key)),
+                order_by=", ".join([delta_column] + key_columns)
+            )
+        return self.read_table(
+            table_name=table_name,
+            batch_size=batch_size,
+            where_clause=self.incremental_where(delta_column, last_value),
+            order_by=delta_column
+        )
+
+    def get_table_stats(self, table_name: str) -> Dict[str, Any]:
+        """
+        Get approximate table statistics from information_schema, without scanning the table
+
+        TABLE_ROWS is InnoDB's estimate from sampled index pages (exact for
+        MyISAM). MySQL 8 caches these values for information_schema_stats_expiry
+        seconds (a day by default). UPDATE_TIME is not persisted by InnoDB and
+        is NULL after a server restart.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            {
+                'row_count': int,
+                'row_count_exact': bool,
+                'total_bytes': int,
+                'data_bytes': int,
+                'partitions': int,
+                'last_modified': datetime or None,
+                'created': datetime or None,
+                'source': 'information_schema.tables'
+            }
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT
+                    t.TABLE_ROWS,
+                    t.DATA_LENGTH + t.INDEX_LENGTH,
+                    t.DATA_LENGTH,
+                    t.UPDATE_TIME,
+                    t.CREATE_TIME,
+                    t.ENGINE,
+                    (
+                        SELECT COUNT(*)
+                        FROM information_schema.PARTITIONS p
+                        WHERE p.TABLE_SCHEMA = t.TABLE_SCHEMA AND p.TABLE_NAME = t.TABLE_NAME
+                    )
+                FROM information_schema.TABLES t
+                WHERE t.TABLE_SCHEMA = DATABASE()
+                    AND t.TABLE_NAME = %s
+            """, (table_name,))
+            row = cursor.fetchone()
+            cursor.close()
+
+            if row is None or row[0] is None:
+                raise Exception(f"no statistics for {table_name}")
+
+            return {
+                'row_count': int(row[0]),
+                'row_count_exact': row[5] == 'MyISAM',
+                'total_bytes': int(row[1] or 0),
+                'data_bytes': int(row[2] or 0),
+                'partitions': int(row[6] or 1),
+                'last_modified': row[3],
+                'created': row[4],
+                'source': 'information_schema.tables'
+            }
+
+        except Exception as e:
+            raise Exception(f"Failed to get table stats: {str(e)}")
+        finally:
+            self.close()
+
+    def ddl_version(self) -> str:
+        """
+        Cheap catalog fingerprint that changes when tables, columns or indexes change
+
+        information_schema has no reliable DDL time (instant ALTER TABLE keeps
+        CREATE_TIME), so this checksums the column and index definitions.
+        """
+        return self._fetch_ddl_version("""
+            SELECT
+                (
+                    SELECT CONCAT(COUNT(*), ':', IFNULL(SUM(CRC32(CONCAT_WS(':',
+                        TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION, COLUMN_TYPE, IS_NULLABLE))), 0))
+                    FROM information_schema.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                ),
+                (
+                    SELECT CONCAT(COUNT(*), ':', IFNULL(SUM(CRC32(CONCAT_WS(':',
+                        TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX, COLUMN_NAME, NON_UNIQUE))), 0))
+                    FROM information_schema.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                )
+        """)
+
+    def introspect_database(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Columns, primary key, indexes and statistics of every table, in two catalog queries
+
+        Columns come from information_schema.COLUMNS (as in get_schema), index
+        key columns from information_schema.STATISTICS and row counts from the
+        TABLE_ROWS estimate (see get_table_stats).
+
+        Returns:
+            {
+                table_name: {
+                    'columns': list of column info (as get_schema),
+                    'primary_key': list of column names,
+                    'indexes': [{'name': str, 'columns': list, 'unique': bool, 'primary': bool}],
+                    'stats': {'row_count': int, 'row_count_exact': False, 'total_bytes': int,
+                              'schema_modified': ISO datetime the table was (re)built}
+                }
+            }
+        """
+        return self._run_introspection(
+            """
+                SELECT
+                    c.TABLE_NAME,
+                    c.COLUMN_NAME,
+                    c.DATA_TYPE,
+                    c.IS_NULLABLE,
+                    c.CHARACTER_MAXIMUM_LENGTH,
+                    c.NUMERIC_PRECISION,
+                    c.NUMERIC_SCALE
+                FROM information_schema.COLUMNS c
+                JOIN information_schema.TABLES t
+                    ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+                WHERE c.TABLE_SCHEMA = DATABASE()
+                    AND t.TABLE_TYPE = 'BASE TABLE'
+                ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+            """,
+            """
+                SELECT
+                    t.TABLE_NAME,
+                    s.INDEX_NAME,
+                    s.INDEX_NAME = 'PRIMARY',
+                    s.NON_UNIQUE = 0,
+                    s.COLUMN_NAME,
+                    t.TABLE_ROWS,
+                    t.DATA_LENGTH + t.INDEX_LENGTH,
+                    t.CREATE_TIME
+                FROM information_schema.TABLES t
+                LEFT JOIN information_schema.STATISTICS s
+                    ON s.TABLE_SCHEMA = t.TABLE_SCHEMA AND s.TABLE_NAME = t.TABLE_NAME
+                WHERE t.TABLE_SCHEMA = DATABASE()
+                    AND t.TABLE_TYPE = 'BASE TABLE'
+                ORDER BY t.TABLE_NAME, s.INDEX_NAME = 'PRIMARY' DESC, s.INDEX_NAME, s.SEQ_IN_INDEX
+            """
+        )
+
+    def preview_data(self, table_name: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Preview first N rows of a table
+
+        Args:
+            table_name: Name of the table
+            limit: Number of rows to return
+
+        Returns:
+            List of row dicts
+        """
+        import pymysql.cursors
+
+        try:
+            conn = self.connect()
+            cursor = conn.cursor(pymysql.cursors.DictCursor)
+
+            cursor.execute(f"SELECT * FROM {table_name} LIMIT %s", (limit,))
+            rows = cursor.fetchall()
+
+            cursor.close()
+            self.close()
+
+            return list(rows)
+
+        except Exception as e:
+            raise Exception(f"Failed to preview data: {str(e)}")
 
 
 class OracleConnector(DatabaseConnector):
@@ -0,0 +1,133 @@
+"""
+Extraction checkpoints for resumable database loads in FlowForge.
+
+Keyset-paged database extractions record their progress next to the Bronze
+table, one checkpoint per job:
+
+    bronze/{tableName}/_checkpoints/{jobId}.json
+
+Each page is uploaded as its own Bronze part before the checkpoint is advanced
+to the page's last (delta_column, primary key) value, so a failed load resumes
+after the last committed page instead of starting over. Key values are stored
+in a JSON form that every connector can compare against (see `key_value`).
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+import logging
+
+from utils.s3 import S3Client
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIRNAME = "_checkpoints"
+
+
+def checkpoint_key(table_prefix: str, job_id: str) -> str:
+    """Return the checkpoint key of a job's extraction into a Bronze table prefix."""
+    return f"{table_prefix.rstrip('/')}/{CHECKPOINT_DIRNAME}/{job_id}.json"
+
+
+def new_checkpoint(
+    job_id: str,
+    run_id: str,
+    source_table: str,
+    key_columns: List[str],
+    start_watermark: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Build an empty checkpoint for an extraction that starts after `start_watermark`.
+
+    Args:
+        job_id: FlowForge job ID
+        run_id: Run performing the extraction
+        source_table: Source table being paged
+        key_columns: Keyset columns (delta column first, then the primary key)
+        start_watermark: Watermark the extraction starts after (None for a full load)
+
+    Returns:
+        Checkpoint dict with no committed pages
+    """
+    return {
+        "job_id": job_id,
+        "run_id": run_id,
+        "source_table": source_table,
+        "key_columns": key_columns,
+        "start_watermark": start_watermark,
+        "last_key": None,
+        "parts": [],
+        "status": "in_progress",
+        "updated_at": None,
+    }
+
+
+def load_checkpoint(s3: S3Client, table_prefix: str, job_id: str) -> Optional[Dict[str, Any]]:
+    """Load a job's extraction checkpoint, or None if it has none."""
+    key = checkpoint_key(table_prefix, job_id)
+    if not s3.object_exists(key):
+        return None
+    return s3.read_json(key)
+
+
+def can_resume(
+    checkpoint: Optional[Dict[str, Any]],
+    source_table: str,
+    key_columns: List[str],
+    start_watermark: Optional[str],
+) -> bool:
+    """
+    Check whether a checkpoint belongs to an unfinished extraction of the same range.
+
+    A checkpoint only applies when it was started from the same watermark over
+    the same table and keyset; otherwise its pages cover different rows.
+    """
+    return (
+        checkpoint is not None
+        and checkpoint.get("status") == "in_progress"
+        and checkpoint.get("source_table") == source_table
+        and checkpoint.get("key_columns") == key_columns
+        and checkpoint.get("start_watermark") == start_watermark
+        and bool(checkpoint.get("parts"))
+    )
+
+
+def save_checkpoint(s3: S3Client, table_prefix: str, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Persist a checkpoint (after the parts it lists have been uploaded).
+
+    Args:
+        s3: S3Client instance
+        table_prefix: Bronze table prefix
+        checkpoint: Checkpoint dict (see `new_checkpoint`)
+
+    Returns:
+        The saved checkpoint
+    """
+    checkpoint["updated_at"] = datetime.utcnow().isoformat()
+    key = checkpoint_key(table_prefix, checkpoint["job_id"])
+    s3.write_json(key, checkpoint)
+    logger.info(
+        f"Checkpoint {key}: {len(checkpoint['parts'])} page(s), last key {checkpoint['last_key']}, "
+        f"{checkpoint['status']}"
+    )
+    return checkpoint
+
+
+def key_value(value: Any) -> Any:
+    """
+    Convert a keyset value read from the source into its checkpoint form.
+
+    Dates and datetimes become ISO 8601 strings ('T' separated, milliseconds
+    unless the value has sub-millisecond digits, so SQL Server can convert the
+    literal back to a DATETIME), Decimals become strings and other values are
+    kept as they are.
+    """
+    if isinstance(value, datetime):
+        timespec = "milliseconds" if value.microsecond % 1000 == 0 else "microseconds"
+        return value.isoformat(timespec=timespec)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
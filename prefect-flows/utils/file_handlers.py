@@ -2,17 +2,41 @@
 File Format Handler Framework for FlowForge
 
 Provides pluggable architecture for reading different file formats.
-Supports CSV, JSON, Parquet, Excel, and compressed files.
+Supports CSV, JSON, Parquet, Excel, and compressed files (gzip, bzip2,
+Zstandard and ZIP archives, see utils/compression.py).
 """
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
+import io
+import zipfile
 import polars as pl
+import pyarrow as pa
 from prefect import get_run_logger
 from prefect.exceptions import MissingContextError
 import logging
 
+from utils.compression import (
+    COMPRESSION_EXTENSIONS,
+    archive_members,
+    compression_of,
+    decompress_to_file,
+    open_archive_member,
+    open_decompressed,
+    strip_compression_extension,
+)
+from utils.json_stream import (
+    DEFAULT_BATCH_ROWS,
+    flatten_structs,
+    iter_json_array_batches,
+    iter_ndjson_batches,
+)
+
+
+# A local file path or an open, seekable binary stream (e.g. S3Client.open_object)
+FileSource = Union[str, BinaryIO]
+
 
 def _get_logger():
     """Get logger - Prefect if available, otherwise standard logging."""
@@ -22,6 +46,13 @@ def _get_logger():
         return logging.getLogger(__name__)
 
 
+def _source_name(file_path: FileSource) -> str:
+    """Return the file name of a path or binary stream (used for format detection)."""
+    if isinstance(file_path, str):
+        return file_path
+    return getattr(file_path, 'name', '') or ''
+
+
 class FileFormatHandler(ABC):
     """Abstract base class for file format handlers."""
 
@@ -39,12 +70,12 @@ class FileFormatHandler(ABC):
         pass
 
     @abstractmethod
-    def read(self, file_path: str, options: Dict[str, Any]) -> pl.DataFrame:
+    def read(self, file_path: FileSource, options: Dict[str, Any]) -> pl.DataFrame:
         """
         Read file and return Polars DataFrame.
 
         Args:
-            file_path: Path to the file
+            file_path: Path to the file, or an open binary stream
             options: Format-specific options
 
         Returns:
@@ -52,13 +83,48 @@ class FileFormatHandler(ABC):
         """
         pass
 
+    def scan(self, file_path: str, options: Dict[str, Any]) -> pl.LazyFrame:
+        """
+        Lazily scan file for streaming (bounded-memory) processing.
+
+        Args:
+            file_path: Path to the file
+            options: Format-specific options
+
+        Returns:
+            Polars LazyFrame over the file contents
+
+        Raises:
+            NotImplementedError: If the format cannot be streamed
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support streaming reads")
+
+    def iter_batches(self, file_path: FileSource, options: Dict[str, Any]) -> Iterator[pa.RecordBatch]:
+        """
+        Read file incrementally as Arrow record batches.
+
+        Used for formats that cannot be scanned lazily, and for streams (e.g.
+        S3Client.open_object), which are parsed while they are still being read.
+
+        Args:
+            file_path: Path to the file, or an open binary stream
+            options: Format-specific options
+
+        Returns:
+            Iterator of record batches sharing one schema
+
+        Raises:
+            NotImplementedError: If the format cannot be read incrementally
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support incremental reads")
+
     @abstractmethod
-    def infer_schema(self, file_path: str, sample_rows: int = 100) -> List[Dict[str, Any]]:
+    def infer_schema(self, file_path: FileSource, sample_rows: int = 100) -> List[Dict[str, Any]]:
         """
         Infer schema from file.
 
         Args:
-            file_path: Path to the file
+            file_path: Path to the file, or an open binary stream
             sample_rows: Number of rows to sample for inference
 
         Returns:
@@ -105,12 +171,19 @@ class FileFormatHandler(ABC):
 
 
 class CSVHandler(FileFormatHandler):
-    """Handler for CSV (Comma-Separated Values) files."""
+    """Handler for CSV (Comma-Separated Values) files.
+
+    Options:
+        has_header, delimiter, encoding, skip_rows: CSV dialect
+        infer_schema_length: Rows used for type inference
+        schema: Explicit column name -> Polars dtype mapping (e.g. a pinned schema
+            from utils/schema_registry); type inference is skipped entirely
+    """
 
     def can_handle(self, file_path: str) -> bool:
         return file_path.lower().endswith(('.csv', '.txt', '.tsv'))
 
-    def read(self, file_path: str, options: Dict[str, Any]) -> pl.DataFrame:
+    def read(self, file_path: FileSource, options: Dict[str, Any]) -> pl.DataFrame:
         logger = _get_logger()
 
         # Extract CSV options
@@ -119,8 +192,9 @@ class CSVHandler(FileFormatHandler):
         encoding = options.get('encoding', 'utf-8')
         skip_rows = options.get('skip_rows', 0)
         infer_schema_length = options.get('infer_schema_length', None)
+        schema = options.get('schema')
 
-        logger.info(f"Reading CSV: has_header={has_header}, delimiter='{delimiter}', encoding='{encoding}'")
+        logger.info(f"Reading CSV: has_header={has_header}, delimiter='{delimiter}', encoding='{encoding}', pinned_schema={schema is not None}")
 
         try:
             df = pl.read_csv(
@@ -129,8 +203,9 @@ class CSVHandler(FileFormatHandler):
                 separator=delimiter,
                 encoding=encoding,
                 skip_rows=skip_rows,
-                try_parse_dates=True,
+                try_parse_dates=schema is None,
                 infer_schema_length=infer_schema_length,
+                schema=schema,
                 ignore_errors=False,
             )
 
@@ -141,9 +216,132 @@ class CSVHandler(FileFormatHandler):
             logger.error(f"Failed to read CSV file: {e}")
             raise
 
-    def infer_schema(self, file_path: str, sample_rows: int = 100) -> List[Dict[str, Any]]:
+    def scan(self, file_path: str, options: Dict[str, Any]) -> pl.LazyFrame:
+        logger = _get_logger()
+
+        has_header = options.get('has_header', True)
+        delimiter = options.get('delimiter', ',')
+        encoding = options.get('encoding', 'utf-8')
+        skip_rows = options.get('skip_rows', 0)
+        # A full-file inference pass defeats streaming, so bound it by default
+        infer_schema_length = options.get('infer_schema_length') or 10000
+
+        if encoding.lower().replace('-', '') not in ('utf8', 'utf8lossy'):
+            raise NotImplementedError(f"Streaming CSV reads require UTF-8 input (got '{encoding}')")
+
+        schema = options.get('schema')
+
+        logger.info(f"Scanning CSV: has_header={has_header}, delimiter='{delimiter}', infer_schema_length={infer_schema_length}, pinned_schema={schema is not None}")
+
+        return pl.scan_csv(
+            file_path,
+            has_header=has_header,
+            separator=delimiter,
+            encoding='utf8-lossy' if 'lossy' in encoding.lower() else 'utf8',
+            skip_rows=skip_rows,
+            try_parse_dates=schema is None,
+            infer_schema_length=infer_schema_length,
+            schema=schema,
+            ignore_errors=False,
+            low_memory=True,
+        )
+
+    def iter_batches(self, file_path: FileSource, options: Dict[str, Any]) -> Iterator[pa.RecordBatch]:
+        """
+        Parse a CSV incrementally with Arrow's streaming CSV reader.
+
+        Column types are the pinned `schema`, or inferred by Polars from the first
+        `infer_schema_length` rows (default: 10,000); a later value that does not
+        fit them raises. A stream is rewound after sampling, so it must be seekable.
+        """
+        import pyarrow.csv as pa_csv
+
+        has_header = options.get('has_header', True)
+        delimiter = options.get('delimiter', ',')
+        encoding = options.get('encoding', 'utf-8')
+        skip_rows = options.get('skip_rows', 0)
+
+        if encoding.lower().replace('-', '') != 'utf8':
+            raise NotImplementedError(f"Incremental CSV reads require strict UTF-8 input (got '{encoding}')")
+
+        schema = options.get('schema')
+        stream = open(file_path, 'rb') if isinstance(file_path, str) else file_path
+        if schema is None:
+            sample_rows = options.get('infer_schema_length') or 10000
+            head = b''.join(stream.readline() for _ in range(skip_rows + int(has_header) + sample_rows))
+            stream.seek(0)
+            schema = pl.read_csv(
+                io.BytesIO(head),
+                has_header=has_header,
+                separator=delimiter,
+                skip_rows=skip_rows,
+                try_parse_dates=True,
+                infer_schema_length=None,
+            ).schema
+
+        # Names come from the Polars schema, so they match an eager read (headerless
+        # files get column_1, column_2, ...); the header line itself is skipped
+        reader = pa_csv.open_csv(
+            stream,
+            read_options=pa_csv.ReadOptions(
+                column_names=list(schema),
+                skip_rows=skip_rows + int(has_header),
+                block_size=16 * 1024 * 1024,
+            ),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=pl.DataFrame(schema=schema).to_arrow().schema,
+                null_values=[''],
+                strings_can_be_null=True,
+            ),
+        )
+        return self._read_batches(reader, stream if isinstance(file_path, str) else None)
+
+    @staticmethod
+    def _read_batches(reader, owned_stream) -> Iterator[pa.RecordBatch]:
+        try:
+            yield from reader
+        finally:
+            if owned_stream is not None:
+                owned_stream.close()
+
+    def read_header(self, file_path: FileSource, options: Dict[str, Any]) -> List[str]:
+        """
+        Return the column names of a CSV file by reading only its header line.
+
+        Headerless files get Polars' positional names (column_1, column_2, ...).
+        A stream is rewound afterwards, so it can still be parsed in full.
+        """
+        import csv
+
+        delimiter = options.get('delimiter', ',')
+        encoding = options.get('encoding', 'utf-8').replace('-lossy', '').replace('8lossy', '8')
+        skip_rows = options.get('skip_rows', 0)
+
+        stream = open(file_path, 'rb') if isinstance(file_path, str) else file_path
+        try:
+            for _ in range(skip_rows):
+                stream.readline()
+            line = stream.readline().decode(encoding, errors='replace').lstrip('\ufeff')
+        finally:
+            if isinstance(file_path, str):
+                stream.close()
+            else:
+                stream.seek(0)
+
+        fields = next(csv.reader([line], delimiter=delimiter), [])
+        if not options.get('has_header', True):
+            return [f"column_{index + 1}" for index in range(len(fields))]
+        return fields
+
+    def infer_schema(self, file_path: FileSource, sample_rows: int = 100) -> List[Dict[str, Any]]:
         """Infer schema by reading first N rows."""
-        df = pl.read_csv(file_path, n_rows=sample_rows, try_parse_dates=True)
+        if not isinstance(file_path, str):
+            # Only pull the header and sample lines off the stream, not the whole object
+            sample = io.BytesIO(b''.join(file_path.readline() for _ in range(sample_rows + 1)))
+            df = pl.read_csv(sample, n_rows=sample_rows, try_parse_dates=True)
+        else:
+            df = pl.read_csv(file_path, n_rows=sample_rows, try_parse_dates=True)
 
         schema = []
         for col_name in df.columns:
@@ -163,19 +361,30 @@ class CSVHandler(FileFormatHandler):
 
 
 class JSONHandler(FileFormatHandler):
-    """Handler for JSON and JSON Lines (JSONL) files."""
+    """Handler for JSON and JSON Lines (JSONL) files.
+
+    Options:
+        mode: "standard" (default) or "lines"; .jsonl/.ndjson files are always "lines"
+        flatten: Flatten nested objects into top-level columns (default: False)
+        flatten_separator: Joins parent and child names of flattened columns (default: "_")
+        batch_rows: Records per batch for incremental reads (default: 50,000)
+    """
 
     def can_handle(self, file_path: str) -> bool:
         return file_path.lower().endswith(('.json', '.jsonl', '.ndjson'))
 
-    def read(self, file_path: str, options: Dict[str, Any]) -> pl.DataFrame:
+    @staticmethod
+    def _mode(file_path: FileSource, options: Dict[str, Any]) -> str:
+        name = _source_name(file_path)
+        if name.endswith('.jsonl') or name.endswith('.ndjson'):
+            return 'lines'
+        return options.get('mode', 'standard')
+
+    def read(self, file_path: FileSource, options: Dict[str, Any]) -> pl.DataFrame:
         logger = _get_logger()
 
         # Determine JSON mode
-        if file_path.endswith('.jsonl') or file_path.endswith('.ndjson'):
-            mode = 'lines'
-        else:
-            mode = options.get('mode', 'standard')
+        mode = self._mode(file_path, options)
 
         logger.info(f"Reading JSON file in '{mode}' mode")
 
@@ -187,6 +396,9 @@ class JSONHandler(FileFormatHandler):
                 # Standard JSON
                 df = pl.read_json(file_path)
 
+            if options.get('flatten'):
+                df = pl.from_arrow(flatten_structs(df.to_arrow(), options.get('flatten_separator', '_')))
+
             logger.info(f"Successfully read JSON: {df.height} rows, {df.width} columns")
             return df
 
@@ -194,14 +406,46 @@ class JSONHandler(FileFormatHandler):
             logger.error(f"Failed to read JSON file: {e}")
             raise
 
-    def infer_schema(self, file_path: str, sample_rows: int = 100) -> List[Dict[str, Any]]:
+    def scan(self, file_path: str, options: Dict[str, Any]) -> pl.LazyFrame:
+        # Only newline-delimited JSON can be scanned lazily, and flattening
+        # needs the Arrow batch reader
+        if self._mode(file_path, options) == 'lines' and not options.get('flatten'):
+            return pl.scan_ndjson(file_path, low_memory=True)
+        raise NotImplementedError("Lazy JSON scans require unflattened JSON Lines input")
+
+    def iter_batches(self, file_path: FileSource, options: Dict[str, Any]) -> Iterator[pa.RecordBatch]:
+        """Stream a top-level JSON array or JSON Lines file as record batches in constant memory."""
+        return self._iter_batches(file_path, self._mode(file_path, options), options)
+
+    @staticmethod
+    def _iter_batches(file_path: FileSource, mode: str, options: Dict[str, Any]) -> Iterator[pa.RecordBatch]:
+        reader = iter_ndjson_batches if mode == 'lines' else iter_json_array_batches
+        stream = open(file_path, 'rb') if isinstance(file_path, str) else file_path
+        try:
+            yield from reader(
+                stream,
+                batch_rows=options.get('batch_rows') or DEFAULT_BATCH_ROWS,
+                flatten=bool(options.get('flatten')),
+                separator=options.get('flatten_separator', '_'),
+            )
+        finally:
+            if isinstance(file_path, str):
+                stream.close()
+
+    def infer_schema(self, file_path: FileSource, sample_rows: int = 100) -> List[Dict[str, Any]]:
         """Infer schema by reading first N rows."""
         # Determine mode from extension
-        if file_path.endswith('.jsonl') or file_path.endswith('.ndjson'):
+        if self._mode(file_path, {}) == 'lines':
             df = pl.read_ndjson(file_path, n_rows=sample_rows)
         else:
-            df = pl.read_json(file_path)
-            df = df.head(sample_rows)
+            # Decode only the first array elements instead of the whole document
+            stream = open(file_path, 'rb') if isinstance(file_path, str) else file_path
+            try:
+                first_batch = next(iter_json_array_batches(stream, batch_rows=sample_rows), None)
+            finally:
+                if isinstance(file_path, str):
+                    stream.close()
+            df = pl.from_arrow(first_batch) if first_batch is not None else pl.DataFrame()
 
         schema = []
         for col_name in df.columns:
@@ -226,7 +470,7 @@ class ParquetHandler(FileFormatHandler):
     def can_handle(self, file_path: str) -> bool:
         return file_path.lower().endswith('.parquet')
 
-    def read(self, file_path: str, options: Dict[str, Any]) -> pl.DataFrame:
+    def read(self, file_path: FileSource, options: Dict[str, Any]) -> pl.DataFrame:
         logger = _get_logger()
 
         # Parquet options
@@ -250,7 +494,20 @@ class ParquetHandler(FileFormatHandler):
             logger.error(f"Failed to read Parquet file: {e}")
             raise
 
-    def infer_schema(self, file_path: str, sample_rows: int = 100) -> List[Dict[str, Any]]:
+    def scan(self, file_path: str, options: Dict[str, Any]) -> pl.LazyFrame:
+        lf = pl.scan_parquet(file_path, low_memory=True)
+        columns = options.get('columns', None)
+        if columns:
+            lf = lf.select(columns)
+        return lf
+
+    def iter_batches(self, file_path: FileSource, options: Dict[str, Any]) -> Iterator[pa.RecordBatch]:
+        """Read row group by row group; a stream is only read for the footer and the row groups."""
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(file_path).iter_batches(columns=options.get('columns', None))
+
+    def infer_schema(self, file_path: FileSource, sample_rows: int = 100) -> List[Dict[str, Any]]:
         """Parquet has embedded schema - read metadata without loading data."""
         import pyarrow.parquet as pq
 
@@ -286,19 +543,23 @@ class ParquetHandler(FileFormatHandler):
 
         return schema
 
-    def get_metadata(self, file_path: str) -> Dict[str, Any]:
+    def get_metadata(self, file_path: FileSource) -> Dict[str, Any]:
         """Extract Parquet file metadata."""
         import pyarrow.parquet as pq
 
         parquet_file = pq.ParquetFile(file_path)
         metadata = parquet_file.metadata
+        if isinstance(file_path, str):
+            file_size = Path(file_path).stat().st_size
+        else:
+            file_size = file_path.seek(0, io.SEEK_END)
 
         return {
             "num_rows": metadata.num_rows,
             "num_columns": metadata.num_columns,
             "num_row_groups": metadata.num_row_groups,
             "compression": str(metadata.row_group(0).column(0).compression) if metadata.num_row_groups > 0 else "none",
-            "file_size": Path(file_path).stat().st_size,
+            "file_size": file_size,
             "created_by": metadata.created_by
         }
 
@@ -307,14 +568,28 @@ class ParquetHandler(FileFormatHandler):
 
 
 class ExcelHandler(FileFormatHandler):
-    """Handler for Excel files (XLSX, XLS)."""
+    """Handler for Excel files (XLSX, XLS), read with the calamine engine (fastexcel)."""
 
     def can_handle(self, file_path: str) -> bool:
         return file_path.lower().endswith(('.xlsx', '.xls'))
 
-    def read(self, file_path: str, options: Dict[str, Any]) -> pl.DataFrame:
+    def read(self, file_path: FileSource, options: Dict[str, Any]) -> pl.DataFrame:
+        """
+        Read one sheet.
+
+        Options:
+            sheet_name / sheet_index: Single sheet to read, by name or 1-based number
+                (default: first sheet)
+            infer_schema_length: Rows used for dtype inference (default: 1000)
+
+        Several sheets (the `sheets` option) are read with `read_sheets`, one
+        DataFrame per sheet.
+        """
         logger = _get_logger()
 
+        if options.get('sheets'):
+            raise ValueError("The 'sheets' option selects several sheets: read them with read_sheets()")
+
         # Excel options
         sheet_name = options.get('sheet_name', None)
         sheet_index = options.get('sheet_index', 0)
@@ -328,19 +603,7 @@ class ExcelHandler(FileFormatHandler):
         logger.info(f"Reading Excel file, sheet: {sheet_id}")
 
         try:
-            # pl.read_excel returns a dict of sheet_name -> DataFrame when sheet_id=None
-            # or a single DataFrame when sheet_id is specified
-            result = pl.read_excel(
-                file_path,
-                sheet_id=sheet_id,
-            )
-
-            # If result is a dict (multiple sheets), get the first one
-            if isinstance(result, dict):
-                df = list(result.values())[0]
-            else:
-                df = result
-
+            df = self._load_sheet(self._workbook_source(file_path), sheet_id, options)
             logger.info(f"Successfully read Excel: {df.height} rows, {df.width} columns")
             return df
 
@@ -348,19 +611,68 @@ class ExcelHandler(FileFormatHandler):
             logger.error(f"Failed to read Excel file: {e}")
             raise
 
-    def infer_schema(self, file_path: str, sample_rows: int = 100) -> List[Dict[str, Any]]:
-        """Infer schema from Excel sheet."""
-        # Read first N rows
-        result = pl.read_excel(file_path)
+    def read_sheets(self, file_path: FileSource, options: Dict[str, Any]) -> Dict[str, pl.DataFrame]:
+        """
+        Read the sheets selected by `options["sheets"]` ("all" or a list of names) concurrently.
 
-        # If result is a dict, get the first sheet
-        if isinstance(result, dict):
-            df = list(result.values())[0]
-        else:
-            df = result
+        The workbook is read into memory once and each sheet is parsed by its own
+        calamine reader on a thread pool.
 
-        df = df.head(sample_rows)
+        Options:
+            infer_schema_length: Rows per sheet used for dtype inference (default: 1000)
+            max_workers: Sheets parsed in parallel (default: one per sheet, up to 8)
 
+        Returns:
+            Dict of sheet name -> DataFrame, in workbook order
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        logger = _get_logger()
+        source = self._workbook_source(file_path)
+        sheet_names = self._select_sheets(source, options.get('sheets'))
+
+        max_workers = min(options.get('max_workers') or 8, len(sheet_names)) or 1
+        logger.info(f"Reading {len(sheet_names)} Excel sheets with {max_workers} workers: {sheet_names}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = executor.map(lambda name: self._load_sheet(source, name, options), sheet_names)
+            return dict(zip(sheet_names, frames))
+
+    def infer_schema(self, file_path: FileSource, sample_rows: int = 100) -> List[Dict[str, Any]]:
+        """Infer schema from the first `sample_rows` rows of the first Excel sheet (see `infer_sheet_schemas`)."""
+        df = self._load_sheet(
+            self._workbook_source(file_path),
+            0,
+            {'infer_schema_length': sample_rows},
+            n_rows=sample_rows,
+        )
+        return self._frame_schema(df)
+
+    def infer_sheet_schemas(
+        self,
+        file_path: FileSource,
+        sample_rows: int = 100,
+        sheets: Union[str, List[str]] = 'all',
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Infer the schema of each selected sheet from its first `sample_rows` rows.
+
+        Sheets are sampled concurrently, as in `read_sheets`.
+
+        Returns:
+            Dict of sheet name -> column definitions (as for `infer_schema`), in workbook order
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        source = self._workbook_source(file_path)
+        sheet_names = self._select_sheets(source, sheets)
+        options = {'infer_schema_length': sample_rows}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(sheet_names)) or 1) as executor:
+            frames = executor.map(lambda name: self._load_sheet(source, name, options, n_rows=sample_rows), sheet_names)
+            return {name: self._frame_schema(df) for name, df in zip(sheet_names, frames)}
+
+    def _frame_schema(self, df: pl.DataFrame) -> List[Dict[str, Any]]:
         schema = []
         for col_name in df.columns:
             dtype = df.schema[col_name]
@@ -374,24 +686,179 @@ class ExcelHandler(FileFormatHandler):
 
         return schema
 
-    def list_sheets(self, file_path: str) -> List[str]:
+    def list_sheets(self, file_path: FileSource) -> List[str]:
         """List all sheet names in Excel file."""
         try:
-            import openpyxl
-            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-            sheet_names = workbook.sheetnames
-            workbook.close()
-            return sheet_names
+            import fastexcel
+            return fastexcel.read_excel(self._workbook_source(file_path)).sheet_names
         except Exception:
-            # Fallback: just return empty list if openpyxl not available
+            # Fallback: just return empty list if the workbook cannot be opened
             return []
 
     def supported_extensions(self) -> List[str]:
         return ['.xlsx', '.xls']
 
+    @staticmethod
+    def _select_sheets(source: Union[str, bytes], selected: Union[str, List[str]]) -> List[str]:
+        """Resolve "all" or a list of sheet names to the workbook's sheet names, in workbook order."""
+        import fastexcel
+
+        available = fastexcel.read_excel(source).sheet_names
+        if selected == 'all':
+            return available
+        missing = [name for name in selected if name not in available]
+        if missing:
+            raise ValueError(f"Sheets not found in workbook: {missing} (available: {available})")
+        return [name for name in available if name in selected]
+
+    @staticmethod
+    def _workbook_source(file_path: FileSource) -> Union[str, bytes]:
+        """Return a path or the workbook bytes (calamine needs random access to the zip)."""
+        if isinstance(file_path, str):
+            return file_path
+        file_path.seek(0)
+        return file_path.read()
+
+    @staticmethod
+    def _load_sheet(
+        source: Union[str, bytes],
+        sheet_id: Union[str, int],
+        options: Dict[str, Any],
+        n_rows: Optional[int] = None,
+    ) -> pl.DataFrame:
+        """
+        Load one sheet with its own calamine reader (thread-safe).
+
+        `sheet_id` is a sheet name or a 1-based sheet number, as for pl.read_excel;
+        0 reads the first sheet (where pl.read_excel would return all of them).
+        """
+        read_options = {'schema_sample_rows': options.get('infer_schema_length') or 1000}
+        if n_rows is not None:
+            read_options['n_rows'] = n_rows
 
-# Registry of all handlers
+        sheet = {'sheet_name': sheet_id} if isinstance(sheet_id, str) else {'sheet_id': sheet_id or 1}
+        return pl.read_excel(source, engine='calamine', read_options=read_options, **sheet)
+
+
+class CompressedFileHandler(FileFormatHandler):
+    """Handler for gzip/bzip2/Zstandard-compressed files and ZIP archives.
+
+    Decompresses as a stream and delegates to the handler for the inner format
+    (orders.csv.gz is read by the CSV handler). ZIP archives may hold several
+    members; they are parsed concurrently and combined into one DataFrame with
+    an `_archive_member` column.
+
+    Options (in addition to those of the inner format):
+        max_workers: ZIP members parsed in parallel (default: one per member, up to 8)
+    """
+
+    def can_handle(self, file_path: str) -> bool:
+        return compression_of(file_path) is not None
+
+    def read(self, file_path: FileSource, options: Dict[str, Any]) -> pl.DataFrame:
+        logger = _get_logger()
+        name = _source_name(file_path)
+        compression = compression_of(name)
+
+        if compression == 'zip':
+            return self._read_archive(file_path, options)
+
+        inner_name = strip_compression_extension(name)
+        logger.info(f"Reading {compression}-compressed file as {Path(inner_name).name}")
+        with open_decompressed(file_path, compression) as stream:
+            return get_file_handler(inner_name).read(stream, options)
+
+    def scan(self, file_path: str, options: Dict[str, Any]) -> pl.LazyFrame:
+        # Lazy scans need a plain local file: decompress next to the source
+        if compression_of(file_path) == 'zip':
+            return self._scan_archive(file_path, options)
+        local_file = self._decompress_local(file_path)
+        return get_file_handler(str(local_file)).scan(str(local_file), options)
+
+    def iter_batches(self, file_path: FileSource, options: Dict[str, Any]) -> Iterator[pa.RecordBatch]:
+        if not isinstance(file_path, str):
+            raise NotImplementedError("Incremental reads of compressed streams are not supported")
+        if compression_of(file_path) == 'zip':
+            raise NotImplementedError("Incremental reads of ZIP archives are not supported")
+        local_file = self._decompress_local(file_path)
+        return get_file_handler(str(local_file)).iter_batches(str(local_file), options)
+
+    def infer_schema(self, file_path: FileSource, sample_rows: int = 100) -> List[Dict[str, Any]]:
+        """Infer schema from the start of the decompressed data (first member of a ZIP archive)."""
+        name = _source_name(file_path)
+        compression = compression_of(name)
+
+        if compression == 'zip':
+            source = self._archive_source(file_path)
+            members = archive_members(source)
+            if not members:
+                return []
+            with open_archive_member(source, members[0]) as stream:
+                return get_file_handler(members[0]).infer_schema(stream, sample_rows)
+
+        with open_decompressed(file_path, compression) as stream:
+            return get_file_handler(strip_compression_extension(name)).infer_schema(stream, sample_rows)
+
+    def supported_extensions(self) -> List[str]:
+        return list(COMPRESSION_EXTENSIONS)
+
+    @staticmethod
+    def _decompress_local(file_path: str) -> Path:
+        local_file = Path(strip_compression_extension(file_path))
+        if not local_file.exists():
+            decompress_to_file(file_path, compression_of(file_path), local_file)
+        return local_file
+
+    @staticmethod
+    def _archive_source(file_path: FileSource) -> Union[str, bytes]:
+        """ZIP needs random access; streams are read once so each thread can open its own handle."""
+        if isinstance(file_path, str):
+            return file_path
+        file_path.seek(0)
+        return file_path.read()
+
+    def _read_archive(self, file_path: FileSource, options: Dict[str, Any]) -> pl.DataFrame:
+        from concurrent.futures import ThreadPoolExecutor
+
+        logger = _get_logger()
+        source = self._archive_source(file_path)
+        members = archive_members(source)
+        if not members:
+            raise ValueError(f"ZIP archive contains no data files: {_source_name(file_path)}")
+
+        def read_member(member: str) -> pl.DataFrame:
+            with open_archive_member(source, member) as stream:
+                df = get_file_handler(member).read(stream, options)
+            return df.with_columns(pl.lit(member).alias('_archive_member'))
+
+        max_workers = min(options.get('max_workers') or 8, len(members))
+        logger.info(f"Reading {len(members)} ZIP members with {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(read_member, members))
+
+        df = pl.concat(frames, how='diagonal_relaxed')
+        logger.info(f"Successfully read ZIP archive: {df.height} rows, {df.width} columns")
+        return df
+
+    def _scan_archive(self, file_path: str, options: Dict[str, Any]) -> pl.LazyFrame:
+        members = archive_members(file_path)
+        if not members:
+            raise ValueError(f"ZIP archive contains no data files: {file_path}")
+
+        extract_dir = Path(strip_compression_extension(file_path))
+        frames = []
+        with zipfile.ZipFile(file_path) as archive:
+            for member in members:
+                # Extracted under the archive's directory, so the scans outlive this call
+                local_file = Path(archive.extract(member, extract_dir))
+                lf = get_file_handler(str(local_file)).scan(str(local_file), options)
+                frames.append(lf.with_columns(pl.lit(member).alias('_archive_member')))
+        return pl.concat(frames, how='diagonal_relaxed')
+
+
+# Registry of all handlers (compressed files first, so orders.csv.gz is not taken for CSV)
 HANDLERS = [
+    CompressedFileHandler(),
     CSVHandler(),
     JSONHandler(),
     ParquetHandler(),
@@ -426,10 +893,12 @@ def detect_file_format(file_path: str) -> str:
     Args:
         file_path: Path to the file
 
+    Compression extensions are ignored (orders.csv.gz and orders.csv.zip are 'csv').
+
     Returns:
         Format name: 'csv', 'json', 'parquet', 'excel'
     """
-    file_path_lower = file_path.lower()
+    file_path_lower = strip_compression_extension(file_path.lower())
 
     if file_path_lower.endswith(('.csv', '.txt', '.tsv')):
         return 'csv'
@@ -128,11 +128,33 @@ def calculate_file_hash(file_path: Path) -> str:
     """Calculate MD5 hash of a file for deduplication."""
     hash_md5 = hashlib.md5()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
 
+def etag_md5(etag: Optional[str]) -> Optional[str]:
+    """
+    Return the MD5 hash encoded in an S3 ETag, if there is one.
+
+    The ETag of an object uploaded in a single PUT is the MD5 of its content, so
+    it can be compared with `calculate_file_hash` without downloading the file.
+    Multipart ETags ("<md5-of-part-md5s>-<parts>") are not content hashes.
+
+    Args:
+        etag: ETag as returned by S3 (quotes are ignored)
+
+    Returns:
+        Lowercase MD5 hex digest, or None for multipart/unknown ETags
+    """
+    if not etag:
+        return None
+    etag = etag.strip('"').lower()
+    if len(etag) == 32 and all(c in "0123456789abcdef" for c in etag):
+        return etag
+    return None
+
+
 def update_watermark(
     source_id: str,
     watermark_column: str,
@@ -208,7 +230,12 @@ def get_watermark(source_id: str, logger) -> Optional[dict]:
         return None
 
 
-def check_file_already_processed(source_id: str, file_hash: str, logger) -> bool:
+def check_file_already_processed(
+    source_id: str,
+    file_hash: str,
+    logger,
+    file_size: Optional[int] = None
+) -> bool:
     """
     Check if a file with the same hash has already been processed.
 
@@ -216,6 +243,7 @@ def check_file_already_processed(source_id: str, file_hash: str, logger) -> bool
         source_id: Source/Job ID
         file_hash: MD5 hash of the file
         logger: Prefect logger
+        file_size: Optional file size in bytes; when given, only files of the same size match
 
     Returns:
         True if file was already processed (duplicate)
@@ -227,6 +255,7 @@ def check_file_already_processed(source_id: str, file_hash: str, logger) -> bool
         payload = {
             "source_id": source_id,
             "file_hash": file_hash,
+            "file_size": file_size,
         }
 
         response = requests.post(api_url, json=payload, timeout=10)
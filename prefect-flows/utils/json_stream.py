@@ -0,0 +1,262 @@
+"""
+Incremental JSON readers for FlowForge.
+
+Reads large JSON documents as a stream of Arrow record batches, so Bronze can
+write them to Parquet batch by batch in constant memory:
+
+- JSON Lines / NDJSON: blocks of lines are parsed by Arrow's C++ JSON reader.
+- Standard JSON with a top-level array: elements are decoded one by one from a
+  rolling text buffer, never holding the whole document.
+
+The schema is inferred from the first batch and pinned for the rest of the
+file. Missing fields become null; values that do not fit the pinned types and
+fields that only appear later raise instead of being coerced or dropped.
+"""
+
+from typing import BinaryIO, Iterator, List, Optional
+import codecs
+import io
+import json
+
+import pyarrow as pa
+import pyarrow.json as pa_json
+
+DEFAULT_BATCH_ROWS = 50_000
+
+# Text read from the source per refill of the array decoder's buffer
+_READ_CHUNK_BYTES = 4 * 1024 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+def iter_ndjson_batches(
+    stream: BinaryIO,
+    *,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    flatten: bool = False,
+    separator: str = "_",
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yield record batches of up to `batch_rows` rows from a JSON Lines stream.
+
+    Args:
+        stream: Binary stream positioned at the start of the data
+        batch_rows: Lines parsed per batch
+        flatten: Flatten nested struct columns into top-level columns
+        separator: Joins parent and child names of flattened columns
+    """
+    schema: Optional[pa.Schema] = None
+    lines: List[bytes] = []
+
+    def parse(block: List[bytes]) -> pa.Table:
+        nonlocal schema
+        data = io.BytesIO(b"".join(line if line.endswith(b"\n") else line + b"\n" for line in block))
+        if schema is None:
+            table = pa_json.read_json(data)
+            schema = _nullable_schema(table.schema)
+            table = table.cast(schema)
+        else:
+            table = pa_json.read_json(
+                data,
+                parse_options=pa_json.ParseOptions(explicit_schema=schema, unexpected_field_behavior="error"),
+            )
+        return table
+
+    for line in stream:
+        if not line.strip():
+            continue
+        lines.append(line)
+        if len(lines) >= batch_rows:
+            yield from _to_batches(parse(lines), flatten, separator)
+            lines = []
+
+    if lines:
+        yield from _to_batches(parse(lines), flatten, separator)
+
+
+def iter_json_array_batches(
+    stream: BinaryIO,
+    *,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    flatten: bool = False,
+    separator: str = "_",
+    encoding: str = "utf-8",
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yield record batches from a JSON document whose top level is an array of objects.
+
+    A top-level object is treated as a single record.
+
+    Args:
+        stream: Binary stream positioned at the start of the document
+        batch_rows: Array elements per batch
+        flatten: Flatten nested struct columns into top-level columns
+        separator: Joins parent and child names of flattened columns
+        encoding: Text encoding of the document
+    """
+    schema: Optional[pa.Schema] = None
+    records: List[dict] = []
+
+    def build(block: List[dict]) -> pa.Table:
+        nonlocal schema
+        # Infer over every record of the block (from_pylist only looks at the
+        # keys of the first one), keeping columns in document order
+        table = pa.Table.from_struct_array(pa.array(block))
+        table = table.select(list(dict.fromkeys(key for record in block for key in record)))
+        if schema is None:
+            schema = _nullable_schema(table.schema)
+        return _conform(table, schema)
+
+    for record in _iter_array_elements(stream, encoding):
+        records.append(record)
+        if len(records) >= batch_rows:
+            yield from _to_batches(build(records), flatten, separator)
+            records = []
+
+    if records:
+        yield from _to_batches(build(records), flatten, separator)
+
+
+def flatten_structs(table: pa.Table, separator: str = "_") -> pa.Table:
+    """
+    Flatten nested struct columns (recursively) into top-level columns.
+
+    Uses Arrow's columnar flatten, so no per-row Python work is done:
+    {"a": {"b": 1, "c": {"d": 2}}} becomes columns a_b and a_c_d.
+    """
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    if separator != ".":
+        table = table.rename_columns([name.replace(".", separator) for name in table.column_names])
+    return table
+
+
+def _to_batches(table: pa.Table, flatten: bool, separator: str) -> List[pa.RecordBatch]:
+    if flatten:
+        table = flatten_structs(table, separator)
+    return table.combine_chunks().to_batches()
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Fit a block to the pinned schema with lossless casts only.
+
+    Raises ValueError for fields outside the schema and for values the pinned
+    types cannot hold, e.g. 2.5 in an integer column.
+    """
+    columns = _conform_array(
+        table.to_struct_array().combine_chunks(), pa.struct(list(schema)), ""
+    )
+    return pa.Table.from_struct_array(columns).cast(schema)
+
+
+def _conform_array(array: pa.Array, data_type: pa.DataType, path: str) -> pa.Array:
+    if pa.types.is_null(array.type):
+        return pa.nulls(len(array), data_type)
+    if pa.types.is_struct(data_type) and pa.types.is_struct(array.type):
+        names = [data_type.field(i).name for i in range(data_type.num_fields)]
+        unexpected = [
+            f"{path}{array.type.field(i).name}" for i in range(array.type.num_fields)
+            if array.type.field(i).name not in names
+        ]
+        if unexpected:
+            raise ValueError(f"JSON fields not in the schema inferred from the first batch: {unexpected}")
+        children = []
+        for i in range(data_type.num_fields):
+            field = data_type.field(i)
+            index = array.type.get_field_index(field.name)
+            if index < 0:
+                children.append(pa.nulls(len(array), field.type))
+            else:
+                children.append(_conform_array(array.field(index), field.type, f"{path}{field.name}."))
+        return pa.StructArray.from_arrays(children, fields=list(data_type), mask=array.is_null())
+    if pa.types.is_list(data_type) and pa.types.is_list(array.type):
+        values = _conform_array(array.values, data_type.value_type, path)
+        return pa.ListArray.from_arrays(array.offsets, values, type=data_type, mask=array.is_null())
+    try:
+        return array.cast(data_type)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+        raise ValueError(
+            f"JSON field '{path.rstrip('.')}' does not fit the inferred type {data_type}: {e}"
+        ) from e
+
+
+def _nullable_schema(schema: pa.Schema) -> pa.Schema:
+    """Replace all-null (untyped) fields with strings so later batches with values still fit."""
+    return pa.schema([field.with_type(_nullable_type(field.type)) for field in schema])
+
+
+def _nullable_type(data_type: pa.DataType) -> pa.DataType:
+    if pa.types.is_null(data_type):
+        return pa.string()
+    if pa.types.is_struct(data_type):
+        return pa.struct([
+            data_type.field(i).with_type(_nullable_type(data_type.field(i).type))
+            for i in range(data_type.num_fields)
+        ])
+    if pa.types.is_list(data_type):
+        return pa.list_(_nullable_type(data_type.value_type))
+    return data_type
+
+
+def _iter_array_elements(stream: BinaryIO, encoding: str) -> Iterator[dict]:
+    """Decode the elements of a top-level JSON array one at a time from a rolling buffer."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    pos = 0
+    eof = False
+    in_array = False
+
+    def refill() -> bool:
+        nonlocal buffer, pos, eof
+        chunk = stream.read(_READ_CHUNK_BYTES)
+        eof = not chunk
+        buffer = buffer[pos:] + decoder.decode(chunk or b"", final=eof)
+        pos = 0
+        return not eof
+
+    def skip(chars: str) -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in chars:
+                pos += 1
+            if pos < len(buffer) or not refill():
+                return
+
+    skip(_WHITESPACE + "\ufeff")
+    if pos < len(buffer) and buffer[pos] == "[":
+        in_array = True
+        pos += 1
+
+    while True:
+        skip(_WHITESPACE + "," if in_array else _WHITESPACE)
+        if pos >= len(buffer):
+            if in_array:
+                raise ValueError("Unexpected end of JSON document: unterminated top-level array")
+            return
+        if in_array and buffer[pos] == "]":
+            return
+
+        while True:
+            try:
+                element, end = _DECODER.raw_decode(buffer, pos)
+                # A number at the buffer edge may continue in the next chunk
+                if end < len(buffer) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            refill()
+
+        pos = end
+        if isinstance(element, dict):
+            yield element
+        else:
+            raise ValueError(f"Expected JSON objects in the top-level array, got {type(element).__name__}")
+
+        if not in_array:
+            skip(_WHITESPACE)
+            if pos < len(buffer):
+                raise ValueError("Unexpected data after top-level JSON object")
+            return
@@ -285,6 +285,7 @@ def catalog_bronze_asset(
     dataframe: Any,
     environment: str = "prod",
     custom_table_name: Optional[str] = None,
+    file_size: Optional[int] = None,
 ) -> str:
     """
     Convenience function to catalog a Bronze layer asset.
@@ -298,6 +299,7 @@ def catalog_bronze_asset(
         dataframe: Polars DataFrame to extract schema from
         environment: Environment
         custom_table_name: User-configured table name from UI (e.g., "loan_payments_bronze")
+        file_size: Total size in bytes for multi-part tables (defaults to the size of s3_key)
 
     Returns:
         Asset ID
@@ -305,7 +307,8 @@ def catalog_bronze_asset(
     # Use custom table name if provided, otherwise generate from source_slug
     table_name = custom_table_name if custom_table_name else f"{source_slug}_bronze"
     schema = get_schema_from_dataframe(dataframe)
-    file_size = get_file_size_from_s3(s3_key)
+    if file_size is None:
+        file_size = get_file_size_from_s3(s3_key)
 
     return upsert_metadata_catalog_entry(
         layer="bronze",
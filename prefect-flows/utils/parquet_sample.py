@@ -5,11 +5,12 @@ Utility to read first N rows from Parquet files in MinIO
 
 import sys
 import json
-import tempfile
-from pathlib import Path
 from typing import Dict, List, Any
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 
+from utils.bronze_parts import dataset_part_keys
 from utils.s3 import S3Client
 
 
@@ -18,7 +19,8 @@ def get_sample_data(s3_key: str, limit: int = 100) -> Dict[str, Any]:
     Read first N rows from a Parquet file in S3.
 
     Args:
-        s3_key: S3 key of the Parquet file (can include s3:// prefix)
+        s3_key: S3 key of the Parquet file or of a Bronze manifest (can include
+            s3:// prefix)
         limit: Number of rows to return (default: 100)
 
     Returns:
@@ -33,47 +35,56 @@ def get_sample_data(s3_key: str, limit: int = 100) -> Dict[str, Any]:
         if len(parts) == 2:
             s3_key = parts[1]  # Extract just the key part
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_dir_path = Path(tmp_dir)
-        local_file = tmp_dir_path / Path(s3_key).name
-
-        # Download Parquet file from S3
-        s3.download_file(s3_key, local_file)
-
-        # Read first N rows using Polars
-        df = pl.read_parquet(local_file, n_rows=limit)
-
-        # Convert to list of dictionaries for JSON serialization
-        rows = []
-        for row in df.to_dicts():
-            cleaned = {}
-            for key, value in row.items():
-                # Handle datetime/date types from Polars
-                if hasattr(value, "isoformat"):
-                    cleaned[key] = value.isoformat()
-                # Leave simple types as-is
-                elif isinstance(value, (int, float, str, bool)) or value is None:
-                    cleaned[key] = value
-                else:
-                    # Fallback to string to keep JSON serializable
-                    cleaned[key] = str(value)
-            rows.append(cleaned)
-
-        # Get column names and types
-        schema = [
-            {
-                "name": col,
-                "type": str(df.schema[col])
-            }
-            for col in df.columns
-        ]
-
-        return {
-            "schema": schema,
-            "rows": rows,
-            "total_rows_in_sample": df.height,
-            "total_columns": df.width,
+    # Open each part as a seekable stream: only the footer and the first
+    # row group(s) are fetched, not the whole file
+    tables = []
+    remaining = limit
+    for part_key in dataset_part_keys(s3, s3_key):
+        with s3.open_object(part_key, read_ahead=0) as stream:
+            parquet_file = pq.ParquetFile(stream)
+            batches = []
+            for batch in parquet_file.iter_batches(batch_size=limit):
+                batches.append(batch.slice(0, remaining))
+                remaining -= batches[-1].num_rows
+                if remaining <= 0:
+                    break
+            tables.append(pa.Table.from_batches(batches, schema=parquet_file.schema_arrow))
+        if remaining <= 0:
+            break
+    # Parts of one table may add columns over time
+    df = pl.concat([pl.from_arrow(table) for table in tables], how="diagonal_relaxed") if tables else pl.DataFrame()
+
+    # Convert to list of dictionaries for JSON serialization
+    rows = []
+    for row in df.to_dicts():
+        cleaned = {}
+        for key, value in row.items():
+            # Handle datetime/date types from Polars
+            if hasattr(value, "isoformat"):
+                cleaned[key] = value.isoformat()
+            # Leave simple types as-is
+            elif isinstance(value, (int, float, str, bool)) or value is None:
+                cleaned[key] = value
+            else:
+                # Fallback to string to keep JSON serializable
+                cleaned[key] = str(value)
+        rows.append(cleaned)
+
+    # Get column names and types
+    schema = [
+        {
+            "name": col,
+            "type": str(df.schema[col])
         }
+        for col in df.columns
+    ]
+
+    return {
+        "schema": schema,
+        "rows": rows,
+        "total_rows_in_sample": df.height,
+        "total_columns": df.width,
+    }
 
 
 def main():
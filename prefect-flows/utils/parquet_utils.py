@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import BinaryIO, Iterable, Sequence
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 def read_csv(path: str | Path, *, has_header: bool = True, infer_schema_length: int | None = None) -> pl.DataFrame:
@@ -36,6 +38,7 @@ def add_audit_columns(
     source_file: str,
     include_row_number: bool = True,
     timestamp: datetime | None = None,
+    row_number_start: int = 1,
 ) -> pl.DataFrame:
     """Append FlowForge audit columns to a DataFrame.
 
@@ -44,20 +47,64 @@ def add_audit_columns(
         source_file: Original file name (stored in `_source_file`).
         include_row_number: When True add `_row_number` column (1-based).
         timestamp: Optional timestamp (defaults to `datetime.utcnow`).
+        row_number_start: `_row_number` of the first row (for batches of a larger file).
 
     Returns:
         DataFrame enriched with audit columns.
     """
     ts = timestamp or datetime.utcnow()
-    columns: list[pl.Series] = [
-        pl.Series("_ingested_at", [ts.isoformat()] * df.height),
-        pl.Series("_source_file", [source_file] * df.height),
+    columns = [
+        pl.lit(ts.isoformat()).alias("_ingested_at"),
+        pl.lit(source_file).alias("_source_file"),
     ]
     if include_row_number:
-        columns.append(pl.Series("_row_number", list(range(1, df.height + 1))))
+        columns.append(
+            pl.int_range(row_number_start, pl.len() + row_number_start, dtype=pl.Int64).alias("_row_number")
+        )
+    return df.with_columns(columns)
 
-    audit_df = pl.DataFrame(columns)
-    return pl.concat([df, audit_df], how="horizontal")
+
+def add_audit_columns_lazy(
+    lf: pl.LazyFrame,
+    *,
+    source_file: str,
+    include_row_number: bool = True,
+    timestamp: datetime | None = None,
+) -> pl.LazyFrame:
+    """Append FlowForge audit columns to a LazyFrame without materializing it.
+
+    Produces the same columns and dtypes as `add_audit_columns`, so Bronze
+    files written in streaming mode are interchangeable with eager ones.
+    """
+    ts = timestamp or datetime.utcnow()
+    lf = lf.with_columns(
+        pl.lit(ts.isoformat()).alias("_ingested_at"),
+        pl.lit(source_file).alias("_source_file"),
+    )
+    if include_row_number:
+        # with_row_index is streaming-friendly but prepends the column; move it last
+        lf = lf.with_row_index("_row_number", offset=1).select(
+            pl.exclude("_row_number"),
+            pl.col("_row_number").cast(pl.Int64),
+        )
+    return lf
+
+
+def streaming_chunk_rows(sample: pl.DataFrame, memory_budget_mb: int) -> int:
+    """Derive a streaming chunk size (rows) that keeps in-flight data within a memory budget.
+
+    Args:
+        sample: Small sample of the data used to estimate the in-memory row width.
+        memory_budget_mb: Approximate peak memory allowed for in-flight batches.
+
+    Returns:
+        Rows per streaming chunk / Parquet row group.
+    """
+    bytes_per_row = max(sample.estimated_size() / max(sample.height, 1), 1.0)
+    # Each worker thread holds a chunk while parsing, transforming and writing
+    in_flight_chunks = pl.thread_pool_size() * 3
+    rows = int(memory_budget_mb * 1024 * 1024 / (bytes_per_row * in_flight_chunks))
+    return max(rows, 1_000)
 
 
 def ensure_columns(df: pl.DataFrame, required: Sequence[str]) -> None:
@@ -75,9 +122,82 @@ def write_parquet(df: pl.DataFrame, path: str | Path) -> Path:
     return path
 
 
-def read_parquet(path: str | Path) -> pl.DataFrame:
-    """Read Parquet into a Polars DataFrame."""
-    return pl.read_parquet(path)
+def sink_parquet(
+    lf: pl.LazyFrame,
+    path: str | Path,
+    *,
+    row_group_size: int | None = None,
+) -> Path:
+    """Stream a LazyFrame to Parquet and return the target Path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lf.sink_parquet(path, compression="zstd", row_group_size=row_group_size)
+    return path
+
+
+def write_parquet_batches(frames: Iterable[pl.DataFrame], path: str | Path) -> int:
+    """Write DataFrames with a common schema to one Parquet file, one at a time.
+
+    Only the current frame is held in memory. Returns the number of rows written.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    writer: pq.ParquetWriter | None = None
+    rows = 0
+    try:
+        for df in frames:
+            table = df.to_arrow()
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+            elif table.schema != writer.schema:
+                table = table.cast(writer.schema)
+            writer.write_table(table)
+            rows += df.height
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        pq.write_table(pa.table({}), path, compression="zstd")
+    return rows
+
+
+def read_parquet(path: str | Path | BinaryIO, *, n_rows: int | None = None) -> pl.DataFrame:
+    """Read Parquet from a path or binary stream (optionally only the first `n_rows`).
+
+    A stream is decoded row group by row group as it is read, instead of being
+    buffered whole before decoding starts.
+    """
+    if isinstance(path, (str, Path)):
+        return pl.read_parquet(path, n_rows=n_rows)
+
+    parquet_file = pq.ParquetFile(path)
+    batches = []
+    rows = 0
+    for batch in parquet_file.iter_batches():
+        batches.append(batch)
+        rows += batch.num_rows
+        if n_rows is not None and rows >= n_rows:
+            break
+    table = pa.Table.from_batches(batches, schema=parquet_file.schema_arrow)
+    if n_rows is not None:
+        table = table.slice(0, n_rows)
+    return pl.from_arrow(table)
+
+
+def scan_parquet(paths: str | Path | Sequence[str | Path]) -> pl.LazyFrame:
+    """Lazily scan one or more local Parquet files.
+
+    Multiple files are concatenated diagonally, so columns added in later
+    files are kept (null-filled for earlier ones).
+    """
+    if isinstance(paths, (str, Path)):
+        return pl.scan_parquet(paths)
+    frames = [pl.scan_parquet(path) for path in paths]
+    if not frames:
+        return pl.LazyFrame()
+    return pl.concat(frames, how="diagonal")
 
 
 def deduplicate(
@@ -90,6 +210,16 @@ def deduplicate(
     return df.unique(subset=subset, keep=keep)
 
 
+def deduplicate_lazy(
+    lf: pl.LazyFrame,
+    *,
+    subset: Iterable[str] | None = None,
+    keep: str = "last",
+) -> pl.LazyFrame:
+    """Lazy variant of `deduplicate`."""
+    return lf.unique(subset=subset, keep=keep)
+
+
 def add_surrogate_key(
     df: pl.DataFrame,
     *,
@@ -97,4 +227,18 @@ def add_surrogate_key(
     start: int = 1,
 ) -> pl.DataFrame:
     """Attach an auto-incrementing surrogate key column."""
-    return df.with_columns(pl.Series(key_column, range(start, start + df.height)))
+    return df.with_columns(_surrogate_key_expr(key_column, start))
+
+
+def add_surrogate_key_lazy(
+    lf: pl.LazyFrame,
+    *,
+    key_column: str = "_sk_id",
+    start: int = 1,
+) -> pl.LazyFrame:
+    """Lazy variant of `add_surrogate_key`."""
+    return lf.with_columns(_surrogate_key_expr(key_column, start))
+
+
+def _surrogate_key_expr(key_column: str, start: int) -> pl.Expr:
+    return pl.int_range(start, pl.len() + start, dtype=pl.Int64).alias(key_column)
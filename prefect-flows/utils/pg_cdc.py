@@ -0,0 +1,446 @@
+"""
+PostgreSQL logical replication (CDC) decoding and checkpoints for FlowForge.
+
+A table ingested with databaseConfig.syncMode = "cdc" is read from a logical
+replication slot instead of being polled. The slot's output plugin is either
+the built-in pgoutput (binary protocol, filtered by a publication) or wal2json
+(format-version 2, one JSON document per change). Both are decoded into the
+same change events, buffered per committed transaction and turned into Arrow
+tables with CDC audit columns:
+
+    _cdc_op          I(nsert), U(pdate), D(elete), T(runcate) or R (initial snapshot row)
+    _cdc_lsn         LSN of the change
+    _cdc_commit_lsn  end LSN of the change's transaction
+
+Progress is checkpointed next to the Bronze table, one checkpoint per job:
+
+    bronze/{tableName}/_checkpoints/{jobId}.cdc.json
+
+"lsn" is the end LSN of the last transaction written to a Bronze part (the
+slot is confirmed up to it, so the server may free older WAL); "silver_lsn" is
+the last one Silver has merged. Bronze parts are registered in the table
+manifest with their end LSN, so Silver picks up every part after silver_lsn,
+including parts of earlier runs whose Silver step failed.
+"""
+
+from datetime import datetime, time as dt_time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import json
+import logging
+import re
+import struct
+
+import pyarrow as pa
+
+from utils.extract_checkpoint import CHECKPOINT_DIRNAME
+from utils.s3 import S3Client
+
+logger = logging.getLogger(__name__)
+
+CDC_PLUGINS = ("pgoutput", "wal2json")
+
+OP_COLUMN = "_cdc_op"
+LSN_COLUMN = "_cdc_lsn"
+COMMIT_LSN_COLUMN = "_cdc_commit_lsn"
+
+# (column name, Arrow type) of a change's columns
+ColumnSpec = Tuple[Tuple[str, pa.DataType], ...]
+
+
+def lsn_to_int(lsn: str) -> int:
+    """Convert an LSN in PostgreSQL's text form ("16/B374D848") to an integer."""
+    high, low = lsn.split("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+
+def lsn_to_str(lsn: int) -> str:
+    """Convert an integer LSN to PostgreSQL's text form."""
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+
+def cdc_checkpoint_key(table_prefix: str, job_id: str) -> str:
+    """Return the CDC checkpoint key of a job's Bronze table."""
+    return f"{table_prefix.rstrip('/')}/{CHECKPOINT_DIRNAME}/{job_id}.cdc.json"
+
+
+def new_cdc_checkpoint(job_id: str, source_table: str, slot_name: str, plugin: str, lsn: int) -> Dict[str, Any]:
+    """
+    Build the checkpoint of a newly created replication slot
+
+    Args:
+        job_id: FlowForge job ID
+        source_table: Source table
+        slot_name: Replication slot
+        plugin: Output plugin ("pgoutput" or "wal2json")
+        lsn: Consistent point of the slot (the initial snapshot is as of this LSN)
+
+    Returns:
+        Checkpoint dict
+    """
+    return {
+        "job_id": job_id,
+        "source_table": source_table,
+        "slot_name": slot_name,
+        "plugin": plugin,
+        "lsn": lsn_to_str(lsn),
+        "silver_lsn": None,
+        "updated_at": None,
+    }
+
+
+def load_cdc_checkpoint(s3: S3Client, table_prefix: str, job_id: str) -> Optional[Dict[str, Any]]:
+    """Load a job's CDC checkpoint, or None if it has none."""
+    key = cdc_checkpoint_key(table_prefix, job_id)
+    if not s3.object_exists(key):
+        return None
+    return s3.read_json(key)
+
+
+def save_cdc_checkpoint(s3: S3Client, table_prefix: str, checkpoint: Dict[str, Any]) -> str:
+    """Persist a CDC checkpoint; returns its key."""
+    checkpoint["updated_at"] = datetime.utcnow().isoformat()
+    key = cdc_checkpoint_key(table_prefix, checkpoint["job_id"])
+    s3.write_json(key, checkpoint)
+    logger.info(f"CDC checkpoint {key}: lsn {checkpoint['lsn']}")
+    return key
+
+
+def commit_silver_lsn(s3: S3Client, checkpoint_key: str, lsn: str) -> None:
+    """Record that Silver has merged every CDC part up to `lsn`."""
+    checkpoint = s3.read_json(checkpoint_key)
+    if checkpoint["silver_lsn"] is None or lsn_to_int(lsn) > lsn_to_int(checkpoint["silver_lsn"]):
+        checkpoint["silver_lsn"] = lsn
+        checkpoint["updated_at"] = datetime.utcnow().isoformat()
+        s3.write_json(checkpoint_key, checkpoint)
+    logger.info(f"Silver merged CDC changes up to {lsn}")
+
+
+def pending_parts(manifest: Dict[str, Any], checkpoint: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Manifest parts of a CDC job that Silver has not merged yet, in LSN order."""
+    silver_lsn = lsn_to_int(checkpoint["silver_lsn"]) if checkpoint.get("silver_lsn") else -1
+    parts = [
+        part for part in manifest["parts"]
+        if part.get("cdc_job_id") == checkpoint["job_id"] and lsn_to_int(part["cdc_end_lsn"]) > silver_lsn
+    ]
+    return sorted(parts, key=lambda part: lsn_to_int(part["cdc_end_lsn"]))
+
+
+def split_type_name(type_name: str) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    Split a formatted PostgreSQL type into (base name, precision, scale)
+
+    e.g. "numeric(12,2)" -> ("numeric", 12, 2) and
+    "timestamp(3) without time zone" -> ("timestamp without time zone", 3, None)
+    """
+    match = re.search(r"\((\d+)(?:,\s*(\d+))?\)", type_name)
+    if not match:
+        return type_name, None, None
+    base = (type_name[:match.start()] + type_name[match.end():]).strip()
+    return base, int(match.group(1)), int(match.group(2)) if match.group(2) else None
+
+
+def arrow_type_for(connector, type_name: str, precision: Optional[int] = None, scale: Optional[int] = None) -> pa.DataType:
+    """Arrow type of a PostgreSQL column, as in connector.describe_query()."""
+    if type_name in ("numeric", "decimal") and not precision:
+        # Unconstrained NUMERIC can exceed any fixed decimal128 precision/scale
+        return pa.string()
+    return connector._pg_type_to_arrow(type_name, precision, scale)
+
+
+class PgOutputDecoder:
+    """Decoder of pgoutput protocol version 1 messages"""
+
+    def __init__(self, arrow_type: Callable[[int, int], pa.DataType]):
+        """
+        Args:
+            arrow_type: Maps a column's (type OID, typmod) to an Arrow type
+        """
+        self.arrow_type = arrow_type
+        # relation OID -> {"table", "columns": ColumnSpec, "key": [column names]}
+        self.relations: Dict[int, Dict[str, Any]] = {}
+
+    def decode(self, payload: bytes, lsn: int) -> Iterator[Dict[str, Any]]:
+        """
+        Decode one replication message
+
+        Args:
+            payload: Message payload
+            lsn: WAL position of the message (data_start)
+
+        Yields:
+            {"kind": "begin"}, {"kind": "commit", "end_lsn"},
+            {"kind": "relation", "table", "columns"} or
+            {"kind": "change", "op", "lsn", "table", "columns", "values"}
+        """
+        reader = _Reader(payload)
+        kind = reader.char()
+        if kind == "B":
+            yield {"kind": "begin"}
+        elif kind == "C":
+            reader.int8()
+            reader.int64()
+            yield {"kind": "commit", "end_lsn": reader.int64()}
+        elif kind == "R":
+            relation_id = reader.uint32()
+            table = f"{reader.string()}.{reader.string()}"
+            reader.int8()
+            columns, key = [], []
+            for _ in range(reader.int16()):
+                flags = reader.int8()
+                name = reader.string()
+                type_oid = reader.uint32()
+                typmod = reader.int32()
+                columns.append((name, self.arrow_type(type_oid, typmod)))
+                if flags & 1:
+                    key.append(name)
+            self.relations[relation_id] = {"table": table, "columns": tuple(columns), "key": key}
+            yield {"kind": "relation", "table": table, "columns": tuple(columns)}
+        elif kind in ("I", "U", "D"):
+            relation = self.relations[reader.uint32()]
+            names = [name for name, _ in relation["columns"]]
+            old = None
+            if kind in ("U", "D") and reader.peek() in ("K", "O"):
+                reader.char()
+                old = dict(zip(names, reader.tuple_data()))
+            new = None
+            if kind in ("I", "U"):
+                reader.char()
+                new = dict(zip(names, reader.tuple_data()))
+
+            if kind == "D":
+                yield self._change("D", lsn, relation, old)
+                return
+            if kind == "U":
+                if old is not None and any(old[name] != new[name] for name in relation["key"]):
+                    # The primary key changed: the old key no longer exists
+                    yield self._change("D", lsn, relation, {name: old[name] for name in relation["key"]})
+                for name, value in new.items():
+                    if value is _UNCHANGED_TOAST:
+                        new[name] = old.get(name) if old else None
+                        if new[name] in (None, _UNCHANGED_TOAST):
+                            new[name] = None
+                            _warn_unchanged_toast(relation["table"], name)
+            yield self._change(kind, lsn, relation, new)
+        elif kind == "T":
+            relation_count = reader.int32()
+            reader.int8()
+            for _ in range(relation_count):
+                relation = self.relations.get(reader.uint32())
+                if relation:
+                    yield self._change("T", lsn, relation, {})
+        # Origin ("O"), type ("Y") and logical messages ("M") carry no row changes
+
+    @staticmethod
+    def _change(op: str, lsn: int, relation: Dict[str, Any], values: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "kind": "change",
+            "op": op,
+            "lsn": lsn,
+            "table": relation["table"],
+            "columns": relation["columns"],
+            "values": values,
+        }
+
+
+class Wal2JsonDecoder:
+    """Decoder of wal2json format-version 2 messages"""
+
+    def __init__(self, arrow_type: Callable[[str], pa.DataType]):
+        """
+        Args:
+            arrow_type: Maps a formatted type name (e.g. "numeric(12,2)") to an Arrow type
+        """
+        self.arrow_type = arrow_type
+        self._types: Dict[str, pa.DataType] = {}
+
+    def decode(self, payload: bytes, lsn: int) -> Iterator[Dict[str, Any]]:
+        """Decode one replication message (see PgOutputDecoder.decode)"""
+        # Keep fractional numbers as their text, so NUMERIC values are not rounded through float
+        message = json.loads(payload, parse_float=str)
+        action = message["action"]
+        if action == "B":
+            yield {"kind": "begin"}
+        elif action == "C":
+            # wal2json sends the commit at the transaction's end LSN
+            yield {"kind": "commit", "end_lsn": lsn}
+        elif action in ("I", "U", "D", "T"):
+            table = f"{message['schema']}.{message['table']}"
+            new = message.get("columns") or []
+            old = message.get("identity") or []
+            if action == "U" and old:
+                new_values = {column["name"]: column["value"] for column in new}
+                if any(_json_text(column["value"]) != _json_text(new_values.get(column["name"])) for column in old):
+                    # The primary key changed: the old key no longer exists
+                    yield self._change("D", lsn, table, old)
+            yield self._change(action, lsn, table, old if action == "D" else new)
+        # Logical messages ("M") carry no row changes
+
+    def _change(self, op: str, lsn: int, table: str, columns: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "kind": "change",
+            "op": op,
+            "lsn": lsn,
+            "table": table,
+            "columns": tuple((column["name"], self._arrow_type(column["type"])) for column in columns),
+            "values": {column["name"]: _json_text(column["value"]) for column in columns},
+        }
+
+    def _arrow_type(self, type_name: str) -> pa.DataType:
+        if type_name not in self._types:
+            self._types[type_name] = self.arrow_type(type_name)
+        return self._types[type_name]
+
+
+class ChangeBuffer:
+    """Committed changes of one table, buffered until they are flushed to a Bronze part"""
+
+    def __init__(self):
+        self.columns: Dict[str, pa.DataType] = {}
+        self.rows: List[Tuple[str, int, int, Dict[str, Optional[str]]]] = []
+        self.num_bytes = 0
+        self.end_lsn: Optional[int] = None
+        self.started_at: Optional[float] = None
+
+    def conflicts(self, changes: List[Dict[str, Any]]) -> bool:
+        """Whether changes retype a buffered column (so the buffer must be flushed first)."""
+        return any(
+            name in self.columns and self.columns[name] != arrow_type
+            for change in changes
+            for name, arrow_type in change["columns"]
+        )
+
+    def add(self, changes: List[Dict[str, Any]], end_lsn: int, now: float) -> None:
+        """Add the changes of a transaction committed at `end_lsn`."""
+        for change in changes:
+            for name, arrow_type in change["columns"]:
+                self.columns.setdefault(name, arrow_type)
+            self.rows.append((change["op"], change["lsn"], end_lsn, change["values"]))
+            self.num_bytes += sum(len(value) for value in change["values"].values() if value is not None) + 24
+        self.end_lsn = end_lsn
+        if self.started_at is None:
+            self.started_at = now
+
+    def to_arrow(self) -> pa.Table:
+        """Buffered changes as an Arrow table (source columns, then the CDC audit columns)."""
+        arrays = {
+            name: _text_array([values.get(name) for _, _, _, values in self.rows], arrow_type)
+            for name, arrow_type in self.columns.items()
+        }
+        arrays[OP_COLUMN] = pa.array([op for op, _, _, _ in self.rows], pa.string())
+        arrays[LSN_COLUMN] = pa.array([lsn for _, lsn, _, _ in self.rows], pa.uint64())
+        arrays[COMMIT_LSN_COLUMN] = pa.array([end_lsn for _, _, end_lsn, _ in self.rows], pa.uint64())
+        return pa.table(arrays)
+
+    def clear(self) -> None:
+        """Drop the buffered changes (after they were flushed)."""
+        self.columns = {}
+        self.rows = []
+        self.num_bytes = 0
+        self.end_lsn = None
+        self.started_at = None
+
+
+def snapshot_columns(table: pa.Table, lsn: int) -> pa.Table:
+    """Add CDC audit columns to rows of the initial snapshot (op "R", as of the slot's consistent point)."""
+    lsn_scalar = pa.scalar(lsn, pa.uint64())
+    return (
+        table.append_column(OP_COLUMN, pa.repeat(pa.scalar("R", pa.string()), table.num_rows))
+        .append_column(LSN_COLUMN, pa.repeat(lsn_scalar, table.num_rows))
+        .append_column(COMMIT_LSN_COLUMN, pa.repeat(lsn_scalar, table.num_rows))
+    )
+
+
+# Marker for a TOASTed value the update did not change (pgoutput sends no value)
+_UNCHANGED_TOAST = object()
+_warned_toast = set()
+
+
+def _warn_unchanged_toast(table: str, column: str) -> None:
+    if (table, column) not in _warned_toast:
+        _warned_toast.add((table, column))
+        logger.warning(
+            f"Unchanged TOASTed value of {table}.{column} is not sent by pgoutput; "
+            f"set REPLICA IDENTITY FULL on the table to keep it (written as NULL)"
+        )
+
+
+def _json_text(value: Any) -> Optional[str]:
+    """Text form of a wal2json value (booleans as PostgreSQL's t/f)."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _text_array(values: List[Optional[str]], arrow_type: pa.DataType) -> pa.Array:
+    """Convert PostgreSQL text output values to an Arrow array of `arrow_type`."""
+    if pa.types.is_boolean(arrow_type):
+        return pa.array([None if value is None else value == "t" for value in values], arrow_type)
+    if pa.types.is_binary(arrow_type):
+        return pa.array(
+            [None if value is None else bytes.fromhex(value[2:]) if value.startswith("\\x") else value.encode("utf-8")
+             for value in values],
+            arrow_type,
+        )
+    if pa.types.is_time(arrow_type):
+        return pa.array([None if value is None else dt_time.fromisoformat(value) for value in values], arrow_type)
+    return pa.array(values, pa.string()).cast(arrow_type)
+
+
+class _Reader:
+    """Big-endian reader of pgoutput message fields"""
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.offset = 0
+
+    def _unpack(self, fmt: str, size: int):
+        value = struct.unpack_from(fmt, self.payload, self.offset)[0]
+        self.offset += size
+        return value
+
+    def int8(self) -> int:
+        return self._unpack(">b", 1)
+
+    def int16(self) -> int:
+        return self._unpack(">h", 2)
+
+    def int32(self) -> int:
+        return self._unpack(">i", 4)
+
+    def uint32(self) -> int:
+        return self._unpack(">I", 4)
+
+    def int64(self) -> int:
+        return self._unpack(">Q", 8)
+
+    def char(self) -> str:
+        value = chr(self.payload[self.offset])
+        self.offset += 1
+        return value
+
+    def peek(self) -> str:
+        return chr(self.payload[self.offset])
+
+    def string(self) -> str:
+        end = self.payload.index(b"\0", self.offset)
+        value = self.payload[self.offset:end].decode("utf-8")
+        self.offset = end + 1
+        return value
+
+    def tuple_data(self) -> List[Any]:
+        values = []
+        for _ in range(self.int16()):
+            kind = self.char()
+            if kind == "n":
+                values.append(None)
+            elif kind == "u":
+                values.append(_UNCHANGED_TOAST)
+            else:
+                length = self.int32()
+                values.append(self.payload[self.offset:self.offset + length].decode("utf-8"))
+                self.offset += length
+        return values
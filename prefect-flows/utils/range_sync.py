@@ -0,0 +1,200 @@
+"""
+Checksum range sync for database tables without a reliable delta column.
+
+A table synced with databaseConfig.syncMode = "checksum" is divided into
+fixed-width ranges ("leaves") of its integer primary key. The row count and
+checksum (sum of row hashes, computed inside the source database) of every
+leaf that Silver currently holds are kept next to the Bronze table:
+
+    bronze/{tableName}/_sync/{jobId}.json           committed state
+    bronze/{tableName}/_sync/{jobId}.pending.json   state of the latest extract
+
+Because checksums are sums, the checksum of any aligned group of `fanout**level`
+leaves is the sum of its leaves. A sync compares the source against the
+committed state from the top level down, only descending into ranges whose
+count or checksum differ, and then pulls just the mismatching leaves. Rows
+Silver holds in those leaves that the source no longer has are deletes.
+
+The extract writes a pending state; Silver promotes it to the committed state
+(`commit_sync_state`) once the changes are merged, so a failed Silver run
+leaves the previous state in place and the next sync pulls the changes again.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+from utils.s3 import S3Client
+
+logger = logging.getLogger(__name__)
+
+SYNC_DIRNAME = "_sync"
+# Child ranges per range when descending into a mismatch
+DEFAULT_FANOUT = 16
+# Estimated rows per leaf, used to size the leaf width on the first sync
+DEFAULT_LEAF_ROWS = 10_000
+
+# fetch(level, ranges) -> {bucket: (row_count, checksum)} of the source at `level`,
+# restricted to half-open key ranges (None: the whole table)
+Fetch = Callable[[int, Optional[List[Tuple[int, int]]]], Dict[int, Tuple[int, int]]]
+
+
+def sync_state_key(table_prefix: str, job_id: str, pending: bool = False) -> str:
+    """Return the (pending) sync state key of a job's Bronze table."""
+    suffix = ".pending.json" if pending else ".json"
+    return f"{table_prefix.rstrip('/')}/{SYNC_DIRNAME}/{job_id}{suffix}"
+
+
+def new_sync_state(
+    job_id: str,
+    source_table: str,
+    key_column: str,
+    base: int,
+    leaf_width: int,
+    fanout: int = DEFAULT_FANOUT,
+) -> Dict[str, Any]:
+    """
+    Build an empty sync state
+
+    Args:
+        job_id: FlowForge job ID
+        source_table: Source table
+        key_column: Integer primary key column
+        base: Key value where leaf 0 starts
+        leaf_width: Key values per leaf
+        fanout: Child ranges per range
+
+    Returns:
+        Sync state with no leaves
+    """
+    return {
+        "job_id": job_id,
+        "source_table": source_table,
+        "key_column": key_column,
+        "base": base,
+        "leaf_width": leaf_width,
+        "fanout": fanout,
+        "leaves": {},
+        "run_id": None,
+        "updated_at": None,
+    }
+
+
+def leaf_width_for(lo: int, hi: int, row_count: Optional[int], leaf_rows: int = DEFAULT_LEAF_ROWS) -> int:
+    """Leaf width (in key values) giving about `leaf_rows` rows per leaf over keys lo..hi."""
+    span = hi - lo + 1
+    if not row_count:
+        return max(1, leaf_rows)
+    return max(1, -(-span * leaf_rows // row_count))
+
+
+def load_sync_state(s3: S3Client, table_prefix: str, job_id: str) -> Optional[Dict[str, Any]]:
+    """Load a job's committed sync state, or None if it has none."""
+    key = sync_state_key(table_prefix, job_id)
+    if not s3.object_exists(key):
+        return None
+    return s3.read_json(key)
+
+
+def save_pending_state(s3: S3Client, table_prefix: str, state: Dict[str, Any]) -> str:
+    """Write the state of an extract as the job's pending sync state; returns its key."""
+    state["updated_at"] = datetime.utcnow().isoformat()
+    key = sync_state_key(table_prefix, state["job_id"], pending=True)
+    s3.write_json(key, state)
+    logger.info(f"Pending sync state {key}: {len(state['leaves'])} leaves")
+    return key
+
+
+def commit_sync_state(s3: S3Client, pending_key: str) -> str:
+    """Promote a pending sync state once Silver holds its rows; returns the committed key."""
+    key = pending_key[:-len(".pending.json")] + ".json"
+    s3.copy_file(pending_key, key)
+    s3.delete_object(pending_key)
+    logger.info(f"Committed sync state {key}")
+    return key
+
+
+def bucket_range(state: Dict[str, Any], level: int, bucket: int) -> Tuple[int, int]:
+    """Half-open key range [lo, hi) of a bucket at `level` (level 0 = leaves)."""
+    width = state["leaf_width"] * state["fanout"] ** level
+    lo = state["base"] + bucket * width
+    return lo, lo + width
+
+
+def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge adjacent and overlapping half-open ranges."""
+    merged: List[Tuple[int, int]] = []
+    for lo, hi in sorted(ranges):
+        if merged and lo <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(hi, merged[-1][1]))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def top_level(state: Dict[str, Any], lo: int, hi: int) -> int:
+    """Lowest level at which keys lo..hi (and the stored leaves) fit in about `fanout` buckets."""
+    leaf_ids = [int(leaf) for leaf in state["leaves"]]
+    first = min([(lo - state["base"]) // state["leaf_width"]] + leaf_ids)
+    last = max([(hi - state["base"]) // state["leaf_width"]] + leaf_ids)
+    level = 0
+    while (last - first) // state["fanout"] ** level + 1 > state["fanout"]:
+        level += 1
+    return level
+
+
+def find_changed_leaves(fetch: Fetch, state: Dict[str, Any], level: int) -> Dict[int, Optional[Tuple[int, int]]]:
+    """
+    Find the leaves whose source count or checksum differs from the stored state
+
+    Starts with one query over the whole table at `level` and descends one level
+    at a time, querying only the ranges that mismatched.
+
+    Returns:
+        {leaf: (row_count, checksum) in the source, or None if the leaf is now empty}
+    """
+    fanout = state["fanout"]
+    stored_leaves = {int(leaf): (value[0], int(value[1])) for leaf, value in state["leaves"].items()}
+
+    ranges = None
+    while True:
+        current = fetch(level, ranges)
+        stored = _aggregate(stored_leaves, fanout ** level)
+        if ranges is not None:
+            # Only the queried ranges were read from the source
+            stored = {bucket: value for bucket, value in stored.items() if _in_ranges(state, level, bucket, ranges)}
+        mismatched = sorted(
+            bucket for bucket in set(current) | set(stored)
+            if current.get(bucket) != stored.get(bucket)
+        )
+        logger.info(f"Checksum level {level}: {len(current)} ranges read, {len(mismatched)} differ")
+        if level == 0 or not mismatched:
+            return {bucket: current.get(bucket) for bucket in mismatched}
+        ranges = merge_ranges([bucket_range(state, level, bucket) for bucket in mismatched])
+        level -= 1
+
+
+def apply_leaves(state: Dict[str, Any], changed: Dict[int, Optional[Tuple[int, int]]]) -> Dict[str, Any]:
+    """Record the source values of changed leaves in the state (dropping emptied leaves)."""
+    for leaf, value in changed.items():
+        if value is None:
+            state["leaves"].pop(str(leaf), None)
+        else:
+            state["leaves"][str(leaf)] = [value[0], str(value[1])]
+    return state
+
+
+def _aggregate(leaves: Dict[int, Tuple[int, int]], leaves_per_bucket: int) -> Dict[int, Tuple[int, int]]:
+    """Sum leaf counts and checksums into buckets of `leaves_per_bucket` leaves."""
+    buckets: Dict[int, Tuple[int, int]] = {}
+    for leaf, (count, checksum) in leaves.items():
+        bucket = leaf // leaves_per_bucket
+        total_count, total_checksum = buckets.get(bucket, (0, 0))
+        buckets[bucket] = (total_count + count, total_checksum + checksum)
+    return buckets
+
+
+def _in_ranges(state: Dict[str, Any], level: int, bucket: int, ranges: List[Tuple[int, int]]) -> bool:
+    """Whether a bucket lies inside one of the (bucket-aligned) key ranges."""
+    lo, hi = bucket_range(state, level, bucket)
+    return any(range_lo <= lo and hi <= range_hi for range_lo, range_hi in ranges)
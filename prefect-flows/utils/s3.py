@@ -1,29 +1,174 @@
 """S3/MinIO client utilities for FlowForge."""
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 from botocore.exceptions import ClientError
-from typing import List, Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
+import hashlib
+import io
+import json
 import logging
+import time
 
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+
+def _transfer_stats(s3_key: str, local_path: Optional[str | Path], num_bytes: int, started: float) -> Dict[str, Any]:
+    """Build the stats dict reported for a completed transfer."""
+    seconds = max(time.perf_counter() - started, 1e-6)
+    return {
+        's3_key': s3_key,
+        'local_path': str(local_path) if local_path is not None else None,
+        'bytes': num_bytes,
+        'seconds': round(seconds, 3),
+        'mb_per_sec': round(num_bytes / MB / seconds, 2),
+    }
+
+
+def _format_throughput(stats: Dict[str, Any]) -> str:
+    return f"{stats['bytes'] / MB:.1f} MB in {stats['seconds']:.2f}s, {stats['mb_per_sec']:.1f} MB/s"
+
+
+def is_precondition_failure(error: ClientError) -> bool:
+    """Whether a conditional write failed because the object changed (or appeared) in the meantime."""
+    return error.response['Error']['Code'] in ('PreconditionFailed', 'ConditionalRequestConflict', '412', '409')
+
+
+class S3ObjectReader(io.RawIOBase):
+    """Seekable, read-only file object over an S3/MinIO object.
+
+    Data is fetched with ranged GETs in fixed-size blocks. Blocks ahead of the
+    current position are prefetched on background threads, so sequential reads
+    do not wait for one GET at a time. At most ``read_ahead + 2`` blocks are
+    held in memory and nothing is written to local disk.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        s3_key: str,
+        size: int,
+        block_size: int,
+        read_ahead: int = 2,
+    ):
+        """
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Bucket name
+            s3_key: S3 object key
+            size: Object size in bytes
+            block_size: Bytes fetched per ranged GET
+            read_ahead: Number of blocks to prefetch beyond the current one
+        """
+        super().__init__()
+        self.name = s3_key
+        self.size = size
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._block_size = block_size
+        self._read_ahead = read_ahead
+        self._position = 0
+        self._blocks: Dict[int, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(read_ahead, 1))
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self.size:
+            return 0
+
+        index = self._position // self._block_size
+        block = self._get_block(index)
+        start = self._position - index * self._block_size
+        count = min(len(buffer), len(block) - start)
+        buffer[:count] = block[start:start + count]
+        self._position += count
+        return count
+
+    def close(self) -> None:
+        if not self.closed:
+            for future in self._blocks.values():
+                future.cancel()
+            self._blocks.clear()
+            self._executor.shutdown(wait=False)
+        super().close()
+
+    def _get_block(self, index: int) -> bytes:
+        """Return block `index`, scheduling read-ahead and evicting consumed blocks."""
+        last_index = (self.size - 1) // self._block_size
+        for ahead in range(index, min(index + self._read_ahead, last_index) + 1):
+            if ahead not in self._blocks:
+                self._blocks[ahead] = self._executor.submit(self._fetch_block, ahead)
+
+        # Keep the previous block around for short backward seeks (e.g. Parquet footers)
+        for stale in [i for i in self._blocks if i < index - 1 or i > index + self._read_ahead]:
+            self._blocks.pop(stale).cancel()
+
+        return self._blocks[index].result()
+
+    def _fetch_block(self, index: int) -> bytes:
+        start = index * self._block_size
+        end = min(start + self._block_size, self.size) - 1
+        response = self._s3_client.get_object(
+            Bucket=self._bucket,
+            Key=self.name,
+            Range=f"bytes={start}-{end}"
+        )
+        return response['Body'].read()
+
 
 class S3Client:
     """S3/MinIO client wrapper with FlowForge-specific utilities."""
 
     def __init__(self):
         """Initialize S3 client with configuration from settings."""
+        # Multipart part size and per-transfer thread concurrency
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.s3_multipart_threshold_mb * MB,
+            multipart_chunksize=settings.s3_multipart_chunksize_mb * MB,
+            max_concurrency=settings.s3_max_concurrency,
+            use_threads=True
+        )
         self.s3_client = boto3.client(
             's3',
             endpoint_url=settings.s3_endpoint_url,
             aws_access_key_id=settings.s3_access_key_id,
             aws_secret_access_key=settings.s3_secret_access_key,
             region_name=settings.s3_region,
-            config=Config(signature_version='s3v4')
+            config=Config(
+                signature_version='s3v4',
+                # Enough pooled connections for bulk transfers running multipart in parallel
+                max_pool_connections=max(settings.s3_max_concurrency * settings.s3_bulk_max_workers, 10)
+            )
         )
         self.bucket = settings.s3_bucket_name
 
@@ -35,6 +180,9 @@ class S3Client:
     ) -> str:
         """Upload a file to S3/MinIO.
 
+        Large files are split into parts and uploaded concurrently according to
+        the client's TransferConfig.
+
         Args:
             local_path: Local file path
             s3_key: S3 object key (path in bucket)
@@ -43,53 +191,257 @@ class S3Client:
         Returns:
             S3 URI of uploaded file
         """
+        return self._upload(local_path, s3_key, metadata)['s3_uri']
+
+    def download_file(self, s3_key: str, local_path: str | Path) -> Path:
+        """Download a file from S3/MinIO.
+
+        Large objects are fetched as concurrent ranged parts according to the
+        client's TransferConfig.
+
+        Args:
+            s3_key: S3 object key
+            local_path: Local destination path
+
+        Returns:
+            Path to downloaded file
+        """
+        return Path(self._download(s3_key, local_path)['local_path'])
+
+    def download_file_hashed(
+        self,
+        s3_key: str,
+        local_path: str | Path,
+        algorithm: str = "md5"
+    ) -> Dict[str, Any]:
+        """Download an object while hashing it, in a single pass over the bytes.
+
+        The object is read sequentially through `open_object`, so ranged GETs
+        for the next blocks run while the current block is hashed and written.
+
+        Args:
+            s3_key: S3 object key
+            local_path: Local destination path
+            algorithm: hashlib algorithm name
+
+        Returns:
+            Transfer stats (see `download_many`) plus the hex digest under `algorithm`
+        """
+        local_path = Path(local_path)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+
+        started = time.perf_counter()
+        digest = hashlib.new(algorithm)
+        block_size = settings.s3_read_block_size_mb * MB
+        with self.open_object(s3_key, block_size=block_size) as source, open(local_path, 'wb') as target:
+            for chunk in iter(lambda: source.read(block_size), b""):
+                digest.update(chunk)
+                target.write(chunk)
+
+        stats = _transfer_stats(s3_key, local_path, local_path.stat().st_size, started)
+        stats[algorithm] = digest.hexdigest()
+        logger.info(f"Downloaded and hashed s3://{self.bucket}/{s3_key} → {local_path} ({_format_throughput(stats)})")
+        return stats
+
+    def upload_many(
+        self,
+        files: List[Tuple[str | Path, str]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Upload many files concurrently on a bounded thread pool.
+
+        Args:
+            files: List of (local_path, s3_key) pairs
+            max_workers: Concurrent transfers (defaults to settings.s3_bulk_max_workers)
+
+        Returns:
+            Per-file transfer stats (s3_key, local_path, bytes, seconds,
+            mb_per_sec, s3_uri) in input order
+        """
+        return self._transfer_many(self._upload, files, max_workers, "Uploaded")
+
+    def download_many(
+        self,
+        objects: List[Tuple[str, str | Path]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Download many objects concurrently on a bounded thread pool.
+
+        Args:
+            objects: List of (s3_key, local_path) pairs
+            max_workers: Concurrent transfers (defaults to settings.s3_bulk_max_workers)
+
+        Returns:
+            Per-object transfer stats (s3_key, local_path, bytes, seconds,
+            mb_per_sec) in input order
+        """
+        return self._transfer_many(self._download, objects, max_workers, "Downloaded")
+
+    def _upload(
+        self,
+        local_path: str | Path,
+        s3_key: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Upload a single file and return its transfer stats."""
         try:
             extra_args = {}
             if metadata:
                 extra_args['Metadata'] = metadata
 
+            started = time.perf_counter()
             self.s3_client.upload_file(
                 str(local_path),
                 self.bucket,
                 s3_key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=self.transfer_config
             )
+            stats = _transfer_stats(s3_key, local_path, Path(local_path).stat().st_size, started)
 
             s3_uri = f"s3://{self.bucket}/{s3_key}"
-            logger.info(f"Uploaded {local_path} → {s3_uri}")
-            return s3_uri
+            stats['s3_uri'] = s3_uri
+            logger.info(f"Uploaded {local_path} → {s3_uri} ({_format_throughput(stats)})")
+            return stats
 
         except ClientError as e:
             logger.error(f"Failed to upload {local_path}: {e}")
             raise
 
-    def download_file(self, s3_key: str, local_path: str | Path) -> Path:
-        """Download a file from S3/MinIO.
+    def _download(self, s3_key: str, local_path: str | Path) -> Dict[str, Any]:
+        """Download a single object and return its transfer stats."""
+        try:
+            local_path = Path(local_path)
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+
+            started = time.perf_counter()
+            self.s3_client.download_file(
+                self.bucket,
+                s3_key,
+                str(local_path),
+                Config=self.transfer_config
+            )
+            stats = _transfer_stats(s3_key, local_path, local_path.stat().st_size, started)
+
+            logger.info(f"Downloaded s3://{self.bucket}/{s3_key} → {local_path} ({_format_throughput(stats)})")
+            return stats
+
+        except ClientError as e:
+            logger.error(f"Failed to download {s3_key}: {e}")
+            raise
+
+    def _transfer_many(
+        self,
+        transfer: Callable[..., Dict[str, Any]],
+        items: List[Tuple[Any, Any]],
+        max_workers: Optional[int],
+        verb: str
+    ) -> List[Dict[str, Any]]:
+        """Run `transfer` over `items` on a bounded pool and log aggregate throughput."""
+        if not items:
+            return []
+
+        max_workers = min(max_workers or settings.s3_bulk_max_workers, len(items))
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(transfer, *item) for item in items]
+            # result() re-raises the first failure once in-flight transfers finish
+            results = [future.result() for future in futures]
+
+        total = _transfer_stats(
+            f"{len(results)} objects", None, sum(r['bytes'] for r in results), started
+        )
+        logger.info(f"{verb} {total['s3_key']} with {max_workers} workers ({_format_throughput(total)})")
+        return results
+
+    def open_object(
+        self,
+        s3_key: str,
+        block_size: Optional[int] = None,
+        read_ahead: Optional[int] = None
+    ) -> io.BufferedReader:
+        """Open an S3/MinIO object as a seekable, read-only binary stream.
+
+        The stream can be passed directly to Polars/PyArrow readers and the
+        file format handlers, avoiding a temporary local copy of the object.
 
         Args:
             s3_key: S3 object key
-            local_path: Local destination path
+            block_size: Bytes per ranged GET (defaults to settings.s3_read_block_size_mb)
+            read_ahead: Blocks prefetched in the background (defaults to
+                settings.s3_read_ahead_blocks; use 0 for random-access reads)
 
         Returns:
-            Path to downloaded file
+            Buffered binary file object; its `name` is the S3 key
         """
         try:
-            local_path = Path(local_path)
-            local_path.parent.mkdir(parents=True, exist_ok=True)
+            block_size = block_size or settings.s3_read_block_size_mb * MB
+            if read_ahead is None:
+                read_ahead = settings.s3_read_ahead_blocks
 
-            self.s3_client.download_file(
+            raw = S3ObjectReader(
+                self.s3_client,
                 self.bucket,
                 s3_key,
-                str(local_path)
+                size=self.get_object_size(s3_key),
+                block_size=block_size,
+                read_ahead=read_ahead,
             )
-
-            logger.info(f"Downloaded s3://{self.bucket}/{s3_key} → {local_path}")
-            return local_path
+            logger.info(f"Opened stream for s3://{self.bucket}/{s3_key} ({raw.size} bytes)")
+            return io.BufferedReader(raw, buffer_size=block_size)
 
         except ClientError as e:
-            logger.error(f"Failed to download {s3_key}: {e}")
+            logger.error(f"Failed to open {s3_key}: {e}")
             raise
 
+    def read_range(self, s3_key: str, start: int, end: int) -> bytes:
+        """Read bytes [start, end) of an S3/MinIO object with a single ranged GET.
+
+        Args:
+            s3_key: S3 object key
+            start: First byte offset
+            end: Offset one past the last byte
+
+        Returns:
+            The requested bytes (fewer if the object ends before `end`)
+        """
+        if end <= start:
+            return b''
+        response = self.s3_client.get_object(
+            Bucket=self.bucket,
+            Key=s3_key,
+            Range=f"bytes={start}-{end - 1}"
+        )
+        return response['Body'].read()
+
+    def get_object_size(self, s3_key: str) -> int:
+        """Return the size of an S3/MinIO object in bytes.
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            Object size in bytes
+        """
+        response = self.s3_client.head_object(Bucket=self.bucket, Key=s3_key)
+        return response['ContentLength']
+
+    def get_object_metadata(self, s3_key: str) -> Dict[str, Any]:
+        """Return size, ETag and last-modified time of an S3/MinIO object (one HEAD request).
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            Dict with `size`, `etag` (without quotes) and `last_modified`
+        """
+        response = self.s3_client.head_object(Bucket=self.bucket, Key=s3_key)
+        return {
+            'size': response['ContentLength'],
+            'etag': response.get('ETag', '').strip('"'),
+            'last_modified': response.get('LastModified'),
+        }
+
     def list_objects(
         self,
         prefix: str = "",
@@ -156,6 +508,86 @@ class S3Client:
         s3_key = f"{layer}/{workflow_id}/{job_id}/{filename}"
         return f"s3://{self.bucket}/{s3_key}"
 
+    def read_json(self, s3_key: str) -> Any:
+        """Read and parse a small JSON object from S3/MinIO.
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            Parsed JSON value
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
+            return json.loads(response['Body'].read())
+
+        except ClientError as e:
+            logger.error(f"Failed to read JSON {s3_key}: {e}")
+            raise
+
+    def read_json_with_etag(self, s3_key: str) -> Tuple[Any, Optional[str]]:
+        """Read a small JSON object together with its ETag, for a conditional rewrite.
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            (parsed JSON value, ETag), or (None, None) if the object does not exist
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
+            return json.loads(response['Body'].read()), response['ETag']
+
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                return None, None
+            logger.error(f"Failed to read JSON {s3_key}: {e}")
+            raise
+
+    def write_json(
+        self,
+        s3_key: str,
+        data: Any,
+        if_match: Optional[str] = None,
+        if_none_match: bool = False
+    ) -> str:
+        """Serialize a value as JSON and write it to S3/MinIO.
+
+        Args:
+            s3_key: S3 object key
+            data: JSON-serializable value
+            if_match: Only write if the object still has this ETag
+            if_none_match: Only write if the object does not exist yet
+
+        Returns:
+            S3 URI of written object
+
+        Raises:
+            ClientError: With code PreconditionFailed (or ConditionalRequestConflict)
+                when a condition does not hold; see `is_precondition_failure`
+        """
+        conditions = {}
+        if if_match:
+            conditions['IfMatch'] = if_match
+        if if_none_match:
+            conditions['IfNoneMatch'] = '*'
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket,
+                Key=s3_key,
+                Body=json.dumps(data, indent=2, default=str).encode('utf-8'),
+                ContentType='application/json',
+                **conditions
+            )
+            s3_uri = f"s3://{self.bucket}/{s3_key}"
+            logger.info(f"Wrote JSON → {s3_uri}")
+            return s3_uri
+
+        except ClientError as e:
+            if not is_precondition_failure(e):
+                logger.error(f"Failed to write JSON {s3_key}: {e}")
+            raise
+
     def object_exists(self, s3_key: str) -> bool:
         """Check if an object exists in S3/MinIO.
 
@@ -185,10 +617,12 @@ class S3Client:
         """
         try:
             copy_source = {'Bucket': self.bucket, 'Key': source_key}
-            self.s3_client.copy_object(
+            # Managed copy switches to multipart server-side copy above 5 GB
+            self.s3_client.copy(
                 CopySource=copy_source,
                 Bucket=self.bucket,
-                Key=dest_key
+                Key=dest_key,
+                Config=self.transfer_config
             )
 
             s3_uri = f"s3://{self.bucket}/{dest_key}"
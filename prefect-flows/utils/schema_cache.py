@@ -0,0 +1,92 @@
+"""
+Local metadata cache of source database schemas in FlowForge.
+
+The UI schema browser asks for one table's schema at a time. Instead of
+querying the source catalog per table, the whole database is introspected in
+bulk (`connector.introspect_database()`: columns, primary keys, indexes and
+statistics for every table) and cached as one JSON document per connection:
+
+    {SCHEMA_CACHE_DIR}/{sha256(connection)}.json
+
+Each lookup first reads the connector's DDL version (`connector.ddl_version()`,
+one cheap catalog query over modify dates or catalog row versions). The cache
+is only rebuilt when that version changed, so it is invalidated by DDL and not
+by time. Table statistics in the cache are as of the last introspection.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_path(connector, cache_dir: str) -> str:
+    """Cache file of a connector's database (keyed without the password)."""
+    connection = json.dumps(list(connector._pool_key()[:5]), default=str)
+    return os.path.join(cache_dir, f"{hashlib.sha256(connection.encode('utf-8')).hexdigest()}.json")
+
+
+def load_database_metadata(connector, refresh: bool = False, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get bulk metadata for every table of a connector's database
+
+    Args:
+        connector: DatabaseConnector instance
+        refresh: Introspect even if the cached metadata is current
+        cache_dir: Cache directory (default: SCHEMA_CACHE_DIR)
+
+    Returns:
+        {
+            "tables": {table_name: {"columns", "primary_key", "indexes", "stats"}},
+            "ddl_version": str or None (connector has no DDL change detection),
+            "introspected_at": ISO datetime,
+            "cached": bool
+        }
+    """
+    cache_dir = cache_dir or settings.schema_cache_dir
+    path = _cache_path(connector, cache_dir)
+
+    try:
+        ddl_version = connector.ddl_version()
+    except NotImplementedError:
+        ddl_version = None
+
+    if ddl_version is not None and not refresh:
+        try:
+            with open(path, "r", encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            if cached.get("ddl_version") == ddl_version:
+                cached["cached"] = True
+                return cached
+            logger.info(f"DDL change detected for {connector.database}, refreshing schema metadata")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable schema cache {path}: {e}")
+
+    metadata = {
+        "tables": connector.introspect_database(),
+        "ddl_version": ddl_version,
+        "introspected_at": datetime.utcnow().isoformat(),
+    }
+
+    if ddl_version is not None:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first, so concurrent readers never see a partial document
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(metadata, cache_file, default=str)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache schema metadata: {e}")
+
+    metadata["cached"] = False
+    return metadata
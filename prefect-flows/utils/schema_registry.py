@@ -0,0 +1,179 @@
+"""
+Pinned schema registry for FlowForge file sources.
+
+Each Bronze table keeps the source schema of its landing files next to its
+part manifest:
+
+    bronze/{tableName}/_schema.json
+
+The schema is pinned from a user-approved `column_mappings` dataType list or,
+failing that, from the first successful ingest. Later runs read the landing
+file with an explicit schema and skip type inference. Only the header line is
+checked for drift.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import logging
+import re
+
+import polars as pl
+
+from utils.s3 import S3Client
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_FILENAME = "_schema.json"
+
+# column_mappings dataType (as set in the web app) -> Polars dtype
+MAPPING_DATA_TYPES = {
+    "integer": pl.Int64,
+    "decimal": pl.Float64,
+    "float": pl.Float64,
+    "number": pl.Float64,
+    "boolean": pl.Boolean,
+    "date": pl.Date,
+    "datetime": pl.Datetime("us"),
+    "timestamp": pl.Datetime("us"),
+    "time": pl.Time,
+}
+
+_SIMPLE_DTYPES = {
+    name: getattr(pl, name)
+    for name in (
+        "Int8", "Int16", "Int32", "Int64", "UInt8", "UInt16", "UInt32", "UInt64",
+        "Float32", "Float64", "Boolean", "String", "Date", "Time", "Null",
+    )
+}
+
+
+def schema_key(table_prefix: str) -> str:
+    """Return the schema registry key for a Bronze table prefix (e.g. "bronze/customers/")."""
+    return f"{table_prefix.rstrip('/')}/{SCHEMA_FILENAME}"
+
+
+def load_schema(s3: S3Client, table_prefix: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the pinned schema of a Bronze table.
+
+    Returns:
+        Registry entry with `columns` ([{"name", "dtype"}]), `source`, `file_format`,
+        `version` and timestamps, or None if no schema is pinned yet
+    """
+    key = schema_key(table_prefix)
+    if not s3.object_exists(key):
+        return None
+    return s3.read_json(key)
+
+
+def save_schema(
+    s3: S3Client,
+    table_prefix: str,
+    schema: Dict[str, pl.DataType],
+    *,
+    source: str,
+    file_format: str,
+    run_id: Optional[str] = None,
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Pin a schema for a Bronze table, replacing `previous` (if any) with a new version.
+
+    Args:
+        s3: S3Client instance
+        table_prefix: Bronze table prefix
+        schema: Column name -> Polars dtype, in file column order
+        source: "column_mappings" or "inferred"
+        file_format: Landing file format the schema applies to
+        run_id: Run that produced the schema
+        previous: Entry being replaced (schema drift)
+
+    Returns:
+        The written registry entry
+    """
+    now = datetime.utcnow().isoformat()
+    entry = {
+        "table_prefix": table_prefix,
+        "file_format": file_format,
+        "source": source,
+        "version": (previous or {}).get("version", 0) + 1,
+        "run_id": run_id,
+        "columns": [{"name": name, "dtype": dtype_to_str(dtype)} for name, dtype in schema.items()],
+        "created_at": (previous or {}).get("created_at", now),
+        "updated_at": now,
+    }
+    s3.write_json(schema_key(table_prefix), entry)
+    logger.info(f"Pinned {source} schema v{entry['version']} for {table_prefix} ({len(schema)} columns)")
+    return entry
+
+
+def schema_from_column_mappings(column_mappings: Optional[List[dict]]) -> Optional[Dict[str, pl.DataType]]:
+    """
+    Build a source schema from column mappings, if every mapping carries a dataType.
+
+    Unknown data types (email, phone, ...) are read as strings.
+    """
+    if not column_mappings or not all(mapping.get("dataType") for mapping in column_mappings):
+        return None
+    return {
+        mapping["sourceColumn"]: MAPPING_DATA_TYPES.get(mapping["dataType"].lower(), pl.String)
+        for mapping in column_mappings
+    }
+
+
+def to_polars_schema(entry: Dict[str, Any]) -> Dict[str, pl.DataType]:
+    """Return the pinned schema of a registry entry as column name -> Polars dtype."""
+    return {column["name"]: dtype_from_str(column["dtype"]) for column in entry["columns"]}
+
+
+def header_drift(entry: Dict[str, Any], header: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Compare a landing file's header with the pinned schema.
+
+    Returns:
+        None if the header matches the pinned column order exactly, otherwise a
+        dict with `added`, `removed` and `reordered`
+    """
+    pinned = [column["name"] for column in entry["columns"]]
+    if header == pinned:
+        return None
+    return {
+        "added": [name for name in header if name not in pinned],
+        "removed": [name for name in pinned if name not in header],
+        "reordered": sorted(header) == sorted(pinned),
+    }
+
+
+def dtype_to_str(dtype: pl.DataType) -> str:
+    """Serialize a (flat) Polars dtype, e.g. "Int64", "Datetime(us, UTC)", "Decimal(18, 2)"."""
+    if isinstance(dtype, pl.Datetime):
+        tz = f", {dtype.time_zone}" if dtype.time_zone else ""
+        return f"Datetime({dtype.time_unit or 'us'}{tz})"
+    if isinstance(dtype, pl.Duration):
+        return f"Duration({dtype.time_unit or 'us'})"
+    if isinstance(dtype, pl.Decimal):
+        return f"Decimal({dtype.precision}, {dtype.scale})"
+    name = dtype.base_type().__name__
+    if name == "Utf8":
+        return "String"
+    if name not in _SIMPLE_DTYPES:
+        raise ValueError(f"Cannot pin dtype {dtype}")
+    return name
+
+
+def dtype_from_str(value: str) -> pl.DataType:
+    """Parse a dtype serialized by `dtype_to_str`."""
+    match = re.fullmatch(r"(\w+)(?:\((.*)\))?", value.strip())
+    if not match:
+        raise ValueError(f"Unknown dtype: {value}")
+    name, args = match.group(1), [arg.strip() for arg in (match.group(2) or "").split(",") if arg.strip()]
+
+    if name == "Datetime":
+        return pl.Datetime(args[0] if args else "us", args[1] if len(args) > 1 else None)
+    if name == "Duration":
+        return pl.Duration(args[0] if args else "us")
+    if name == "Decimal":
+        return pl.Decimal(int(args[0]) if args else None, int(args[1]) if len(args) > 1 else 0)
+    if name in _SIMPLE_DTYPES:
+        return _SIMPLE_DTYPES[name]
+    raise ValueError(f"Unknown dtype: {value}")
@@ -0,0 +1,235 @@
+"""
+Cached table samples for database previews and AI analysis in FlowForge.
+
+UI previews and AI config analysis read a few hundred rows of a source table,
+often the same table many times in a row. Samples are read with the
+connector's dialect sampling query (`build_sample`) and cached as small local
+Parquet files keyed by connection, table and schema fingerprint:
+
+    {SAMPLE_CACHE_DIR}/{sha256(connection, table, fingerprint)}.parquet
+
+Rows returned by a sampling query come in physical order, so a random subset
+of them is kept in random order: any prefix of a cached sample is itself a
+uniform sample. A schema change (new fingerprint) misses the cache, and samples
+older than SAMPLE_CACHE_TTL_SECONDS are evicted. A repeat preview only runs the
+catalog query for the schema; the row count is cached with the sample.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Samples are read with at least this many rows, so a 100-row preview and a
+# 1000-row AI analysis of the same table share one cached sample
+MIN_SAMPLE_ROWS = 1000
+
+
+def schema_fingerprint(schema: List[Dict[str, Any]]) -> str:
+    """Fingerprint of a table schema as returned by connector.get_schema()."""
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+class SampleCache:
+    """Local Parquet cache of table samples with TTL eviction"""
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Directory holding cached samples (default: SAMPLE_CACHE_DIR)
+            ttl_seconds: Age after which samples are evicted (default: SAMPLE_CACHE_TTL_SECONDS, 0 disables caching)
+        """
+        self.cache_dir = cache_dir or settings.sample_cache_dir
+        self.ttl_seconds = settings.sample_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+
+    def key(self, connection: tuple, table_name: str, fingerprint: str) -> str:
+        """Cache key of a table sample (the connection tuple must not include credentials)."""
+        raw = json.dumps([list(connection), table_name, fingerprint], default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, rows: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached sample with at least `rows` rows (or all of a smaller table)
+
+        Returns:
+            {"table": pa.Table, "row_count": int, "row_count_exact": bool,
+             "strategy": str, "sampled_at": float} or None on a miss
+        """
+        if not self.ttl_seconds:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            table = pq.read_table(path)
+        except OSError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached sample {path}: {e}")
+            return None
+
+        info = json.loads(table.schema.metadata[b"flowforge_sample"])
+        if table.num_rows < rows and not info["complete"]:
+            return None
+        info["table"] = table.replace_schema_metadata(None)
+        return info
+
+    def put(
+        self,
+        key: str,
+        table: pa.Table,
+        *,
+        row_count: Optional[int],
+        row_count_exact: bool,
+        strategy: str,
+        complete: bool,
+    ) -> None:
+        """
+        Cache a sample, then evict expired samples
+
+        Args:
+            key: Cache key (see `key`)
+            table: Sampled rows
+            row_count: Rows in the source table
+            row_count_exact: Whether row_count is exact or a statistics estimate
+            strategy: Sampling strategy used ("sample" or "head")
+            complete: The sample holds the whole table
+        """
+        if not self.ttl_seconds:
+            return
+        info = {
+            "row_count": row_count,
+            "row_count_exact": row_count_exact,
+            "strategy": strategy,
+            "complete": complete,
+            "sampled_at": time.time(),
+        }
+        table = table.replace_schema_metadata({"flowforge_sample": json.dumps(info)})
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first, so concurrent readers never see a partial sample
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            pq.write_table(table, temp_path, compression="zstd")
+            os.replace(temp_path, self._path(key))
+        except Exception as e:
+            logger.warning(f"Failed to cache table sample: {e}")
+            return
+        self.evict_expired()
+
+    def evict_expired(self) -> int:
+        """Delete samples older than the TTL; returns how many were deleted"""
+        deadline = time.time() - self.ttl_seconds
+        evicted = 0
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < deadline:
+                    os.remove(entry.path)
+                    evicted += 1
+            except OSError:
+                pass
+        return evicted
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.parquet")
+
+
+def sample_table(
+    connector,
+    table_name: str,
+    rows: int,
+    schema: List[Dict[str, Any]],
+    count_rows: Optional[Callable[[], Tuple[Optional[int], bool]]] = None,
+    use_cache: bool = True,
+    cache: Optional[SampleCache] = None,
+) -> Dict[str, Any]:
+    """
+    Read a sample of a table, from the sample cache when possible
+
+    Args:
+        connector: DatabaseConnector instance
+        table_name: Table to sample
+        rows: Rows wanted (at least MIN_SAMPLE_ROWS are read and cached)
+        schema: connector.get_schema(table_name), fingerprinted for the cache key
+        count_rows: Returns (row_count, row_count_exact) for the table; only
+            called on a cache miss, to size the sample (None reads the first rows)
+        use_cache: Read and write the sample cache
+        cache: SampleCache to use (default: SAMPLE_CACHE_DIR / SAMPLE_CACHE_TTL_SECONDS)
+
+    Returns:
+        {
+            "table": pa.Table (at most `rows` rows),
+            "row_count": int or None (from the cache on a hit),
+            "row_count_exact": bool,
+            "strategy": "sample" | "head",
+            "cached": bool,
+            "sampled_at": float (epoch seconds)
+        }
+    """
+    cache = cache or SampleCache()
+    # Connection identity without the password
+    key = cache.key(connector._pool_key()[:5], table_name, schema_fingerprint(schema))
+
+    if use_cache:
+        cached = cache.get(key, rows)
+        if cached is not None:
+            cached["table"] = cached["table"].slice(0, rows)
+            cached["cached"] = True
+            return cached
+
+    row_count, row_count_exact = count_rows() if count_rows else (None, False)
+    sample_rows = max(rows, MIN_SAMPLE_ROWS)
+    query = connector.build_sample(table_name, sample_rows, row_count)
+    head_query = connector.build_select(table_name, limit=sample_rows)
+    strategy = "head" if query == head_query else "sample"
+
+    table = None
+    if strategy == "sample":
+        try:
+            table = connector.read_query(query)
+        except Exception as e:
+            # e.g. TABLESAMPLE on a view
+            logger.warning(f"Sampling {table_name} failed, reading its first rows instead: {e}")
+        if table is not None and table.num_rows == 0:
+            table = None
+        if table is None:
+            strategy = "head"
+    if table is None:
+        table = connector.read_query(head_query)
+    else:
+        table = table.take(random.sample(range(table.num_rows), min(table.num_rows, sample_rows)))
+
+    complete = strategy == "head" and table.num_rows < sample_rows
+    if use_cache:
+        cache.put(
+            key,
+            table,
+            row_count=row_count,
+            row_count_exact=row_count_exact,
+            strategy=strategy,
+            complete=complete,
+        )
+
+    return {
+        "table": table.slice(0, rows),
+        "row_count": row_count,
+        "row_count_exact": row_count_exact,
+        "strategy": strategy,
+        "cached": False,
+        "sampled_at": time.time(),
+    }